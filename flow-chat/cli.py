@@ -479,7 +479,7 @@ async def temporal_stats():
         print(f"Error: {e}")
 
 
-async def decay_claims():
+async def decay_claims(incremental: bool = False):
     """Apply confidence decay to all claims."""
     from tools.temporal_tracker import TemporalTracker
 
@@ -490,7 +490,7 @@ async def decay_claims():
     await tracker.connect()
 
     try:
-        updated = await tracker.decay_all_claims()
+        updated = await tracker.decay_all_claims(incremental=incremental)
         print(f"\nUpdated {updated} claims with decayed confidence.")
 
     finally:
@@ -1552,7 +1552,7 @@ Semantic Embedding Commands:
 
 Temporal Tracking Commands:
   python cli.py temporal-stats
-  python cli.py decay-claims
+  python cli.py decay-claims --incremental
   python cli.py aging-claims --min-age 365 --max-conf 0.4
   python cli.py claim-temporal 42
   python cli.py paradigm-shifts --days 730
@@ -1647,7 +1647,8 @@ LLM Integration Commands:
     subparsers.add_parser('temporal-stats', help='Show temporal tracking statistics')
 
     # Decay Claims
-    subparsers.add_parser('decay-claims', help='Apply confidence decay to all claims')
+    decay = subparsers.add_parser('decay-claims', help='Apply confidence decay to all claims')
+    decay.add_argument('--incremental', action='store_true', help='Only revisit claims whose decay is due')
 
     # Aging Claims
     aging = subparsers.add_parser('aging-claims', help='Show aging claims needing attention')
@@ -1808,7 +1809,7 @@ LLM Integration Commands:
     elif args.command == 'temporal-stats':
         asyncio.run(temporal_stats())
     elif args.command == 'decay-claims':
-        asyncio.run(decay_claims())
+        asyncio.run(decay_claims(args.incremental))
     elif args.command == 'aging-claims':
         asyncio.run(aging_claims(args.min_age, args.max_conf))
     elif args.command == 'claim-temporal':
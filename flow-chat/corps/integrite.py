@@ -16,6 +16,22 @@ Cryptographie:
 Fichiers:
 - Baseline: /opt/flow-chat/adn/integrite.json
 - Stocke: {path: hash} pour chaque fichier surveillé
+- Cache: /opt/flow-chat/adn/integrite_cache.json
+- Stocke: {path: [inode, taille, mtime_ns, ctime_ns, hash]}
+
+Scan incrémental (mémoire des cellules):
+- Chaque arbre d'organe est parcouru une seule fois (os.walk)
+- Un fichier dont (inode, taille, mtime_ns, ctime_ns) n'a pas changé
+  garde son hash en cache, sans être relu
+- Seuls les fichiers modifiés sont rehashés, par blocs de 1 Mo, dans un
+  pool de threads (hashlib libère le GIL)
+- Un fichier modifié juste avant le scan (mtime dans RACY_WINDOW_NS) n'est
+  pas mis en cache: une écriture dans la même tranche de mtime serait
+  invisible au prochain stat
+- Le cache vit dans adn/, modifiable comme le code qu'il couvre: tous les
+  FULL_VERIFY_EVERY scans, et à chaque verify demandé via [EXEC], tout est
+  relu sans le consulter (un hash en cache démenti est compté dans
+  cache_mismatches)
 
 Communication:
 - Appelé par: veille.py (patrouille), chaine.py (sync)
@@ -24,16 +40,23 @@ Communication:
 API [EXEC:integrite]:
 - scan    : Scanner tous les fichiers, calculer hashs
 - commit  : Sauvegarder l'état actuel comme baseline
-- verify  : Comparer état actuel au baseline, retourner score
+- verify  : Relire tous les fichiers, comparer au baseline, retourner score
 - status  : État complet (score, anomalies, hash global)
 - hash <p>: Hash d'un fichier spécifique
 """
 
+import os
 import json
+import time
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+# Taille des blocs lus pour hasher un fichier
+CHUNK_SIZE = 1024 * 1024
 
 
 # =============================================================================
@@ -65,7 +88,9 @@ def hash_pqc(data: bytes) -> str:
 
 def hash_file(filepath: str) -> str:
     """
-    Hash le contenu d'un fichier.
+    Hash le contenu d'un fichier, lu par blocs de CHUNK_SIZE.
+
+    Même résultat que hash_pqc(contenu), sans charger le fichier en mémoire.
 
     Args:
         filepath: Chemin absolu du fichier
@@ -74,12 +99,42 @@ def hash_file(filepath: str) -> str:
         Hash SHAKE256 ou chaîne vide si erreur
     """
     try:
+        shake = hashlib.shake_256()
         with open(filepath, 'rb') as f:
-            return hash_pqc(f.read())
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                shake.update(chunk)
+        return shake.hexdigest(64)
     except (IOError, OSError):
         return ""
 
 
+def walk_files(root: Path, extensions: Iterable[str], ignore_dirs: Set[str]) -> Iterator[str]:
+    """
+    Parcourt un arbre une seule fois et retourne les fichiers aux bonnes extensions.
+
+    Les dossiers dont le chemin contient un nom de ignore_dirs ne sont pas
+    descendus (même règle que Integrite._should_ignore).
+
+    Args:
+        root: Dossier racine
+        extensions: Suffixes acceptés (".py", ...)
+        ignore_dirs: Noms à ignorer
+
+    Yields:
+        Chemins absolus des fichiers
+    """
+    suffixes = tuple(extensions)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            d for d in dirnames
+            if not any(ignored in os.path.join(dirpath, d) for ignored in ignore_dirs)
+        ]
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if name.endswith(suffixes) and not any(ignored in path for ignored in ignore_dirs):
+                yield path
+
+
 # =============================================================================
 # ORGANE INTÉGRITÉ
 # =============================================================================
@@ -105,6 +160,16 @@ class Integrite:
     # Chemins
     FLOW_HOME = "/opt/flow-chat"
     STATE_FILE = "/opt/flow-chat/adn/integrite.json"
+    CACHE_FILE = "/opt/flow-chat/adn/integrite_cache.json"
+
+    # Threads de hashage (seuls les fichiers modifiés sont relus)
+    HASH_WORKERS = 4
+
+    # mtime trop récent pour être fiable (granularité du système de fichiers)
+    RACY_WINDOW_NS = 2_000_000_000
+
+    # Scans incrémentaux avant un scan complet (qui ignore le cache de stat)
+    FULL_VERIFY_EVERY = 24
 
     # Organes à surveiller (dossiers dans FLOW_HOME)
     ORGANES = [
@@ -144,7 +209,20 @@ class Integrite:
         self.current: Dict[str, str] = {}
         self.last_scan: Optional[str] = None
         self.anomalies: List[Dict] = []
+
+        # Cache {chemin_relatif: [inode, taille, mtime_ns, ctime_ns, hash]}
+        self._stat_cache: Dict[str, list] = {}
+        self._cache_dirty = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.last_rehashed = 0
+
+        # Relecture complète périodique (le cache n'est pas une preuve)
+        self._scans_since_full = 0
+        self.last_full_scan: Optional[str] = None
+        self.cache_mismatches = 0
+
         self._load()
+        self._load_cache()
 
     def _load(self):
         """Charge le baseline depuis le fichier JSON."""
@@ -167,45 +245,134 @@ class Integrite:
             "updated": datetime.now().isoformat()
         }, indent=2))
 
+    def _load_cache(self):
+        """Charge le cache de stat depuis le fichier JSON."""
+        try:
+            cache_path = Path(self.CACHE_FILE)
+            if cache_path.exists():
+                self._stat_cache = json.loads(cache_path.read_text())
+        except (json.JSONDecodeError, IOError):
+            self._stat_cache = {}  # Cache perdu: tout sera rehashé une fois
+
+    def _save_cache(self):
+        """Persiste le cache de stat s'il a changé (écriture atomique)."""
+        if not self._cache_dirty:
+            return
+        try:
+            cache_path = Path(self.CACHE_FILE)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self._stat_cache))
+            os.replace(tmp_path, cache_path)
+            self._cache_dirty = False
+        except (IOError, OSError):
+            pass  # Le cache n'est qu'une optimisation
+
+    def hash_files(self, paths: Iterable[str], full: bool = False) -> Dict[str, str]:
+        """
+        Hash des fichiers, en ne relisant que ceux qui ont changé.
+
+        Un fichier est considéré inchangé si (inode, taille, mtime_ns,
+        ctime_ns) est identique à l'entrée du cache.
+
+        Args:
+            paths: Chemins absolus sous FLOW_HOME
+            full: Tout relire sans faire confiance au cache (qui est mis à jour)
+
+        Returns:
+            Dict {chemin_relatif: hash} des fichiers lisibles
+        """
+        started_ns = time.time_ns()
+        hashes: Dict[str, str] = {}
+        to_hash: List[Tuple[str, str, list]] = []
+
+        for path in paths:
+            rel_path = os.path.relpath(path, self.FLOW_HOME)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            key = [st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns]
+            cached = self._stat_cache.get(rel_path)
+            if not full and cached is not None and cached[:4] == key:
+                hashes[rel_path] = cached[4]
+            else:
+                to_hash.append((rel_path, path, key))
+
+        if len(to_hash) > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.HASH_WORKERS, thread_name_prefix='integrite')
+            results = self._executor.map(hash_file, [path for _, path, _ in to_hash])
+        else:
+            results = [hash_file(path) for _, path, _ in to_hash]
+
+        racy_ns = started_ns - self.RACY_WINDOW_NS
+        for (rel_path, _, key), file_hash in zip(to_hash, results):
+            cached = self._stat_cache.get(rel_path)
+            if cached is not None and cached[:4] == key and cached[4] != file_hash:
+                # Contenu changé sans que le stat ne bouge (ou cache falsifié)
+                self.cache_mismatches += 1
+            if not file_hash:
+                self._cache_dirty |= self._stat_cache.pop(rel_path, None) is not None
+                continue
+            hashes[rel_path] = file_hash
+            if key[2] < racy_ns and key[3] < racy_ns:
+                entry = key + [file_hash]
+                if cached != entry:
+                    self._stat_cache[rel_path] = entry
+                    self._cache_dirty = True
+            else:
+                # À relire au prochain scan
+                self._cache_dirty |= self._stat_cache.pop(rel_path, None) is not None
+
+        self.last_rehashed = len(to_hash)
+        self._save_cache()
+        return hashes
+
     def _should_ignore(self, path_str: str) -> bool:
         """Vérifie si un chemin doit être ignoré."""
         return any(ignored in path_str for ignored in self.IGNORE_DIRS)
 
-    def scan(self) -> Dict[str, str]:
+    def scan(self, full: bool = False) -> Dict[str, str]:
         """
         Scanne tous les fichiers de code des organes.
 
-        Parcourt chaque organe, trouve les fichiers avec les bonnes extensions,
-        calcule leur hash SHAKE256.
+        Parcourt chaque organe une fois, trouve les fichiers avec les bonnes
+        extensions et calcule leur hash SHAKE256 (seuls les fichiers modifiés
+        depuis le dernier scan sont relus, voir hash_files). Tous les
+        FULL_VERIFY_EVERY scans, tout est relu.
+
+        Args:
+            full: Forcer la relecture de tous les fichiers
 
         Returns:
             Dict {chemin_relatif: hash} de tous les fichiers scannés
         """
-        self.current = {}
-
+        full = full or self._scans_since_full >= self.FULL_VERIFY_EVERY
+        paths: List[str] = []
         for organe in self.ORGANES:
             organe_path = Path(self.FLOW_HOME) / organe
 
             if not organe_path.exists():
                 continue
 
-            # Scanner récursivement chaque extension
-            for ext in self.CODE_EXTENSIONS:
-                for filepath in organe_path.rglob(f"*{ext}"):
-                    path_str = str(filepath)
+            paths.extend(walk_files(organe_path, self.CODE_EXTENSIONS, self.IGNORE_DIRS))
 
-                    # Ignorer certains dossiers
-                    if self._should_ignore(path_str):
-                        continue
+        self.current = self.hash_files(paths, full=full)
 
-                    # Chemin relatif pour stockage
-                    rel_path = str(filepath.relative_to(self.FLOW_HOME))
-                    file_hash = hash_file(path_str)
-
-                    if file_hash:
-                        self.current[rel_path] = file_hash
+        # Oublier les fichiers disparus (les fichiers d'organes hors scan restent)
+        for rel_path in [p for p in self._stat_cache if p not in self.current]:
+            if not os.path.exists(os.path.join(self.FLOW_HOME, rel_path)):
+                del self._stat_cache[rel_path]
+                self._cache_dirty = True
+        self._save_cache()
 
         self.last_scan = datetime.now().isoformat()
+        if full:
+            self._scans_since_full = 0
+            self.last_full_scan = self.last_scan
+        else:
+            self._scans_since_full += 1
         return self.current
 
     def commit_baseline(self) -> int:
@@ -225,20 +392,23 @@ class Integrite:
         self._save()
         return len(self.baseline)
 
-    def verify(self) -> Tuple[float, List[Dict]]:
+    def verify(self, full: bool = False) -> Tuple[float, List[Dict]]:
         """
         Vérifie l'intégrité par rapport au baseline.
 
         Compare chaque fichier du baseline à l'état actuel.
         Détecte: fichiers modifiés, supprimés, nouveaux.
 
+        Args:
+            full: Rescanner d'abord en relisant tous les fichiers (sans le cache)
+
         Returns:
             Tuple (score, anomalies) où:
             - score: float 0.0-1.0, pourcentage de fichiers intacts
             - anomalies: liste de dicts décrivant chaque différence
         """
-        if not self.current:
-            self.scan()
+        if full or not self.current:
+            self.scan(full=full)
 
         if not self.baseline:
             return 0.0, [{"type": "no_baseline", "msg": "Pas de baseline - commit d'abord"}]
@@ -331,7 +501,10 @@ class Integrite:
             "files_current": len(self.current),
             "anomalies": len(anomalies),
             "anomaly_details": anomalies[:10],
-            "last_scan": self.last_scan
+            "last_scan": self.last_scan,
+            "last_full_scan": self.last_full_scan,
+            "last_rehashed": self.last_rehashed,
+            "cache_mismatches": self.cache_mismatches
         }
 
 
@@ -369,14 +542,15 @@ def exec_integrite(cmd: str) -> str:
 
     if action == "scan":
         hashes = integrite.scan()
-        return f"Scanned {len(hashes)} files\nGlobal: {integrite.global_hash()[:32]}"
+        return (f"Scanned {len(hashes)} files ({integrite.last_rehashed} rehashed)\n"
+                f"Global: {integrite.global_hash()[:32]}")
 
     elif action == "commit":
         count = integrite.commit_baseline()
         return f"Baseline committed: {count} files\nHash: {integrite.global_hash()[:32]}"
 
     elif action == "verify":
-        score, anomalies = integrite.verify()
+        score, anomalies = integrite.verify(full=True)
         result = f"Integrity: {score*108:.1f}%\n"
         if anomalies:
             result += f"Anomalies ({len(anomalies)}):\n"
@@ -421,7 +595,7 @@ Last scan: {s['last_scan']}"""
         return """Usage:
   scan           Scanner tous les fichiers
   commit         Sauvegarder baseline
-  verify         Vérifier intégrité globale
+  verify         Vérifier intégrité globale (relecture complète)
   status         État complet
   hash <path>    Hash d'un fichier
   knowledge      Lire connaissances vérifiées (PQC)
@@ -590,10 +764,7 @@ def get_organ_files(organ_name: str) -> List[Path]:
     }
 
     if organ_path.exists():
-        for ext in all_extensions:
-            for f in organ_path.rglob(f"*{ext}"):
-                if not any(x in str(f) for x in Integrite.IGNORE_DIRS):
-                    files.append(f)
+        files.extend(Path(f) for f in walk_files(organ_path, all_extensions, Integrite.IGNORE_DIRS))
 
     # Aussi chercher dans corps/ pour les modules
     corps_file = Path(Integrite.FLOW_HOME) / "corps" / f"{organ_name}.py"
@@ -618,11 +789,13 @@ def hash_organ(organ_name: str) -> Tuple[str, Dict[str, str]]:
         Tuple (hash_global, {fichier: hash})
     """
     files = get_organ_files(organ_name)
-    file_hashes = {}
+    # Signer ou vérifier une signature: relire le contenu, pas le cache
+    hashes = integrite.hash_files((str(f) for f in files), full=True)
 
+    file_hashes = {}
     for f in files:
         rel_path = str(f.relative_to(Integrite.FLOW_HOME))
-        file_hashes[rel_path] = hash_file(str(f))
+        file_hashes[rel_path] = hashes.get(rel_path, "")
 
     # Hash global = hash de tous les hashs concaténés
     combined = "".join(h for _, h in sorted(file_hashes.items()))
@@ -3,17 +3,26 @@ CIPHER API Integrations
 Academic paper sources: OpenAlex, arXiv, PubMed, Semantic Scholar
 """
 
-from .base import AcademicSource, Paper
+from .base import AcademicSource, Paper, InvalidResponse
+from .http_cache import HTTPCache, CacheMiss, get_http_cache, set_http_cache
 from .openalex import OpenAlexClient
 from .arxiv import ArxivClient
 from .pubmed import PubMedClient
 from .semantic_scholar import SemanticScholarClient
+from .hydrator import BatchCoalescer, PaperHydrator
 
 __all__ = [
     'AcademicSource',
     'Paper',
+    'InvalidResponse',
+    'HTTPCache',
+    'CacheMiss',
+    'get_http_cache',
+    'set_http_cache',
     'OpenAlexClient',
     'ArxivClient',
     'PubMedClient',
     'SemanticScholarClient',
+    'BatchCoalescer',
+    'PaperHydrator',
 ]
@@ -38,6 +38,14 @@ class ArxivClient(AcademicSource):
     - stat.* - Statistics
     """
 
+    CACHE_TTLS = [
+        (r'[?&]id_list=', 7 * 86400),     # single paper lookups
+        (r'sortBy=submittedDate', 6 * 3600),  # newest-first listings move daily
+    ]
+
+    # IDs per id_list lookup
+    MAX_BATCH = 100
+
     def __init__(self, requests_per_second: float = 1.0):
         """
         Initialize arXiv client.
@@ -47,7 +55,8 @@ class ArxivClient(AcademicSource):
         """
         super().__init__(
             base_url="http://export.arxiv.org/api/query",
-            requests_per_second=requests_per_second
+            requests_per_second=requests_per_second,
+            max_connections=1  # arXiv asks for no parallel requests
         )
 
     @property
@@ -195,8 +204,7 @@ class ArxivClient(AcademicSource):
         }
 
         try:
-            xml_response = await self._get_xml(self.base_url, params)
-            root = ET.fromstring(xml_response)
+            root = await self._get_xml(self.base_url, params)
 
             papers = []
             for entry in root.findall('atom:entry', ARXIV_NS):
@@ -227,8 +235,7 @@ class ArxivClient(AcademicSource):
         }
 
         try:
-            xml_response = await self._get_xml(self.base_url, params)
-            root = ET.fromstring(xml_response)
+            root = await self._get_xml(self.base_url, params)
 
             entries = root.findall('atom:entry', ARXIV_NS)
             if entries:
@@ -239,6 +246,39 @@ class ArxivClient(AcademicSource):
             logger.error(f"arXiv fetch failed for {paper_id}: {e}")
             return None
 
+    async def fetch_many(self, paper_ids: List[str]) -> Dict[str, Paper]:
+        """
+        Fetch papers by arXiv ID, MAX_BATCH per id_list request.
+
+        Args:
+            paper_ids: arXiv IDs (with or without version / "arXiv:" prefix)
+
+        Returns:
+            Requested ID -> Paper, for the papers found
+        """
+        clean_ids = {pid: pid.replace('arXiv:', '').strip() for pid in paper_ids}
+        unique_ids = list(dict.fromkeys(clean_ids.values()))
+
+        by_id: Dict[str, Paper] = {}
+        for i in range(0, len(unique_ids), self.MAX_BATCH):
+            batch = unique_ids[i:i + self.MAX_BATCH]
+            params = {
+                'id_list': ','.join(batch),
+                'max_results': len(batch)
+            }
+            try:
+                root = await self._get_xml(self.base_url, params)
+            except Exception as e:
+                logger.error(f"arXiv batch fetch failed: {e}")
+                continue
+
+            for entry in root.findall('atom:entry', ARXIV_NS):
+                paper = self._parse_entry(entry)
+                by_id[paper.external_id] = paper
+                by_id[re.sub(r'v\d+$', '', paper.external_id)] = paper
+
+        return {pid: by_id[clean] for pid, clean in clean_ids.items() if clean in by_id}
+
     async def search_by_category(
         self,
         category: str,
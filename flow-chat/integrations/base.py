@@ -3,14 +3,20 @@ Base classes for academic API integrations
 """
 
 import asyncio
+import json
+import random
+import xml.etree.ElementTree as ET
 import aiohttp
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Optional, List, Dict, Any, AsyncIterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, List, Dict, Any, AsyncIterator, Callable, Mapping, Tuple
 from enum import Enum
 import logging
 
+from .http_cache import HTTPCache, CacheMiss, TTLRules, DEFAULT_TTL, get_http_cache, request_signature, ttl_for
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,31 +95,163 @@ class Paper:
         }
 
 
+class InvalidResponse(aiohttp.ClientError):
+    """A successful response whose body cannot be parsed (never cached)"""
+
+
+def decode_json(body: bytes) -> Any:
+    """Parsed JSON body (InvalidResponse if it is not JSON)"""
+    try:
+        return json.loads(body)
+    except ValueError as e:  # JSONDecodeError, UnicodeDecodeError
+        raise InvalidResponse(f"Response is not valid JSON: {e}") from e
+
+
+def decode_xml(body: bytes) -> ET.Element:
+    """Root element of an XML body (InvalidResponse if it is not well-formed)"""
+    try:
+        return ET.fromstring(body.decode('utf-8', errors='replace'))
+    except ET.ParseError as e:
+        raise InvalidResponse(f"Response is not valid XML: {e}") from e
+
+
+# Longest Retry-After honoured (seconds)
+MAX_RETRY_AFTER = 300.0
+
+# Responses worth retrying (throttling and transient server errors)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
 class RateLimiter:
     """
-    Token bucket rate limiter for API calls.
+    Adaptive rate limiter for API calls (AIMD).
+
+    Each caller reserves the next send slot (GCRA token bucket, bursts of up
+    to `burst` requests) and sleeps outside any lock. The rate is halved on
+    HTTP 429/503 or when latency climbs far above its running average, and
+    grows back additively on success up to max_rate. A Retry-After pauses
+    every caller until it has passed.
     """
 
-    def __init__(self, requests_per_second: float):
+    # Latency this many times the running average counts as congestion
+    LATENCY_FACTOR = 4.0
+    # Fraction of max_rate regained per successful response
+    INCREASE = 0.05
+    # Minimum seconds between two rate decreases (one burst of 429s = one decrease)
+    DECREASE_COOLDOWN = 1.0
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        max_rate: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        burst: Optional[float] = None
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_second: Starting rate (the source's documented quota)
+            max_rate: Ceiling for additive increase (default: the starting rate)
+            min_rate: Floor for multiplicative decrease (default: 1/20 of it)
+            burst: Requests that may be sent back to back (default: one second's worth)
+        """
         self.rate = requests_per_second
-        self.tokens = requests_per_second
-        self.last_update = asyncio.get_event_loop().time() if asyncio.get_event_loop().is_running() else 0
-        self._lock = asyncio.Lock()
+        self.max_rate = max_rate or requests_per_second
+        self.min_rate = min_rate or requests_per_second / 20
+        self.burst = max(1.0, burst or requests_per_second)
+
+        self._tat = 0.0            # theoretical arrival time of the next request
+        self._blocked_until = 0.0  # Retry-After pause
+        self._paused = 0.0         # total Retry-After delay applied to reserved slots
+        self._last_decrease = float('-inf')
+        self.latency: Optional[float] = None  # running average (seconds)
+
+        self.throttled = 0
+        self.slowdowns = 0
 
     async def acquire(self):
         """Wait until a request can be made."""
-        async with self._lock:
-            now = asyncio.get_event_loop().time()
-            elapsed = now - self.last_update
-            self.tokens = min(self.rate, self.tokens + elapsed * self.rate)
-            self.last_update = now
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        interval = 1.0 / self.rate
+        start = max(now, self._blocked_until, self._tat - (self.burst - 1) * interval)
+        self._tat = max(self._tat, start) + interval
+
+        paused = self._paused
+        while True:
+            delay = start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self._paused == paused:
+                return
+            # A Retry-After received while sleeping pushed the schedule back;
+            # keep this slot, shifted, rather than reserving another one
+            start = max(start + self._paused - paused, self._blocked_until)
+            paused = self._paused
+
+    def _decrease(self, factor: float, now: float):
+        if now - self._last_decrease < self.DECREASE_COOLDOWN:
+            return
+        self._last_decrease = now
+        self.rate = max(self.min_rate, self.rate * factor)
+
+    def on_response(self, status: int, latency: float, retry_after: Optional[float] = None):
+        """
+        Adapt the rate to a response.
 
-            if self.tokens < 1:
-                wait_time = (1 - self.tokens) / self.rate
-                await asyncio.sleep(wait_time)
-                self.tokens = 0
-            else:
-                self.tokens -= 1
+        Args:
+            status: HTTP status
+            latency: Seconds from send to response headers
+            retry_after: Parsed Retry-After header, if any
+        """
+        now = asyncio.get_running_loop().time()
+        if retry_after is not None and status in RETRY_STATUSES:
+            until = now + retry_after
+            if until > self._blocked_until:
+                # Slots already reserved move back by the added pause
+                pause = until - max(now, self._blocked_until)
+                self._paused += pause
+                if self._tat > now:
+                    self._tat += pause
+                self._blocked_until = until
+
+        if status in (429, 503):
+            self.throttled += 1
+            self._decrease(0.5, now)
+            return
+        if status >= 500:
+            return
+
+        if self.latency is not None and latency > self.LATENCY_FACTOR * self.latency:
+            self.slowdowns += 1
+            self._decrease(0.8, now)
+        else:
+            self.rate = min(self.max_rate, self.rate + self.INCREASE * self.max_rate)
+        self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'rate': self.rate,
+            'max_rate': self.max_rate,
+            'latency': self.latency,
+            'throttled': self.throttled,
+            'slowdowns': self.slowdowns,
+        }
 
 
 class AcademicSource(ABC):
@@ -121,18 +259,42 @@ class AcademicSource(ABC):
     Abstract base class for academic paper sources.
 
     All API clients inherit from this and implement the search/fetch methods.
+
+    Responses go through the shared HTTP cache (http_cache.py); subclasses
+    set CACHE_TTLS to give their endpoints their own lifetimes.
     """
 
+    # (pattern on "METHOD url?params", TTL seconds), first match wins
+    CACHE_TTLS: TTLRules = ()
+    DEFAULT_CACHE_TTL: float = DEFAULT_TTL
+
+    # Retries: jittered exponential backoff, at most MAX_RETRIES per request,
+    # and retries overall limited to RETRY_RATIO of requests (plus RETRY_BUDGET)
+    MAX_RETRIES = 3
+    BACKOFF_BASE = 1.0
+    BACKOFF_MAX = 30.0
+    RETRY_RATIO = 0.1
+    RETRY_BUDGET = 10.0
+
+    # IDs one batch request accepts (1 = no batch endpoint, see fetch_many)
+    MAX_BATCH = 1
+
     def __init__(
         self,
         base_url: str,
         requests_per_second: float = 1.0,
-        timeout: int = 30
+        timeout: int = 30,
+        use_cache: bool = True,
+        max_connections: int = 4
     ):
         self.base_url = base_url.rstrip('/')
         self.rate_limiter = RateLimiter(requests_per_second)
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_connections = max_connections
         self._session: Optional[aiohttp.ClientSession] = None
+        self.http_cache: Optional[HTTPCache] = get_http_cache() if use_cache else None
+        self._retry_tokens = self.RETRY_BUDGET
+        self.retries = 0
 
     @property
     @abstractmethod
@@ -143,12 +305,22 @@ class AcademicSource(ABC):
     async def get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
+            trace = aiohttp.TraceConfig()
+            trace.on_request_headers_sent.append(self._on_request_headers_sent)
             self._session = aiohttp.ClientSession(
                 timeout=self.timeout,
-                headers=self._default_headers()
+                headers=self._default_headers(),
+                connector=aiohttp.TCPConnector(limit_per_host=self.max_connections),
+                trace_configs=[trace]
             )
         return self._session
 
+    @staticmethod
+    async def _on_request_headers_sent(session, trace_ctx, params):
+        """Note when a request actually left (see _send)"""
+        if trace_ctx.trace_request_ctx is not None:
+            trace_ctx.trace_request_ctx['sent'] = asyncio.get_running_loop().time()
+
     def _default_headers(self) -> Dict[str, str]:
         """Default HTTP headers. Override in subclasses."""
         return {
@@ -160,35 +332,150 @@ class AcademicSource(ABC):
         if self._session and not self._session.closed:
             await self._session.close()
 
-    async def _get(self, url: str, params: Optional[Dict] = None) -> Dict:
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        json_body: Any = None,
+        decode: Callable[[bytes], Any] = bytes
+    ) -> Any:
         """
-        Make a rate-limited GET request.
+        Make a rate-limited request through the HTTP cache.
+
+        Fresh cached responses are returned without a request; stale ones
+        are revalidated with their ETag / Last-Modified. A fetched body is
+        only stored once `decode` has accepted it.
+
+        Args:
+            decode: Parses the body; raises InvalidResponse if it is unusable
+
+        Returns:
+            The decoded response body
+        """
+        cache = self.http_cache
+        entry = None
+        if cache is not None:
+            signature = request_signature(method, url, params, json_body)
+            key = cache.key(signature)
+            entry = await asyncio.to_thread(cache.lookup, key)
+            if entry is not None and (entry.fresh or cache.offline):
+                return decode(entry.body)
+            if cache.offline:
+                raise CacheMiss(f"Not in offline HTTP cache: {signature}")
+
+        headers = cache.conditional_headers(entry) if entry is not None else None
+        attempt = 0
+
+        while True:
+            may_retry = attempt < self.MAX_RETRIES and self._retry_tokens >= 1
+            retry_after = None
+            try:
+                status, body, response_headers, retry_after = await self._send(
+                    method, url, params, json_body, headers, may_retry
+                )
+                if status not in RETRY_STATUSES:
+                    break
+                reason = f"HTTP {status}"
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not may_retry:
+                    logger.error(f"API request failed: {url} - {e!r}")
+                    raise
+                reason = repr(e)
+            except aiohttp.ClientError as e:
+                logger.error(f"API request failed: {url} - {e}")
+                raise
+
+            # Retry-After is enforced by the rate limiter; otherwise back off with full jitter
+            delay = 0.0 if retry_after is not None else random.uniform(
+                0, min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt)
+            )
+            logger.warning(f"API request failed ({reason}), retry {attempt + 1} in {delay:.1f}s: {url}")
+            self._retry_tokens -= 1
+            self.retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+        # Only successful requests earn retries back: during an outage the
+        # budget drains instead of being topped up by every new call
+        self._retry_tokens = min(self.RETRY_BUDGET, self._retry_tokens + self.RETRY_RATIO)
+
+        if status == 304 and entry is not None:
+            await asyncio.to_thread(
+                cache.refresh, entry, ttl_for(signature, self.CACHE_TTLS, self.DEFAULT_CACHE_TTL)
+            )
+            return decode(entry.body)
+
+        value = decode(body)
+        if cache is not None:
+            await asyncio.to_thread(
+                cache.store, key, signature, body, response_headers,
+                ttl_for(signature, self.CACHE_TTLS, self.DEFAULT_CACHE_TTL)
+            )
+        return value
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        json_body: Any,
+        headers: Optional[Dict[str, str]],
+        may_retry: bool
+    ) -> Tuple[int, bytes, Mapping[str, str], Optional[float]]:
+        """
+        One rate-limited request; feeds the response back to the rate limiter.
+
+        Error statuses raise, except retryable ones when may_retry is set.
+
+        Returns:
+            (status, body, headers, Retry-After seconds)
         """
         await self.rate_limiter.acquire()
         session = await self.get_session()
-
-        try:
-            async with session.get(url, params=params) as response:
+        loop = asyncio.get_running_loop()
+        timing = {'sent': loop.time()}
+
+        async with session.request(
+            method, url, params=params, json=json_body, headers=headers, trace_request_ctx=timing
+        ) as response:
+            # Latency runs from the request headers going out: time spent
+            # waiting for a connection (limit_per_host) is not the server's
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            self.rate_limiter.on_response(response.status, loop.time() - timing['sent'], retry_after)
+            if response.status >= 400 and not (may_retry and response.status in RETRY_STATUSES):
                 response.raise_for_status()
-                return await response.json()
-        except aiohttp.ClientError as e:
-            logger.error(f"API request failed: {url} - {e}")
-            raise
+            body = await response.read()
+            return response.status, body, response.headers, retry_after
 
-    async def _get_xml(self, url: str, params: Optional[Dict] = None) -> str:
+    async def _get(self, url: str, params: Optional[Dict] = None) -> Dict:
+        """
+        Make a rate-limited GET request.
+        """
+        return await self._request('GET', url, params, decode=decode_json)
+
+    async def _get_xml(self, url: str, params: Optional[Dict] = None) -> ET.Element:
         """
         Make a rate-limited GET request expecting XML response.
+
+        Returns:
+            Root element of the parsed document
         """
-        await self.rate_limiter.acquire()
-        session = await self.get_session()
+        return await self._request('GET', url, params, decode=decode_xml)
 
-        try:
-            async with session.get(url, params=params) as response:
-                response.raise_for_status()
-                return await response.text()
-        except aiohttp.ClientError as e:
-            logger.error(f"API request failed: {url} - {e}")
-            raise
+    async def _post(self, url: str, params: Optional[Dict] = None, json_body: Any = None) -> Any:
+        """
+        Make a rate-limited POST request with a JSON body (read-only query endpoints).
+        """
+        return await self._request('POST', url, params, json_body, decode=decode_json)
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Statistics of the HTTP cache this source uses"""
+        return self.http_cache.stats() if self.http_cache is not None else None
+
+    def rate_stats(self) -> Dict[str, Any]:
+        """Current adaptive rate and retry counters"""
+        return {**self.rate_limiter.stats(), 'retries': self.retries, 'retry_tokens': self._retry_tokens}
 
     @abstractmethod
     async def search(
@@ -225,6 +512,29 @@ class AcademicSource(ABC):
         """
         pass
 
+    async def fetch_many(self, paper_ids: List[str]) -> Dict[str, Paper]:
+        """
+        Fetch several papers by ID.
+
+        Sources with a batch endpoint override this to send MAX_BATCH IDs
+        per request; the default fetches them one by one (an ID whose fetch
+        fails counts as not found).
+
+        Args:
+            paper_ids: Paper identifiers
+
+        Returns:
+            Requested ID -> Paper, for the papers found
+        """
+        papers = await asyncio.gather(*(self.fetch(paper_id) for paper_id in paper_ids), return_exceptions=True)
+        found = {}
+        for paper_id, paper in zip(paper_ids, papers):
+            if isinstance(paper, Exception):
+                logger.error(f"Fetch of {paper_id} failed: {paper}")
+            elif paper is not None:
+                found[paper_id] = paper
+        return found
+
     async def stream(
         self,
         query: str,
@@ -0,0 +1,376 @@
+"""
+Shared on-disk HTTP response cache for the academic integrations
+
+- Requests are keyed by sha256(method, URL, sorted params, JSON body);
+  response bodies are stored zlib-compressed under their own sha256, so
+  identical payloads (e.g. the same record reached through two queries)
+  are stored once
+- Every source declares a TTL per endpoint; a stale entry that carried an
+  ETag or Last-Modified is revalidated with If-None-Match /
+  If-Modified-Since and a 304 only refreshes its expiry
+- The store is bounded in bytes; least recently used entries are evicted.
+  The methods are blocking (callers run them in a worker thread) and
+  thread-safe
+- Modes: 'normal'; 'record' (never expires, keeps everything - builds a
+  fixture store); 'offline' (serves only from the store, a miss raises
+  CacheMiss without touching the network)
+
+Location: $CIPHER_HTTP_CACHE, default $CIPHER_BASE_PATH/cache/http
+Mode: $CIPHER_HTTP_CACHE_MODE (default normal)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Union
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(os.getenv(
+    "CIPHER_HTTP_CACHE",
+    Path(os.getenv("CIPHER_BASE_PATH", "/opt/cipher")) / "cache" / "http"
+))
+DEFAULT_MAX_BYTES = int(os.getenv("CIPHER_HTTP_CACHE_MB", "512")) * 1024 * 1024
+DEFAULT_MODE = os.getenv("CIPHER_HTTP_CACHE_MODE", "normal")
+DEFAULT_TTL = 86400.0
+
+MODES = ('normal', 'record', 'offline')
+
+# (pattern matched against "METHOD url?params", TTL in seconds); first match wins
+TTLRules = Sequence[Tuple[str, float]]
+
+# Credentials and contact details do not change a response (and stay off disk)
+UNKEYED_PARAMS = frozenset({'api_key', 'email', 'mailto', 'tool'})
+
+
+class CacheMiss(aiohttp.ClientError):
+    """An offline cache has no response for a request"""
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body with its validators"""
+    key: str
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+def request_signature(
+    method: str,
+    url: str,
+    params: Optional[Mapping[str, Any]] = None,
+    json_body: Any = None
+) -> str:
+    """Canonical text of a request (params sorted); TTL rules match against it"""
+    signature = f"{method.upper()} {url}"
+    keyed = sorted(k for k in (params or {}) if k not in UNKEYED_PARAMS)
+    if keyed:
+        signature += '?' + '&'.join(f"{k}={params[k]}" for k in keyed)
+    if json_body is not None:
+        signature += ' ' + json.dumps(json_body, sort_keys=True, separators=(',', ':'))
+    return signature
+
+
+def ttl_for(signature: str, rules: TTLRules, default: float = DEFAULT_TTL) -> float:
+    """TTL of the first rule matching a request signature"""
+    for pattern, ttl in rules:
+        if re.search(pattern, signature):
+            return ttl
+    return default
+
+
+class HTTPCache:
+    """
+    Content-addressed, size-bounded HTTP response store (SQLite index + body files).
+    """
+
+    RECOUNT_EVERY = 1000
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        mode: str = DEFAULT_MODE
+    ):
+        """
+        Open (or create) a cache.
+
+        Args:
+            directory: Cache directory (index.sqlite + bodies/)
+            max_bytes: Budget for stored (compressed) bodies
+            mode: 'normal', 'record' or 'offline'
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown HTTP cache mode {mode!r} (expected one of {MODES})")
+        self.directory = Path(directory)
+        self.bodies = self.directory / 'bodies'
+        self.bodies.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.mode = mode
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.directory / 'index.sqlite'), timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                signature TEXT NOT NULL,
+                body_hash TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_responses_body ON responses(body_hash)")
+        self._db.commit()
+
+        # Running total of the body bytes; recounted from the index when it
+        # passes max_bytes or every RECOUNT_EVERY stores (other processes
+        # share the directory)
+        self._bytes = self._total_bytes()
+        self._stores_since_count = 0
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def offline(self) -> bool:
+        return self.mode == 'offline'
+
+    @staticmethod
+    def key(signature: str) -> str:
+        return hashlib.sha256(signature.encode('utf-8')).hexdigest()
+
+    def _body_path(self, body_hash: str) -> Path:
+        return self.bodies / body_hash[:2] / body_hash
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """
+        Stored response for a request key (fresh or stale), or None.
+
+        Fresh entries (any entry when offline) count as hits.
+        """
+        with self._lock:
+            return self._lookup(key)
+
+    def _lookup(self, key: str) -> Optional[CachedResponse]:
+        row = self._db.execute(
+            "SELECT body_hash, etag, last_modified, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        body_hash, etag, last_modified, expires_at = row
+        try:
+            body = zlib.decompress(self._body_path(body_hash).read_bytes())
+        except (OSError, zlib.error):
+            with self._db:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+
+        with self._db:
+            self._db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+        entry = CachedResponse(key, body, etag, last_modified, expires_at)
+        if entry.fresh or self.offline:
+            self.hits += 1
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: CachedResponse) -> Dict[str, str]:
+        """Validators to send when refetching a stale entry"""
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    # -------------------------------------------------------------------------
+    # Storing
+    # -------------------------------------------------------------------------
+
+    def _expiry(self, ttl: float) -> float:
+        return float('inf') if self.mode == 'record' else time.time() + ttl
+
+    def refresh(self, entry: CachedResponse, ttl: float):
+        """A 304 Not Modified: extend the entry's lifetime"""
+        with self._lock:
+            self.revalidated += 1
+            entry.expires_at = self._expiry(ttl)
+            with self._db:
+                self._db.execute("UPDATE responses SET expires_at = ? WHERE key = ?", (entry.expires_at, entry.key))
+
+    def store(self, key: str, signature: str, body: bytes, headers: Mapping[str, str], ttl: float):
+        """
+        Store a fetched response body.
+
+        Args:
+            key: Request key
+            signature: Canonical request text (kept for inspection)
+            body: Raw response body
+            headers: Response headers (validators, Cache-Control)
+            ttl: Lifetime in seconds
+        """
+        with self._lock:
+            self.misses += 1
+            if 'no-store' in headers.get('Cache-Control', '') and self.mode != 'record':
+                return
+            self._store(key, signature, body, headers, ttl)
+
+    def _store(self, key: str, signature: str, body: bytes, headers: Mapping[str, str], ttl: float):
+        body_hash = hashlib.sha256(body).hexdigest()
+        path = self._body_path(body_hash)
+        try:
+            if not path.exists():
+                path.parent.mkdir(exist_ok=True)
+                tmp = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+                tmp.write_bytes(zlib.compress(body, 6))
+                os.replace(tmp, path)
+                self._bytes += path.stat().st_size
+            size = path.stat().st_size
+
+            now = time.time()
+            with self._db:
+                old = self._db.execute("SELECT body_hash FROM responses WHERE key = ?", (key,)).fetchone()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, signature, body_hash, size, etag, last_modified, stored_at, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, signature, body_hash, size, headers.get('ETag'), headers.get('Last-Modified'),
+                     now, self._expiry(ttl), now)
+                )
+            if old and old[0] != body_hash:
+                self._drop_body(old[0])
+            self._stores_since_count += 1
+            self._evict()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"HTTP cache write failed: {e}")
+
+    def _drop_body(self, body_hash: str):
+        """Delete a body file no entry refers to any more"""
+        if self._db.execute("SELECT 1 FROM responses WHERE body_hash = ? LIMIT 1", (body_hash,)).fetchone():
+            return
+        path = self._body_path(body_hash)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return
+        self._bytes = max(0, self._bytes - size)
+
+    def _total_bytes(self) -> int:
+        # Shared bodies are counted once
+        return self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) as size FROM responses GROUP BY body_hash)"
+        ).fetchone()[0]
+
+    def _evict(self):
+        """Drop least recently used entries until the bodies fit in max_bytes"""
+        if self.mode == 'record':
+            return
+        if self._bytes <= self.max_bytes and self._stores_since_count < self.RECOUNT_EVERY:
+            return
+        total = self._bytes = self._total_bytes()
+        self._stores_since_count = 0
+        if total <= self.max_bytes:
+            return
+
+        victims = []
+        for key, body_hash, size in self._db.execute(
+            "SELECT key, body_hash, size FROM responses ORDER BY last_access"
+        ):
+            victims.append((key, body_hash))
+            total -= size  # over-estimates the bytes freed when a body is shared
+            if total <= self.max_bytes:
+                break
+        with self._db:
+            self._db.executemany("DELETE FROM responses WHERE key = ?", [(k,) for k, _ in victims])
+        for body_hash in {h for _, h in victims}:
+            self._drop_body(body_hash)
+        self.evictions += len(victims)
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def clear(self):
+        """Remove every stored response"""
+        with self._lock:
+            hashes = [h for (h,) in self._db.execute("SELECT DISTINCT body_hash FROM responses")]
+            with self._db:
+                self._db.execute("DELETE FROM responses")
+            for body_hash in hashes:
+                try:
+                    self._body_path(body_hash).unlink()
+                except FileNotFoundError:
+                    pass
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        served = self.hits + self.revalidated
+        requests = served + self.misses
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            total = self._total_bytes()
+        return {
+            'mode': self.mode,
+            'entries': entries,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': served / requests if requests else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+_cache: Optional[HTTPCache] = None
+_cache_failed = False
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    """Process-wide cache shared by every AcademicSource (None if it cannot be opened)"""
+    global _cache, _cache_failed
+    if _cache is None and not _cache_failed:
+        try:
+            _cache = HTTPCache()
+        except (OSError, sqlite3.Error) as e:
+            _cache_failed = True
+            logger.warning(f"HTTP cache disabled ({DEFAULT_CACHE_DIR}): {e}")
+    return _cache
+
+
+def set_http_cache(cache: Optional[HTTPCache]):
+    """Replace the shared cache (e.g. with an offline fixture store for benchmarks)"""
+    global _cache, _cache_failed
+    _cache, _cache_failed = cache, cache is None
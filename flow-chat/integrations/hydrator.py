@@ -0,0 +1,350 @@
+"""
+Bulk paper hydration
+
+Callers ask for papers (or their citations / references) one at a time;
+the hydrator coalesces those requests into the sources' batch endpoints:
+
+- Semantic Scholar: POST /paper/batch (500 IDs)
+- PubMed: efetch with many PMIDs (200)
+- OpenAlex: ids.openalex: / doi: / cites: OR filters (50)
+- arXiv: id_list (100)
+
+IDs requested within a short window are sent together (a full batch goes
+out at once); an ID already queued or in flight is not requested again,
+its callers share the pending result. Recently hydrated papers are kept in
+a small LRU, since the HTTP cache is keyed by the whole batch and misses
+when the same paper shows up in a different one.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Iterable, List, Optional, Set, TypeVar
+
+from .base import AcademicSource, Paper, SourceType
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+DIRECTIONS = ('references', 'citations')
+
+
+class BatchCoalescer(Generic[T]):
+    """
+    Collects single-key lookups into batch calls and fans the results back out.
+    """
+
+    def __init__(
+        self,
+        fetch_batch: Callable[[List[str]], Awaitable[Dict[str, T]]],
+        max_batch: int,
+        delay: float = 0.02,
+        max_cached: int = 10000
+    ):
+        """
+        Initialize the coalescer.
+
+        Args:
+            fetch_batch: Looks up a list of keys, returns key -> value for those found
+            max_batch: Keys per call
+            delay: How long a key waits for others to share its batch (seconds)
+            max_cached: Values (found ones) remembered after their batch completes
+        """
+        self.fetch_batch = fetch_batch
+        self.max_batch = max(1, max_batch)
+        self.delay = delay
+        self.max_cached = max_cached
+
+        self._queued: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._cache: "OrderedDict[str, T]" = OrderedDict()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.requested = 0
+        self.cache_hits = 0
+        self.shared = 0
+        self.batches = 0
+        self.failed = 0
+
+    def _future(self, key: str) -> asyncio.Future:
+        """Pending result for a key, queueing it if nobody asked for it yet"""
+        future = self._queued.get(key) or self._in_flight.get(key)
+        if future is not None:
+            self.shared += 1
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queued[key] = future
+        if len(self._queued) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.delay, self._flush)
+        return future
+
+    def _flush(self):
+        """Send every queued key, max_batch per call"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._queued:
+            batch = {}
+            while self._queued and len(batch) < self.max_batch:
+                key, future = self._queued.popitem(last=False)
+                batch[key] = future
+            self._in_flight.update(batch)
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: Dict[str, asyncio.Future]):
+        self.batches += 1
+        try:
+            results = await self._lookup(list(batch))
+        finally:
+            for key in batch:
+                self._in_flight.pop(key, None)
+
+        for key, future in batch.items():
+            value = results.get(key)
+            self._remember(key, value)
+            if not future.done():
+                future.set_result(value)
+
+    async def _lookup(self, keys: List[str]) -> Dict[str, T]:
+        """
+        fetch_batch, isolating failures: when a batch fails its keys are
+        retried one by one, and a key that fails on its own is not found.
+        """
+        try:
+            return await self.fetch_batch(keys)
+        except Exception as e:
+            if len(keys) == 1:
+                self.failed += 1
+                logger.warning(f"Lookup of {keys[0]!r} failed: {e}")
+                return {}
+            logger.warning(f"Batch of {len(keys)} keys failed ({e}), retrying them one by one")
+
+        results: Dict[str, T] = {}
+        for found in await asyncio.gather(*(self._lookup([key]) for key in keys)):
+            results.update(found)
+        return results
+
+    def _remember(self, key: str, value: Optional[T]):
+        # Misses are not remembered: a failed batch looks like "not found"
+        if value is None or self.max_cached <= 0:
+            return
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[T]:
+        """Value for a key (None if not found)"""
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, T]:
+        """
+        Values for several keys, sharing batches with concurrent callers.
+
+        Returns:
+            key -> value, for the keys found
+        """
+        results: Dict[str, T] = {}
+        pending: Dict[str, asyncio.Future] = {}
+        for key in dict.fromkeys(keys):
+            self.requested += 1
+            if key in self._cache:
+                self.cache_hits += 1
+                self._cache.move_to_end(key)
+                results[key] = self._cache[key]
+            else:
+                pending[key] = self._future(key)
+
+        if pending:
+            # shield: a cancelled caller must not cancel a result others are waiting for
+            values = await asyncio.gather(*(asyncio.shield(f) for f in pending.values()))
+            results.update((key, value) for key, value in zip(pending, values) if value is not None)
+        return results
+
+    def clear(self):
+        """Forget remembered values"""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'requested': self.requested,
+            'cache_hits': self.cache_hits,
+            'shared': self.shared,
+            'batches': self.batches,
+            'failed': self.failed,
+            'max_batch': self.max_batch,
+            'cached': len(self._cache),
+        }
+
+
+class PaperHydrator:
+    """
+    Coalesced paper and citation-graph lookups over a set of AcademicSources.
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[AcademicSource],
+        delay: float = 0.02,
+        max_cached: int = 10000,
+        max_links: int = 100
+    ):
+        """
+        Initialize the hydrator.
+
+        Args:
+            sources: Clients to fetch through (one per source type)
+            delay: Batching window (seconds)
+            max_cached: Papers (and link lists) remembered per source
+            max_links: Max citations / references kept per paper
+        """
+        self.sources: Dict[SourceType, AcademicSource] = {s.source_type: s for s in sources}
+        self.max_links = max_links
+
+        self._papers: Dict[SourceType, BatchCoalescer[Paper]] = {}
+        self._links: Dict[Any, BatchCoalescer[List[str]]] = {}
+        for source_type, source in self.sources.items():
+            self._papers[source_type] = BatchCoalescer(source.fetch_many, source.MAX_BATCH, delay, max_cached)
+            for direction in DIRECTIONS:
+                # Graph lookups exist only for sources with batch link endpoints
+                lookup = getattr(source, f"get_{direction[:-1]}_ids", None)
+                if lookup is not None:
+                    self._links[source_type, direction] = BatchCoalescer(
+                        partial(lookup, limit=max_links), source.MAX_BATCH, delay, max_cached
+                    )
+
+    def _source_type(self, source: Any) -> SourceType:
+        source_type = SourceType(source) if isinstance(source, str) else source
+        if source_type not in self.sources:
+            raise ValueError(f"No {source_type.value} client registered")
+        return source_type
+
+    def _link_coalescer(self, source: Any, direction: str) -> BatchCoalescer[List[str]]:
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown direction {direction!r} (expected one of {DIRECTIONS})")
+        source_type = self._source_type(source)
+        coalescer = self._links.get((source_type, direction))
+        if coalescer is None:
+            raise ValueError(f"{source_type.value} has no batch {direction} lookup")
+        return coalescer
+
+    # -------------------------------------------------------------------------
+    # Papers
+    # -------------------------------------------------------------------------
+
+    async def fetch(self, source: Any, paper_id: str) -> Optional[Paper]:
+        """
+        Fetch one paper; concurrent calls are sent as one batch.
+
+        Args:
+            source: SourceType (or its value, e.g. "openalex")
+            paper_id: Identifier in any form the source's fetch accepts
+        """
+        return await self._papers[self._source_type(source)].get(paper_id)
+
+    async def fetch_many(self, source: Any, paper_ids: Iterable[str]) -> Dict[str, Paper]:
+        """
+        Fetch several papers.
+
+        Returns:
+            Requested ID -> Paper, for the papers found
+        """
+        return await self._papers[self._source_type(source)].get_many(paper_ids)
+
+    # -------------------------------------------------------------------------
+    # Citation graph
+    # -------------------------------------------------------------------------
+
+    async def link_ids(self, source: Any, paper_ids: Iterable[str], direction: str = 'references') -> Dict[str, List[str]]:
+        """
+        IDs of the papers each paper cites ('references') or is cited by ('citations').
+
+        Returns:
+            Requested ID -> linked paper IDs (at most max_links)
+        """
+        return await self._link_coalescer(source, direction).get_many(paper_ids)
+
+    async def expand(
+        self,
+        source: Any,
+        paper_ids: Iterable[str],
+        direction: str = 'references'
+    ) -> Dict[str, List[Paper]]:
+        """
+        Citing or cited papers of several papers, hydrated in batches.
+
+        Papers linked from several of them are fetched once.
+
+        Returns:
+            Requested ID -> linked papers
+        """
+        links = await self.link_ids(source, paper_ids, direction)
+        papers = await self.fetch_many(source, (i for ids in links.values() for i in ids))
+        return {pid: [papers[i] for i in ids if i in papers] for pid, ids in links.items()}
+
+    async def crawl(
+        self,
+        source: Any,
+        seed_ids: Iterable[str],
+        direction: str = 'references',
+        depth: int = 1,
+        max_papers: int = 500
+    ) -> AsyncIterator[List[Paper]]:
+        """
+        Breadth-first walk of the citation graph from seed papers.
+
+        Each level costs a handful of batch requests however wide it is.
+
+        Args:
+            source: SourceType (or its value)
+            seed_ids: Starting paper IDs (not yielded themselves)
+            direction: 'references' (older work) or 'citations' (newer work)
+            depth: Levels to walk
+            max_papers: Stop after this many papers
+
+        Yields:
+            The newly reached papers of each level
+        """
+        frontier = list(dict.fromkeys(seed_ids))
+        seen = set(frontier)
+        found = 0
+
+        for _ in range(depth):
+            if not frontier or found >= max_papers:
+                return
+            links = await self.link_ids(source, frontier, direction)
+
+            next_ids = []
+            for pid in frontier:
+                for linked in links.get(pid, []):
+                    if linked not in seen:
+                        seen.add(linked)
+                        next_ids.append(linked)
+            next_ids = next_ids[:max_papers - found]
+
+            papers = await self.fetch_many(source, next_ids)
+            level = [papers[pid] for pid in next_ids if pid in papers]
+            found += len(level)
+            logger.info(f"Citation crawl ({direction}): {len(level)} papers, {found} total")
+            if level:
+                yield level
+            frontier = [pid for pid in next_ids if pid in papers]
+
+    def clear(self):
+        """Forget remembered papers and links"""
+        for coalescer in list(self._papers.values()) + list(self._links.values()):
+            coalescer.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {t.value: c.stats() for t, c in self._papers.items()}
+        stats.update({f"{t.value}_{d}": c.stats() for (t, d), c in self._links.items()})
+        return stats
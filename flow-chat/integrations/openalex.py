@@ -7,8 +7,9 @@ No API key required. Very generous rate limits (10+ rps with polite email).
 """
 
 import logging
+import re
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
 
 from .base import AcademicSource, Paper, Author, SourceType
 
@@ -29,6 +30,15 @@ class OpenAlexClient(AcademicSource):
     All data is free and openly licensed (CC0).
     """
 
+    CACHE_TTLS = [
+        (r'/works/[^?]+$', 7 * 86400),    # single work records (incl. doi:...)
+        (r'/concepts/', 30 * 86400),      # concept metadata barely changes
+        (r'/works\?', 86400),             # searches, citation lists
+    ]
+
+    # Values per OR filter (ids.openalex:W1|W2|..., doi:...|..., cites:...|...)
+    MAX_BATCH = 50
+
     def __init__(
         self,
         email: str = "cipher@pwnd.icu",
@@ -115,7 +125,8 @@ class OpenAlexClient(AcademicSource):
                 'openalex_id': work.get('id'),
                 'type': work.get('type'),
                 'is_oa': oa_info.get('is_oa', False),
-                'cited_by_api_url': work.get('cited_by_api_url')
+                'cited_by_api_url': work.get('cited_by_api_url'),
+                'referenced_works': work.get('referenced_works', [])
             }
         )
 
@@ -241,6 +252,198 @@ class OpenAlexClient(AcademicSource):
             logger.error(f"OpenAlex fetch failed for {paper_id}: {e}")
             return None
 
+    @staticmethod
+    def _filter_key(paper_id: str) -> Optional[Tuple[str, str]]:
+        """(filter name, value) that selects a work by OpenAlex ID or DOI, or None"""
+        match = re.fullmatch(r'(?:https://openalex\.org/)?(W\d+)', paper_id.strip(), re.IGNORECASE)
+        if match:
+            return 'ids.openalex', match.group(1).upper()
+        doi = re.sub(r'^(https://doi\.org/|doi:)', '', paper_id.strip(), flags=re.IGNORECASE).lower()
+        if doi.startswith('10.') and not re.search(r'[|,]', doi):
+            return 'doi', doi
+        return None
+
+    @staticmethod
+    def _work_keys(work: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """The _filter_key values a work answers to"""
+        keys = [('ids.openalex', work.get('id', '').replace('https://openalex.org/', '').upper())]
+        if work.get('doi'):
+            keys.append(('doi', work['doi'].replace('https://doi.org/', '').lower()))
+        return keys
+
+    async def _filter_works(
+        self,
+        filter_name: str,
+        values: List[str],
+        select: Optional[str] = None,
+        max_results: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Works matching any of several values of a filter, MAX_BATCH values per request.
+
+        Args:
+            filter_name: OpenAlex filter (ids.openalex, doi, cites)
+            values: Filter values (OR-ed)
+            select: Comma-separated fields to return (None = full records)
+            max_results: Stop paging after this many works per batch (None = one per value)
+        """
+        url = f"{self.base_url}/works"
+        works = []
+        for i in range(0, len(values), self.MAX_BATCH):
+            batch = values[i:i + self.MAX_BATCH]
+            wanted = max_results or len(batch)
+            params = {
+                'filter': f"{filter_name}:{'|'.join(batch)}",
+                'per_page': min(wanted, 200),
+                'cursor': '*',
+                'mailto': self.email
+            }
+            if select:
+                params['select'] = select
+
+            fetched = 0
+            while params['cursor'] and fetched < wanted:
+                data = await self._get(url, params)
+                results = data.get('results', [])
+                works.extend(results)
+                fetched += len(results)
+                if len(results) < params['per_page']:
+                    break
+                params['cursor'] = data.get('meta', {}).get('next_cursor')
+        return works
+
+    async def fetch_many(self, paper_ids: List[str]) -> Dict[str, Paper]:
+        """
+        Fetch works by OpenAlex ID or DOI with OR filters (MAX_BATCH per request).
+
+        Other identifiers are fetched one by one.
+
+        Args:
+            paper_ids: OpenAlex IDs (W123 or https://openalex.org/W123) or DOIs
+
+        Returns:
+            Requested ID -> Paper, for the works found
+        """
+        wanted: Dict[Tuple[str, str], List[str]] = {}
+        others = []
+        for paper_id in dict.fromkeys(paper_ids):
+            key = self._filter_key(paper_id)
+            if key is None:
+                others.append(paper_id)
+            else:
+                wanted.setdefault(key, []).append(paper_id)
+
+        papers: Dict[str, Paper] = {}
+        for filter_name in ('ids.openalex', 'doi'):
+            values = [value for name, value in wanted if name == filter_name]
+            if not values:
+                continue
+            try:
+                works = await self._filter_works(filter_name, values)
+            except Exception as e:
+                logger.error(f"OpenAlex batch fetch failed: {e}")
+                continue
+            for work in works:
+                paper = self._parse_work(work)
+                for key in self._work_keys(work):
+                    for paper_id in wanted.get(key, []):
+                        papers[paper_id] = paper
+
+        if others:
+            papers.update(await super().fetch_many(others))
+        return papers
+
+    async def get_citation_ids(self, paper_ids: List[str], limit: int = 100) -> Dict[str, List[str]]:
+        """
+        IDs of the works citing each of several works (cites: OR filter).
+
+        A batch's paging budget (limit per work) is shared by all its works;
+        when it runs out, the works left with fewer than `limit` citing works
+        are paged again on their own.
+
+        Args:
+            paper_ids: OpenAlex IDs
+            limit: Max citing works per work
+
+        Returns:
+            Requested ID -> OpenAlex IDs of citing works
+        """
+        wanted: Dict[str, List[str]] = {}
+        for paper_id in paper_ids:
+            key = self._filter_key(paper_id)
+            if key and key[0] == 'ids.openalex':
+                wanted.setdefault(key[1], []).append(paper_id)
+        if not wanted:
+            return {}
+
+        links: Dict[str, List[str]] = {paper_id: [] for ids in wanted.values() for paper_id in ids}
+        linked: Dict[str, Set[str]] = {paper_id: set() for paper_id in links}
+
+        def collect(works: List[Dict[str, Any]]):
+            for work in works:
+                citing_id = work.get('id', '').replace('https://openalex.org/', '')
+                for ref in work.get('referenced_works') or []:
+                    for paper_id in wanted.get(ref.replace('https://openalex.org/', '').upper(), []):
+                        if len(links[paper_id]) < limit and citing_id not in linked[paper_id]:
+                            linked[paper_id].add(citing_id)
+                            links[paper_id].append(citing_id)
+
+        values = list(wanted)
+        for i in range(0, len(values), self.MAX_BATCH):
+            batch = values[i:i + self.MAX_BATCH]
+            budget = limit * len(batch)
+            try:
+                works = await self._filter_works('cites', batch, select='id,referenced_works', max_results=budget)
+            except Exception as e:
+                logger.error(f"OpenAlex batch citations fetch failed: {e}")
+                continue
+            collect(works)
+            if len(works) < budget:
+                continue  # every citing work was listed
+
+            for value in batch:
+                if len(links[wanted[value][0]]) >= limit:
+                    continue
+                try:
+                    collect(await self._filter_works('cites', [value], select='id,referenced_works', max_results=limit))
+                except Exception as e:
+                    logger.error(f"OpenAlex citations fetch failed for {value}: {e}")
+        return links
+
+    async def get_reference_ids(self, paper_ids: List[str], limit: int = 100) -> Dict[str, List[str]]:
+        """
+        IDs of the works referenced by each of several works.
+
+        Args:
+            paper_ids: OpenAlex IDs or DOIs
+            limit: Max references per work
+
+        Returns:
+            Requested ID -> OpenAlex IDs of referenced works
+        """
+        wanted: Dict[Tuple[str, str], List[str]] = {}
+        for paper_id in paper_ids:
+            key = self._filter_key(paper_id)
+            if key:
+                wanted.setdefault(key, []).append(paper_id)
+
+        links: Dict[str, List[str]] = {}
+        for filter_name in ('ids.openalex', 'doi'):
+            values = [value for name, value in wanted if name == filter_name]
+            if not values:
+                continue
+            try:
+                works = await self._filter_works(filter_name, values, select='id,doi,referenced_works')
+            except Exception as e:
+                logger.error(f"OpenAlex batch references fetch failed: {e}")
+                continue
+            for work in works:
+                refs = [r.replace('https://openalex.org/', '') for r in work.get('referenced_works') or []]
+                for key in self._work_keys(work):
+                    for paper_id in wanted.get(key, []):
+                        links[paper_id] = refs[:limit]
+        return links
+
     async def get_citations(self, paper_id: str, limit: int = 100) -> List[Paper]:
         """
         Get papers that cite a given work.
@@ -287,14 +490,10 @@ class OpenAlexClient(AcademicSource):
         # OpenAlex includes referenced_works in the work object
         ref_ids = work.raw_metadata.get('referenced_works', [])
 
-        # Fetch each reference (batch if many)
-        papers = []
-        for ref_id in ref_ids[:limit]:
-            paper = await self.fetch(ref_id)
-            if paper:
-                papers.append(paper)
-
-        return papers
+        # Fetch the references in batches
+        ref_ids = ref_ids[:limit]
+        papers = await self.fetch_many(ref_ids)
+        return [papers[ref_id] for ref_id in ref_ids if ref_id in papers]
 
     async def search_by_concept(
         self,
@@ -31,6 +31,15 @@ class PubMedClient(AcademicSource):
     - With API key: 10 requests/second
     """
 
+    CACHE_TTLS = [
+        (r'/efetch\.fcgi', 30 * 86400),   # article records
+        (r'/elink\.fcgi', 7 * 86400),     # related articles
+        (r'/esearch\.fcgi', 6 * 3600),    # searches (new articles daily)
+    ]
+
+    # PMIDs per efetch request
+    MAX_BATCH = 200
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -275,8 +284,7 @@ class PubMedClient(AcademicSource):
         url = f"{self.base_url}/efetch.fcgi"
 
         try:
-            xml_response = await self._get_xml(url, params)
-            root = ET.fromstring(xml_response)
+            root = await self._get_xml(url, params)
 
             papers = []
             for article in root.findall('.//PubmedArticle'):
@@ -341,9 +349,9 @@ class PubMedClient(AcademicSource):
         if not pmids:
             return []
 
-        # Fetch details in batches of 200
+        # Fetch details in batches
         papers = []
-        batch_size = 200
+        batch_size = self.MAX_BATCH
 
         for i in range(0, len(pmids), batch_size):
             batch = pmids[i:i + batch_size]
@@ -372,6 +380,26 @@ class PubMedClient(AcademicSource):
         papers = await self._fetch_details([pmid])
         return papers[0] if papers else None
 
+    async def fetch_many(self, paper_ids: List[str]) -> Dict[str, Paper]:
+        """
+        Fetch papers by PMID, MAX_BATCH per efetch request.
+
+        Args:
+            paper_ids: PubMed IDs (e.g., "12345678" or "PMID:12345678")
+
+        Returns:
+            Requested ID -> Paper, for the papers found
+        """
+        clean_ids = {pid: pid.replace('PMID:', '').strip() for pid in paper_ids}
+        pmids = list(dict.fromkeys(clean_ids.values()))
+
+        by_pmid: Dict[str, Paper] = {}
+        for i in range(0, len(pmids), self.MAX_BATCH):
+            for paper in await self._fetch_details(pmids[i:i + self.MAX_BATCH]):
+                by_pmid[paper.raw_metadata.get('pmid')] = paper
+
+        return {pid: by_pmid[pmid] for pid, pmid in clean_ids.items() if pmid in by_pmid}
+
     async def search_by_mesh(
         self,
         mesh_term: str,
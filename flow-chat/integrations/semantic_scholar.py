@@ -30,6 +30,22 @@ class SemanticScholarClient(AcademicSource):
     - With API key: 1000+ requests/5 minutes
     """
 
+    CACHE_TTLS = [
+        (r'/paper/search\?', 86400),
+        (r'/(citations|references)\?', 86400),
+        (r'/paper/batch\?', 7 * 86400),
+        (r'/paper/[^/?]+\?', 7 * 86400),  # single paper records
+        (r'/author/', 7 * 86400),
+    ]
+
+    MAX_BATCH = 500
+
+    BATCH_FIELDS = [
+        'paperId', 'title', 'abstract', 'authors', 'year',
+        'publicationDate', 'venue', 'citationCount',
+        'fieldsOfStudy', 'url', 'externalIds'
+    ]
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -61,6 +77,17 @@ class SemanticScholarClient(AcademicSource):
             headers['x-api-key'] = self.api_key
         return headers
 
+    @staticmethod
+    def _clean_id(paper_id: str) -> str:
+        """Convert an identifier to the form the Graph API expects."""
+        if paper_id.startswith('S2:'):
+            return paper_id[3:]
+        if paper_id.startswith('DOI:'):
+            return paper_id
+        if paper_id.startswith('10.'):
+            return f"DOI:{paper_id}"
+        return paper_id  # arXiv:, PMID:, CorpusId: and bare S2 IDs
+
     def _parse_paper(self, paper_data: Dict[str, Any]) -> Paper:
         """Parse Semantic Scholar paper data into Paper object."""
 
@@ -205,17 +232,7 @@ class SemanticScholarClient(AcademicSource):
         Returns:
             Paper object or None
         """
-        # Parse ID format
-        if paper_id.startswith('S2:'):
-            paper_id = paper_id[3:]
-        elif paper_id.startswith('DOI:') or paper_id.startswith('10.'):
-            if paper_id.startswith('DOI:'):
-                paper_id = paper_id[4:]
-            paper_id = f"DOI:{paper_id}"
-        elif paper_id.startswith('arXiv:'):
-            pass  # Keep as-is
-        elif paper_id.startswith('PMID:'):
-            paper_id = f"PMID:{paper_id[5:]}"
+        paper_id = self._clean_id(paper_id)
 
         fields = [
             'paperId', 'title', 'abstract', 'authors', 'year',
@@ -373,12 +390,41 @@ class SemanticScholarClient(AcademicSource):
             logger.error(f"Semantic Scholar author papers fetch failed: {e}")
             return []
 
+    async def _batch(self, paper_ids: List[str], fields: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Look up papers through POST /paper/batch, MAX_BATCH IDs per request.
+
+        A failed request only loses its own IDs; if every request fails,
+        the error is raised.
+
+        Returns:
+            One record per ID, in order (None for unknown IDs and failed requests)
+        """
+        url = f"{self.base_url}/paper/batch"
+        params = {'fields': ','.join(fields)}
+
+        records = []
+        error = None
+        succeeded = 0
+        for i in range(0, len(paper_ids), self.MAX_BATCH):
+            batch = [self._clean_id(pid) for pid in paper_ids[i:i + self.MAX_BATCH]]
+            try:
+                records.extend(await self._post(url, params, {'ids': batch}))
+                succeeded += 1
+            except Exception as e:
+                logger.error(f"Semantic Scholar batch of {len(batch)} IDs failed: {e}")
+                records.extend([None] * len(batch))
+                error = e
+        if error is not None and not succeeded:
+            raise error
+        return records
+
     async def batch_fetch(self, paper_ids: List[str]) -> List[Paper]:
         """
-        Fetch multiple papers in a single request.
+        Fetch multiple papers in as few requests as possible.
 
         Args:
-            paper_ids: List of paper IDs (max 500)
+            paper_ids: List of paper IDs (sent MAX_BATCH per request)
 
         Returns:
             List of Paper objects
@@ -386,44 +432,82 @@ class SemanticScholarClient(AcademicSource):
         if not paper_ids:
             return []
 
-        # Clean IDs
-        clean_ids = []
-        for pid in paper_ids[:500]:
-            if pid.startswith('S2:'):
-                clean_ids.append(pid[3:])
-            else:
-                clean_ids.append(pid)
+        try:
+            records = await self._batch(paper_ids, self.BATCH_FIELDS)
+            return [self._parse_paper(p) for p in records if p is not None]
 
-        fields = [
-            'paperId', 'title', 'abstract', 'authors', 'year',
-            'publicationDate', 'venue', 'citationCount',
-            'fieldsOfStudy', 'url', 'externalIds'
-        ]
+        except Exception as e:
+            logger.error(f"Semantic Scholar batch fetch failed: {e}")
+            return []
 
-        url = f"{self.base_url}/paper/batch"
-        params = {'fields': ','.join(fields)}
+    async def fetch_many(self, paper_ids: List[str]) -> Dict[str, Paper]:
+        """
+        Fetch papers by ID through the batch endpoint.
 
-        # POST request for batch
-        await self.rate_limiter.acquire()
-        session = await self.get_session()
+        Args:
+            paper_ids: Paper IDs (any format accepted by fetch)
 
-        try:
-            async with session.post(
-                url,
-                params=params,
-                json={'ids': clean_ids}
-            ) as response:
-                response.raise_for_status()
-                papers_data = await response.json()
-
-            return [
-                self._parse_paper(p) for p in papers_data
-                if p is not None
-            ]
+        Returns:
+            Requested ID -> Paper, for the papers found
+        """
+        if not paper_ids:
+            return {}
 
+        try:
+            records = await self._batch(paper_ids, self.BATCH_FIELDS)
         except Exception as e:
             logger.error(f"Semantic Scholar batch fetch failed: {e}")
-            return []
+            return {}
+
+        return {
+            pid: self._parse_paper(record)
+            for pid, record in zip(paper_ids, records)
+            if record is not None
+        }
+
+    async def _link_ids(self, paper_ids: List[str], relation: str, limit: int) -> Dict[str, List[str]]:
+        """IDs of the citing or cited papers of many papers, via nested batch fields."""
+        if not paper_ids:
+            return {}
+
+        try:
+            records = await self._batch(paper_ids, [f'{relation}.paperId'])
+        except Exception as e:
+            logger.error(f"Semantic Scholar batch {relation} fetch failed: {e}")
+            return {}
+
+        links = {}
+        for pid, record in zip(paper_ids, records):
+            if record is not None:
+                linked = record.get(relation) or []
+                links[pid] = [p['paperId'] for p in linked if p.get('paperId')][:limit]
+        return links
+
+    async def get_citation_ids(self, paper_ids: List[str], limit: int = 100) -> Dict[str, List[str]]:
+        """
+        IDs of the papers citing each of several papers (one request per MAX_BATCH).
+
+        Args:
+            paper_ids: Paper IDs
+            limit: Max citing papers per paper
+
+        Returns:
+            Requested ID -> S2 paper IDs
+        """
+        return await self._link_ids(paper_ids, 'citations', limit)
+
+    async def get_reference_ids(self, paper_ids: List[str], limit: int = 100) -> Dict[str, List[str]]:
+        """
+        IDs of the papers referenced by each of several papers (one request per MAX_BATCH).
+
+        Args:
+            paper_ids: Paper IDs
+            limit: Max references per paper
+
+        Returns:
+            Requested ID -> S2 paper IDs
+        """
+        return await self._link_ids(paper_ids, 'references', limit)
 
     async def recommendations(
         self,
@@ -469,13 +553,8 @@ class SemanticScholarClient(AcademicSource):
 
         params = {'fields': ','.join(fields)}
 
-        await self.rate_limiter.acquire()
-        session = await self.get_session()
-
         try:
-            async with session.post(url, params=params, json=body) as response:
-                response.raise_for_status()
-                data = await response.json()
+            data = await self._post(url, params, body)
 
             papers_data = data.get('recommendedPapers', [])
             return [self._parse_paper(p) for p in papers_data]
@@ -0,0 +1,15 @@
+-- ============================================================================
+-- CIPHER Migration: Incremental Graph Sync
+-- Version: 003
+-- Date: 2026-10-18
+-- Description: Index the high-water mark columns read by GraphEngine.sync_graph()
+-- ============================================================================
+
+-- Claims touched since the last sync (new claims also set updated_at)
+CREATE INDEX IF NOT EXISTS idx_claims_updated_at ON synthesis.claims(updated_at);
+
+-- New connections are read by id range (primary key), no index needed
+
+-- ============================================================================
+-- Migration complete
+-- ============================================================================
@@ -0,0 +1,43 @@
+-- ============================================================================
+-- CIPHER Migration: Incremental Confidence Decay
+-- Version: 004
+-- Date: 2026-10-18
+-- Description: Track when each claim's decayed confidence next changes, so
+--              TemporalTracker.decay_all_claims(incremental=True) only
+--              revisits claims that are due
+-- ============================================================================
+
+ALTER TABLE synthesis.claims
+    ADD COLUMN IF NOT EXISTS decay_due_at TIMESTAMP;
+
+CREATE INDEX IF NOT EXISTS idx_claims_decay_due ON synthesis.claims(decay_due_at);
+
+-- Any other write to a decay input makes the claim due again
+CREATE OR REPLACE FUNCTION synthesis.reset_decay_due()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.decay_due_at IS NOT DISTINCT FROM OLD.decay_due_at AND (
+        NEW.confidence IS DISTINCT FROM OLD.confidence
+        OR NEW.current_confidence IS DISTINCT FROM OLD.current_confidence
+        OR NEW.claim_type IS DISTINCT FROM OLD.claim_type
+        OR NEW.evidence_strength IS DISTINCT FROM OLD.evidence_strength
+        OR NEW.domains IS DISTINCT FROM OLD.domains
+        OR NEW.created_at IS DISTINCT FROM OLD.created_at
+        OR NEW.status IS DISTINCT FROM OLD.status
+    ) THEN
+        NEW.decay_due_at := NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_claims_reset_decay_due ON synthesis.claims;
+CREATE TRIGGER trg_claims_reset_decay_due
+    BEFORE UPDATE ON synthesis.claims
+    FOR EACH ROW EXECUTE FUNCTION synthesis.reset_decay_due();
+
+COMMENT ON COLUMN synthesis.claims.decay_due_at IS 'When temporal decay next moves current_confidence (NULL = recompute)';
+
+-- ============================================================================
+-- Migration complete
+-- ============================================================================
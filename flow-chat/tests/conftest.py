@@ -0,0 +1,5 @@
+"""Test setup: import tools/ and integrations/ from the flow-chat tree"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
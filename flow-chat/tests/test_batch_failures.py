@@ -0,0 +1,91 @@
+"""Batch lookups: one failing ID or chunk must not lose the others"""
+import asyncio
+
+import pytest
+
+import integrations.base
+from integrations.base import AcademicSource, SourceType
+from integrations.hydrator import BatchCoalescer
+from integrations.openalex import OpenAlexClient
+from integrations.semantic_scholar import SemanticScholarClient
+
+
+@pytest.fixture(autouse=True)
+def no_http_cache(monkeypatch):
+    monkeypatch.setattr(integrations.base, 'get_http_cache', lambda: None)
+
+
+def test_coalescer_isolates_failing_key():
+    calls = []
+
+    async def fetch_batch(keys):
+        calls.append(list(keys))
+        if 'bad' in keys:
+            raise RuntimeError("server rejected the batch")
+        return {key: key.upper() for key in keys}
+
+    async def main():
+        coalescer = BatchCoalescer(fetch_batch, max_batch=10, delay=0.01)
+        results = await asyncio.gather(*(coalescer.get(k) for k in ('a', 'bad', 'c')))
+        return coalescer, results
+
+    coalescer, results = asyncio.run(main())
+    assert results == ['A', None, 'C']
+    assert calls[0] == ['a', 'bad', 'c']
+    assert sorted(map(tuple, calls[1:])) == [('a',), ('bad',), ('c',)]
+    assert coalescer.stats()['failed'] == 1
+
+
+class OneByOne(AcademicSource):
+    source_type = SourceType.ARXIV
+
+    async def search(self, query, limit=100, offset=0, **kwargs):
+        return []
+
+    async def fetch(self, paper_id):
+        if paper_id == 'bad':
+            raise RuntimeError("parse error")
+        return paper_id.upper()
+
+
+def test_default_fetch_many_isolates_failures():
+    source = OneByOne("https://example.org", use_cache=False)
+    assert asyncio.run(source.fetch_many(['a', 'bad', 'c'])) == {'a': 'A', 'c': 'C'}
+
+
+def test_semantic_scholar_keeps_successful_chunks():
+    client = SemanticScholarClient()
+    client.MAX_BATCH = 2
+
+    async def post(url, params, body):
+        if 'BAD' in body['ids']:
+            raise RuntimeError("HTTP 500")
+        return [{'paperId': pid} for pid in body['ids']]
+
+    client._post = post
+    records = asyncio.run(client._batch(['A', 'B', 'BAD', 'C', 'D'], ['paperId']))
+    assert [r and r['paperId'] for r in records] == ['A', 'B', None, None, 'D']
+
+
+def test_openalex_citations_budget_is_per_work():
+    client = OpenAlexClient()
+    limit = 3
+    # W1 is cited 10 times, W2 twice; the batched query's budget (limit x 2)
+    # is used up by W1's citing works
+    citing = {'W1': [f'W1{i:02d}' for i in range(10)], 'W2': ['W201', 'W202']}
+    order = citing['W1'] + citing['W2']
+    calls = []
+
+    async def filter_works(filter_name, values, select=None, max_results=None):
+        calls.append(list(values))
+        ids = [w for w in order if any(w in citing[v] for v in values)][:max_results]
+        return [{'id': f'https://openalex.org/{w}',
+                 'referenced_works': [f'https://openalex.org/{v}' for v in citing if w in citing[v]]}
+                for w in ids]
+
+    client._filter_works = filter_works
+    links = asyncio.run(client.get_citation_ids(['W1', 'W2'], limit=limit))
+    assert links['W1'] == citing['W1'][:limit]
+    assert links['W2'] == citing['W2']
+    # W1 already has its limit; only W2 was paged again
+    assert calls == [['W1', 'W2'], ['W2']]
@@ -0,0 +1,75 @@
+"""pgvector ANN path: permanent vs temporary fallback to the local index"""
+import asyncio
+from contextlib import asynccontextmanager
+
+import asyncpg
+import pytest
+
+from tools.cipher_brain import CipherBrain
+
+
+class FakeConn:
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, sql):
+        pass
+
+    async def fetch(self, sql, *params):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class FakePool:
+    def __init__(self, outcomes):
+        self.conn = FakeConn(outcomes)
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+def make_brain(outcomes) -> CipherBrain:
+    brain = CipherBrain.__new__(CipherBrain)
+    brain.pool = FakePool(outcomes)
+    brain._pgvector_ann = True
+    brain._pgvector_retry_at = 0.0
+    return brain
+
+
+def query(brain):
+    return asyncio.run(brain._ann_query("SELECT 1"))
+
+
+def test_missing_extension_disables_for_good():
+    brain = make_brain([asyncpg.UndefinedFunctionError("operator does not exist: vector <=> vector"), [1]])
+    assert query(brain) is None
+    assert brain._pgvector_ann is False
+    assert query(brain) is None
+    assert brain.pool.conn.outcomes == [[1]]  # never asked again
+
+
+def test_transient_error_backs_off():
+    brain = make_brain([asyncpg.QueryCanceledError("statement timeout"), ["row"]])
+    assert query(brain) is None
+    assert brain._pgvector_ann is True
+    # Still inside the back-off window: local index
+    assert query(brain) is None
+    assert brain.pool.conn.outcomes == [["row"]]
+
+    brain._pgvector_retry_at = 0.0
+    assert query(brain) == ["row"]
+
+
+@pytest.mark.parametrize("error", [asyncpg.UndefinedObjectError("type vector does not exist"),
+                                   asyncpg.UndefinedColumnError("column embedding does not exist")])
+def test_schema_errors_are_permanent(error):
+    brain = make_brain([error])
+    assert query(brain) is None
+    assert brain._pgvector_ann is False
@@ -0,0 +1,72 @@
+"""CipherBrain._refresh_claim_index: single build, out-of-order top-up"""
+import asyncio
+
+from tools.cipher_brain import CipherBrain, Claim, Domain
+
+
+def claim(text):
+    return Claim(text=text, claim_type='finding', confidence=0.8,
+                 evidence_strength='moderate', domains=[Domain.NEUROSCIENCES])
+
+
+class FakeClaims:
+    """synthesis.claims as a dict, answering _get_recent_claims"""
+
+    def __init__(self, ids):
+        self.rows = {i: claim(f"claim {i}") for i in ids}
+        self.calls = []
+
+    async def __call__(self, limit=1000, after_id=0):
+        self.calls.append(after_id)
+        await asyncio.sleep(0)  # let a concurrent refresh run meanwhile
+        return [(i, self.rows[i]) for i in sorted(self.rows, reverse=True) if i > after_id][:limit]
+
+
+def make_brain(ids):
+    brain = CipherBrain.__new__(CipherBrain)
+    brain.claim_index = None
+    brain._claim_index_lock = asyncio.Lock()
+    brain._get_recent_claims = FakeClaims(ids)
+    return brain
+
+
+def test_concurrent_refreshes_build_once():
+    brain = make_brain([1, 2, 3])
+
+    async def both():
+        return await asyncio.gather(brain._refresh_claim_index(limit=10),
+                                    brain._refresh_claim_index(limit=10))
+
+    first, second = asyncio.run(both())
+    assert first is second is brain.claim_index
+    assert len(first) == 3
+    # One full load, then a top-up against it
+    assert brain._get_recent_claims.calls[0] == 0
+    assert len(brain._get_recent_claims.calls) == 2
+
+
+def test_top_up_picks_up_late_commit_below_max_id():
+    brain = make_brain([1, 2, 3])
+    index = asyncio.run(brain._refresh_claim_index(limit=10))
+
+    # Claim 5 is saved locally; claim 4 (another worker) commits afterwards
+    rows = brain._get_recent_claims.rows
+    rows[5] = claim("claim 5")
+    index.add(5, rows[5])
+    rows[4] = claim("claim 4")
+
+    asyncio.run(brain._refresh_claim_index(limit=10))
+    assert 4 in index
+    assert len(index) == 5
+    assert index.max_id == 5
+
+
+def test_top_up_skips_indexed_claims():
+    brain = make_brain(range(1, 6))
+    index = asyncio.run(brain._refresh_claim_index(limit=10))
+    before = index.recent(5)
+
+    asyncio.run(brain._refresh_claim_index(limit=10))
+    # Rescanned ids are not re-added (which would reorder the window)
+    assert index.recent(5) == before
+    assert brain._get_recent_claims.calls[-1] == max(5 - CipherBrain.CLAIM_INDEX_RESCAN, 0)
@@ -0,0 +1,85 @@
+"""Embedding cache: disk store appends, clears shared with other processes"""
+import asyncio
+
+import numpy as np
+import pytest
+
+from tools.embedding_cache import DiskVectorStore, EmbeddingCache
+
+
+def vec(*values):
+    return np.asarray(values, dtype=np.float32)
+
+
+def test_put_get_roundtrip(tmp_path):
+    store = DiskVectorStore(tmp_path)
+    store.put_many({'a': vec(1, 2, 3), 'b': vec(4, 5, 6)})
+    store.put_many({'a': vec(9, 9, 9), 'c': vec(7, 8, 9)})  # 'a' is kept, not appended again
+    got = store.get_many(['a', 'b', 'c', 'missing'])
+    assert sorted(got) == ['a', 'b', 'c']
+    assert got['a'].tolist() == [1, 2, 3]
+    assert got['c'].tolist() == [7, 8, 9]
+    assert len(store) == 3
+    assert (tmp_path / 'vectors.f32').stat().st_size == 3 * 3 * 4
+
+
+def test_dimension_mismatch_rejected(tmp_path):
+    store = DiskVectorStore(tmp_path)
+    store.put_many({'a': vec(1, 2, 3)})
+    with pytest.raises(ValueError):
+        store.put_many({'b': vec(1, 2)})
+
+
+def test_partial_append_is_realigned(tmp_path):
+    store = DiskVectorStore(tmp_path)
+    store.put_many({'a': vec(1, 2, 3)})
+    # A crashed append left half a row behind, with no index row for it
+    with open(tmp_path / 'vectors.f32', 'ab') as f:
+        f.write(b'\x00' * 6)
+    store.put_many({'b': vec(4, 5, 6)})
+    got = store.get_many(['a', 'b'])
+    assert got['a'].tolist() == [1, 2, 3]
+    assert got['b'].tolist() == [4, 5, 6]
+
+
+def test_clear_in_another_process(tmp_path):
+    reader = DiskVectorStore(tmp_path)
+    writer = DiskVectorStore(tmp_path)
+    writer.put_many({'a': vec(1, 2, 3)})
+    old = reader.get_many(['a'])['a']
+
+    # The other process starts over with a different model width
+    writer.clear()
+    writer.put_many({'b': vec(1, 2, 3, 4, 5)})
+
+    assert old.tolist() == [1, 2, 3]  # copies taken before the clear are untouched
+    assert reader.get_many(['a']) == {}
+    assert reader.get_many(['b'])['b'].tolist() == [1, 2, 3, 4, 5]
+    assert reader.dimensions == 5
+
+    # Its own appends follow the new width too
+    reader.put_many({'c': vec(5, 4, 3, 2, 1)})
+    assert writer.get_many(['c'])['c'].tolist() == [5, 4, 3, 2, 1]
+
+
+def test_reader_misses_while_index_names_another_file(tmp_path):
+    store = DiskVectorStore(tmp_path)
+    store.put_many({'a': vec(1, 2, 3)})
+    store._db.execute("UPDATE meta SET value = 'other' WHERE name = 'file'")
+    store._db.commit()
+    assert store.get_many(['a']) == {}
+
+
+def test_cache_async_paths(tmp_path):
+    async def run():
+        cache = EmbeddingCache('test-model', directory=tmp_path)
+        assert await cache.aget_many(['x']) == [None]
+        await cache.aput_many(['x', 'y'], [[1.0, 2.0], [3.0, 4.0]])
+        assert await cache.aget_many(['x', 'y']) == [[1.0, 2.0], [3.0, 4.0]]
+
+        # A fresh process finds the vectors on disk
+        other = EmbeddingCache('test-model', directory=tmp_path)
+        assert await other.aget_many(['y']) == [[3.0, 4.0]]
+        assert other.disk_hits == 1
+
+    asyncio.run(run())
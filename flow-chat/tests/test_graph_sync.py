@@ -0,0 +1,141 @@
+"""GraphEngine.sync_graph: rescan windows, dedupe, reloads"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from tools.graph_engine import GraphEngine
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class FakeConn:
+    """Committed synthesis.claims / synthesis.connections rows, queried the way GraphEngine does"""
+
+    def __init__(self):
+        self.claims = {}
+        self.connections = {}
+
+    def claim(self, claim_id, text=None, confidence=0.8, updated_at=T0):
+        self.claims[claim_id] = {
+            'id': claim_id, 'claim_text': text or f"claim {claim_id}", 'claim_type': 'finding',
+            'domains': [1], 'confidence': confidence, 'updated_at': updated_at,
+        }
+
+    def connect(self, connection_id, source, target):
+        self.connections[connection_id] = {
+            'id': connection_id, 'source_claim_id': source, 'target_claim_id': target,
+            'connection_type': 'supports', 'strength': 0.7, 'cross_domain': False, 'reasoning': None,
+        }
+
+    async def fetchrow(self, sql, *args):
+        return {
+            'claim_mark': max(self.claims, default=0),
+            'claim_updated_mark': max((c['updated_at'] for c in self.claims.values()), default=datetime(1970, 1, 1)),
+            'connection_mark': max(self.connections, default=0),
+        }
+
+    async def fetch(self, sql, *args):
+        if 'FROM synthesis.claims' in sql:
+            if 'updated_at >=' in sql:
+                after_id, since = args
+                rows = [c for c in self.claims.values() if c['id'] > after_id or c['updated_at'] >= since]
+            else:
+                rows = [c for c in self.claims.values() if c['confidence'] >= args[0]]
+        elif 'ANY($2' in sql:
+            after_id, revived = args
+            rows = [c for c in self.connections.values() if c['id'] > after_id
+                    or c['source_claim_id'] in revived or c['target_claim_id'] in revived]
+        else:
+            rows = [c for c in self.connections.values() if c['id'] <= args[0]]
+        return sorted(rows, key=lambda r: r['id'])
+
+
+@pytest.fixture
+def db():
+    conn = FakeConn()
+    for i in (1, 2, 3):
+        conn.claim(i)
+    conn.connect(10, 1, 2)
+    conn.connect(12, 2, 3)
+    return conn
+
+
+def engine_for(db, min_confidence=0.0):
+    engine = GraphEngine("postgresql://unused")
+    engine._conn = db
+    asyncio.run(engine.load_graph(min_confidence))
+    return engine
+
+
+def sync(engine):
+    return asyncio.run(engine.sync_graph())
+
+
+def test_no_change_sync_is_a_noop(db):
+    engine = engine_for(db)
+    version = engine._version
+    assert sync(engine) == {'nodes_added': 0, 'nodes_updated': 0, 'edges_added': 0, 'reloaded': False}
+    assert engine._version == version  # path cache kept
+
+
+def test_late_commits_are_picked_up_once(db):
+    engine = engine_for(db)
+
+    # Connection 11 and claim 4 commit after 12 / a later updated_at were seen
+    db.claim(4, updated_at=T0 - timedelta(minutes=1))
+    db.connect(11, 3, 1)
+    db.connect(13, 4, 1)
+    assert sync(engine) == {'nodes_added': 1, 'nodes_updated': 0, 'edges_added': 2, 'reloaded': False}
+    assert engine.edge_count == 4
+    assert engine._nodes[1].in_degree == 2
+
+    assert sync(engine)['edges_added'] == 0
+    assert engine.edge_count == 4
+
+
+def test_updates_counted_only_when_changed(db):
+    engine = engine_for(db)
+    db.claim(2, text="revised", updated_at=T0 + timedelta(seconds=1))
+    version = engine._version
+    assert sync(engine)['nodes_updated'] == 1
+    assert engine._nodes[2].claim_text == "revised"
+    assert engine._version == version + 1
+
+    # Re-read from the lag window, unchanged
+    assert sync(engine)['nodes_updated'] == 0
+    assert engine._version == version + 1
+
+
+def test_dangling_connection_retried_and_mark_not_advanced(db):
+    engine = engine_for(db, min_confidence=0.5)
+    db.claim(5, confidence=0.1)
+    db.connect(20, 1, 5)
+    assert sync(engine)['edges_added'] == 0
+    assert engine._connection_mark == 12
+
+    # The claim gains confidence: it is revived with its connection
+    db.claim(5, confidence=0.9, updated_at=T0 + timedelta(seconds=5))
+    assert sync(engine) == {'nodes_added': 1, 'nodes_updated': 0, 'edges_added': 1, 'reloaded': False}
+    assert engine._connection_mark == 20
+
+
+def test_confidence_drop_reloads_with_full_counts(db):
+    engine = engine_for(db, min_confidence=0.5)
+    db.claim(3, confidence=0.1, updated_at=T0 + timedelta(seconds=1))
+    result = sync(engine)
+    assert result == {'nodes_added': 2, 'nodes_updated': 0, 'edges_added': 1, 'reloaded': True}
+    assert 3 not in engine._nodes
+
+
+def test_periodic_full_reload(db, monkeypatch):
+    engine = engine_for(db)
+    # A connection older than the rescan window that committed very late
+    monkeypatch.setattr(GraphEngine, 'SYNC_CONNECTION_WINDOW', 0)
+    db.connect(5, 3, 2)
+    assert sync(engine)['edges_added'] == 0
+
+    engine._loaded_at -= GraphEngine.FULL_RELOAD_INTERVAL
+    result = sync(engine)
+    assert result['reloaded'] is True
+    assert engine.edge_count == 3
@@ -0,0 +1,115 @@
+"""HTTP response cache and the AcademicSource request path through it"""
+import asyncio
+import os
+
+import aiohttp
+import pytest
+
+from integrations.base import AcademicSource, InvalidResponse, SourceType
+from integrations.http_cache import CacheMiss, HTTPCache
+
+
+class FakeSource(AcademicSource):
+    """AcademicSource whose _send replays canned (status, body, headers)"""
+
+    source_type = SourceType.OPENALEX
+
+    def __init__(self, cache, responses):
+        super().__init__("https://api.example.org", requests_per_second=1000, use_cache=False)
+        self.http_cache = cache
+        self.responses = list(responses)
+        self.sent = 0
+
+    async def _send(self, method, url, params, json_body, headers, may_retry):
+        self.sent += 1
+        status, body, response_headers = self.responses.pop(0)
+        return status, body, response_headers, None
+
+    async def search(self, query, limit=100, offset=0, **kwargs):
+        return []
+
+    async def fetch(self, paper_id):
+        return None
+
+
+def get(source, url="https://api.example.org/works"):
+    return asyncio.run(source._get(url, {'q': 'x'}))
+
+
+def test_valid_body_is_cached(tmp_path):
+    cache = HTTPCache(tmp_path, mode='normal')
+    source = FakeSource(cache, [(200, b'{"results": [1]}', {})])
+    assert get(source) == {"results": [1]}
+    assert get(source) == {"results": [1]}
+    assert source.sent == 1
+    assert cache.stats()['hits'] == 1
+
+
+def test_invalid_body_raises_client_error_and_is_not_cached(tmp_path):
+    cache = HTTPCache(tmp_path, mode='normal')
+    source = FakeSource(cache, [(200, b'<html>Service busy</html>', {}),
+                                (200, b'{"results": []}', {})])
+    with pytest.raises(aiohttp.ClientError) as excinfo:
+        get(source)
+    assert isinstance(excinfo.value, InvalidResponse)
+    assert cache.stats()['entries'] == 0
+
+    # The next call goes back to the network
+    assert get(source) == {"results": []}
+    assert source.sent == 2
+
+
+def test_invalid_xml_is_not_cached(tmp_path):
+    cache = HTTPCache(tmp_path, mode='normal')
+    source = FakeSource(cache, [(200, b'<feed><entry>', {}), (200, b'<feed><entry/></feed>', {})])
+    with pytest.raises(InvalidResponse):
+        asyncio.run(source._get_xml("https://api.example.org/query"))
+    root = asyncio.run(source._get_xml("https://api.example.org/query"))
+    assert root.tag == 'feed'
+    assert cache.stats()['entries'] == 1
+
+
+def test_offline_miss(tmp_path):
+    source = FakeSource(HTTPCache(tmp_path, mode='offline'), [])
+    with pytest.raises(CacheMiss):
+        get(source)
+    assert source.sent == 0
+
+
+def test_running_byte_count_matches_index(tmp_path):
+    cache = HTTPCache(tmp_path, max_bytes=10**6, mode='normal')
+    for i in range(20):
+        body = bytes(range(256)) * (i + 1)
+        cache.store(cache.key(f"GET /{i}"), f"GET /{i}", body, {}, ttl=60)
+    # Same body under a second key is stored (and counted) once
+    cache.store(cache.key("GET /dup"), "GET /dup", bytes(range(256)), {}, ttl=60)
+    assert cache._bytes == cache._total_bytes()
+
+    cache.store(cache.key("GET /0"), "GET /0", b"replaced", {}, ttl=60)
+    assert cache._bytes == cache._total_bytes()
+
+
+def test_eviction_keeps_budget(tmp_path):
+    cache = HTTPCache(tmp_path, max_bytes=4096, mode='normal')
+    for i in range(50):
+        body = os.urandom(1000)  # incompressible
+        cache.store(cache.key(f"GET /{i}"), f"GET /{i}", body, {}, ttl=60)
+        assert cache._bytes <= cache.max_bytes
+        assert cache._bytes == cache._total_bytes()
+    assert cache.evictions > 0
+    # The most recent entry survives
+    assert cache.lookup(cache.key("GET /49")) is not None
+
+
+def test_store_from_worker_threads(tmp_path):
+    cache = HTTPCache(tmp_path, mode='normal')
+
+    async def main():
+        await asyncio.gather(*(
+            asyncio.to_thread(cache.store, cache.key(f"GET /{i}"), f"GET /{i}", f"{i}".encode(), {}, 60)
+            for i in range(32)
+        ))
+        return await asyncio.to_thread(cache.lookup, cache.key("GET /7"))
+
+    assert asyncio.run(main()).body == b"7"
+    assert cache.stats()['entries'] == 32
@@ -0,0 +1,100 @@
+"""corps/integrite.py: stat cache, racy window and full verification"""
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+# Importing the corps package pulls in every organe; load the module alone
+_spec = importlib.util.spec_from_file_location(
+    "integrite_under_test", Path(__file__).resolve().parents[1] / "corps" / "integrite.py"
+)
+integrite_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(integrite_mod)
+
+
+@pytest.fixture
+def organe(tmp_path, monkeypatch):
+    monkeypatch.setattr(integrite_mod.Integrite, "FLOW_HOME", str(tmp_path))
+    monkeypatch.setattr(integrite_mod.Integrite, "STATE_FILE", str(tmp_path / "adn" / "integrite.json"))
+    monkeypatch.setattr(integrite_mod.Integrite, "CACHE_FILE", str(tmp_path / "adn" / "integrite_cache.json"))
+    monkeypatch.setattr(integrite_mod.Integrite, "ORGANES", ["corps"])
+    root = tmp_path / "corps"
+    root.mkdir()
+    for name in ("a.py", "b.py", "c.py"):
+        (root / name).write_text(f"# {name}\n")
+    return root
+
+
+def make(racy_window_ns=0, full_every=1000):
+    integ = integrite_mod.Integrite()
+    integ.RACY_WINDOW_NS = racy_window_ns
+    integ.FULL_VERIFY_EVERY = full_every
+    return integ
+
+
+def test_unchanged_files_come_from_the_cache(organe):
+    integ = make()
+    first = integ.scan()
+    assert integ.last_rehashed == 3
+
+    assert integ.scan() == first
+    assert integ.last_rehashed == 0
+
+    (organe / "b.py").write_text("# b.py changed\n")
+    second = integ.scan()
+    assert integ.last_rehashed == 1
+    assert second["corps/b.py"] == integrite_mod.hash_file(str(organe / "b.py"))
+
+    # A new instance reads the persisted cache
+    assert make().scan() == second
+
+
+def test_recently_modified_files_are_not_cached(organe):
+    integ = make(racy_window_ns=60 * 10**9)
+    integ.scan()
+    assert integ._stat_cache == {}
+    integ.scan()
+    assert integ.last_rehashed == 3
+
+
+def test_same_stat_rewrite_is_caught_by_full_scan(organe):
+    integ = make(full_every=2)
+    integ.scan()
+    integ.commit_baseline()
+
+    # Same size, mtime restored: only ctime moves, so forge the cache entry
+    # to match (as an attacker with write access to adn/ could)
+    path = organe / "a.py"
+    st = path.stat()
+    path.write_text("# a.pz\n")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    st = path.stat()
+    integ._stat_cache["corps/a.py"][:4] = [st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns]
+
+    assert integ.verify(full=False) == (1.0, [])  # current scan still trusted
+    integ.scan()
+    assert integ.last_rehashed == 0
+    assert integ.verify()[0] == 1.0  # the forged entry hides the change
+
+    # Second incremental scan since the last full one: the next scan is full
+    integ.scan()
+    assert integ.last_rehashed == 3
+    assert integ.cache_mismatches == 1
+    score, anomalies = integ.verify()
+    assert [a["type"] for a in anomalies] == ["modified"]
+    assert integ.last_full_scan is not None
+
+
+def test_verify_full_rereads_everything(organe):
+    integ = make()
+    integ.scan()
+    integ.commit_baseline()
+    integ._stat_cache["corps/c.py"][4] = "0" * 128  # poisoned cache
+
+    integ.scan()
+    assert integ.current["corps/c.py"] == "0" * 128
+    score, anomalies = integ.verify(full=True)
+    assert score == 1.0 and anomalies == []
+    assert integ.last_rehashed == 3
+    assert integ._stat_cache["corps/c.py"][4] == integ.baseline["corps/c.py"]
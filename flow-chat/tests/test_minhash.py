@@ -0,0 +1,61 @@
+"""MinHash / LSH near-duplicate detection"""
+from tools.hash_learning import HashLearning
+from tools.minhash import LSHIndex, MinHasher
+
+ABSTRACT = ("We show that sparse coding in the primary visual cortex yields receptive "
+            "fields resembling Gabor filters, and that the learned dictionary predicts "
+            "neural responses to natural images better than classical models.")
+REWORDED = ABSTRACT.replace("We show that", "Here we demonstrate that").replace("natural images", "natural scenes")
+UNRELATED = ("A randomised controlled trial of 400 patients found no effect of vitamin D "
+             "supplementation on the incidence of seasonal influenza.")
+
+
+def test_reworded_text_is_similar():
+    hasher = MinHasher()
+    sig = hasher.signature(ABSTRACT)
+    assert hasher.similarity(sig, hasher.signature(REWORDED)) > 0.7
+    assert hasher.similarity(sig, hasher.signature(UNRELATED)) < 0.2
+
+
+def test_query_without_recording_then_remember():
+    learner = HashLearning()
+    assert learner.is_duplicate(ABSTRACT, threshold=0.5, record=False) == (False, None)
+    # Not recorded: still new
+    assert learner.is_duplicate(REWORDED, threshold=0.5, record=False) == (False, None)
+
+    learner.remember(ABSTRACT)
+    duplicate, key = learner.is_duplicate(REWORDED, threshold=0.5, record=False)
+    assert duplicate and key == learner.compute_shake256(ABSTRACT)
+    assert learner.is_duplicate(ABSTRACT)[0]
+    assert not learner.is_duplicate(UNRELATED, threshold=0.5)[0]
+
+
+def test_texts_without_shingles_never_match():
+    learner = HashLearning()
+    learner.remember("...")
+    assert learner.is_duplicate("!!!") == (False, None)
+    assert learner.is_duplicate("...") == (False, None)
+    assert len(learner._seen) == 0
+
+
+def test_index_persists_and_evicts(tmp_path):
+    hasher = MinHasher()
+    path = tmp_path / "seen.db"
+    index = LSHIndex(hasher, max_entries=2, path=path)
+    for key, text in (("a", ABSTRACT), ("b", UNRELATED), ("c", REWORDED)):
+        index.add(key, hasher.signature(text))
+    assert "a" not in index
+    index.close()
+
+    reopened = LSHIndex(hasher, max_entries=2, path=path)
+    assert len(reopened) == 2
+    matches = reopened.query(hasher.signature(ABSTRACT), threshold=0.5)
+    assert [key for key, _ in matches] == ["c"]
+
+
+def test_unwritable_store_falls_back_to_memory(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    learner = HashLearning(seen_store=blocker / "seen.db")
+    learner.remember(ABSTRACT)
+    assert learner.is_duplicate(ABSTRACT)[0]
@@ -0,0 +1,52 @@
+"""RateLimiter slot scheduling around Retry-After"""
+import asyncio
+
+from integrations.base import RateLimiter
+
+RATE = 20.0
+INTERVAL = 1.0 / RATE
+TOLERANCE = 0.015
+
+
+def test_retry_after_shifts_waiting_callers_without_drift():
+    async def main():
+        loop = asyncio.get_running_loop()
+        limiter = RateLimiter(RATE, burst=1)
+        sends = []
+
+        async def caller():
+            await limiter.acquire()
+            sends.append(loop.time())
+
+        async def throttled():
+            await asyncio.sleep(INTERVAL / 2)
+            limiter.on_response(429, 0.0, retry_after=0.1)
+            return limiter._blocked_until
+
+        *_, blocked_until = await asyncio.gather(*(caller() for _ in range(5)), throttled())
+        # A caller arriving once the queue has drained follows straight on
+        await caller()
+        return sends, blocked_until
+
+    sends, blocked_until = asyncio.run(main())
+    assert len(sends) == 6
+    first, waiting, late = sends[0], sends[1:5], sends[5]
+    assert first < blocked_until
+    assert min(waiting) >= blocked_until - TOLERANCE
+    gaps = [b - a for a, b in zip(sends[1:], sends[2:])]
+    assert all(gap >= INTERVAL - TOLERANCE for gap in gaps)
+    # One slot per waiting caller: at most one interval of slack after the pause
+    assert max(waiting) <= blocked_until + 4 * INTERVAL + TOLERANCE
+    assert late <= max(waiting) + INTERVAL + TOLERANCE
+
+
+def test_retry_after_delays_new_callers():
+    async def main():
+        loop = asyncio.get_running_loop()
+        limiter = RateLimiter(RATE, burst=1)
+        limiter.on_response(503, 0.0, retry_after=0.1)
+        start = loop.time()
+        await limiter.acquire()
+        return loop.time() - start
+
+    assert asyncio.run(main()) >= 0.1 - TOLERANCE
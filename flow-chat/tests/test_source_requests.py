@@ -0,0 +1,85 @@
+"""AcademicSource._send latency samples and the retry budget"""
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from integrations.base import AcademicSource, SourceType
+
+
+class Source(AcademicSource):
+    source_type = SourceType.OPENALEX
+
+    async def search(self, query, limit=100, offset=0, **kwargs):
+        return []
+
+    async def fetch(self, paper_id):
+        return None
+
+
+class RecordingLimiter:
+    def __init__(self):
+        self.latencies = []
+
+    async def acquire(self):
+        pass
+
+    def on_response(self, status, latency, retry_after=None):
+        self.latencies.append(latency)
+
+
+def test_latency_excludes_connection_queue():
+    async def slow(request):
+        await asyncio.sleep(0.2)
+        return web.json_response({})
+
+    async def main():
+        app = web.Application()
+        app.router.add_get('/', slow)
+        async with TestServer(app) as server:
+            source = Source(str(server.make_url('/')), use_cache=False, max_connections=1)
+            source.rate_limiter = RecordingLimiter()
+            try:
+                # One connection per host: the second request queues behind the first
+                await asyncio.gather(*(source._get(str(server.make_url('/'))) for _ in range(2)))
+            finally:
+                await source.close()
+            return source.rate_limiter.latencies
+
+    latencies = asyncio.run(main())
+    assert len(latencies) == 2
+    assert max(latencies) < 0.35
+
+
+class FlakySource(Source):
+    def __init__(self, outcomes):
+        super().__init__("https://api.example.org", use_cache=False)
+        self.BACKOFF_BASE = 0.0
+        self.outcomes = list(outcomes)
+
+    async def _send(self, method, url, params, json_body, headers, may_retry):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome, b'{}', {}, None
+
+
+def test_failed_requests_do_not_refill_retry_tokens():
+    source = FlakySource([aiohttp.ClientConnectionError("down")] * 40)
+    source._retry_tokens = 2.0
+    for _ in range(10):
+        with pytest.raises(aiohttp.ClientConnectionError):
+            asyncio.run(source._get("https://api.example.org/works"))
+    # Two retries spent, none earned back by the failing calls
+    assert source.retries == 2
+    assert source._retry_tokens < 1
+
+
+def test_successful_requests_refill_retry_tokens():
+    source = FlakySource([200] * 10)
+    source._retry_tokens = 0.0
+    for _ in range(10):
+        asyncio.run(source._get("https://api.example.org/works"))
+    assert source._retry_tokens == pytest.approx(10 * source.RETRY_RATIO)
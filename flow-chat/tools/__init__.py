@@ -10,12 +10,17 @@ from .pattern_detector import PatternDetector, CrossDomainInsight
 from .embeddings import (
     EmbeddingService,
     EmbeddingResult,
+    CandidateMatrix,
     SentenceTransformerBackend,
     get_embedding_service,
     embed_text,
     embed_texts,
     compute_similarity
 )
+from .embedding_cache import EmbeddingCache
+from .vector_index import VectorIndex, parse_vector, to_pgvector
+from .claim_index import ClaimIndex
+from .minhash import MinHasher, LSHIndex
 from .nlp_extractor import (
     NLPExtractor,
     get_nlp_extractor,
@@ -99,11 +104,25 @@ __all__ = [
     # Embeddings
     'EmbeddingService',
     'EmbeddingResult',
+    'CandidateMatrix',
     'SentenceTransformerBackend',
     'get_embedding_service',
     'embed_text',
     'embed_texts',
     'compute_similarity',
+    'EmbeddingCache',
+
+    # Vector Index
+    'VectorIndex',
+    'parse_vector',
+    'to_pgvector',
+
+    # Claim Index
+    'ClaimIndex',
+
+    # Near-Duplicate Detection
+    'MinHasher',
+    'LSHIndex',
 
     # NLP Extraction
     'NLPExtractor',
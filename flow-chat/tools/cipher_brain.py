@@ -17,16 +17,21 @@ Principles:
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 import json
 import re
+import time
 
 import asyncpg
+import numpy as np
 
-from .hash_learning import HashLearning, EntropyScore
-from .embeddings import EmbeddingService, get_embedding_service
+from .hash_learning import HashLearning, EntropyScore, DEFAULT_SEEN_STORE
+from .embeddings import EmbeddingService, get_embedding_service, normalize_rows
+from .vector_index import VectorIndex, parse_vector, to_pgvector
+from .claim_index import ClaimIndex, NEGATION_PAIRS, opposing_pair
 from .nlp_extractor import (
     NLPExtractor, get_nlp_extractor,
     ExtractedClaim as NLPClaim,
@@ -167,7 +172,20 @@ class CipherBrain:
     and generates new hypotheses through cross-domain synthesis.
     """
 
-    def __init__(self, db_url: str, embedding_model: str = "all-MiniLM-L6-v2", use_nlp: bool = True):
+    # Seconds the local vector index stands in after a transient pgvector error
+    PGVECTOR_RETRY_AFTER = 60.0
+
+    # Claim ids below the index's newest one re-read on each top-up: a claim
+    # saved by another worker can commit after a higher id was indexed
+    CLAIM_INDEX_RESCAN = 200
+
+    def __init__(
+        self,
+        db_url: str,
+        embedding_model: str = "all-MiniLM-L6-v2",
+        use_nlp: bool = True,
+        seen_store: Optional[Union[str, Path]] = DEFAULT_SEEN_STORE
+    ):
         """
         Initialize the brain.
 
@@ -175,16 +193,28 @@ class CipherBrain:
             db_url: PostgreSQL connection string
             embedding_model: Sentence transformer model for embeddings
             use_nlp: Whether to use NLP-based extraction (requires spaCy)
+            seen_store: SQLite file remembering learned abstracts across runs
+                (None = this process only)
         """
         self.db_url = db_url
         self.pool: Optional[asyncpg.Pool] = None
-        self.hash_learner = HashLearning()
+        self.hash_learner = HashLearning(seen_store=seen_store)
         self._api_clients = {}
 
         # Embedding service for semantic representations
         self.embedding_service = get_embedding_service(embedding_model)
         self._embeddings_enabled = True
 
+        # Nearest-neighbour search: pgvector HNSW first, local index as fallback
+        self._pgvector_ann = True
+        self._pgvector_retry_at = 0.0
+        self.vector_index: Optional[VectorIndex] = None
+        self._vector_index_lock = asyncio.Lock()
+
+        # Recent claims for connection discovery (see _refresh_claim_index)
+        self.claim_index: Optional[ClaimIndex] = None
+        self._claim_index_lock = asyncio.Lock()
+
         # NLP extractor for advanced claim extraction
         self._use_nlp = use_nlp
         self._nlp_extractor: Optional[NLPExtractor] = None
@@ -537,7 +567,7 @@ class CipherBrain:
         return list(set(entities))[:10]  # Limit to top 10
 
     async def find_connections(self, claim: Claim,
-                               existing_claims: List[Tuple[int, Claim]]
+                               existing_claims: Union[ClaimIndex, List[Tuple[int, Claim]]]
                                ) -> List[Connection]:
         """
         Find connections between a new claim and existing claims.
@@ -547,55 +577,56 @@ class CipherBrain:
         - Contradictions (opposing findings)
         - Extensions (building on previous work)
         - Analogies (similar patterns in different domains)
+
+        Only claims sharing an entity, or cross-domain claims with opposing
+        terms or a hypothesis to extend, are visited (see ClaimIndex).
         """
+        if not isinstance(existing_claims, ClaimIndex):
+            index = ClaimIndex(max_claims=len(existing_claims))
+            index.add_many(existing_claims)
+            existing_claims = index
+
         connections = []
+        claim_masks = ClaimIndex.features(claim)[2]
+        claim_domains = set(claim.domains)
+
+        for entry, shared, cross_domain in existing_claims.candidates(claim):
+            existing = entry.claim
 
-        for claim_id, existing in existing_claims:
             # Skip if same claim
             if claim.entropy_hash == existing.entropy_hash:
                 continue
 
-            # Check for cross-domain (the interesting cases)
-            claim_domains = set(claim.domains)
-            existing_domains = set(existing.domains)
-            cross_domain = bool(claim_domains) and bool(existing_domains) and claim_domains != existing_domains
-
-            # Calculate entity overlap
-            claim_entities = set(e.lower() for e in claim.entities)
-            existing_entities = set(e.lower() for e in existing.entities)
-            entity_overlap = len(claim_entities & existing_entities)
-
-            if entity_overlap == 0 and not cross_domain:
-                continue  # No obvious connection
+            entity_overlap = len(shared)
 
             # Determine connection type
             connection_type = None
             strength = 0.0
             reasoning = ""
 
-            # Check for contradiction
-            contradiction_signals = self._check_contradiction(claim.text, existing.text)
-            if contradiction_signals['is_contradiction']:
+            # Check for contradiction (term masks precomputed per claim)
+            pair = opposing_pair(claim_masks, entry.masks)
+            if pair is not None:
                 connection_type = 'contradicts'
-                strength = contradiction_signals['confidence']
-                reasoning = contradiction_signals['reason']
+                strength = 0.7
+                reasoning = "Opposing terms: {} vs {}".format(*NEGATION_PAIRS[pair])
 
             # Check for support
             elif entity_overlap >= 2 and claim.claim_type == existing.claim_type:
                 connection_type = 'supports'
                 strength = min(0.8, 0.3 + entity_overlap * 0.1)
-                reasoning = f"Shared entities: {claim_entities & existing_entities}"
+                reasoning = f"Shared entities: {set(shared)}"
 
             # Check for cross-domain analogy
             elif cross_domain and entity_overlap >= 1:
                 connection_type = 'analogous'
                 strength = 0.6 + entity_overlap * 0.1
-                reasoning = f"Cross-domain ({[d.name for d in claim_domains]} <-> {[d.name for d in existing_domains]}) with shared concepts"
+                reasoning = f"Cross-domain ({[d.name for d in claim_domains]} <-> {[d.name for d in entry.domains]}) with shared concepts"
 
                 await self.think(
                     'connection',
                     f"Found cross-domain analogy: {claim.text[:50]}... <-> {existing.text[:50]}...",
-                    domains=list(claim_domains | existing_domains),
+                    domains=list(claim_domains | entry.domains),
                     importance=0.8
                 )
 
@@ -611,7 +642,7 @@ class CipherBrain:
                 entropy = self.hash_learner.analyze(combined_text)
 
                 connections.append(Connection(
-                    source_claim_id=claim_id,
+                    source_claim_id=entry.claim_id,
                     target_claim_id=0,  # Will be set when claim is saved
                     connection_type=connection_type,
                     strength=min(1.0, strength),
@@ -634,17 +665,7 @@ class CipherBrain:
         text2_lower = text2.lower()
 
         # Direct negation patterns
-        negation_pairs = [
-            ('increase', 'decrease'),
-            ('positive', 'negative'),
-            ('significant', 'not significant'),
-            ('supports', 'refutes'),
-            ('found', 'found no'),
-            ('correlation', 'no correlation'),
-            ('effect', 'no effect'),
-        ]
-
-        for pos, neg in negation_pairs:
+        for pos, neg in NEGATION_PAIRS:
             if (pos in text1_lower and neg in text2_lower) or \
                (neg in text1_lower and pos in text2_lower):
                 result['is_contradiction'] = True
@@ -854,6 +875,17 @@ class CipherBrain:
             )
             return result
 
+        # Skip reworded or re-fetched copies of an abstract already learned from
+        # (remembered below, once the paper is saved)
+        duplicate, _ = self.hash_learner.is_duplicate(abstract, threshold=0.9, record=False)
+        if duplicate:
+            await self.think(
+                'observation',
+                f"'{paper.get('title', '')[:50]}...' duplicates a paper already learned, skipping",
+                importance=0.2
+            )
+            return result
+
         # Determine domains
         domains = self._classify_domains(paper)
 
@@ -870,7 +902,7 @@ class CipherBrain:
         result['claims_extracted'] = len(claims)
 
         # Save claims and find connections
-        existing_claims = await self._get_recent_claims(limit=1000)
+        existing_claims = await self._refresh_claim_index(limit=1000)
 
         for claim in claims:
             claim.source_id = source_id
@@ -883,12 +915,14 @@ class CipherBrain:
                 await self._save_connection(conn)
                 result['connections_found'] += 1
 
-            existing_claims.append((claim_id, claim))
+            existing_claims.add(claim_id, claim)
+
+        self.hash_learner.remember(abstract)
 
         # Detect patterns periodically
         if result['claims_extracted'] > 0:
             all_connections = await self._get_recent_connections(limit=500)
-            patterns = await self.detect_patterns(existing_claims[-100:], all_connections)
+            patterns = await self.detect_patterns(existing_claims.recent(100), all_connections)
             result['patterns_detected'] = len(patterns)
 
             for pattern in patterns:
@@ -996,7 +1030,7 @@ class CipherBrain:
             # Convert embedding to pgvector format if present
             embedding_str = None
             if claim.embedding:
-                embedding_str = '[' + ','.join(str(x) for x in claim.embedding) + ']'
+                embedding_str = to_pgvector(claim.embedding)
 
             result = await conn.fetchrow('''
                 INSERT INTO synthesis.claims
@@ -1020,7 +1054,11 @@ class CipherBrain:
                 claim.entropy_hash,
                 embedding_str
             )
-            return result['id']
+
+        # Keep the local index current (only once it has been loaded)
+        if self.vector_index is not None and claim.embedding:
+            self.vector_index.add(result['id'], claim.embedding, sorted(d.value for d in claim.domains))
+        return result['id']
 
     async def _save_connection(self, conn: Connection):
         """Save connection to database."""
@@ -1076,16 +1114,39 @@ class CipherBrain:
                 'pattern_detector'
             )
 
-    async def _get_recent_claims(self, limit: int = 1000) -> List[Tuple[int, Claim]]:
-        """Get recent claims from database."""
+    async def _refresh_claim_index(self, limit: int = 1000) -> ClaimIndex:
+        """
+        Index of the most recent claims, loaded once and then topped up
+        with claims saved since (by this or any other process).
+
+        The top-up re-reads the last CLAIM_INDEX_RESCAN ids and adds the
+        ones not indexed yet, so claims committed out of id order are not
+        skipped.
+        """
+        async with self._claim_index_lock:
+            index = self.claim_index
+            if index is None or index.max_claims != limit:
+                index = ClaimIndex(max_claims=limit)
+                index.add_many(reversed(await self._get_recent_claims(limit=limit)))
+                self.claim_index = index
+            else:
+                newer = await self._get_recent_claims(
+                    limit=limit, after_id=max(index.max_id - self.CLAIM_INDEX_RESCAN, 0)
+                )
+                index.add_many((cid, claim) for cid, claim in reversed(newer) if cid not in index)
+            return index
+
+    async def _get_recent_claims(self, limit: int = 1000, after_id: int = 0) -> List[Tuple[int, Claim]]:
+        """Get recent claims from database (newest first, optionally only ids above after_id)."""
         async with self.pool.acquire() as conn:
             rows = await conn.fetch('''
                 SELECT id, claim_text, claim_type, confidence, evidence_strength,
                        domains, entities, entropy_hash
                 FROM synthesis.claims
+                WHERE id > $2
                 ORDER BY created_at DESC
                 LIMIT $1
-            ''', limit)
+            ''', limit, after_id)
 
             claims = []
             for row in rows:
@@ -1157,6 +1218,72 @@ class CipherBrain:
     # SEMANTIC SEARCH METHODS
     # =========================================================================
 
+    async def load_vector_index(self, rebuild: bool = False) -> VectorIndex:
+        """
+        Load every claim embedding into the local vector index.
+
+        Args:
+            rebuild: Reload even if the index is already in memory
+
+        Returns:
+            The loaded VectorIndex
+        """
+        async with self._vector_index_lock:
+            if self.vector_index is not None and not rebuild:
+                return self.vector_index
+
+            index = VectorIndex(self.embedding_service.dimensions)
+            last_id = 0
+            async with self.pool.acquire() as conn:
+                while True:
+                    rows = await conn.fetch('''
+                        SELECT id, embedding::text as embedding, domains
+                        FROM synthesis.claims
+                        WHERE embedding IS NOT NULL AND id > $1
+                        ORDER BY id
+                        LIMIT 10000
+                    ''', last_id)
+                    if not rows:
+                        break
+                    index.add_batch(
+                        [row['id'] for row in rows],
+                        np.stack([parse_vector(row['embedding']) for row in rows]),
+                        [sorted(row['domains'] or []) for row in rows]
+                    )
+                    last_id = rows[-1]['id']
+
+            index.build_ivf()
+            self.vector_index = index
+            logger.info(f"Vector index loaded: {len(index)} claims")
+            return index
+
+    async def _ann_query(self, sql: str, *params, ef_search: int = 40) -> Optional[List]:
+        """
+        Run an ORDER BY embedding <=> ... query through the HNSW index.
+
+        Returns None if pgvector cannot serve it, so callers fall back to
+        the local index: for good when the extension or column is missing,
+        for PGVECTOR_RETRY_AFTER seconds after any other database error.
+        """
+        if not self._pgvector_ann or time.monotonic() < self._pgvector_retry_at:
+            return None
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    # Filters are applied after the index scan - widen it so they still fill the limit
+                    await conn.execute(f"SET LOCAL hnsw.ef_search = {min(max(ef_search, 40), 1000)}")
+                    return await conn.fetch(sql, *params)
+        except (asyncpg.UndefinedFunctionError, asyncpg.UndefinedObjectError, asyncpg.UndefinedColumnError) as e:
+            logger.warning(f"pgvector not installed, using local vector index: {e}")
+            self._pgvector_ann = False
+            return None
+        except (asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            logger.warning(
+                f"pgvector search failed, using local vector index for {self.PGVECTOR_RETRY_AFTER:.0f}s: {e}"
+            )
+            self._pgvector_retry_at = time.monotonic() + self.PGVECTOR_RETRY_AFTER
+            return None
+
     async def semantic_search_claims(
         self,
         query: str,
@@ -1167,6 +1294,9 @@ class CipherBrain:
         """
         Search claims using semantic similarity.
 
+        Covers every embedded claim: the pgvector HNSW index answers the
+        query, or the local vector index if pgvector cannot.
+
         Args:
             query: Natural language query
             limit: Maximum results
@@ -1179,48 +1309,45 @@ class CipherBrain:
         # Generate query embedding
         query_result = await self.embedding_service.embed(query)
         query_vector = query_result.vector
+        domain_values = [d.value for d in domains] if domains else None
 
         # Build query with optional domain filter
         domain_filter = ""
-        params = [limit * 3]  # Fetch more to filter after similarity
-
-        if domains:
-            domain_values = [d.value for d in domains]
-            domain_filter = "AND domains && $2"
+        params = [to_pgvector(query_vector), limit]
+        if domain_values:
+            domain_filter = "AND domains && $3"
             params.append(domain_values)
 
-        async with self.pool.acquire() as conn:
-            # Fetch claims with embeddings
-            rows = await conn.fetch(f'''
-                SELECT id, claim_text, embedding
-                FROM synthesis.claims
-                WHERE embedding IS NOT NULL
-                {domain_filter}
-                ORDER BY created_at DESC
-                LIMIT $1
-            ''', *params)
-
-        # Compute similarities
-        results = []
-        for row in rows:
-            if row['embedding']:
-                # Parse pgvector format
-                emb_str = row['embedding']
-                if isinstance(emb_str, str):
-                    emb_values = [float(x) for x in emb_str.strip('[]').split(',')]
-                else:
-                    emb_values = list(emb_str)
-
-                similarity = self.embedding_service.cosine_similarity(
-                    query_vector, emb_values
-                )
-
-                if similarity >= threshold:
-                    results.append((row['id'], row['claim_text'], similarity))
+        rows = await self._ann_query(f'''
+            SELECT id, claim_text, 1 - (embedding <=> $1::vector) as similarity
+            FROM synthesis.claims
+            WHERE embedding IS NOT NULL
+            {domain_filter}
+            ORDER BY embedding <=> $1::vector
+            LIMIT $2
+        ''', *params, ef_search=limit * (8 if domain_values else 2))
+
+        if rows is not None:
+            return [(row['id'], row['claim_text'], float(row['similarity']))
+                    for row in rows if row['similarity'] >= threshold]
+
+        index = await self.load_vector_index()
+        wanted = set(domain_values or [])
+        hits = index.search(
+            query_vector, k=limit, threshold=threshold,
+            accept=(lambda _id, claim_domains: not wanted.isdisjoint(claim_domains)) if wanted else None
+        )
+        texts = await self._claim_texts([claim_id for claim_id, _ in hits])
+        return [(claim_id, texts[claim_id], similarity) for claim_id, similarity in hits if claim_id in texts]
 
-        # Sort by similarity and return top results
-        results.sort(key=lambda x: x[2], reverse=True)
-        return results[:limit]
+    async def _claim_texts(self, claim_ids: List[int]) -> Dict[int, str]:
+        if not claim_ids:
+            return {}
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch('''
+                SELECT id, claim_text FROM synthesis.claims WHERE id = ANY($1::int[])
+            ''', claim_ids)
+        return {row['id']: row['claim_text'] for row in rows}
 
     async def find_similar_claims(
         self,
@@ -1244,56 +1371,51 @@ class CipherBrain:
         async with self.pool.acquire() as conn:
             # Get the reference claim
             ref = await conn.fetchrow('''
-                SELECT claim_text, embedding, domains
+                SELECT claim_text, embedding::text as embedding, domains
                 FROM synthesis.claims
                 WHERE id = $1
             ''', claim_id)
 
-            if not ref or not ref['embedding']:
-                return []
-
-            ref_embedding = ref['embedding']
-            if isinstance(ref_embedding, str):
-                ref_vector = [float(x) for x in ref_embedding.strip('[]').split(',')]
-            else:
-                ref_vector = list(ref_embedding)
-
-            ref_domains = set(ref['domains'] or [])
+        if not ref or not ref['embedding']:
+            return []
 
-            # Fetch candidate claims
-            rows = await conn.fetch('''
-                SELECT id, claim_text, embedding, domains
-                FROM synthesis.claims
-                WHERE embedding IS NOT NULL AND id != $1
-                ORDER BY created_at DESC
-                LIMIT $2
-            ''', claim_id, limit * 5)
-
-        results = []
-        for row in rows:
-            if not row['embedding']:
-                continue
+        ref_domains = sorted(set(ref['domains'] or []))
 
-            emb_str = row['embedding']
-            if isinstance(emb_str, str):
-                emb_values = [float(x) for x in emb_str.strip('[]').split(',')]
-            else:
-                emb_values = list(emb_str)
-
-            claim_domains = set(row['domains'] or [])
-
-            # Filter for cross-domain if requested
-            if cross_domain_only and claim_domains == ref_domains:
-                continue
+        # Same-domain-set claims are skipped when cross_domain_only
+        domain_filter = ""
+        params = [ref['embedding'], claim_id, limit]
+        if cross_domain_only:
+            domain_filter = "AND NOT (COALESCE(domains, '{}') @> $4 AND COALESCE(domains, '{}') <@ $4)"
+            params.append(ref_domains)
+
+        rows = await self._ann_query(f'''
+            SELECT id, claim_text, domains, 1 - (embedding <=> $1::vector) as similarity
+            FROM synthesis.claims
+            WHERE embedding IS NOT NULL AND id != $2
+            {domain_filter}
+            ORDER BY embedding <=> $1::vector
+            LIMIT $3
+        ''', *params, ef_search=limit * (8 if cross_domain_only else 2))
+
+        if rows is not None:
+            return [
+                (row['id'], row['claim_text'], float(row['similarity']), [Domain(d) for d in (row['domains'] or [])])
+                for row in rows if row['similarity'] >= threshold
+            ]
 
-            similarity = self.embedding_service.cosine_similarity(ref_vector, emb_values)
+        index = await self.load_vector_index()
 
-            if similarity >= threshold:
-                domains = [Domain(d) for d in (row['domains'] or [])]
-                results.append((row['id'], row['claim_text'], similarity, domains))
+        def accept(other_id: int, claim_domains: List[int]) -> bool:
+            if other_id == claim_id:
+                return False
+            return not (cross_domain_only and sorted(set(claim_domains)) == ref_domains)
 
-        results.sort(key=lambda x: x[2], reverse=True)
-        return results[:limit]
+        hits = index.search(parse_vector(ref['embedding']), k=limit, threshold=threshold, accept=accept)
+        texts = await self._claim_texts([other_id for other_id, _ in hits])
+        return [
+            (other_id, texts[other_id], similarity, [Domain(d) for d in index.payload(other_id) or []])
+            for other_id, similarity in hits if other_id in texts
+        ]
 
     async def embed_existing_claims(
         self,
@@ -1328,7 +1450,7 @@ class CipherBrain:
             async with self.pool.acquire() as conn:
                 # Fetch batch
                 rows = await conn.fetch('''
-                    SELECT id, claim_text
+                    SELECT id, claim_text, domains
                     FROM synthesis.claims
                     WHERE embedding IS NULL
                     ORDER BY id
@@ -1347,12 +1469,14 @@ class CipherBrain:
 
                     # Update database
                     for row, emb_result in zip(rows, embedding_results):
-                        embedding_str = '[' + ','.join(str(x) for x in emb_result.vector) + ']'
+                        embedding_str = to_pgvector(emb_result.vector)
                         await conn.execute('''
                             UPDATE synthesis.claims
                             SET embedding = $1::vector
                             WHERE id = $2
                         ''', embedding_str, row['id'])
+                        if self.vector_index is not None:
+                            self.vector_index.add(row['id'], emb_result.vector, sorted(row['domains'] or []))
 
                     total_updated += len(rows)
                     logger.info(f"Updated {total_updated}/{count} claims with embeddings")
@@ -1401,42 +1525,32 @@ class CipherBrain:
                     by_domain[domain_id] = []
                 by_domain[domain_id].append(row)
 
-        # Compare across domains
+        # Parse and normalise each embedding once
+        vectors = {row['id']: parse_vector(row['embedding']) for row in rows}
+
+        # Compare across domains - one matrix product per domain pair
         domain_ids = list(by_domain.keys())
         for i, domain_a in enumerate(domain_ids):
+            claims_a = by_domain[domain_a][:20]  # Limit comparisons
+            matrix_a = normalize_rows([vectors[c['id']] for c in claims_a])
+
             for domain_b in domain_ids[i+1:]:
-                claims_a = by_domain[domain_a]
-                claims_b = by_domain[domain_b]
-
-                for claim_a in claims_a[:20]:  # Limit comparisons
-                    emb_a = claim_a['embedding']
-                    if isinstance(emb_a, str):
-                        vec_a = [float(x) for x in emb_a.strip('[]').split(',')]
-                    else:
-                        vec_a = list(emb_a)
-
-                    for claim_b in claims_b[:20]:
-                        if claim_a['id'] == claim_b['id']:
-                            continue
-
-                        emb_b = claim_b['embedding']
-                        if isinstance(emb_b, str):
-                            vec_b = [float(x) for x in emb_b.strip('[]').split(',')]
-                        else:
-                            vec_b = list(emb_b)
-
-                        similarity = self.embedding_service.cosine_similarity(vec_a, vec_b)
-
-                        if similarity >= threshold:
-                            connections.append({
-                                'claim_a_id': claim_a['id'],
-                                'claim_a_text': claim_a['claim_text'],
-                                'domain_a': Domain(domain_a).name,
-                                'claim_b_id': claim_b['id'],
-                                'claim_b_text': claim_b['claim_text'],
-                                'domain_b': Domain(domain_b).name,
-                                'similarity': similarity
-                            })
+                claims_b = by_domain[domain_b][:20]
+                block = matrix_a @ normalize_rows([vectors[c['id']] for c in claims_b]).T
+
+                for a_idx, b_idx in np.argwhere(block >= threshold):
+                    claim_a, claim_b = claims_a[a_idx], claims_b[b_idx]
+                    if claim_a['id'] == claim_b['id']:
+                        continue
+                    connections.append({
+                        'claim_a_id': claim_a['id'],
+                        'claim_a_text': claim_a['claim_text'],
+                        'domain_a': Domain(domain_a).name,
+                        'claim_b_id': claim_b['id'],
+                        'claim_b_text': claim_b['claim_text'],
+                        'domain_b': Domain(domain_b).name,
+                        'similarity': float(block[a_idx, b_idx])
+                    })
 
         # Sort by similarity and return top
         connections.sort(key=lambda x: x['similarity'], reverse=True)
@@ -0,0 +1,220 @@
+"""
+CIPHER Claim Index
+
+Candidate lookup for CipherBrain.find_connections. A new claim can only
+connect to an existing claim that:
+
+- shares at least one entity, or
+- is cross-domain AND either contains opposing negation terms or
+  (for a method/finding) is a hypothesis
+
+So instead of scanning every recent claim, the index keeps inverted
+postings (entity -> claims, negation term -> claims, claim type ->
+claims) and visits only the union of the matching postings. Each claim's
+lowercase entity set, domain set and negation-term masks are computed
+once, when it is added.
+
+The index covers a sliding window of the most recent claims and is
+updated incrementally as claims are saved.
+"""
+
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+# Direct negation patterns checked by the contradiction test (order = priority)
+NEGATION_PAIRS = [
+    ('increase', 'decrease'),
+    ('positive', 'negative'),
+    ('significant', 'not significant'),
+    ('supports', 'refutes'),
+    ('found', 'found no'),
+    ('correlation', 'no correlation'),
+    ('effect', 'no effect'),
+]
+
+EXTENDING_TYPES = ('method', 'finding')
+
+
+def negation_masks(text: str) -> Tuple[int, int]:
+    """
+    Bit masks of the NEGATION_PAIRS terms present in a text.
+
+    Args:
+        text: Claim text
+
+    Returns:
+        (positive-term mask, negative-term mask); bit i is pair i
+    """
+    text_lower = text.lower()
+    pos_mask = neg_mask = 0
+    for i, (pos, neg) in enumerate(NEGATION_PAIRS):
+        if pos in text_lower:
+            pos_mask |= 1 << i
+        if neg in text_lower:
+            neg_mask |= 1 << i
+    return pos_mask, neg_mask
+
+
+def opposing_pair(masks_a: Tuple[int, int], masks_b: Tuple[int, int]) -> Optional[int]:
+    """First NEGATION_PAIRS index on which two texts oppose, or None"""
+    opposed = (masks_a[0] & masks_b[1]) | (masks_a[1] & masks_b[0])
+    if not opposed:
+        return None
+    return (opposed & -opposed).bit_length() - 1
+
+
+@dataclass
+class IndexedClaim:
+    """A claim with the normalised features used for matching"""
+    claim_id: int
+    claim: Any
+    seq: int
+    entities: FrozenSet[str]
+    domains: FrozenSet[Any]
+    masks: Tuple[int, int]
+
+
+class ClaimIndex:
+    """
+    Inverted index over a window of recent claims.
+    """
+
+    def __init__(self, max_claims: int = 1000):
+        """
+        Initialize an empty index.
+
+        Args:
+            max_claims: Window size; the oldest claims are evicted beyond it
+        """
+        self.max_claims = max_claims
+        self._entries: "OrderedDict[int, IndexedClaim]" = OrderedDict()
+        self._seq = 0
+        self.max_id = 0  # highest claim id ever added (for topping up from the database)
+
+        # Postings (claim id sets)
+        self._by_entity: Dict[str, Set[int]] = defaultdict(set)
+        self._by_pos_term: List[Set[int]] = [set() for _ in NEGATION_PAIRS]
+        self._by_neg_term: List[Set[int]] = [set() for _ in NEGATION_PAIRS]
+        self._by_type: Dict[str, Set[int]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, claim_id: int) -> bool:
+        return claim_id in self._entries
+
+    @staticmethod
+    def features(claim: Any) -> Tuple[FrozenSet[str], FrozenSet[Any], Tuple[int, int]]:
+        """Normalised (entities, domains, negation masks) of a claim"""
+        return (
+            frozenset(e.lower() for e in claim.entities),
+            frozenset(claim.domains),
+            negation_masks(claim.text)
+        )
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def add(self, claim_id: int, claim: Any):
+        """
+        Add (or refresh) a claim as the most recent entry.
+
+        Args:
+            claim_id: Database id
+            claim: Claim (text, claim_type, domains, entities, entropy_hash)
+        """
+        if claim_id in self._entries:
+            self._remove(claim_id)
+
+        entities, domains, masks = self.features(claim)
+        entry = IndexedClaim(claim_id, claim, self._seq, entities, domains, masks)
+        self._seq += 1
+        self._entries[claim_id] = entry
+        self.max_id = max(self.max_id, claim_id)
+
+        for entity in entities:
+            self._by_entity[entity].add(claim_id)
+        for i in range(len(NEGATION_PAIRS)):
+            if masks[0] >> i & 1:
+                self._by_pos_term[i].add(claim_id)
+            if masks[1] >> i & 1:
+                self._by_neg_term[i].add(claim_id)
+        self._by_type[claim.claim_type].add(claim_id)
+
+        while len(self._entries) > self.max_claims:
+            self._remove(next(iter(self._entries)))
+
+    def add_many(self, claims: Iterable[Tuple[int, Any]]):
+        """Add claims oldest first"""
+        for claim_id, claim in claims:
+            self.add(claim_id, claim)
+
+    def _remove(self, claim_id: int):
+        entry = self._entries.pop(claim_id)
+        for entity in entry.entities:
+            postings = self._by_entity[entity]
+            postings.discard(claim_id)
+            if not postings:
+                del self._by_entity[entity]
+        for postings in self._by_pos_term + self._by_neg_term:
+            postings.discard(claim_id)
+        self._by_type[entry.claim.claim_type].discard(claim_id)
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def candidates(self, claim: Any) -> List[Tuple[IndexedClaim, FrozenSet[str], bool]]:
+        """
+        Existing claims that may connect to a claim, oldest first.
+
+        Args:
+            claim: The new claim
+
+        Returns:
+            List of (entry, shared entities, cross_domain)
+        """
+        entities, domains, masks = self.features(claim)
+
+        sharing: Set[int] = set()
+        for entity in entities:
+            sharing |= self._by_entity.get(entity, set())
+
+        # Without shared entities only cross-domain contradictions or extensions can match
+        other: Set[int] = set()
+        if domains:
+            for i in range(len(NEGATION_PAIRS)):
+                if masks[0] >> i & 1:
+                    other |= self._by_neg_term[i]
+                if masks[1] >> i & 1:
+                    other |= self._by_pos_term[i]
+            if claim.claim_type in EXTENDING_TYPES:
+                other |= self._by_type.get('hypothesis', set())
+            other -= sharing
+
+        results = []
+        for claim_id in sharing:
+            entry = self._entries[claim_id]
+            cross = bool(domains) and bool(entry.domains) and domains != entry.domains
+            results.append((entry, entities & entry.entities, cross))
+        for claim_id in other:
+            entry = self._entries[claim_id]
+            if entry.domains and domains != entry.domains:
+                results.append((entry, frozenset(), True))
+
+        results.sort(key=lambda r: r[0].seq)
+        return results
+
+    def recent(self, limit: int) -> List[Tuple[int, Any]]:
+        """The `limit` most recent (claim_id, claim) pairs, oldest first"""
+        entries = list(self._entries.values())[-limit:] if limit > 0 else []
+        return [(e.claim_id, e.claim) for e in entries]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'claims': len(self._entries),
+            'max_claims': self.max_claims,
+            'entities': len(self._by_entity),
+        }
@@ -9,8 +9,10 @@ and manages the learning schedule.
 
 import asyncio
 import logging
+from contextlib import aclosing
+from functools import partial
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, Set, Tuple, Awaitable, AsyncIterator, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import random
@@ -23,7 +25,7 @@ import sys
 sys.path.append('..')
 from integrations import (
     OpenAlexClient, ArxivClient, PubMedClient, SemanticScholarClient,
-    Paper
+    Paper, PaperHydrator
 )
 
 logger = logging.getLogger(__name__)
@@ -176,6 +178,8 @@ class LearningSession:
     session_id: str
     domain: Domain
     started_at: datetime
+    # Unique papers handed to the extraction workers (at most max_papers:
+    # fetching stops once that many are queued)
     papers_fetched: int = 0
     claims_extracted: int = 0
     connections_found: int = 0
@@ -211,6 +215,7 @@ class DomainLearner:
         self._arxiv: Optional[ArxivClient] = None
         self._pubmed: Optional[PubMedClient] = None
         self._semantic_scholar: Optional[SemanticScholarClient] = None
+        self._hydrator: Optional[PaperHydrator] = None
 
         # Learning state
         self.sessions: List[LearningSession] = []
@@ -220,6 +225,11 @@ class DomainLearner:
         self.max_papers_per_domain = self.config.get('max_papers_per_domain', 100)
         self.batch_size = self.config.get('batch_size', 50)
         self.cross_domain_boost = self.config.get('cross_domain_boost', 2.0)
+        self.extraction_workers = self.config.get('extraction_workers', 4)
+        self.queue_size = self.config.get('queue_size', 32)
+        if self.extraction_workers < 1:
+            # Nothing would drain the queue and the producers would block forever
+            raise ValueError(f"extraction_workers must be at least 1, got {self.extraction_workers}")
 
     @property
     def openalex(self) -> OpenAlexClient:
@@ -252,6 +262,16 @@ class DomainLearner:
             )
         return self._semantic_scholar
 
+    @property
+    def hydrator(self) -> PaperHydrator:
+        """Batched paper / citation-graph lookups over the clients above"""
+        if self._hydrator is None:
+            self._hydrator = PaperHydrator(
+                [self.openalex, self.arxiv, self.pubmed, self.semantic_scholar],
+                max_links=self.config.get('max_links', 100)
+            )
+        return self._hydrator
+
     async def close(self):
         """Close all API clients."""
         if self._openalex:
@@ -272,6 +292,10 @@ class DomainLearner:
         """
         Learn from a single domain.
 
+        Sources are fetched concurrently (each behind its client's rate
+        limiter), papers are deduplicated as they arrive and
+        `extraction_workers` workers learn from them through a bounded queue.
+
         Args:
             domain: Which domain to learn
             max_papers: Maximum papers to process
@@ -299,80 +323,134 @@ class DomainLearner:
             importance=0.5
         )
 
-        papers = []
+        # Each source streams its result batches into a bounded queue as they
+        # arrive; a pool of workers runs brain.learn_from_paper on the papers
+        sources = []
+        if strategy.openalex_weight > 0:
+            sources.append(self._stream_openalex(
+                strategy,
+                limit=int(max_papers * strategy.openalex_weight),
+                days_back=days_back
+            ))
+        if strategy.arxiv_weight > 0 and strategy.arxiv_categories:
+            sources.append(self._stream_arxiv(
+                strategy,
+                limit=int(max_papers * strategy.arxiv_weight * 0.5),
+                days_back=days_back
+            ))
+        if strategy.pubmed_weight > 0 and strategy.pubmed_mesh:
+            sources.append(self._stream_pubmed(
+                strategy,
+                limit=int(max_papers * strategy.pubmed_weight * 0.5),
+                days_back=days_back
+            ))
+        if strategy.semantic_scholar_weight > 0:
+            # Semantic Scholar (for high-impact papers)
+            sources.append(self._stream_semantic_scholar(
+                strategy,
+                limit=int(max_papers * strategy.semantic_scholar_weight * 0.3),
+                days_back=days_back
+            ))
 
-        # Fetch from each source based on strategy weights
-        try:
-            # OpenAlex (if weighted)
-            if strategy.openalex_weight > 0:
-                openalex_papers = await self._fetch_openalex(
-                    strategy,
-                    limit=int(max_papers * strategy.openalex_weight),
-                    days_back=days_back
-                )
-                papers.extend(openalex_papers)
-
-            # arXiv (if weighted)
-            if strategy.arxiv_weight > 0 and strategy.arxiv_categories:
-                arxiv_papers = await self._fetch_arxiv(
-                    strategy,
-                    limit=int(max_papers * strategy.arxiv_weight * 0.5),
-                    days_back=days_back
-                )
-                papers.extend(arxiv_papers)
-
-            # PubMed (if weighted)
-            if strategy.pubmed_weight > 0 and strategy.pubmed_mesh:
-                pubmed_papers = await self._fetch_pubmed(
-                    strategy,
-                    limit=int(max_papers * strategy.pubmed_weight * 0.5),
-                    days_back=days_back
-                )
-                papers.extend(pubmed_papers)
+        await self._run_pipeline(sources, session, max_papers)
+        logger.info(f"Fetched {session.papers_fetched} unique papers for {domain.name}")
 
-            # Semantic Scholar (for high-impact papers)
-            if strategy.semantic_scholar_weight > 0:
-                s2_papers = await self._fetch_semantic_scholar(
-                    strategy,
-                    limit=int(max_papers * strategy.semantic_scholar_weight * 0.3),
-                    days_back=days_back
-                )
-                papers.extend(s2_papers)
+        await self.brain.think(
+            'observation',
+            f"Completed {domain.name} session: {session.papers_fetched} papers, "
+            f"{session.claims_extracted} claims, {session.connections_found} connections",
+            domains=[domain],
+            importance=0.6
+        )
 
-        except Exception as e:
-            error_msg = f"Error fetching papers for {domain.name}: {e}"
-            logger.error(error_msg)
-            session.errors.append(error_msg)
+        return session
 
-        # Deduplicate
-        unique_papers = self._deduplicate_papers(papers)
-        session.papers_fetched = len(unique_papers)
+    async def learn_citation_graph(
+        self,
+        seed_ids: List[str],
+        source: str = 'openalex',
+        direction: str = 'references',
+        depth: int = 2,
+        max_papers: int = 200
+    ) -> LearningSession:
+        """
+        Learn from the papers around seed papers in the citation graph.
 
-        logger.info(f"Fetched {len(unique_papers)} unique papers for {domain.name}")
+        Each level of the walk costs a few batch requests (see PaperHydrator)
+        and its papers go through the same extraction workers as learn_domain.
 
-        # Process each paper
-        for paper in unique_papers[:max_papers]:
-            try:
-                result = await self.brain.learn_from_paper(paper.to_dict())
-                session.claims_extracted += result['claims_extracted']
-                session.connections_found += result['connections_found']
-                session.patterns_detected += result['patterns_detected']
+        Args:
+            seed_ids: Paper IDs in the source's format (OpenAlex W-IDs / DOIs, S2 IDs)
+            source: 'openalex' or 'semantic_scholar'
+            direction: 'references' (older work) or 'citations' (newer work)
+            depth: Levels to walk
+            max_papers: Maximum papers to process
 
-            except Exception as e:
-                error_msg = f"Error processing paper {paper.external_id}: {e}"
-                logger.error(error_msg)
-                session.errors.append(error_msg)
+        Returns:
+            LearningSession with results
+        """
+        session = LearningSession(
+            session_id=f"citation_graph_{datetime.now().isoformat()}",
+            domain=None,  # Follows the graph across domains
+            started_at=datetime.now()
+        )
+        self.sessions.append(session)
 
         await self.brain.think(
             'observation',
-            f"Completed {domain.name} session: {session.papers_fetched} papers, "
-            f"{session.claims_extracted} claims, {session.connections_found} connections",
-            domains=[domain],
+            f"Following the {direction} of {len(seed_ids)} seed papers on {source} (depth {depth})",
             importance=0.6
         )
 
+        stream = self.hydrator.crawl(source, seed_ids, direction=direction, depth=depth, max_papers=max_papers)
+        await self._run_pipeline([stream], session, max_papers)
+
+        await self.brain.think(
+            'observation',
+            f"Citation graph session: {session.papers_fetched} papers, "
+            f"{session.claims_extracted} claims, {session.connections_found} connections",
+            importance=0.7
+        )
+
         return session
 
+    async def _run_pipeline(
+        self,
+        sources: List[AsyncIterator[List[Paper]]],
+        session: LearningSession,
+        max_papers: int
+    ):
+        """Feed the sources' papers through the bounded queue to the extraction workers."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        seen_titles: Set[str] = set()
+        limit_reached = asyncio.Event()
+
+        producers = [
+            asyncio.create_task(self._produce(stream, queue, session, seen_titles, max_papers, limit_reached))
+            for stream in sources
+        ]
+        workers = [
+            asyncio.create_task(self._extraction_worker(queue, session))
+            for _ in range(self.extraction_workers)
+        ]
+
+        try:
+            # Stop fetching as soon as enough unique papers are queued
+            fetching = asyncio.gather(*producers, return_exceptions=True)
+            limit_wait = asyncio.create_task(limit_reached.wait())
+            await asyncio.wait({fetching, limit_wait}, return_when=asyncio.FIRST_COMPLETED)
+            limit_wait.cancel()
+            for producer in producers:
+                producer.cancel()
+            await fetching
+
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in producers + workers:
+                task.cancel()
+
     async def learn_all_domains(
         self,
         max_papers_per_domain: int = None,
@@ -510,144 +588,203 @@ class DomainLearner:
 
         return session
 
-    async def _fetch_openalex(
+    async def _produce(
+        self,
+        stream: AsyncIterator[List[Paper]],
+        queue: asyncio.Queue,
+        session: LearningSession,
+        seen_titles: Set[str],
+        max_papers: int,
+        limit_reached: asyncio.Event
+    ):
+        """Deduplicate a source's papers as they arrive and queue them for extraction."""
+        async with aclosing(stream):
+            try:
+                async for papers in stream:
+                    for paper in papers:
+                        if session.papers_fetched >= max_papers:
+                            limit_reached.set()
+                            return
+                        title_hash = self._accept_paper(paper, seen_titles)
+                        if title_hash is None:
+                            continue
+                        session.papers_fetched += 1
+                        try:
+                            await queue.put(paper)  # blocks while the workers are behind
+                        except asyncio.CancelledError:
+                            # Fetching was stopped before the paper was queued: give it back
+                            session.papers_fetched -= 1
+                            seen_titles.discard(title_hash)
+                            self.seen_ids.discard(paper.external_id)
+                            raise
+                        if session.papers_fetched >= max_papers:
+                            limit_reached.set()
+            except Exception as e:
+                target = session.domain.name if session.domain else session.session_id
+                error_msg = f"Error fetching papers for {target}: {e}"
+                logger.error(error_msg)
+                session.errors.append(error_msg)
+
+    async def _extraction_worker(self, queue: asyncio.Queue, session: LearningSession):
+        """Run brain.learn_from_paper on queued papers until a None sentinel."""
+        while True:
+            paper = await queue.get()
+            if paper is None:
+                return
+            try:
+                result = await self.brain.learn_from_paper(paper.to_dict())
+                session.claims_extracted += result['claims_extracted']
+                session.connections_found += result['connections_found']
+                session.patterns_detected += result['patterns_detected']
+
+            except Exception as e:
+                error_msg = f"Error processing paper {paper.external_id}: {e}"
+                logger.error(error_msg)
+                session.errors.append(error_msg)
+
+    @staticmethod
+    async def _run_searches(
+        searches: List[Tuple[Callable[[], Awaitable[List[Paper]]], str]]
+    ) -> AsyncIterator[List[Paper]]:
+        """
+        Run one source's searches concurrently, yielding each result list as it completes.
+
+        The source client's RateLimiter still spaces the actual requests.
+
+        Args:
+            searches: (search call, error message prefix) pairs
+        """
+        async def run(search: Callable[[], Awaitable[List[Paper]]], error_msg: str) -> List[Paper]:
+            try:
+                return await search()
+            except Exception as e:
+                logger.error(f"{error_msg}: {e}")
+                return []
+
+        tasks = [asyncio.ensure_future(run(search, error_msg)) for search, error_msg in searches]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _stream_openalex(
         self,
         strategy: DomainStrategy,
         limit: int,
         days_back: int
-    ) -> List[Paper]:
+    ) -> AsyncIterator[List[Paper]]:
         """Fetch papers from OpenAlex."""
-        papers = []
-
         # Calculate date range
         from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
 
         # Search by concepts
-        for concept_id in strategy.openalex_concepts[:2]:  # Limit concepts
-            try:
-                results = await self.openalex.search(
-                    query="",
-                    concept_ids=[concept_id],
-                    limit=limit // len(strategy.openalex_concepts),
-                    from_date=from_date,
-                    is_oa=True,  # Prefer open access
-                    sort="cited_by_count"
-                )
-                papers.extend(results)
-            except Exception as e:
-                logger.error(f"OpenAlex search failed for concept {concept_id}: {e}")
+        searches = [
+            (partial(
+                self.openalex.search,
+                query="",
+                concept_ids=[concept_id],
+                limit=limit // len(strategy.openalex_concepts),
+                from_date=from_date,
+                is_oa=True,  # Prefer open access
+                sort="cited_by_count"
+            ), f"OpenAlex search failed for concept {concept_id}")
+            for concept_id in strategy.openalex_concepts[:2]  # Limit concepts
+        ]
 
         # Also search by keywords
-        for keyword in strategy.keywords[:3]:
-            try:
-                results = await self.openalex.search(
-                    query=keyword,
-                    limit=limit // 10,
-                    from_date=from_date
-                )
-                papers.extend(results)
-            except Exception as e:
-                logger.error(f"OpenAlex keyword search failed for '{keyword}': {e}")
-
-        return papers
-
-    async def _fetch_arxiv(
+        searches += [
+            (partial(
+                self.openalex.search,
+                query=keyword,
+                limit=limit // 10,
+                from_date=from_date
+            ), f"OpenAlex keyword search failed for '{keyword}'")
+            for keyword in strategy.keywords[:3]
+        ]
+
+        return self._run_searches(searches)
+
+    def _stream_arxiv(
         self,
         strategy: DomainStrategy,
         limit: int,
         days_back: int
-    ) -> List[Paper]:
+    ) -> AsyncIterator[List[Paper]]:
         """Fetch papers from arXiv."""
-        papers = []
-
-        for category in strategy.arxiv_categories[:3]:
-            try:
-                results = await self.arxiv.search(
-                    query=f"cat:{category}",
-                    limit=limit // len(strategy.arxiv_categories),
-                    sort_by="submittedDate",
-                    sort_order="descending"
-                )
-                papers.extend(results)
-            except Exception as e:
-                logger.error(f"arXiv search failed for category {category}: {e}")
-
-        return papers
-
-    async def _fetch_pubmed(
+        return self._run_searches([
+            (partial(
+                self.arxiv.search,
+                query=f"cat:{category}",
+                limit=limit // len(strategy.arxiv_categories),
+                sort_by="submittedDate",
+                sort_order="descending"
+            ), f"arXiv search failed for category {category}")
+            for category in strategy.arxiv_categories[:3]
+        ])
+
+    def _stream_pubmed(
         self,
         strategy: DomainStrategy,
         limit: int,
         days_back: int
-    ) -> List[Paper]:
+    ) -> AsyncIterator[List[Paper]]:
         """Fetch papers from PubMed."""
-        papers = []
-
         from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y/%m/%d')
 
-        for mesh_term in strategy.pubmed_mesh[:3]:
-            try:
-                results = await self.pubmed.search(
-                    query=f"{mesh_term}[MeSH Terms]",
-                    limit=limit // len(strategy.pubmed_mesh),
-                    from_date=from_date
-                )
-                papers.extend(results)
-            except Exception as e:
-                logger.error(f"PubMed search failed for MeSH term {mesh_term}: {e}")
-
-        return papers
-
-    async def _fetch_semantic_scholar(
+        return self._run_searches([
+            (partial(
+                self.pubmed.search,
+                query=f"{mesh_term}[MeSH Terms]",
+                limit=limit // len(strategy.pubmed_mesh),
+                from_date=from_date
+            ), f"PubMed search failed for MeSH term {mesh_term}")
+            for mesh_term in strategy.pubmed_mesh[:3]
+        ])
+
+    def _stream_semantic_scholar(
         self,
         strategy: DomainStrategy,
         limit: int,
         days_back: int
-    ) -> List[Paper]:
+    ) -> AsyncIterator[List[Paper]]:
         """Fetch papers from Semantic Scholar."""
-        papers = []
-
         # Search by keywords, filter for high-impact
-        for keyword in strategy.keywords[:2]:
-            try:
-                results = await self.semantic_scholar.search(
-                    query=keyword,
-                    limit=limit // 2,
-                    min_citation_count=10,  # Focus on impactful papers
-                    open_access_only=True
-                )
-                papers.extend(results)
-            except Exception as e:
-                logger.error(f"Semantic Scholar search failed for '{keyword}': {e}")
+        return self._run_searches([
+            (partial(
+                self.semantic_scholar.search,
+                query=keyword,
+                limit=limit // 2,
+                min_citation_count=10,  # Focus on impactful papers
+                open_access_only=True
+            ), f"Semantic Scholar search failed for '{keyword}'")
+            for keyword in strategy.keywords[:2]
+        ])
+
+    def _accept_paper(self, paper: Paper, seen_titles: Set[str]) -> Optional[str]:
+        """
+        Record a paper if it is new (by ID and normalized title).
+
+        Returns:
+            The paper's title hash, or None for a duplicate
+        """
+        if paper.external_id in self.seen_ids:
+            return None
+
+        title_normalized = paper.title.lower().strip()
+        title_hash = hash_learner.compute_shake256(title_normalized)[:16]
+        if title_hash in seen_titles:
+            return None
 
-        return papers
+        seen_titles.add(title_hash)
+        self.seen_ids.add(paper.external_id)
+        return title_hash
 
     def _deduplicate_papers(self, papers: List[Paper]) -> List[Paper]:
         """Remove duplicate papers based on ID and title similarity."""
-        seen_ids = set()
-        seen_titles = set()
-        unique = []
-
-        for paper in papers:
-            # Check by ID
-            if paper.external_id in seen_ids:
-                continue
-            if paper.external_id in self.seen_ids:
-                continue
-
-            # Check by normalized title
-            title_normalized = paper.title.lower().strip()
-            title_hash = hash_learner.compute_shake256(title_normalized)[:16]
-
-            if title_hash in seen_titles:
-                continue
-
-            seen_ids.add(paper.external_id)
-            seen_titles.add(title_hash)
-            self.seen_ids.add(paper.external_id)
-            unique.append(paper)
-
-        return unique
+        seen_titles: Set[str] = set()
+        return [paper for paper in papers if self._accept_paper(paper, seen_titles) is not None]
 
     def _detect_domains(self, paper: Paper) -> List[Domain]:
         """Detect which domains a paper belongs to."""
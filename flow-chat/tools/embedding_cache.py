@@ -0,0 +1,342 @@
+"""
+CIPHER Embedding Cache
+
+Content-addressed cache for embedding vectors, shared by every
+EmbeddingService in the process and persisted across restarts.
+
+- Keys are sha256(model name + text): no collisions between texts that
+  share a prefix and length, and no reuse of vectors across models
+- Hot vectors stay in an in-memory LRU bounded by bytes, not entries
+- Every vector is also appended to an on-disk store: one raw float32
+  file per model (read through a memory map) plus a SQLite index from
+  key to row. The store survives restarts and can be shared by several
+  processes (SQLite serialises the appends); clearing it renames a new
+  file over the old one, which the other processes notice on their next
+  read
+
+Location: $CIPHER_EMBEDDING_CACHE, default $CIPHER_BASE_PATH/cache/embeddings
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(os.getenv(
+    "CIPHER_EMBEDDING_CACHE",
+    Path(os.getenv("CIPHER_BASE_PATH", "/opt/cipher")) / "cache" / "embeddings"
+))
+DEFAULT_MAX_MEMORY_BYTES = int(os.getenv("CIPHER_EMBEDDING_CACHE_MB", "256")) * 1024 * 1024
+
+
+def content_key(model_name: str, text: str) -> str:
+    """Cache key for a text embedded by a given model"""
+    return hashlib.sha256(f"{model_name}\0{text}".encode('utf-8', errors='surrogatepass')).hexdigest()
+
+
+class DiskVectorStore:
+    """
+    Append-only float32 vectors with a SQLite key index.
+
+    vectors.f32 holds fixed-size rows; index.sqlite maps key -> row and
+    records the row width and which vector file the rows belong to. The
+    vector file is never truncated in place (other processes may have it
+    mapped): clear() renames a fresh file over it, and readers that find a
+    different file than the index names re-read its width, or treat the
+    lookup as a miss while the swap is in progress.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        directory.mkdir(parents=True, exist_ok=True)
+        self.vectors_path = directory / 'vectors.f32'
+        self.vectors_path.touch(exist_ok=True)
+
+        self._db = sqlite3.connect(str(directory / 'index.sqlite'), check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS vectors (key TEXT PRIMARY KEY, row INTEGER NOT NULL)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        self._db.commit()
+
+        self.dimensions: Optional[int] = self._meta().get('dimensions')
+        self._mapped_file: Optional[str] = None  # file_id of the file behind _mmap
+        self._mmap: Optional[np.memmap] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _file_id(st: os.stat_result) -> str:
+        return f"{st.st_dev}:{st.st_ino}"
+
+    def _meta(self) -> Dict[str, Any]:
+        meta = dict(self._db.execute("SELECT name, value FROM meta").fetchall())
+        if 'dimensions' in meta:
+            meta['dimensions'] = int(meta['dimensions'])
+        return meta
+
+    def _rows(self, f, file_id: str, size: int) -> Optional[np.memmap]:
+        """Memory map over the whole rows of an open vector file, re-opened when it has grown or changed"""
+        if not self.dimensions:
+            return None
+        n_rows = size // (self.dimensions * 4)
+        if n_rows == 0:
+            return None
+        if self._mmap is None or self._mapped_file != file_id or len(self._mmap) < n_rows:
+            self._mmap = np.memmap(f, dtype=np.float32, mode='r', shape=(n_rows, self.dimensions))
+            self._mapped_file = file_id
+        return self._mmap
+
+    def _lookup(self, keys: Sequence[str]) -> Dict[str, int]:
+        """key -> row for the keys present (SQLite caps bound parameters, so in chunks)"""
+        found: Dict[str, int] = {}
+        for start in range(0, len(keys), 500):
+            chunk = list(keys[start:start + 500])
+            placeholders = ','.join('?' * len(chunk))
+            found.update(self._db.execute(
+                f"SELECT key, row FROM vectors WHERE key IN ({placeholders})", chunk
+            ).fetchall())
+        return found
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        if not keys:
+            return {}
+        with self._lock, self._db, open(self.vectors_path, 'rb') as f:
+            # One read transaction: the meta and rows read belong together
+            self._db.execute("BEGIN")
+            meta = self._meta()
+            found = self._lookup(keys)
+            if not found:
+                return {}
+            st = os.fstat(f.fileno())
+            file_id = self._file_id(st)
+            if meta.get('file') not in (None, file_id):
+                return {}  # the index describes another file (clear() in progress)
+            self.dimensions = meta.get('dimensions')
+            rows = self._rows(f, file_id, st.st_size)
+            if rows is None:
+                return {}
+            return {key: np.array(rows[row]) for key, row in found.items() if row < len(rows)}
+
+    def put_many(self, items: Dict[str, np.ndarray]):
+        if not items:
+            return
+        dims = len(next(iter(items.values())))
+        with self._lock, self._db:
+            # BEGIN IMMEDIATE: one writer at a time across processes
+            self._db.execute("BEGIN IMMEDIATE")
+            # Another process may have cleared the store since we last looked
+            self.dimensions = self._meta().get('dimensions')
+            if self.dimensions is None:
+                self.dimensions = dims
+                self._db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('dimensions', ?)", (str(dims),))
+            if dims != self.dimensions:
+                raise ValueError(f"Cache holds {self.dimensions}-d vectors, got {dims}-d")
+
+            existing = self._lookup(list(items))
+            new = [(k, v) for k, v in items.items() if k not in existing]
+            if not new:
+                return
+
+            row_bytes = dims * 4
+            with open(self.vectors_path, 'r+b') as f:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('file', ?)",
+                    (self._file_id(os.fstat(f.fileno())),)
+                )
+                # A failed append may have left part of a row (its index rows
+                # were rolled back): start again on the last row boundary
+                first_row = f.seek(0, os.SEEK_END) // row_bytes
+                if f.tell() != first_row * row_bytes:
+                    f.truncate(first_row * row_bytes)
+                    f.seek(first_row * row_bytes)
+                f.write(np.stack([v for _, v in new]).astype(np.float32).tobytes())
+            self._db.executemany(
+                "INSERT OR IGNORE INTO vectors (key, row) VALUES (?, ?)",
+                [(key, first_row + i) for i, (key, _) in enumerate(new)]
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("BEGIN IMMEDIATE")
+            self._db.execute("DELETE FROM vectors")
+            self._db.execute("DELETE FROM meta")
+            # New file renamed over the old one: mappings of the old file stay valid
+            fresh = self.vectors_path.with_name(f"{self.vectors_path.name}.{os.getpid()}.tmp")
+            fresh.write_bytes(b'')
+            self._db.execute(
+                "INSERT INTO meta (name, value) VALUES ('file', ?)", (self._file_id(os.stat(fresh)),)
+            )
+            os.replace(fresh, self.vectors_path)
+            self.dimensions = None
+            self._mmap = None
+            self._mapped_file = None
+
+    def close(self):
+        self._db.close()
+
+
+class EmbeddingCache:
+    """
+    Two-level embedding cache for one model: byte-bounded LRU + disk store.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        directory: Optional[Path] = DEFAULT_CACHE_DIR,
+        persistent: bool = True
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            model_name: Embedding model (part of every key)
+            max_memory_bytes: LRU budget for vectors held in memory
+            directory: Root of the on-disk stores (one subdirectory per model)
+            persistent: Whether to use the on-disk store at all
+        """
+        self.model_name = model_name
+        self.max_memory_bytes = max_memory_bytes
+        self._lru: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self.disk: Optional[DiskVectorStore] = None
+        if persistent and directory is not None:
+            try:
+                self.disk = DiskVectorStore(Path(directory) / re.sub(r'[^A-Za-z0-9._-]+', '_', model_name))
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Embedding cache not persistent ({directory}): {e}")
+
+    def _remember(self, key: str, vector: np.ndarray):
+        """Insert into the LRU and evict down to the byte budget (lock held)"""
+        if key in self._lru:
+            self._lru.move_to_end(key)
+            return
+        self._lru[key] = vector
+        self._memory_bytes += vector.nbytes
+        while self._memory_bytes > self.max_memory_bytes and self._lru:
+            _, evicted = self._lru.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Look up cached vectors.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Vector (as a list) or None per text
+        """
+        keys = [content_key(self.model_name, t) for t in texts]
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._lru.get(key)
+                if vector is not None:
+                    self._lru.move_to_end(key)
+                    found[key] = vector
+
+        missing = [k for k in dict.fromkeys(keys) if k not in found]
+        if missing and self.disk is not None:
+            try:
+                from_disk = self.disk.get_many(missing)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache read failed: {e}")
+                from_disk = {}
+            with self._lock:
+                for key, vector in from_disk.items():
+                    self._remember(key, vector)
+            found.update(from_disk)
+            self.disk_hits += len(from_disk)
+
+        results = [found[k].tolist() if k in found else None for k in keys]
+        hit_count = sum(r is not None for r in results)
+        self.hits += hit_count
+        self.misses += len(results) - hit_count
+        return results
+
+    def get(self, text: str) -> Optional[List[float]]:
+        return self.get_many([text])[0]
+
+    async def aget_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """get_many for coroutines: lookups that need the disk store run in a worker thread"""
+        if self.disk is not None:
+            keys = [content_key(self.model_name, t) for t in texts]
+            with self._lock:
+                in_memory = all(k in self._lru for k in keys)
+            if not in_memory:
+                return await asyncio.to_thread(self.get_many, texts)
+        return self.get_many(texts)
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[List[float]]):
+        """
+        Store vectors in memory and on disk.
+
+        Args:
+            texts: Embedded texts
+            vectors: Their vectors, in the same order
+        """
+        self._write(self._put_memory(texts, vectors))
+
+    def _put_memory(self, texts: Sequence[str], vectors: Sequence[List[float]]) -> Dict[str, np.ndarray]:
+        items = {content_key(self.model_name, t): np.asarray(v, dtype=np.float32) for t, v in zip(texts, vectors)}
+        with self._lock:
+            for key, vector in items.items():
+                self._remember(key, vector)
+        return items
+
+    def _write(self, items: Dict[str, np.ndarray]):
+        if self.disk is not None:
+            try:
+                self.disk.put_many(items)
+            except (OSError, sqlite3.Error, ValueError) as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+
+    async def aput_many(self, texts: Sequence[str], vectors: Sequence[List[float]]):
+        """put_many for coroutines: the disk write runs in a worker thread"""
+        items = self._put_memory(texts, vectors)
+        if self.disk is not None:
+            await asyncio.to_thread(self._write, items)
+
+    def put(self, text: str, vector: List[float]):
+        self.put_many([text], [vector])
+
+    def clear(self, disk: bool = False):
+        """Drop the in-memory vectors (and the on-disk store if disk=True)"""
+        with self._lock:
+            self._lru.clear()
+            self._memory_bytes = 0
+        if disk and self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'model': self.model_name,
+            'memory_entries': len(self._lru),
+            'memory_bytes': self._memory_bytes,
+            'max_memory_bytes': self.max_memory_bytes,
+            'disk_entries': len(self.disk) if self.disk is not None else None,
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+        }
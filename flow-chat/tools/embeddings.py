@@ -14,11 +14,13 @@ Supports multiple backends:
 
 import asyncio
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Sequence, Union
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import numpy as np
 
+from .embedding_cache import EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +33,62 @@ class EmbeddingResult:
     dimensions: int
 
 
+def normalize_rows(vectors: Any) -> np.ndarray:
+    """
+    L2-normalise vectors into a contiguous float32 matrix.
+
+    Zero vectors stay zero (similarity 0 with everything).
+
+    Args:
+        vectors: One vector or a sequence of vectors
+
+    Returns:
+        (n, dimensions) float32 array
+    """
+    matrix = np.ascontiguousarray(np.asarray(vectors, dtype=np.float32))
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def top_k_indices(scores: np.ndarray, k: int, threshold: float = -1.0) -> np.ndarray:
+    """
+    Indices of the k highest scores at or above threshold, best first.
+
+    Uses argpartition, so only the k winners are sorted.
+    """
+    candidates = np.flatnonzero(scores >= threshold)
+    if len(candidates) > k:
+        candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+class CandidateMatrix:
+    """
+    Candidate vectors stored once as a normalised float32 matrix.
+
+    Build it once and pass it to find_similar / find_similar_batch for
+    every query, instead of re-converting Python lists per call.
+    """
+
+    def __init__(self, ids: Sequence[Any], vectors: Any):
+        self.ids = list(ids)
+        self.matrix = normalize_rows(vectors) if self.ids else np.zeros((0, 0), dtype=np.float32)
+
+    @classmethod
+    def from_pairs(cls, candidates: Sequence[Tuple[Any, List[float]]]) -> 'CandidateMatrix':
+        """Build from (id, vector) tuples"""
+        return cls([c[0] for c in candidates], [c[1] for c in candidates])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+Candidates = Union[CandidateMatrix, Sequence[Tuple[Any, List[float]]]]
+
+
 class EmbeddingBackend(ABC):
     """Abstract base class for embedding backends"""
 
@@ -127,7 +185,7 @@ class EmbeddingService:
 
     Handles:
     - Embedding computation with configurable backend
-    - Caching (optional)
+    - Caching (optional, bounded LRU + on-disk store, see embedding_cache)
     - Similarity computation
     - Batch processing
     """
@@ -135,18 +193,22 @@ class EmbeddingService:
     def __init__(
         self,
         backend: Optional[EmbeddingBackend] = None,
-        cache_enabled: bool = True
+        cache_enabled: bool = True,
+        cache: Optional[EmbeddingCache] = None
     ):
         """
         Initialize the embedding service.
 
         Args:
             backend: Embedding backend to use (default: SentenceTransformer)
-            cache_enabled: Whether to cache embeddings in memory
+            cache_enabled: Whether to cache embeddings
+            cache: Cache to use (default: persistent cache for the backend's model)
         """
         self.backend = backend or SentenceTransformerBackend()
         self.cache_enabled = cache_enabled
-        self._cache: Dict[str, List[float]] = {}
+        self._cache: Optional[EmbeddingCache] = None
+        if cache_enabled:
+            self._cache = cache or EmbeddingCache(self.backend.model_name)
 
     @property
     def dimensions(self) -> int:
@@ -158,11 +220,6 @@ class EmbeddingService:
         """Get model name"""
         return self.backend.model_name
 
-    def _cache_key(self, text: str) -> str:
-        """Generate cache key for text"""
-        # Use first 100 chars + length as simple key
-        return f"{text[:100]}_{len(text)}"
-
     async def embed(self, text: str) -> EmbeddingResult:
         """
         Embed a single text.
@@ -184,13 +241,13 @@ class EmbeddingService:
 
         # Check cache
         if self.cache_enabled:
-            cache_key = self._cache_key(text)
-            if cache_key in self._cache:
+            cached = (await self._cache.aget_many([text]))[0]
+            if cached is not None:
                 return EmbeddingResult(
                     text=text,
-                    vector=self._cache[cache_key],
+                    vector=cached,
                     model=self.model_name,
-                    dimensions=self.dimensions
+                    dimensions=len(cached)
                 )
 
         # Compute embedding
@@ -198,7 +255,7 @@ class EmbeddingService:
 
         # Cache result
         if self.cache_enabled:
-            self._cache[cache_key] = vector
+            await self._cache.aput_many([text], [vector])
 
         return EmbeddingResult(
             text=text,
@@ -230,6 +287,12 @@ class EmbeddingService:
         uncached_indices = []
         uncached_texts = []
 
+        non_empty = [i for i, text in enumerate(texts) if text and text.strip()]
+        if self.cache_enabled:
+            cached = await self._cache.aget_many([texts[i] for i in non_empty])
+        else:
+            cached = [None] * len(non_empty)
+
         for i, text in enumerate(texts):
             if not text or not text.strip():
                 results[i] = EmbeddingResult(
@@ -238,21 +301,18 @@ class EmbeddingService:
                     model=self.model_name,
                     dimensions=self.dimensions
                 )
-            elif self.cache_enabled:
-                cache_key = self._cache_key(text)
-                if cache_key in self._cache:
-                    results[i] = EmbeddingResult(
-                        text=text,
-                        vector=self._cache[cache_key],
-                        model=self.model_name,
-                        dimensions=self.dimensions
-                    )
-                else:
-                    uncached_indices.append(i)
-                    uncached_texts.append(text)
+
+        for i, vector in zip(non_empty, cached):
+            if vector is not None:
+                results[i] = EmbeddingResult(
+                    text=texts[i],
+                    vector=vector,
+                    model=self.model_name,
+                    dimensions=len(vector)
+                )
             else:
                 uncached_indices.append(i)
-                uncached_texts.append(text)
+                uncached_texts.append(texts[i])
 
         # Batch embed uncached texts
         if uncached_texts:
@@ -261,11 +321,11 @@ class EmbeddingService:
 
             vectors = await self.backend.embed_batch(uncached_texts)
 
-            for idx, text, vector in zip(uncached_indices, uncached_texts, vectors):
-                # Cache
-                if self.cache_enabled:
-                    self._cache[self._cache_key(text)] = vector
+            # Cache (one disk write for the whole batch)
+            if self.cache_enabled:
+                await self._cache.aput_many(uncached_texts, vectors)
 
+            for idx, text, vector in zip(uncached_indices, uncached_texts, vectors):
                 results[idx] = EmbeddingResult(
                     text=text,
                     vector=vector,
@@ -301,10 +361,23 @@ class EmbeddingService:
 
         return float(np.dot(a, b) / (norm_a * norm_b))
 
+    def similarity_matrix(self, queries: Any, candidates: Any) -> np.ndarray:
+        """
+        Cosine similarities between every query and every candidate.
+
+        Args:
+            queries: (q, d) vectors (or a single vector)
+            candidates: (n, d) vectors
+
+        Returns:
+            (q, n) similarity matrix from a single GEMM
+        """
+        return normalize_rows(queries) @ normalize_rows(candidates).T
+
     def find_similar(
         self,
         query_vector: List[float],
-        candidates: List[Tuple[Any, List[float]]],
+        candidates: Candidates,
         top_k: int = 10,
         threshold: float = 0.0
     ) -> List[Tuple[Any, float]]:
@@ -313,24 +386,45 @@ class EmbeddingService:
 
         Args:
             query_vector: Query embedding
-            candidates: List of (id, vector) tuples
+            candidates: CandidateMatrix, or list of (id, vector) tuples
             top_k: Number of results to return
             threshold: Minimum similarity threshold
 
         Returns:
             List of (id, similarity) tuples, sorted by similarity
         """
-        similarities = []
+        return self.find_similar_batch([query_vector], candidates, top_k, threshold)[0]
+
+    def find_similar_batch(
+        self,
+        query_vectors: Sequence[List[float]],
+        candidates: Candidates,
+        top_k: int = 10,
+        threshold: float = 0.0
+    ) -> List[List[Tuple[Any, float]]]:
+        """
+        find_similar for many queries with one matrix product.
 
-        for item_id, vector in candidates:
-            sim = self.cosine_similarity(query_vector, vector)
-            if sim >= threshold:
-                similarities.append((item_id, sim))
+        Args:
+            query_vectors: Query embeddings
+            candidates: CandidateMatrix, or list of (id, vector) tuples
+            top_k: Number of results per query
+            threshold: Minimum similarity threshold
 
-        # Sort by similarity descending
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        Returns:
+            One (id, similarity) list per query, sorted by similarity
+        """
+        if not isinstance(candidates, CandidateMatrix):
+            candidates = CandidateMatrix.from_pairs(candidates)
+        if not len(candidates) or top_k <= 0:
+            return [[] for _ in query_vectors]
 
-        return similarities[:top_k]
+        scores = normalize_rows(query_vectors) @ candidates.matrix.T
+
+        results = []
+        for row in scores:
+            results.append([(candidates.ids[i], float(row[i])) for i in top_k_indices(row, top_k, threshold)])
+        return results
 
     async def semantic_search(
         self,
@@ -351,31 +445,55 @@ class EmbeddingService:
         Returns:
             List of (id, similarity) tuples
         """
-        # Embed query
-        query_result = await self.embed(query)
-
-        # Embed all candidates
-        texts = [text for _, text in candidates]
-        candidate_results = await self.embed_batch(texts)
-
-        # Build vector list
-        candidate_vectors = [
-            (candidates[i][0], result.vector)
-            for i, result in enumerate(candidate_results)
-        ]
-
-        return self.find_similar(
-            query_result.vector,
-            candidate_vectors,
+        results = await self.semantic_search_batch([query], candidates, top_k, threshold)
+        return results[0]
+
+    async def semantic_search_batch(
+        self,
+        queries: List[str],
+        candidates: List[Tuple[Any, str]],
+        top_k: int = 10,
+        threshold: float = 0.5
+    ) -> List[List[Tuple[Any, float]]]:
+        """
+        Search many queries against the same candidate texts.
+
+        Candidates are embedded and normalised once, then all queries are
+        scored with a single matrix product.
+
+        Args:
+            queries: Query texts
+            candidates: List of (id, text) tuples
+            top_k: Number of results per query
+            threshold: Minimum similarity
+
+        Returns:
+            One list of (id, similarity) tuples per query
+        """
+        if not queries:
+            return []
+
+        query_results = await self.embed_batch(queries)
+        candidate_results = await self.embed_batch([text for _, text in candidates])
+
+        matrix = CandidateMatrix([c[0] for c in candidates], [r.vector for r in candidate_results])
+        return self.find_similar_batch(
+            [r.vector for r in query_results],
+            matrix,
             top_k=top_k,
             threshold=threshold
         )
 
-    def clear_cache(self):
-        """Clear the embedding cache"""
-        self._cache.clear()
+    def clear_cache(self, disk: bool = False):
+        """Clear the in-memory embedding cache (and the on-disk store if disk=True)"""
+        if self._cache is not None:
+            self._cache.clear(disk=disk)
         logger.info("Embedding cache cleared")
 
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Hit/miss counters and sizes of the embedding cache"""
+        return self._cache.stats() if self._cache is not None else None
+
 
 # Singleton instance for global use
 _embedding_service: Optional[EmbeddingService] = None
@@ -9,19 +9,35 @@ Provides graph-native querying and algorithms using:
 4. Community detection for finding knowledge clusters
 5. Cross-domain bridge analysis
 
+The in-memory graph is stored in CSR form: nodes are dense indices,
+out/in adjacency are NumPy offset + neighbour arrays, and edge records
+are a flat list indexed by edge id. PageRank and clustering run as
+sparse matrix products (scipy.sparse when installed), betweenness is
+sampled Brandes spread over worker processes.
+
 Cross-domain bridge: Math (graph theory) ↔ Neuro (connectomics) ↔ Biology (networks)
 """
 
 import asyncio
 import logging
 import math
-from collections import defaultdict, deque
-from datetime import datetime
+import os
+import time
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import heapq
 
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:  # optional: clustering falls back to per-node set intersection
+    sparse = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,15 +69,37 @@ class GraphNode:
     community_id: Optional[int] = None
 
 
-@dataclass
 class GraphEdge:
     """An edge in the knowledge graph (represents a connection)"""
-    source_id: int
-    target_id: int
-    connection_type: str
-    strength: float
-    cross_domain: bool
-    reasoning: Optional[str] = None
+
+    # One record per connection - slots keep large graphs compact
+    __slots__ = ('source_id', 'target_id', 'connection_type', 'strength', 'cross_domain', 'reasoning')
+
+    def __init__(
+        self,
+        source_id: int,
+        target_id: int,
+        connection_type: str,
+        strength: float,
+        cross_domain: bool,
+        reasoning: Optional[str] = None
+    ):
+        self.source_id = source_id
+        self.target_id = target_id
+        self.connection_type = connection_type
+        self.strength = strength
+        self.cross_domain = cross_domain
+        self.reasoning = reasoning
+
+    def __repr__(self) -> str:
+        return (f"GraphEdge(source_id={self.source_id}, target_id={self.target_id}, "
+                f"connection_type={self.connection_type!r}, strength={self.strength}, "
+                f"cross_domain={self.cross_domain})")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GraphEdge):
+            return NotImplemented
+        return all(getattr(self, a) == getattr(other, a) for a in self.__slots__)
 
 
 @dataclass
@@ -100,15 +138,85 @@ class GraphStats:
     diameter: Optional[int] = None
 
 
+def _csr(keys: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Offsets and a stable ordering that group edges by key (insertion order kept)"""
+    order = np.argsort(keys, kind='stable')
+    ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n), out=ptr[1:])
+    return ptr, order
+
+
+# Path cache marker for "not cached" (None is a cached "no path")
+_MISS = object()
+
+# Adjacency for betweenness worker processes (set once per worker)
+_BRANDES_GRAPH: Optional[Tuple[List[int], List[int], int]] = None
+
+
+def _brandes_init(ptr: List[int], nbr: List[int], n: int):
+    global _BRANDES_GRAPH
+    _BRANDES_GRAPH = (ptr, nbr, n)
+
+
+def _brandes_worker(sources: List[int]) -> List[float]:
+    ptr, nbr, n = _BRANDES_GRAPH
+    return _brandes(ptr, nbr, n, sources)
+
+
+def _brandes(ptr: List[int], nbr: List[int], n: int, sources: List[int]) -> List[float]:
+    """Unnormalised Brandes dependency sums from the given source indices"""
+    betweenness = [0.0] * n
+    for source in sources:
+        # BFS from source
+        dist = {source: 0}
+        num_paths = {source: 1}
+        predecessors = defaultdict(list)
+        queue = deque([source])
+        order = []
+
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            next_dist = dist[v] + 1
+
+            for w in nbr[ptr[v]:ptr[v + 1]]:
+                if w not in dist:
+                    dist[w] = next_dist
+                    queue.append(w)
+
+                if dist[w] == next_dist:
+                    num_paths[w] = num_paths.get(w, 0) + num_paths[v]
+                    predecessors[w].append(v)
+
+        # Accumulate betweenness
+        delta = dict.fromkeys(order, 0.0)
+        for w in reversed(order):
+            for v in predecessors[w]:
+                if num_paths[w] > 0:
+                    delta[v] += (num_paths[v] / num_paths[w]) * (1 + delta[w])
+            if w != source:
+                betweenness[w] += delta[w]
+    return betweenness
+
+
 class GraphEngine:
     """
     Graph-native operations for the CIPHER knowledge network.
 
     Implements graph algorithms optimized for knowledge synthesis:
-    - Path finding (shortest, strongest connections)
+    - Path finding (shortest, strongest connections) with bidirectional
+      search, optional A*, batch queries and a result cache
     - Centrality measures (degree, betweenness, PageRank)
     - Community detection (Louvain-like algorithm)
     - Cross-domain bridge analysis
+
+    load_graph() reads the full graph once; sync_graph() then applies only
+    the claims and connections added or updated since, tracked by id and
+    updated_at high-water marks. Each sync re-reads a trailing window
+    below the marks (SYNC_LAG, SYNC_CONNECTION_WINDOW) so rows whose
+    transaction committed after a later one are not lost; rows already
+    applied are skipped. Anything later than that is picked up by the full
+    reload sync_graph() does every FULL_RELOAD_INTERVAL seconds.
     """
 
     # PageRank parameters
@@ -118,6 +226,24 @@ class GraphEngine:
 
     # Community detection parameters
     COMMUNITY_RESOLUTION = 1.0  # Higher = more communities
+    COMMUNITY_MAX_EDGES = 200000
+
+    # Without scipy, clustering is a per-node Python loop: graph stats skip it past this size
+    STATS_MAX_EDGES_NO_SCIPY = 10000
+
+    # Sampled betweenness: (sources x edges) above which worker processes are used
+    PARALLEL_BETWEENNESS_WORK = 2_000_000
+
+    # Recent path query results kept until the graph changes
+    PATH_CACHE_SIZE = 1024
+
+    # Incremental sync: claims updated up to SYNC_LAG before the last mark and
+    # the last SYNC_CONNECTION_WINDOW connection ids are read again each sync
+    # (updated_at is the writing transaction's start time, ids are assigned
+    # before commit), and the graph is fully reloaded every FULL_RELOAD_INTERVAL
+    SYNC_LAG = timedelta(minutes=5)
+    SYNC_CONNECTION_WINDOW = 10000
+    FULL_RELOAD_INTERVAL = 3600.0
 
     def __init__(self, db_connection_string: str):
         """
@@ -131,10 +257,27 @@ class GraphEngine:
 
         # In-memory graph representation
         self._nodes: Dict[int, GraphNode] = {}
-        self._adjacency: Dict[int, List[Tuple[int, GraphEdge]]] = defaultdict(list)
-        self._reverse_adjacency: Dict[int, List[Tuple[int, GraphEdge]]] = defaultdict(list)
+        self._node_ids: List[int] = []          # dense index -> claim id
+        self._index: Dict[int, int] = {}        # claim id -> dense index
+        self._edges: List[GraphEdge] = []       # edge id -> record
+        self._edge_src: List[int] = []          # edge id -> source index
+        self._edge_dst: List[int] = []          # edge id -> target index
+        self._version = 0
+        self._path_cache: "OrderedDict[Tuple, Optional[GraphPath]]" = OrderedDict()
+        self._domain_links: Optional[Dict[Any, Set[Any]]] = None
+        self._domain_keys: List[Tuple] = []
+        self._build_csr()
         self._loaded = False
 
+        # Incremental sync state
+        self._min_confidence = 0.0
+        self._claim_mark = 0                    # highest claim id seen
+        self._claim_updated_mark = None         # latest claim updated_at seen
+        self._connection_mark = 0               # highest connection id loaded
+        self._recent_connections: Set[int] = set()  # loaded ids inside the rescan window
+        self._loaded_at = 0.0                   # monotonic time of the last full load
+        self._pagerank: Optional[np.ndarray] = None  # last PageRank vector (warm start)
+
     async def connect(self):
         """Establish database connection."""
         import asyncpg
@@ -155,6 +298,18 @@ class GraphEngine:
         """
         logger.info("Loading knowledge graph into memory...")
 
+        self._nodes = {}
+        self._node_ids = []
+        self._index = {}
+        self._edges = []
+        self._edge_src = []
+        self._edge_dst = []
+        self._pagerank = None
+        self._min_confidence = min_confidence
+
+        # High-water marks first: anything committed later is left to sync_graph()
+        marks = await self._fetch_marks()
+
         # Load nodes (claims)
         rows = await self._conn.fetch("""
             SELECT id, claim_text, claim_type, domains, confidence
@@ -163,48 +318,237 @@ class GraphEngine:
         """, min_confidence)
 
         for row in rows:
-            self._nodes[row['id']] = GraphNode(
+            self._add_node(GraphNode(
                 id=row['id'],
                 claim_text=row['claim_text'],
                 claim_type=row['claim_type'] or 'unknown',
                 domains=row['domains'] or [],
                 confidence=row['confidence'] or 0.5
-            )
+            ))
 
         # Load edges (connections)
         edges = await self._conn.fetch("""
-            SELECT source_claim_id, target_claim_id, connection_type,
+            SELECT id, source_claim_id, target_claim_id, connection_type,
                    strength, cross_domain, reasoning
             FROM synthesis.connections
-        """)
+            WHERE id <= $1
+        """, marks['connection_mark'])
 
+        self._connection_mark = 0
+        self._recent_connections = set()
         for row in edges:
-            source_id = row['source_claim_id']
-            target_id = row['target_claim_id']
+            self._add_edge(row)
+        self._trim_recent_connections()
 
-            if source_id not in self._nodes or target_id not in self._nodes:
-                continue
+        self._build_csr()
+        self._claim_mark = marks['claim_mark']
+        self._claim_updated_mark = marks['claim_updated_mark']
+        self._loaded = True
+        self._loaded_at = time.monotonic()
+        logger.info(f"Loaded {len(self._nodes)} nodes and {len(self._edges)} edges")
 
-            edge = GraphEdge(
-                source_id=source_id,
-                target_id=target_id,
-                connection_type=row['connection_type'] or 'related',
-                strength=row['strength'] or 0.5,
-                cross_domain=row['cross_domain'] or False,
-                reasoning=row['reasoning']
-            )
+    async def sync_graph(self) -> Dict[str, int]:
+        """
+        Apply claims and connections added or updated since the last load.
 
-            self._adjacency[source_id].append((target_id, edge))
-            self._reverse_adjacency[target_id].append((source_id, edge))
+        New claims and connections are appended, updated claims are changed
+        in place, and degrees are updated per edge. If PageRank has been
+        computed, it is recomputed from the previous vector. A claim that
+        drops below the load's min_confidence, or a load older than
+        FULL_RELOAD_INTERVAL, triggers a full reload.
 
-            # Update degrees
-            self._nodes[source_id].out_degree += 1
-            self._nodes[target_id].in_degree += 1
-            self._nodes[source_id].degree += 1
-            self._nodes[target_id].degree += 1
+        Returns:
+            Counts of nodes added/updated and edges added, and whether the
+            graph was fully reloaded (then every node and edge counts as added)
+        """
+        if not self._loaded or time.monotonic() - self._loaded_at >= self.FULL_RELOAD_INTERVAL:
+            return await self._reload()
 
-        self._loaded = True
-        logger.info(f"Loaded {len(self._nodes)} nodes and {sum(len(adj) for adj in self._adjacency.values())} edges")
+        marks = await self._fetch_marks()
+
+        # Claims created or touched since the marks, plus the lag window
+        rows = await self._conn.fetch("""
+            SELECT id, claim_text, claim_type, domains, confidence
+            FROM synthesis.claims
+            WHERE id > $1 OR updated_at >= $2
+            ORDER BY id
+        """, self._claim_mark, self._claim_updated_mark - self.SYNC_LAG)
+
+        nodes_added = 0
+        nodes_updated = 0
+        revived = []  # older claims that now pass the confidence filter
+        for row in rows:
+            qualifies = row['confidence'] is not None and row['confidence'] >= self._min_confidence
+            node = self._nodes.get(row['id'])
+
+            if node is None:
+                if not qualifies:
+                    continue
+                self._add_node(GraphNode(
+                    id=row['id'],
+                    claim_text=row['claim_text'],
+                    claim_type=row['claim_type'] or 'unknown',
+                    domains=row['domains'] or [],
+                    confidence=row['confidence'] or 0.5
+                ))
+                nodes_added += 1
+                if row['id'] <= self._claim_mark:
+                    revived.append(row['id'])
+            elif not qualifies:
+                # Removing a node would renumber the CSR; reload instead
+                logger.info(f"Claim {row['id']} fell below min_confidence, reloading graph")
+                return await self._reload()
+            elif self._update_node(node, row):
+                nodes_updated += 1
+
+        # Connections in the rescan window, plus older ones attached to revived claims
+        edges = await self._conn.fetch("""
+            SELECT id, source_claim_id, target_claim_id, connection_type,
+                   strength, cross_domain, reasoning
+            FROM synthesis.connections
+            WHERE id > $1
+               OR (id <= $1 AND (source_claim_id = ANY($2::int[]) OR target_claim_id = ANY($2::int[])))
+            ORDER BY id
+        """, self._connection_mark - self.SYNC_CONNECTION_WINDOW, revived)
+
+        edges_added = sum(1 for row in edges if self._add_edge(row))
+        self._trim_recent_connections()
+
+        self._claim_mark = max(self._claim_mark, marks['claim_mark'])
+        self._claim_updated_mark = max(self._claim_updated_mark, marks['claim_updated_mark'])
+        if nodes_added or edges_added:
+            self._build_csr()
+            if self._pagerank is not None:
+                self.compute_pagerank(warm_start=True)
+        elif nodes_updated:
+            self._graph_changed()
+
+        if nodes_added or nodes_updated or edges_added:
+            logger.info(f"Graph sync: +{nodes_added} nodes, {nodes_updated} updated, +{edges_added} edges")
+        return {'nodes_added': nodes_added, 'nodes_updated': nodes_updated, 'edges_added': edges_added,
+                'reloaded': False}
+
+    async def _reload(self) -> Dict[str, int]:
+        await self.load_graph(self._min_confidence)
+        return {'nodes_added': len(self._nodes), 'nodes_updated': 0, 'edges_added': len(self._edges),
+                'reloaded': True}
+
+    async def _fetch_marks(self):
+        return await self._conn.fetchrow("""
+            SELECT
+                (SELECT COALESCE(MAX(id), 0) FROM synthesis.claims) as claim_mark,
+                (SELECT COALESCE(MAX(updated_at), 'epoch'::timestamp) FROM synthesis.claims) as claim_updated_mark,
+                (SELECT COALESCE(MAX(id), 0) FROM synthesis.connections) as connection_mark
+        """)
+
+    @staticmethod
+    def _update_node(node: GraphNode, row) -> bool:
+        """Apply a re-read claim row; False if nothing changed"""
+        fields = (
+            row['claim_text'],
+            row['claim_type'] or 'unknown',
+            row['domains'] or [],
+            row['confidence'] or 0.5,
+        )
+        if fields == (node.claim_text, node.claim_type, node.domains, node.confidence):
+            return False
+        node.claim_text, node.claim_type, node.domains, node.confidence = fields
+        return True
+
+    def _trim_recent_connections(self):
+        floor = self._connection_mark - self.SYNC_CONNECTION_WINDOW
+        self._recent_connections = {c for c in self._recent_connections if c > floor}
+
+    def _add_node(self, node: GraphNode):
+        self._index[node.id] = len(self._node_ids)
+        self._node_ids.append(node.id)
+        self._nodes[node.id] = node
+
+    def _add_edge(self, row) -> bool:
+        """Append a connection row if both endpoints are loaded and it is new (CSR rebuilt separately)"""
+        connection_id = row['id']
+        source_id = row['source_claim_id']
+        target_id = row['target_claim_id']
+
+        if connection_id in self._recent_connections:
+            return False  # re-read from the rescan window
+        if source_id not in self._index or target_id not in self._index:
+            return False
+
+        # Only accepted connections move the mark: a dangling one is retried while in the window
+        self._recent_connections.add(connection_id)
+        self._connection_mark = max(self._connection_mark, connection_id)
+
+        self._edges.append(GraphEdge(
+            source_id=source_id,
+            target_id=target_id,
+            connection_type=row['connection_type'] or 'related',
+            strength=row['strength'] or 0.5,
+            cross_domain=row['cross_domain'] or False,
+            reasoning=row['reasoning']
+        ))
+        self._edge_src.append(self._index[source_id])
+        self._edge_dst.append(self._index[target_id])
+
+        # Update degrees
+        self._nodes[source_id].out_degree += 1
+        self._nodes[target_id].in_degree += 1
+        self._nodes[source_id].degree += 1
+        self._nodes[target_id].degree += 1
+        return True
+
+    def _build_csr(self):
+        """Rebuild CSR adjacency and degree arrays from the edge list"""
+        n = len(self._node_ids)
+        src = np.asarray(self._edge_src, dtype=np.int64)
+        dst = np.asarray(self._edge_dst, dtype=np.int64)
+
+        self._src = src
+        self._dst = dst
+        self._strength = np.fromiter((e.strength for e in self._edges), dtype=np.float64, count=len(self._edges))
+
+        # Path search cost per edge: stronger connection = cheaper step
+        cost = np.maximum(1.0 - self._strength, 0.0)
+        self._cost_l = cost.tolist()
+        self._min_cost = float(cost.min()) if len(cost) else 0.0
+
+        self._out_ptr, out_order = _csr(src, n)
+        self._in_ptr, in_order = _csr(dst, n)
+        self._out_nbr, self._out_eid = dst[out_order], out_order
+        self._in_nbr, self._in_eid = src[in_order], in_order
+        self._out_deg = np.diff(self._out_ptr)
+        self._in_deg = np.diff(self._in_ptr)
+
+        # Python list views for the traversal loops (faster to index than arrays)
+        self._out_ptr_l = self._out_ptr.tolist()
+        self._out_nbr_l = self._out_nbr.tolist()
+        self._out_eid_l = self._out_eid.tolist()
+        self._in_ptr_l = self._in_ptr.tolist()
+        self._in_nbr_l = self._in_nbr.tolist()
+        self._in_eid_l = self._in_eid.tolist()
+        self._graph_changed()
+
+    def _out(self, node_id: int) -> List[Tuple[int, GraphEdge]]:
+        """Outgoing (neighbor_id, edge) pairs, in load order"""
+        i = self._index.get(node_id)
+        if i is None:
+            return []
+        a, b = self._out_ptr_l[i], self._out_ptr_l[i + 1]
+        ids, edges = self._node_ids, self._edges
+        return [(ids[j], edges[e]) for j, e in zip(self._out_nbr_l[a:b], self._out_eid_l[a:b])]
+
+    def _in(self, node_id: int) -> List[Tuple[int, GraphEdge]]:
+        """Incoming (neighbor_id, edge) pairs, in load order"""
+        i = self._index.get(node_id)
+        if i is None:
+            return []
+        a, b = self._in_ptr_l[i], self._in_ptr_l[i + 1]
+        ids, edges = self._node_ids, self._edges
+        return [(ids[j], edges[e]) for j, e in zip(self._in_nbr_l[a:b], self._in_eid_l[a:b])]
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edges)
 
     def _ensure_loaded(self):
         """Ensure graph is loaded."""
@@ -366,7 +710,7 @@ class GraphEngine:
         target_id: int
     ) -> Optional[GraphPath]:
         """
-        Find shortest path using BFS (in-memory).
+        Find shortest path using bidirectional BFS (in-memory).
 
         Args:
             source_id: Starting node ID
@@ -380,37 +724,21 @@ class GraphEngine:
         if source_id not in self._nodes or target_id not in self._nodes:
             return None
 
-        # BFS
-        queue = deque([(source_id, [source_id], [])])
-        visited = {source_id}
+        key = ('shortest', source_id, target_id)
+        cached = self._cache_get(key)
+        if cached is not _MISS:
+            return cached
 
-        while queue:
-            current, path, edges = queue.popleft()
-
-            if current == target_id:
-                domains = set()
-                for nid in path:
-                    domains.update(self._nodes[nid].domains)
-
-                return GraphPath(
-                    nodes=path,
-                    edges=edges,
-                    total_weight=sum(e.strength for e in edges),
-                    path_type='shortest',
-                    domains_traversed=domains
-                )
-
-            for neighbor, edge in self._adjacency[current]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor], edges + [edge]))
-
-        return None
+        found = self._bidirectional_bfs(self._index[source_id], self._index[target_id])
+        path = self._make_path(*found, 'shortest') if found else None
+        self._cache_put(key, path)
+        return path
 
     def find_strongest_path(
         self,
         source_id: int,
-        target_id: int
+        target_id: int,
+        use_astar: bool = False
     ) -> Optional[GraphPath]:
         """
         Find path with maximum total strength using Dijkstra (inverted weights).
@@ -418,68 +746,27 @@ class GraphEngine:
         Args:
             source_id: Starting node ID
             target_id: Target node ID
+            use_astar: Search forward with A* guided by domain-hop bounds
+                instead of bidirectional Dijkstra (same result)
 
         Returns:
             GraphPath with maximum strength
         """
         self._ensure_loaded()
 
-        if source_id not in self._nodes or target_id not in self._nodes:
-            return None
-
-        # Dijkstra with inverted weights (1 - strength)
-        dist = {source_id: 0}
-        prev = {}
-        prev_edge = {}
-        pq = [(0, source_id)]
-
-        while pq:
-            d, current = heapq.heappop(pq)
-
-            if current == target_id:
-                break
-
-            if d > dist.get(current, float('inf')):
-                continue
-
-            for neighbor, edge in self._adjacency[current]:
-                # Invert strength so higher strength = lower cost
-                weight = 1.0 - edge.strength
-                new_dist = d + weight
-
-                if new_dist < dist.get(neighbor, float('inf')):
-                    dist[neighbor] = new_dist
-                    prev[neighbor] = current
-                    prev_edge[neighbor] = edge
-                    heapq.heappush(pq, (new_dist, neighbor))
-
-        if target_id not in prev:
+        if source_id not in self._nodes or target_id not in self._nodes or source_id == target_id:
             return None
 
-        # Reconstruct path
-        path = []
-        edges = []
-        current = target_id
-
-        while current != source_id:
-            path.append(current)
-            edges.append(prev_edge[current])
-            current = prev[current]
-        path.append(source_id)
-        path.reverse()
-        edges.reverse()
-
-        domains = set()
-        for nid in path:
-            domains.update(self._nodes[nid].domains)
+        key = ('strongest', source_id, target_id)
+        cached = self._cache_get(key)
+        if cached is not _MISS:
+            return cached
 
-        return GraphPath(
-            nodes=path,
-            edges=edges,
-            total_weight=sum(e.strength for e in edges),
-            path_type='strongest',
-            domains_traversed=domains
-        )
+        s, t = self._index[source_id], self._index[target_id]
+        found = self._astar(s, t) if use_astar else self._bidirectional_dijkstra(s, t)
+        path = self._make_path(*found, 'strongest') if found else None
+        self._cache_put(key, path)
+        return path
 
     def find_cross_domain_path(
         self,
@@ -496,52 +783,107 @@ class GraphEngine:
         if source_id not in self._nodes or target_id not in self._nodes:
             return None
 
-        # Modified Dijkstra: prefer cross-domain edges
-        dist = {source_id: 0}
-        prev = {}
-        prev_edge = {}
-        pq = [(0, source_id, set(self._nodes[source_id].domains))]
+        key = ('cross_domain', source_id, target_id)
+        cached = self._cache_get(key)
+        if cached is not _MISS:
+            return cached
+
+        # Modified Dijkstra: prefer cross-domain edges. The cost depends on
+        # the domains seen so far, so this search runs in one direction only.
+        s, t = self._index[source_id], self._index[target_id]
+        nodes, cost = self._nodes, self._cost_l
+        ids = self._node_ids
+        out_ptr, out_nbr, out_eid = self._out_ptr_l, self._out_nbr_l, self._out_eid_l
+
+        dist = {s: 0}
+        parent: Dict[int, Tuple[int, int]] = {}
+        pq = [(0, s, frozenset(nodes[source_id].domains))]
 
         while pq:
-            d, current, domains_seen = heapq.heappop(pq)
+            d, v, domains_seen = heapq.heappop(pq)
 
-            if current == target_id:
+            if v == t:
                 break
 
-            if d > dist.get(current, float('inf')):
+            if d > dist.get(v, float('inf')):
                 continue
 
-            for neighbor, edge in self._adjacency[current]:
-                neighbor_domains = set(self._nodes[neighbor].domains)
-                new_domains = domains_seen | neighbor_domains
+            for k in range(out_ptr[v], out_ptr[v + 1]):
+                w = out_nbr[k]
+                new_domains = domains_seen.union(nodes[ids[w]].domains)
 
                 # Reward crossing into new domains
-                domain_bonus = len(new_domains - domains_seen) * 0.5
-                weight = (1.0 - edge.strength) - domain_bonus
+                domain_bonus = (len(new_domains) - len(domains_seen)) * 0.5
+                new_dist = d + cost[out_eid[k]] - domain_bonus
 
-                new_dist = d + weight
+                if new_dist < dist.get(w, float('inf')):
+                    dist[w] = new_dist
+                    parent[w] = (v, out_eid[k])
+                    heapq.heappush(pq, (new_dist, w, new_domains))
 
-                if new_dist < dist.get(neighbor, float('inf')):
-                    dist[neighbor] = new_dist
-                    prev[neighbor] = current
-                    prev_edge[neighbor] = edge
-                    heapq.heappush(pq, (new_dist, neighbor, new_domains))
+        # Negative (bonus) weights can leave a cycle in the parent pointers
+        found = self._walk_back(parent, s, t) if t in parent else None
+        path = self._make_path(*found, 'cross_domain') if found else None
+        self._cache_put(key, path)
+        return path
 
-        if target_id not in prev:
-            return None
+    def find_paths_among(
+        self,
+        node_ids: List[int],
+        path_type: str = 'shortest'
+    ) -> Dict[Tuple[int, int], GraphPath]:
+        """
+        Paths between every ordered pair of a set of nodes.
 
-        # Reconstruct path
-        path = []
-        edges = []
-        current = target_id
+        Runs one single-source search per node instead of one search per
+        pair; results also fill the path cache.
+
+        Args:
+            node_ids: Claim IDs
+            path_type: 'shortest' (fewest hops) or 'strongest'
+
+        Returns:
+            {(source_id, target_id): GraphPath} for the pairs that are connected
+        """
+        self._ensure_loaded()
+
+        if path_type not in ('shortest', 'strongest'):
+            raise ValueError(f"Unknown path type: {path_type}")
+
+        members = [nid for nid in dict.fromkeys(node_ids) if nid in self._nodes]
+        results: Dict[Tuple[int, int], GraphPath] = {}
+
+        for source_id in members:
+            targets = []
+            for target_id in members:
+                if target_id == source_id:
+                    continue
+                cached = self._cache_get((path_type, source_id, target_id))
+                if cached is _MISS:
+                    targets.append(self._index[target_id])
+                elif cached is not None:
+                    results[(source_id, target_id)] = cached
+            if not targets:
+                continue
+
+            s = self._index[source_id]
+            parent = self._search_tree(s, set(targets), weighted=(path_type == 'strongest'))
+            for t in targets:
+                target_id = self._node_ids[t]
+                path = self._make_path(*self._walk_back(parent, s, t), path_type) if t in parent else None
+                self._cache_put((path_type, source_id, target_id), path)
+                if path is not None:
+                    results[(source_id, target_id)] = path
 
-        while current != source_id:
-            path.append(current)
-            edges.append(prev_edge[current])
-            current = prev[current]
-        path.append(source_id)
-        path.reverse()
-        edges.reverse()
+        return results
+
+    # -------------------------------------------------------------------------
+    # Search primitives (dense indices, parent pointers)
+    # -------------------------------------------------------------------------
+
+    def _make_path(self, node_idx: List[int], edge_ids: List[int], path_type: str) -> GraphPath:
+        path = [self._node_ids[i] for i in node_idx]
+        edges = [self._edges[e] for e in edge_ids]
 
         domains = set()
         for nid in path:
@@ -551,19 +893,266 @@ class GraphEngine:
             nodes=path,
             edges=edges,
             total_weight=sum(e.strength for e in edges),
-            path_type='cross_domain',
+            path_type=path_type,
             domains_traversed=domains
         )
 
+    @staticmethod
+    def _walk_back(parent: Dict[int, Tuple[int, int]], s: int, t: int) -> Optional[Tuple[List[int], List[int]]]:
+        """Node and edge ids from s to t following parent pointers back from t (None on a cycle)"""
+        node_idx, edge_ids = [t], []
+        seen = {t}
+        v = t
+        while v != s:
+            v, e = parent[v]
+            if v in seen:
+                return None
+            seen.add(v)
+            node_idx.append(v)
+            edge_ids.append(e)
+        node_idx.reverse()
+        edge_ids.reverse()
+        return node_idx, edge_ids
+
+    def _join(
+        self,
+        meet: int,
+        fwd: Dict[int, Tuple[int, int]],
+        bwd: Dict[int, Tuple[int, int]]
+    ) -> Tuple[List[int], List[int]]:
+        """Splice the forward tree path to `meet` with the backward tree path from it"""
+        node_idx, edge_ids = [meet], []
+        v = meet
+        while fwd[v][0] != -1:
+            v, e = fwd[v]
+            node_idx.append(v)
+            edge_ids.append(e)
+        node_idx.reverse()
+        edge_ids.reverse()
+
+        v = meet
+        while bwd[v][0] != -1:
+            v, e = bwd[v]
+            node_idx.append(v)
+            edge_ids.append(e)
+        return node_idx, edge_ids
+
+    def _bidirectional_bfs(self, s: int, t: int) -> Optional[Tuple[List[int], List[int]]]:
+        """Fewest-hop path, growing the smaller frontier one full level at a time"""
+        if s == t:
+            return [s], []
+
+        # node -> (next node towards the root, edge id); roots point at -1
+        fwd = {s: (-1, -1)}
+        bwd = {t: (-1, -1)}
+        f_front, b_front = [s], [t]
+
+        while f_front and b_front:
+            if len(f_front) <= len(b_front):
+                front, seen, other = f_front, fwd, bwd
+                ptr, nbr, eid = self._out_ptr_l, self._out_nbr_l, self._out_eid_l
+            else:
+                front, seen, other = b_front, bwd, fwd
+                ptr, nbr, eid = self._in_ptr_l, self._in_nbr_l, self._in_eid_l
+
+            # Levels grow whole, so the first node both searches reach lies on a shortest path
+            nxt = []
+            for v in front:
+                for k in range(ptr[v], ptr[v + 1]):
+                    w = nbr[k]
+                    if w in seen:
+                        continue
+                    seen[w] = (v, eid[k])
+                    if w in other:
+                        return self._join(w, fwd, bwd)
+                    nxt.append(w)
+
+            if front is f_front:
+                f_front = nxt
+            else:
+                b_front = nxt
+
+        return None
+
+    def _bidirectional_dijkstra(self, s: int, t: int) -> Optional[Tuple[List[int], List[int]]]:
+        """Lowest-cost path (cost = 1 - strength), searching from both ends"""
+        cost = self._cost_l
+        sides = (
+            ({s: 0.0}, {s: (-1, -1)}, [(0.0, s)], self._out_ptr_l, self._out_nbr_l, self._out_eid_l),
+            ({t: 0.0}, {t: (-1, -1)}, [(0.0, t)], self._in_ptr_l, self._in_nbr_l, self._in_eid_l),
+        )
+        best, meet = float('inf'), -1
+
+        while sides[0][2] and sides[1][2]:
+            # No better meeting is possible once the two frontiers together exceed it
+            if sides[0][2][0][0] + sides[1][2][0][0] >= best:
+                break
+
+            side = 0 if sides[0][2][0][0] <= sides[1][2][0][0] else 1
+            dist, parent, pq, ptr, nbr, eid = sides[side]
+            other_dist = sides[1 - side][0]
+
+            d, v = heapq.heappop(pq)
+            if d > dist[v]:
+                continue
+
+            for k in range(ptr[v], ptr[v + 1]):
+                w = nbr[k]
+                new_dist = d + cost[eid[k]]
+                if new_dist < dist.get(w, float('inf')):
+                    dist[w] = new_dist
+                    parent[w] = (v, eid[k])
+                    heapq.heappush(pq, (new_dist, w))
+                    if w in other_dist and new_dist + other_dist[w] < best:
+                        best, meet = new_dist + other_dist[w], w
+
+        if meet == -1:
+            return None
+        return self._join(meet, sides[0][1], sides[1][1])
+
+    def _astar(self, s: int, t: int) -> Optional[Tuple[List[int], List[int]]]:
+        """
+        A* towards t. The heuristic is (domain hops still needed) x (cheapest
+        edge cost), where hops come from a BFS over the domain graph; it
+        never overestimates, so the path is optimal.
+        """
+        cost = self._cost_l
+        min_cost = self._min_cost
+        hops = self._domain_hops(t)
+        domains_of = self._domain_keys
+
+        def h(v: int) -> float:
+            if v == t:
+                return 0.0
+            needed = min((hops.get(d, math.inf) for d in domains_of[v]), default=math.inf)
+            return max(needed, 1) * min_cost
+
+        out_ptr, out_nbr, out_eid = self._out_ptr_l, self._out_nbr_l, self._out_eid_l
+        dist = {s: 0.0}
+        parent: Dict[int, Tuple[int, int]] = {}
+        pq = [(h(s), s)]
+
+        while pq:
+            f, v = heapq.heappop(pq)
+            if v == t:
+                return self._walk_back(parent, s, t)
+
+            d = dist[v]
+            if f > d + h(v):
+                continue
+
+            for k in range(out_ptr[v], out_ptr[v + 1]):
+                w = out_nbr[k]
+                new_dist = d + cost[out_eid[k]]
+                if new_dist < dist.get(w, float('inf')):
+                    estimate = h(w)
+                    if estimate == math.inf:
+                        continue  # target domains unreachable from w
+                    dist[w] = new_dist
+                    parent[w] = (v, out_eid[k])
+                    heapq.heappush(pq, (new_dist + estimate, w))
+
+        return None
+
+    def _domain_hops(self, t: int) -> Dict[Any, int]:
+        """Fewest edges from any claim in each domain to a domain of t (BFS over the domain graph)"""
+        if self._domain_links is None:
+            # Domain a -> b whenever some edge leaves a claim in a for a claim in b;
+            # claims without domains share the None pseudo-domain
+            self._domain_keys = [tuple(self._nodes[nid].domains) or (None,) for nid in self._node_ids]
+            pairs = set(zip(
+                (self._domain_keys[i] for i in self._edge_src),
+                (self._domain_keys[i] for i in self._edge_dst)
+            ))
+            reverse: Dict[Any, Set[Any]] = defaultdict(set)
+            for from_domains, to_domains in pairs:
+                for b in to_domains:
+                    reverse[b].update(from_domains)
+            self._domain_links = reverse
+
+        hops = dict.fromkeys(self._domain_keys[t], 0)
+        queue = deque(hops)
+        while queue:
+            b = queue.popleft()
+            for a in self._domain_links.get(b, ()):
+                if a not in hops:
+                    hops[a] = hops[b] + 1
+                    queue.append(a)
+        return hops
+
+    def _search_tree(self, s: int, targets: Set[int], weighted: bool) -> Dict[int, Tuple[int, int]]:
+        """Parent pointers from s until every target is settled (BFS or Dijkstra)"""
+        out_ptr, out_nbr, out_eid = self._out_ptr_l, self._out_nbr_l, self._out_eid_l
+        remaining = set(targets)
+        parent: Dict[int, Tuple[int, int]] = {}
+
+        if not weighted:
+            seen = {s}
+            queue = deque([s])
+            while queue and remaining:
+                v = queue.popleft()
+                for k in range(out_ptr[v], out_ptr[v + 1]):
+                    w = out_nbr[k]
+                    if w not in seen:
+                        seen.add(w)
+                        parent[w] = (v, out_eid[k])
+                        remaining.discard(w)
+                        queue.append(w)
+            return parent
+
+        cost = self._cost_l
+        dist = {s: 0.0}
+        pq = [(0.0, s)]
+        while pq and remaining:
+            d, v = heapq.heappop(pq)
+            if d > dist[v]:
+                continue
+            remaining.discard(v)
+            for k in range(out_ptr[v], out_ptr[v + 1]):
+                w = out_nbr[k]
+                new_dist = d + cost[out_eid[k]]
+                if new_dist < dist.get(w, float('inf')):
+                    dist[w] = new_dist
+                    parent[w] = (v, out_eid[k])
+                    heapq.heappush(pq, (new_dist, w))
+        return parent
+
+    # -------------------------------------------------------------------------
+    # Path cache
+    # -------------------------------------------------------------------------
+
+    def _cache_get(self, key: Tuple) -> Any:
+        """Cached path (or None for 'no path'), _MISS if not cached"""
+        path = self._path_cache.get(key, _MISS)
+        if path is not _MISS:
+            self._path_cache.move_to_end(key)
+        return path
+
+    def _cache_put(self, key: Tuple, path: Any):
+        self._path_cache[key] = path
+        self._path_cache.move_to_end(key)
+        while len(self._path_cache) > self.PATH_CACHE_SIZE:
+            self._path_cache.popitem(last=False)
+
+    def _graph_changed(self):
+        """Invalidate everything derived from the current graph"""
+        self._version += 1
+        self._path_cache.clear()
+        self._domain_links = None
+
     # =========================================================================
     # CENTRALITY MEASURES
     # =========================================================================
 
-    def compute_pagerank(self) -> Dict[int, float]:
+    def compute_pagerank(self, warm_start: bool = True) -> Dict[int, float]:
         """
         Compute PageRank for all nodes.
 
         Identifies the most "important" claims based on connection structure.
+        Each iteration is one sparse mat-vec over the edge arrays.
+
+        Args:
+            warm_start: Start from the previous PageRank vector (new nodes at 1/n)
         """
         self._ensure_loaded()
 
@@ -571,89 +1160,74 @@ class GraphEngine:
         if n == 0:
             return {}
 
-        # Initialize
-        pagerank = {nid: 1.0 / n for nid in self._nodes}
+        # Initialize (the fixed point does not depend on the start vector)
+        pagerank = np.full(n, 1.0 / n)
+        if warm_start and self._pagerank is not None and len(self._pagerank) <= n:
+            pagerank[:len(self._pagerank)] = self._pagerank
         damping = self.PAGERANK_DAMPING
+        src, dst = self._src, self._dst
+        inv_out = 1.0 / np.maximum(self._out_deg, 1)
 
         for _ in range(self.PAGERANK_ITERATIONS):
-            new_pagerank = {}
-            diff = 0.0
-
-            for node_id in self._nodes:
-                # Sum of PageRank from incoming edges
-                incoming_sum = 0.0
-                for source_id, edge in self._reverse_adjacency[node_id]:
-                    out_degree = self._nodes[source_id].out_degree
-                    if out_degree > 0:
-                        incoming_sum += pagerank[source_id] / out_degree
-
-                new_pr = (1 - damping) / n + damping * incoming_sum
-                new_pagerank[node_id] = new_pr
-                diff += abs(new_pr - pagerank[node_id])
-
+            # Rank flowing along every edge, summed per target
+            incoming = np.bincount(dst, weights=(pagerank * inv_out)[src], minlength=n)
+            new_pagerank = (1 - damping) / n + damping * incoming
+            diff = float(np.abs(new_pagerank - pagerank).sum())
             pagerank = new_pagerank
 
             if diff < self.PAGERANK_TOLERANCE:
                 break
 
         # Update nodes
-        for node_id, pr in pagerank.items():
+        self._pagerank = pagerank
+        result = dict(zip(self._node_ids, pagerank.tolist()))
+        for node_id, pr in result.items():
             self._nodes[node_id].pagerank = pr
 
-        return pagerank
+        return result
 
-    def compute_betweenness_centrality(self, sample_size: int = 100) -> Dict[int, float]:
+    def compute_betweenness_centrality(self, sample_size: int = 100, workers: Optional[int] = None) -> Dict[int, float]:
         """
         Compute betweenness centrality (sampled for large graphs).
 
         Identifies claims that act as bridges between different parts of the network.
+
+        Args:
+            sample_size: Number of BFS sources
+            workers: Worker processes for large graphs (default: CPU count, 1 = serial)
         """
         self._ensure_loaded()
 
-        betweenness = {nid: 0.0 for nid in self._nodes}
-        node_ids = list(self._nodes.keys())
+        n = len(self._nodes)
 
         # Sample nodes for efficiency
         import random
-        sample = random.sample(node_ids, min(sample_size, len(node_ids)))
-
-        for source in sample:
-            # BFS from source
-            dist = {source: 0}
-            num_paths = {source: 1}
-            predecessors = defaultdict(list)
-            queue = deque([source])
-            order = []
-
-            while queue:
-                v = queue.popleft()
-                order.append(v)
-
-                for w, _ in self._adjacency[v]:
-                    if w not in dist:
-                        dist[w] = dist[v] + 1
-                        queue.append(w)
-
-                    if dist[w] == dist[v] + 1:
-                        num_paths[w] = num_paths.get(w, 0) + num_paths[v]
-                        predecessors[w].append(v)
-
-            # Accumulate betweenness
-            delta = {v: 0.0 for v in order}
-            for w in reversed(order):
-                for v in predecessors[w]:
-                    if num_paths[w] > 0:
-                        delta[v] += (num_paths[v] / num_paths[w]) * (1 + delta[w])
-                if w != source:
-                    betweenness[w] += delta[w]
+        sample = random.sample(range(n), min(sample_size, n))
+
+        workers = workers or os.cpu_count() or 1
+        scores = None
+        if workers > 1 and len(sample) > 1 and len(sample) * len(self._edges) > self.PARALLEL_BETWEENNESS_WORK:
+            chunks = [sample[i::workers] for i in range(min(workers, len(sample)))]
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=len(chunks),
+                    initializer=_brandes_init,
+                    initargs=(self._out_ptr_l, self._out_nbr_l, n)
+                ) as pool:
+                    partials = list(pool.map(_brandes_worker, chunks))
+                scores = np.sum(partials, axis=0)
+            except Exception as e:
+                logger.warning(f"Parallel betweenness failed, running serially: {e}")
+
+        if scores is None:
+            scores = np.asarray(_brandes(self._out_ptr_l, self._out_nbr_l, n, sample))
 
         # Normalize
-        n = len(self._nodes)
         scale = 1.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
 
-        for node_id in betweenness:
-            betweenness[node_id] *= scale
-            self._nodes[node_id].betweenness = betweenness[node_id]
+        betweenness = dict(zip(self._node_ids, (scores * scale).tolist()))
+        for node_id, value in betweenness.items():
+            self._nodes[node_id].betweenness = value
 
         return betweenness
 
@@ -661,31 +1235,48 @@ class GraphEngine:
         """
         Compute local clustering coefficient for each node.
 
-        Measures how clustered a claim's neighbors are.
+        Measures how clustered a claim's neighbors are. Neighbours are
+        taken in both directions; links between them are counted per
+        directed edge.
         """
         self._ensure_loaded()
 
-        clustering = {}
+        n = len(self._nodes)
+        if n == 0:
+            return {}
 
-        for node_id in self._nodes:
-            neighbors = set(n for n, _ in self._adjacency[node_id])
-            neighbors.update(n for n, _ in self._reverse_adjacency[node_id])
-            k = len(neighbors)
+        if sparse is not None:
+            ones = np.ones(len(self._edges))
+            directed = sparse.csr_matrix((ones, (self._src, self._dst)), shape=(n, n))
+            neighbours = ((directed + directed.T) > 0).astype(np.float64).tocsr()
+            directed.setdiag(0)
+            directed.eliminate_zeros()
 
-            if k < 2:
+            k = np.asarray(neighbours.sum(axis=1)).ravel()
+            links = np.asarray((neighbours @ directed).multiply(neighbours).sum(axis=1)).ravel()
+        else:
+            k = np.zeros(n)
+            links = np.zeros(n)
+            out_ptr, out_nbr = self._out_ptr_l, self._out_nbr_l
+            in_ptr, in_nbr = self._in_ptr_l, self._in_nbr_l
+            for i in range(n):
+                nbrs = set(out_nbr[out_ptr[i]:out_ptr[i + 1]])
+                nbrs.update(in_nbr[in_ptr[i]:in_ptr[i + 1]])
+                k[i] = len(nbrs)
+                if len(nbrs) < 2:
+                    continue
+                links[i] = sum(
+                    1 for a in nbrs for b in out_nbr[out_ptr[a]:out_ptr[a + 1]]
+                    if b in nbrs and b != a
+                )
+
+        clustering = {}
+        max_edges = k * (k - 1)
+        for i, node_id in enumerate(self._node_ids):
+            if k[i] < 2:
                 clustering[node_id] = 0.0
                 continue
-
-            # Count edges between neighbors
-            neighbor_edges = 0
-            for n1 in neighbors:
-                for n2, _ in self._adjacency[n1]:
-                    if n2 in neighbors and n2 != n1:
-                        neighbor_edges += 1
-
-            # Clustering coefficient
-            max_edges = k * (k - 1)
-            clustering[node_id] = neighbor_edges / max_edges if max_edges > 0 else 0.0
+            clustering[node_id] = float(links[i] / max_edges[i])
             self._nodes[node_id].clustering_coefficient = clustering[node_id]
 
         return clustering
@@ -706,17 +1297,16 @@ class GraphEngine:
         self._ensure_loaded()
 
         # Skip community detection for very large graphs
-        edge_count = sum(len(adj) for adj in self._adjacency.values())
-        if edge_count > 20000:
+        edge_count = len(self._edges)
+        if edge_count > self.COMMUNITY_MAX_EDGES:
             logger.warning(f"Graph too large ({edge_count} edges) for community detection. Returning empty.")
             return []
 
         # Initialize: each node is its own community
-        community = {nid: nid for nid in self._nodes}
-        total_weight = sum(
-            sum(e.strength for _, e in adj)
-            for adj in self._adjacency.values()
-        )
+        n = len(self._node_ids)
+        node_ids = self._node_ids
+        community = list(node_ids)
+        total_weight = float(self._strength.sum())
 
         if total_weight == 0:
             # No edges, each node is its own community
@@ -733,63 +1323,73 @@ class GraphEngine:
                 ))
             return communities
 
+        # Weighted degree per node and running total per community
+        strength = self._strength.tolist()
+        k = (np.bincount(self._src, weights=self._strength, minlength=n) +
+             np.bincount(self._dst, weights=self._strength, minlength=n)).tolist()
+        comm_tot = dict(zip(node_ids, k))
+
+        out_ptr, out_nbr, out_eid = self._out_ptr_l, self._out_nbr_l, self._out_eid_l
+        in_ptr, in_nbr, in_eid = self._in_ptr_l, self._in_nbr_l, self._in_eid_l
+
         improved = True
         iteration = 0
         while improved and iteration < max_iterations:
             improved = False
             iteration += 1
 
-            for node_id in self._nodes:
-                current_comm = community[node_id]
+            for i in range(n):
+                current_comm = community[i]
+
+                # Edge weight from this node into each neighbouring community
+                k_in: Dict[int, float] = defaultdict(float)
+                for j, e in zip(out_nbr[out_ptr[i]:out_ptr[i + 1]], out_eid[out_ptr[i]:out_ptr[i + 1]]):
+                    k_in[community[j]] += strength[e]
+                for j, e in zip(in_nbr[in_ptr[i]:in_ptr[i + 1]], in_eid[in_ptr[i]:in_ptr[i + 1]]):
+                    k_in[community[j]] += strength[e]
 
                 # Calculate modularity gain for each neighbor's community
                 best_comm = current_comm
                 best_gain = 0.0
 
-                neighbor_comms = set()
-                for neighbor, edge in self._adjacency[node_id]:
-                    neighbor_comms.add(community[neighbor])
-                for neighbor, edge in self._reverse_adjacency[node_id]:
-                    neighbor_comms.add(community[neighbor])
-
-                for new_comm in neighbor_comms:
+                for new_comm in set(k_in):
                     if new_comm == current_comm:
                         continue
 
-                    # Calculate modularity gain (simplified)
-                    gain = self._modularity_gain(
-                        node_id, new_comm, community, total_weight
-                    )
+                    gain = self._modularity_gain(k_in[new_comm], k[i], comm_tot[new_comm], total_weight)
 
                     if gain > best_gain:
                         best_gain = gain
                         best_comm = new_comm
 
                 if best_comm != current_comm:
-                    community[node_id] = best_comm
+                    community[i] = best_comm
+                    comm_tot[current_comm] -= k[i]
+                    comm_tot[best_comm] += k[i]
                     improved = True
 
         # Build community objects
+        comm_of = dict(zip(node_ids, community))
         comm_nodes = defaultdict(list)
-        for node_id, comm_id in community.items():
+        for node_id, comm_id in comm_of.items():
             comm_nodes[comm_id].append(node_id)
             self._nodes[node_id].community_id = comm_id
 
         communities = []
-        for comm_id, node_ids in comm_nodes.items():
-            if not node_ids:
+        for comm_id, members in comm_nodes.items():
+            if not members:
                 continue
 
             # Calculate community properties
-            density = self._compute_community_density(node_ids)
-            dominant_domains = self._get_dominant_domains(node_ids)
-            bridge_nodes = self._find_bridge_nodes(node_ids, community)
-            coherence = self._compute_community_coherence(node_ids)
+            density = self._compute_community_density(members)
+            dominant_domains = self._get_dominant_domains(members)
+            bridge_nodes = self._find_bridge_nodes(members, comm_of)
+            coherence = self._compute_community_coherence(members)
 
             communities.append(Community(
                 id=comm_id,
-                node_ids=node_ids,
-                size=len(node_ids),
+                node_ids=members,
+                size=len(members),
                 density=density,
                 dominant_domains=dominant_domains,
                 bridge_nodes=bridge_nodes,
@@ -799,37 +1399,19 @@ class GraphEngine:
         communities.sort(key=lambda c: c.size, reverse=True)
         return communities
 
-    def _modularity_gain(
-        self,
-        node_id: int,
-        new_comm: int,
-        community: Dict[int, int],
-        total_weight: float
-    ) -> float:
-        """Calculate modularity gain for moving a node to a new community."""
+    @staticmethod
+    def _modularity_gain(k_in: float, k_i: float, sigma_tot: float, total_weight: float) -> float:
+        """
+        Modularity gain for moving a node to a new community.
+
+        Args:
+            k_in: Edge weight between the node and the community
+            k_i: Weighted degree of the node
+            sigma_tot: Total weighted degree of the community
+            total_weight: Total edge weight of the graph
+        """
         if total_weight == 0:
             return 0.0
-
-        # Sum of edge weights to new community
-        k_in = 0.0
-        for neighbor, edge in self._adjacency[node_id]:
-            if community[neighbor] == new_comm:
-                k_in += edge.strength
-        for neighbor, edge in self._reverse_adjacency[node_id]:
-            if community[neighbor] == new_comm:
-                k_in += edge.strength
-
-        # Node degree
-        k_i = sum(e.strength for _, e in self._adjacency[node_id])
-        k_i += sum(e.strength for _, e in self._reverse_adjacency[node_id])
-
-        # Community total degree
-        sigma_tot = sum(
-            sum(e.strength for _, e in self._adjacency[n]) +
-            sum(e.strength for _, e in self._reverse_adjacency[n])
-            for n, c in community.items() if c == new_comm
-        )
-
         return k_in / total_weight - (sigma_tot * k_i) / (2 * total_weight ** 2)
 
     def _compute_community_density(self, node_ids: List[int]) -> float:
@@ -837,13 +1419,11 @@ class GraphEngine:
         if len(node_ids) < 2:
             return 0.0
 
-        node_set = set(node_ids)
-        internal_edges = 0
-
-        for node_id in node_ids:
-            for neighbor, _ in self._adjacency[node_id]:
-                if neighbor in node_set:
-                    internal_edges += 1
+        members = {self._index[nid] for nid in node_ids}
+        out_ptr, out_nbr = self._out_ptr_l, self._out_nbr_l
+        internal_edges = sum(
+            1 for i in members for j in out_nbr[out_ptr[i]:out_ptr[i + 1]] if j in members
+        )
 
         max_edges = len(node_ids) * (len(node_ids) - 1)
         return internal_edges / max_edges if max_edges > 0 else 0.0
@@ -864,14 +1444,14 @@ class GraphEngine:
         community: Dict[int, int]
     ) -> List[int]:
         """Find nodes that connect to other communities."""
-        node_set = set(node_ids)
+        members = {self._index[nid] for nid in node_ids}
+        out_ptr, out_nbr = self._out_ptr_l, self._out_nbr_l
         bridges = []
 
         for node_id in node_ids:
-            for neighbor, _ in self._adjacency[node_id]:
-                if neighbor not in node_set:
-                    bridges.append(node_id)
-                    break
+            i = self._index[node_id]
+            if any(j not in members for j in out_nbr[out_ptr[i]:out_ptr[i + 1]]):
+                bridges.append(node_id)
 
         return bridges
 
@@ -892,8 +1472,12 @@ class GraphEngine:
         """
         Find all paths that bridge two domains.
 
-        Uses recursive CTE for efficiency.
+        Searches the in-memory graph when it is loaded, otherwise uses a
+        recursive CTE.
         """
+        if self._loaded:
+            return self.find_domain_bridges_in_memory(domain_a, domain_b)
+
         rows = await self._conn.fetch("""
             WITH RECURSIVE bridge_search AS (
                 -- Start from claims in domain A
@@ -946,6 +1530,84 @@ class GraphEngine:
 
         return paths
 
+    def find_domain_bridges_in_memory(
+        self,
+        domain_a: int,
+        domain_b: int,
+        max_depth: int = 5,
+        limit: int = 20
+    ) -> List[GraphPath]:
+        """
+        Shortest paths from claims in domain_a to claims in domain_b.
+
+        One multi-source BFS (parent pointers) replaces a search per claim
+        pair. Every path has at least one edge, so claims in both domains
+        are reached from other domain_a claims.
+
+        Args:
+            domain_a: Starting domain
+            domain_b: Target domain
+            max_depth: Maximum path length in edges
+            limit: Maximum paths returned
+
+        Returns:
+            Paths ordered by length, then total strength
+        """
+        self._ensure_loaded()
+
+        key = ('bridges', domain_a, domain_b, max_depth, limit)
+        cached = self._cache_get(key)
+        if cached is not _MISS:
+            return cached
+
+        nodes, ids = self._nodes, self._node_ids
+        starts = [i for i, nid in enumerate(ids) if domain_a in nodes[nid].domains]
+        out_ptr, out_nbr, out_eid = self._out_ptr_l, self._out_nbr_l, self._out_eid_l
+
+        # Depth 1 is every out-neighbour of a domain_a claim; starts themselves are not seeded
+        parent: Dict[int, Tuple[int, int]] = {}
+        depth: Dict[int, int] = {}
+        root: Dict[int, int] = {}
+        frontier = []
+        for s in starts:
+            for k in range(out_ptr[s], out_ptr[s + 1]):
+                w = out_nbr[k]
+                if w not in parent:
+                    parent[w] = (s, out_eid[k])
+                    depth[w] = 1
+                    root[w] = s
+                    frontier.append(w)
+
+        level = 1
+        while frontier and level < max_depth:
+            level += 1
+            nxt = []
+            for v in frontier:
+                for k in range(out_ptr[v], out_ptr[v + 1]):
+                    w = out_nbr[k]
+                    if w not in parent:
+                        parent[w] = (v, out_eid[k])
+                        depth[w] = level
+                        root[w] = root[v]
+                        nxt.append(w)
+            frontier = nxt
+
+        paths = []
+        for t in parent:
+            if domain_b not in nodes[ids[t]].domains:
+                continue
+            # First step taken by hand: t may be its own root through a self-loop
+            v, e = parent[t]
+            node_idx, edge_ids = self._walk_back(parent, root[t], v)
+            path = self._make_path(node_idx + [t], edge_ids + [e], 'cross_domain')
+            path.domains_traversed = {domain_a, domain_b}
+            paths.append(path)
+
+        paths.sort(key=lambda p: (len(p.edges), -p.total_weight))
+        paths = paths[:limit]
+        self._cache_put(key, paths)
+        return paths
+
     async def get_cross_domain_hubs(self, min_domains: int = 2) -> List[Tuple[int, int, List[int]]]:
         """
         Find claims that connect multiple domains.
@@ -987,11 +1649,12 @@ class GraphEngine:
 
         Args:
             fast: If True, skip expensive clustering and community detection
+                (always skipped on large graphs when scipy is not installed)
         """
         self._ensure_loaded()
 
         node_count = len(self._nodes)
-        edge_count = sum(len(adj) for adj in self._adjacency.values())
+        edge_count = len(self._edges)
 
         if node_count == 0:
             return GraphStats(
@@ -1008,15 +1671,12 @@ class GraphEngine:
         avg_degree = sum(n.degree for n in self._nodes.values()) / node_count
 
         # Cross-domain edge ratio (always compute - it's fast)
-        cross_domain_edges = sum(
-            1 for adj in self._adjacency.values()
-            for _, edge in adj if edge.cross_domain
-        )
+        cross_domain_edges = sum(1 for edge in self._edges if edge.cross_domain)
         cross_domain_ratio = cross_domain_edges / edge_count if edge_count > 0 else 0.0
 
-        # Skip expensive operations for large graphs or fast mode
-        if fast or edge_count > 10000:
-            logger.info(f"Skipping clustering/community detection for large graph ({edge_count} edges)")
+        # Skip expensive operations in fast mode, or for large graphs without scipy
+        if fast or (sparse is None and edge_count > self.STATS_MAX_EDGES_NO_SCIPY):
+            logger.info(f"Skipping clustering/community detection ({edge_count} edges)")
             return GraphStats(
                 node_count=node_count,
                 edge_count=edge_count,
@@ -4,18 +4,35 @@ SHAKE256-based entropy scoring for quality assessment and novelty detection
 
 The idea: novel/high-quality content has higher information entropy.
 We use SHAKE256 (variable-length hash) to:
-1. Detect duplicate/near-duplicate content
+1. Detect duplicate/near-duplicate content (exact hash + MinHash/LSH, see minhash.py)
 2. Score information density/novelty
 3. Track concept evolution over time
+
+Dedup store: $CIPHER_SEEN_STORE, default $CIPHER_BASE_PATH/cache/seen.db
 """
 
 import hashlib
+import logging
 import math
-from typing import Optional, Tuple, List, Dict
+import os
+import sqlite3
+from pathlib import Path
+from typing import Optional, Tuple, List, Union
 from dataclasses import dataclass
 from collections import Counter
 import re
 
+import numpy as np
+
+from .minhash import MinHasher, LSHIndex, normalize_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEEN_STORE = Path(os.getenv(
+    "CIPHER_SEEN_STORE",
+    Path(os.getenv("CIPHER_BASE_PATH", "/opt/cipher")) / "cache" / "seen.db"
+))
+
 
 @dataclass
 class EntropyScore:
@@ -41,15 +58,27 @@ class HashLearning:
     We combine multiple entropy measures for a robust quality signal.
     """
 
-    def __init__(self, hash_length: int = 64):
+    def __init__(
+        self,
+        hash_length: int = 64,
+        max_seen: int = 100000,
+        seen_store: Optional[Union[str, Path]] = None
+    ):
         """
         Initialize with configurable hash length.
 
         Args:
             hash_length: SHAKE256 output length in bytes (default 64 = 512 bits)
+            max_seen: Texts remembered for dedup (oldest forgotten first)
+            seen_store: SQLite file persisting the dedup index (None = memory only)
         """
         self.hash_length = hash_length
-        self._seen_hashes: Dict[str, int] = {}  # hash -> count for dedup
+        self.minhasher = MinHasher()
+        try:
+            self._seen = LSHIndex(self.minhasher, max_entries=max_seen, path=seen_store)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Dedup index not persistent ({seen_store}): {e}")
+            self._seen = LSHIndex(self.minhasher, max_entries=max_seen)
 
     def compute_shake256(self, text: str) -> str:
         """
@@ -251,53 +280,67 @@ class HashLearning:
 
         return min(1.0, max(0.0, novelty))
 
-    def is_duplicate(self, text: str, threshold: float = 0.95) -> Tuple[bool, Optional[str]]:
+    def is_duplicate(
+        self,
+        text: str,
+        threshold: float = 0.95,
+        record: bool = True
+    ) -> Tuple[bool, Optional[str]]:
         """
-        Check if text is a duplicate of something we've seen.
+        Check if text is a duplicate or near-duplicate of something we've seen.
+
+        Exact repeats match on the SHAKE256 hash; otherwise the LSH index is
+        probed with the text's MinHash signature. Texts without a single
+        word character have no shingles and never match (nor are remembered).
 
         Args:
             text: Text to check
-            threshold: Similarity threshold (not used for exact match)
+            threshold: Minimum estimated Jaccard similarity of the shingle sets
+            record: Remember the text if it is not a duplicate (pass False
+                and call remember() once the text has actually been used)
 
         Returns:
             (is_duplicate, matching_hash)
         """
-        text_hash = self.compute_shake256(text)
+        if not normalize_text(text):
+            return False, None
 
-        if text_hash in self._seen_hashes:
-            self._seen_hashes[text_hash] += 1
+        text_hash = self.compute_shake256(text)
+        if text_hash in self._seen:
             return True, text_hash
 
-        self._seen_hashes[text_hash] = 1
+        signature = self.minhasher.signature(text)
+        matches = self._seen.query(signature, threshold, limit=1)
+        if matches:
+            return True, matches[0][0]
+
+        if record:
+            self._seen.add(text_hash, signature)
         return False, None
 
+    def remember(self, text: str):
+        """Record a text for later is_duplicate checks"""
+        if normalize_text(text):
+            self._seen.add(self.compute_shake256(text), self.minhasher.signature(text))
+
     def similarity_hash(self, text: str, shingle_size: int = 3) -> str:
         """
         Create a locality-sensitive hash for near-duplicate detection.
 
-        Uses MinHash-style approach with character shingles.
-        Similar texts will have similar hashes.
+        The hex-encoded MinHash signature of the text's character shingles:
+        the fraction of equal 32-bit words of two such hashes estimates the
+        Jaccard similarity of the texts (see hash_similarity).
         """
-        # Create shingles
-        text_lower = text.lower()
-        shingles = set()
-        for i in range(len(text_lower) - shingle_size + 1):
-            shingles.add(text_lower[i:i + shingle_size])
-
-        if not shingles:
-            return self.compute_shake256(text)
-
-        # Hash each shingle and take min (MinHash approximation)
-        shingle_hashes = []
-        for shingle in shingles:
-            h = hashlib.shake_256(shingle.encode()).hexdigest(8)
-            shingle_hashes.append(h)
-
-        # Sort and take first N for signature
-        shingle_hashes.sort()
-        signature = ''.join(shingle_hashes[:16])
-
-        return hashlib.shake_256(signature.encode()).hexdigest(self.hash_length)
+        return self.minhasher.signature(text, shingle_size).astype('>u4').tobytes().hex()
+
+    @staticmethod
+    def hash_similarity(hash_a: str, hash_b: str) -> float:
+        """Estimated Jaccard similarity of two similarity_hash values"""
+        sig_a = np.frombuffer(bytes.fromhex(hash_a), dtype='>u4')
+        sig_b = np.frombuffer(bytes.fromhex(hash_b), dtype='>u4')
+        if len(sig_a) != len(sig_b):
+            return 0.0
+        return MinHasher.similarity(sig_a, sig_b)
 
     def concept_hash(self, concepts: List[str]) -> str:
         """
@@ -0,0 +1,316 @@
+"""
+CIPHER MinHash
+
+Near-duplicate detection for abstracts and claims.
+
+- A text is normalised (case, punctuation, whitespace) and cut into
+  character shingles; every shingle is hashed in one vectorised pass
+- The MinHash signature keeps, for each of `num_perm` universal hash
+  permutations, the minimum over all shingles. The fraction of equal
+  positions in two signatures estimates the Jaccard similarity of the
+  shingle sets, so reworded duplicates score high
+- LSHIndex splits signatures into bands and buckets each band: only texts
+  that share at least one band bucket are compared, so a lookup touches a
+  handful of candidates instead of every stored text
+- The index holds at most `max_entries` signatures (oldest evicted) and can
+  be persisted to SQLite so it survives restarts
+"""
+
+import logging
+import re
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+# FNV-1a over the shingle's code points, then the murmur3 64-bit finaliser
+_FNV_OFFSET = np.uint64(0xcbf29ce484222325)
+_FNV_PRIME = np.uint64(0x100000001b3)
+_MIX_1 = np.uint64(0xff51afd7ed558ccd)
+_MIX_2 = np.uint64(0xc4ceb9fe1a85ec53)
+_SHIFT = np.uint64(33)
+
+# Shingles permuted per block (bounds the (shingles x num_perm) temporary)
+_BLOCK = 4096
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse punctuation/whitespace runs to single spaces"""
+    return _NON_WORD.sub(' ', text.lower()).strip()
+
+
+def shingle_hashes(text: str, shingle_size: int) -> np.ndarray:
+    """
+    32-bit hashes of the distinct character shingles of a text.
+
+    Args:
+        text: Normalised text
+        shingle_size: Characters per shingle (shorter texts form one shingle)
+
+    Returns:
+        Sorted unique uint64 array of values below 2^32
+    """
+    if not text:
+        return np.zeros(0, dtype=np.uint64)
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    width = min(shingle_size, len(codes))
+    windows = np.lib.stride_tricks.sliding_window_view(codes, width)
+
+    h = np.full(len(windows), _FNV_OFFSET, dtype=np.uint64)
+    for j in range(width):
+        h = (h ^ windows[:, j]) * _FNV_PRIME
+    h ^= h >> _SHIFT
+    h *= _MIX_1
+    h ^= h >> _SHIFT
+    h *= _MIX_2
+    h ^= h >> _SHIFT
+    return np.unique(h & MAX_HASH)
+
+
+class MinHasher:
+    """
+    MinHash signatures from universal hashes (a * x + b) mod (2^61 - 1).
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        """
+        Initialize the permutations.
+
+        Args:
+            num_perm: Signature length (estimate error ~ 1 / sqrt(num_perm))
+            shingle_size: Characters per shingle
+            seed: Permutation seed; signatures are only comparable for equal seeds
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        rng = np.random.RandomState(seed)
+        # a, b < 2^32 keeps a * x + b (x < 2^32) inside uint64
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    @property
+    def scheme(self) -> str:
+        """Identifies the signature space (stored alongside persisted signatures)"""
+        return f"minhash:{self.num_perm}:{self.shingle_size}:{self.seed}"
+
+    def signature(self, text: str, shingle_size: Optional[int] = None) -> np.ndarray:
+        """
+        MinHash signature of a text.
+
+        Args:
+            text: Raw text
+            shingle_size: Override the hasher's shingle size
+
+        Returns:
+            uint32 array of length num_perm (all 2^32 - 1 for empty text)
+        """
+        hashes = shingle_hashes(normalize_text(text), shingle_size or self.shingle_size)
+        signature = np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+        for start in range(0, len(hashes), _BLOCK):
+            block = hashes[start:start + _BLOCK, None]
+            permuted = (block * self._a + self._b) % MERSENNE_PRIME & MAX_HASH
+            np.minimum(signature, permuted.min(axis=0), out=signature)
+        return signature.astype(np.uint32)
+
+    @staticmethod
+    def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.mean(sig_a == sig_b))
+
+
+class LSHIndex:
+    """
+    Banded LSH over MinHash signatures with a bounded, optionally persistent store.
+
+    With b bands of r rows, two texts of Jaccard similarity s become
+    candidates with probability 1 - (1 - s^r)^b; the default 16 x 8 over
+    128 permutations finds pairs above ~0.7 almost surely.
+    """
+
+    def __init__(
+        self,
+        hasher: MinHasher,
+        bands: int = 16,
+        max_entries: int = 100000,
+        path: Optional[Union[str, Path]] = None
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            hasher: Hasher producing the signatures stored here
+            bands: Number of bands (must divide hasher.num_perm)
+            max_entries: Signatures kept; the oldest are evicted beyond it
+            path: SQLite file to persist signatures to (None = memory only)
+        """
+        if hasher.num_perm % bands:
+            raise ValueError(f"{bands} bands do not divide {hasher.num_perm} permutations")
+        self.hasher = hasher
+        self.bands = bands
+        self.rows = hasher.num_perm // bands
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(bands)]
+
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._open(Path(path))
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def _open(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS signatures (key TEXT PRIMARY KEY, seq INTEGER NOT NULL, signature BLOB NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_signatures_seq ON signatures(seq)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        self._db.commit()
+
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'scheme'").fetchone()
+        if row is None:
+            with self._db:
+                self._db.execute("INSERT INTO meta (name, value) VALUES ('scheme', ?)", (self.hasher.scheme,))
+        elif row[0] != self.hasher.scheme:
+            raise ValueError(f"{path} holds {row[0]} signatures, hasher is {self.hasher.scheme}")
+
+        rows = self._db.execute(
+            "SELECT key, signature FROM signatures ORDER BY seq DESC LIMIT ?", (self.max_entries,)
+        ).fetchall()
+        for key, blob in reversed(rows):
+            self._insert(key, np.frombuffer(blob, dtype=np.uint32))
+        with self._db:
+            self._db.execute(
+                "DELETE FROM signatures WHERE seq < (SELECT COALESCE(MIN(seq), 0) FROM "
+                "(SELECT seq FROM signatures ORDER BY seq DESC LIMIT ?))", (self.max_entries,)
+            )
+        logger.info(f"Near-duplicate index: {len(self._entries)} signatures loaded from {path}")
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[b * self.rows:(b + 1) * self.rows].tobytes() for b in range(self.bands)]
+
+    def _insert(self, key: str, signature: np.ndarray) -> List[str]:
+        """Index a signature in memory; returns the evicted keys"""
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = signature
+        for band, band_key in zip(self._buckets, self._band_keys(signature)):
+            band.setdefault(band_key, set()).add(key)
+
+        evicted = []
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            evicted.append(oldest)
+        return evicted
+
+    def _remove(self, key: str):
+        signature = self._entries.pop(key)
+        for band, band_key in zip(self._buckets, self._band_keys(signature)):
+            bucket = band.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del band[band_key]
+
+    def add(self, key: str, signature: np.ndarray):
+        """
+        Store a signature as the most recent entry.
+
+        Args:
+            key: Identifier returned by query (e.g. the exact content hash)
+            signature: MinHash signature from self.hasher
+        """
+        signature = np.ascontiguousarray(signature, dtype=np.uint32)
+        evicted = self._insert(key, signature)
+        if self._db is not None:
+            try:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO signatures (key, seq, signature) "
+                        "VALUES (?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM signatures), ?)",
+                        (key, signature.tobytes())
+                    )
+                    if evicted:
+                        self._db.executemany("DELETE FROM signatures WHERE key = ?", [(k,) for k in evicted])
+            except sqlite3.Error as e:
+                logger.warning(f"Near-duplicate index write failed: {e}")
+
+    def clear(self):
+        """Drop every signature (in memory and on disk)"""
+        self._entries.clear()
+        self._buckets = [{} for _ in range(self.bands)]
+        if self._db is not None:
+            with self._db:
+                self._db.execute("DELETE FROM signatures")
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def query(self, signature: np.ndarray, threshold: float = 0.0, limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        Stored signatures similar to a signature.
+
+        Args:
+            signature: Query signature
+            threshold: Minimum estimated Jaccard similarity
+            limit: Maximum number of results
+
+        Returns:
+            List of (key, similarity), most similar first
+        """
+        signature = np.asarray(signature, dtype=np.uint32)
+        candidates: Set[str] = set()
+        for band, band_key in zip(self._buckets, self._band_keys(signature)):
+            bucket = band.get(band_key)
+            if bucket:
+                candidates |= bucket
+        if not candidates:
+            return []
+
+        keys = list(candidates)
+        similarities = (np.stack([self._entries[k] for k in keys]) == signature).mean(axis=1)
+        results = [(k, float(s)) for k, s in zip(keys, similarities) if s >= threshold]
+        results.sort(key=lambda r: r[1], reverse=True)
+        return results[:limit]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'signatures': len(self._entries),
+            'max_entries': self.max_entries,
+            'bands': self.bands,
+            'rows': self.rows,
+            'buckets': sum(len(b) for b in self._buckets),
+            'persistent': self._db is not None,
+        }
@@ -13,13 +13,15 @@ of disciplines. We actively seek these bridging patterns.
 import asyncio
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Set, Tuple
+from typing import Optional, List, Dict, Any, Iterator, Set, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
+from itertools import islice
 import json
 import math
 
 import asyncpg
+import numpy as np
 
 from .cipher_brain import Domain, Claim, Connection, Pattern, STOPWORDS
 from .hash_learning import HashLearning
@@ -38,6 +40,137 @@ class ConceptCluster:
     bridging_score: float   # How much it bridges domains
 
 
+def _is_bridge_entity(entity: str) -> bool:
+    """Skip stopwords, short entities, purely numeric and all-stopword entities"""
+    return not (
+        entity in STOPWORDS or
+        len(entity) < 3 or
+        entity.isdigit() or
+        all(word in STOPWORDS for word in entity.split())
+    )
+
+
+@dataclass
+class ClaimTable:
+    """
+    Columnar in-memory copy of the claims used by pattern detection.
+
+    One row per claim; entity mentions and domain memberships are stored
+    as parallel (code, row) arrays so group-bys run in NumPy.
+    """
+    ids: np.ndarray             # claim id per row
+    confidence: np.ndarray      # claim confidence per row
+    texts: List[str]            # lowercased claim text per row
+    domain_rows: np.ndarray     # (row, domain value) memberships
+    domain_values: np.ndarray
+    entities: List[str]         # entity code -> normalised entity
+    entity_codes: np.ndarray    # (entity code, row) mentions, duplicates kept
+    entity_rows: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows) -> 'ClaimTable':
+        """Build from synthesis.claims rows (id, claim_text, entities, domains, confidence)"""
+        ids, confidence, texts = [], [], []
+        domain_rows, domain_values = [], []
+        entity_code: Dict[str, int] = {}
+        entity_codes, entity_rows = [], []
+
+        for i, row in enumerate(rows):
+            ids.append(row['id'])
+            confidence.append(row['confidence'] if row['confidence'] is not None else 0.5)
+            texts.append((row['claim_text'] or '').lower())
+
+            for d in set(row['domains'] or []):
+                domain_rows.append(i)
+                domain_values.append(Domain(d).value)
+
+            for entity in (json.loads(row['entities']) if row['entities'] else []):
+                entity_lower = entity.lower().strip()
+                if not _is_bridge_entity(entity_lower):
+                    continue
+                entity_codes.append(entity_code.setdefault(entity_lower, len(entity_code)))
+                entity_rows.append(i)
+
+        return cls(
+            ids=np.asarray(ids, dtype=np.int64),
+            confidence=np.asarray(confidence, dtype=np.float64),
+            texts=texts,
+            domain_rows=np.asarray(domain_rows, dtype=np.int64),
+            domain_values=np.asarray(domain_values, dtype=np.int64),
+            entities=list(entity_code),
+            entity_codes=np.asarray(entity_codes, dtype=np.int64),
+            entity_rows=np.asarray(entity_rows, dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows_containing(self, term: str, limit: int) -> List[int]:
+        """First `limit` rows (by claim id) whose text contains a lowercase term"""
+        return list(islice((i for i, text in enumerate(self.texts) if term in text), limit))
+
+    def entity_domain_groups(self, min_mentions: int = 2, min_domains: int = 2
+                             ) -> Iterator[Tuple[str, List[Tuple[Domain, np.ndarray, float]]]]:
+        """
+        Entities spanning several domains, with their claims per domain.
+
+        Args:
+            min_mentions: Minimum mentions of the entity (before de-duplication)
+            min_domains: Minimum number of distinct domains
+
+        Yields:
+            (entity, [(domain, claim ids, mean confidence), ...] in domain order)
+        """
+        n_rows = len(self.ids)
+        n_entities = len(self.entities)
+        if not n_entities or not len(self.domain_rows):
+            return
+
+        # Entities mentioned often enough; one (entity, claim) pair per mention
+        mentions = np.bincount(self.entity_codes, minlength=n_entities)
+        keep = mentions[self.entity_codes] >= min_mentions
+        pairs = np.unique(self.entity_codes[keep] * n_rows + self.entity_rows[keep])
+        pair_entity, pair_row = pairs // n_rows, pairs % n_rows
+
+        # Join each (entity, claim) pair with the claim's domains
+        order = np.argsort(self.domain_rows, kind='stable')
+        dom_rows, dom_values = self.domain_rows[order], self.domain_values[order]
+        dom_ptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(dom_rows, minlength=n_rows), out=dom_ptr[1:])
+
+        per_pair = dom_ptr[pair_row + 1] - dom_ptr[pair_row]
+        pair_of = np.repeat(np.arange(len(pairs)), per_pair)
+        starts = np.repeat(np.cumsum(per_pair) - per_pair, per_pair)
+        member = dom_ptr[pair_row[pair_of]] + (np.arange(len(pair_of)) - starts)
+
+        t_entity = pair_entity[pair_of]
+        t_row = pair_row[pair_of]
+        t_domain = dom_values[member]
+
+        # Group by (entity, domain): claim lists and confidence sums
+        n_domains = int(self.domain_values.max()) + 1
+        group_key = t_entity * n_domains + t_domain
+        by_group = np.argsort(group_key, kind='stable')
+        keys, counts = np.unique(group_key[by_group], return_counts=True)
+        conf_sums = np.bincount(np.searchsorted(keys, group_key), weights=self.confidence[t_row], minlength=len(keys))
+        group_rows = np.split(t_row[by_group], np.cumsum(counts)[:-1])
+
+        group_entity = keys // n_domains
+        domains_per_entity = np.bincount(group_entity, minlength=n_entities)
+        group_ptr = np.zeros(n_entities + 1, dtype=np.int64)
+        np.cumsum(domains_per_entity, out=group_ptr[1:])
+
+        for code in np.flatnonzero(domains_per_entity >= min_domains):
+            spans = []
+            for g in range(group_ptr[code], group_ptr[code + 1]):
+                spans.append((
+                    Domain(int(keys[g] % n_domains)),
+                    self.ids[group_rows[g]],
+                    float(conf_sums[g] / counts[g])
+                ))
+            yield self.entities[code], spans
+
+
 @dataclass
 class CrossDomainInsight:
     """A significant cross-domain discovery"""
@@ -76,8 +209,8 @@ class PatternDetector:
         self.pool: Optional[asyncpg.Pool] = None
         self.hash_learner = HashLearning()
 
-        # Cache for efficiency
-        self._entity_index: Dict[str, List[int]] = {}  # entity -> claim_ids
+        # Claims loaded once per connect (see _build_indices)
+        self._claims: Optional[ClaimTable] = None
         self._domain_claims: Dict[Domain, List[int]] = {}
 
         # Cross-domain concept mappings (known bridges)
@@ -114,37 +247,23 @@ class PatternDetector:
             await self.pool.close()
 
     async def _build_indices(self):
-        """Build in-memory indices for fast lookup."""
+        """Load claims into the in-memory table used by the detectors."""
         async with self.pool.acquire() as conn:
-            # Index entities to claims
             rows = await conn.fetch('''
-                SELECT id, entities, domains
+                SELECT id, claim_text, entities, domains, confidence
                 FROM synthesis.claims
-                WHERE entities IS NOT NULL
+                ORDER BY id
             ''')
 
-            for row in rows:
-                entities = json.loads(row['entities']) if row['entities'] else []
-                domains = [Domain(d) for d in (row['domains'] or [])]
-
-                for entity in entities:
-                    entity_lower = entity.lower().strip()
-                    # Skip stopwords, short entities, and purely numeric entities
-                    if (entity_lower in STOPWORDS or
-                        len(entity_lower) < 3 or
-                        entity_lower.isdigit()):
-                        continue
-                    if entity_lower not in self._entity_index:
-                        self._entity_index[entity_lower] = []
-                    self._entity_index[entity_lower].append(row['id'])
+        self._claims = ClaimTable.from_rows(rows)
 
-                for domain in domains:
-                    if domain not in self._domain_claims:
-                        self._domain_claims[domain] = []
-                    self._domain_claims[domain].append(row['id'])
+        self._domain_claims = {}
+        for value in np.unique(self._claims.domain_values):
+            rows_in = self._claims.domain_rows[self._claims.domain_values == value]
+            self._domain_claims[Domain(int(value))] = self._claims.ids[rows_in].tolist()
 
-        logger.info(f"Built indices: {len(self._entity_index)} entities, "
-                   f"{len(self._domain_claims)} domains")
+        logger.info(f"Built indices: {len(self._claims.entities)} entities, "
+                   f"{len(self._domain_claims)} domains, {len(self._claims)} claims")
 
     async def detect_all_patterns(self) -> List[CrossDomainInsight]:
         """
@@ -187,74 +306,40 @@ class PatternDetector:
         These are natural bridges - the same concept manifesting
         in different fields.
         """
-        insights = []
+        return list(self.iter_entity_bridges())
 
-        for entity, claim_ids in self._entity_index.items():
-            if len(claim_ids) < 2:
-                continue
-
-            # Skip stopwords, short entities, and purely numeric entities
-            entity_lower = entity.lower().strip()
-            if (entity_lower in STOPWORDS or
-                len(entity_lower) < 3 or
-                entity_lower.isdigit() or
-                all(word in STOPWORDS for word in entity_lower.split())):
-                continue
+    def iter_entity_bridges(self) -> Iterator[CrossDomainInsight]:
+        """
+        Stream entity-bridge insights from the in-memory claim table.
 
-            # Get domains for these claims
-            async with self.pool.acquire() as conn:
-                rows = await conn.fetch('''
-                    SELECT id, claim_text, domains, confidence
-                    FROM synthesis.claims
-                    WHERE id = ANY($1)
-                ''', claim_ids)
-
-            domains = set()
-            claims_by_domain: Dict[Domain, List[Dict]] = defaultdict(list)
-
-            for row in rows:
-                claim_domains = [Domain(d) for d in (row['domains'] or [])]
-                for domain in claim_domains:
-                    domains.add(domain)
-                    claims_by_domain[domain].append({
-                        'id': row['id'],
-                        'text': row['claim_text'],
-                        'confidence': row['confidence']
-                    })
+        Entity/domain spans come from one vectorised group-by, so no
+        query is issued per entity.
+        """
+        if self._claims is None:
+            return
 
-            # Only interested if entity spans 2+ domains
-            if len(domains) < 2:
-                continue
+        for entity, spans in self._claims.entity_domain_groups():
+            novelty = 0.6 if len(spans) == 2 else 0.8
 
             # Create insight for significant bridges
-            domain_list = list(domains)
-            for i, source_domain in enumerate(domain_list):
-                for target_domain in domain_list[i+1:]:
-                    source_claims = claims_by_domain[source_domain]
-                    target_claims = claims_by_domain[target_domain]
-
-                    if not source_claims or not target_claims:
-                        continue
-
+            for i, (source_domain, source_ids, source_conf) in enumerate(spans):
+                for target_domain, target_ids, target_conf in spans[i+1:]:
                     # Calculate confidence based on claim quality
-                    avg_confidence = (
-                        sum(c['confidence'] for c in source_claims) / len(source_claims) +
-                        sum(c['confidence'] for c in target_claims) / len(target_claims)
-                    ) / 2
+                    avg_confidence = (source_conf + target_conf) / 2
 
-                    insights.append(CrossDomainInsight(
+                    yield CrossDomainInsight(
                         title=f"'{entity.title()}' bridges {source_domain.name} and {target_domain.name}",
                         description=(
                             f"The concept '{entity}' appears in both {source_domain.name} "
                             f"and {target_domain.name}, suggesting a potential cross-domain connection. "
-                            f"Found {len(source_claims)} claims in {source_domain.name} and "
-                            f"{len(target_claims)} claims in {target_domain.name}."
+                            f"Found {len(source_ids)} claims in {source_domain.name} and "
+                            f"{len(target_ids)} claims in {target_domain.name}."
                         ),
                         source_domain=source_domain,
                         target_domain=target_domain,
                         mechanism=f"Shared entity: {entity}",
                         confidence=avg_confidence,
-                        novelty=0.6 if len(domains) == 2 else 0.8,
+                        novelty=novelty,
                         implications=[
                             f"Investigate whether '{entity}' has the same meaning across domains",
                             f"Look for methodological transfer from {source_domain.name} to {target_domain.name}"
@@ -263,10 +348,8 @@ class PatternDetector:
                             f"Is '{entity}' in {source_domain.name} causally related to '{entity}' in {target_domain.name}?",
                             f"Can insights about '{entity}' from {source_domain.name} inform {target_domain.name} research?"
                         ],
-                        supporting_claims=[c['id'] for c in source_claims + target_claims]
-                    ))
-
-        return insights
+                        supporting_claims=source_ids.tolist() + target_ids.tolist()
+                    )
 
     async def _detect_concept_bridges(self) -> List[CrossDomainInsight]:
         """
@@ -276,30 +359,27 @@ class PatternDetector:
         """
         insights = []
 
+        if self._claims is None:
+            return insights
+        table = self._claims
+
         for concept, expected_domains in self.known_bridges.items():
-            # Search for claims mentioning this concept
-            async with self.pool.acquire() as conn:
-                rows = await conn.fetch('''
-                    SELECT id, claim_text, domains, confidence
-                    FROM synthesis.claims
-                    WHERE LOWER(claim_text) LIKE $1
-                    LIMIT 100
-                ''', f'%{concept}%')
+            # Search the loaded claim texts for this concept
+            rows = table.rows_containing(concept, limit=100)
 
             if len(rows) < 2:
                 continue
 
             # Group by domain
             found_domains: Dict[Domain, List[Dict]] = defaultdict(list)
-            for row in rows:
-                claim_domains = [Domain(d) for d in (row['domains'] or [])]
-                for domain in claim_domains:
-                    if domain in expected_domains:
-                        found_domains[domain].append({
-                            'id': row['id'],
-                            'text': row['claim_text'],
-                            'confidence': row['confidence']
-                        })
+            selected = np.isin(table.domain_rows, rows)
+            for row, value in zip(table.domain_rows[selected].tolist(), table.domain_values[selected].tolist()):
+                domain = Domain(value)
+                if domain in expected_domains:
+                    found_domains[domain].append({
+                        'id': int(table.ids[row]),
+                        'confidence': float(table.confidence[row])
+                    })
 
             # Create insights for domain pairs
             domains_found = list(found_domains.keys())
@@ -86,6 +86,95 @@ class TemporalPattern:
     confidence: float
 
 
+
+def _decay_query(incremental: bool, track_due: bool) -> str:
+    """
+    Set-based confidence decay (see TemporalTracker.decay_all_claims).
+
+    Parameters: $1/$2 claim type -> base half-life, $3/$4 evidence strength
+    -> multiplier, $5/$6 domain name -> multiplier, $7 default half-life,
+    $8 minimum confidence, $9 change threshold. Returns the number of
+    claims whose confidence was rewritten.
+    """
+    due_filter = "AND (c.decay_due_at IS NULL OR c.decay_due_at <= NOW())" if incremental else ""
+
+    if track_due:
+        # Decayed confidence only falls, so the next change is the first whole day
+        # with original * 0.5^(age / half_life) < level - threshold
+        due = """CASE
+                WHEN p.created_at IS NULL OR p.half_life <= 0 OR p.original <= 0 OR p.level - $9 <= $8
+                    THEN 'infinity'::timestamp
+                ELSE p.created_at + (FLOOR(p.half_life * LN(p.original / (p.level - $9)) / LN(2)) + 1) * INTERVAL '1 day'
+            END"""
+        due_set = "decay_due_at = p.due_at,"
+        due_changed = "OR c.decay_due_at IS DISTINCT FROM p.due_at"
+    else:
+        due, due_set, due_changed = "NULL::timestamp", "", ""
+
+    return f'''
+        WITH claim_types(claim_type, days) AS (
+            SELECT * FROM unnest($1::text[], $2::float8[])
+        ),
+        strengths(evidence_strength, multiplier) AS (
+            SELECT * FROM unnest($3::text[], $4::float8[])
+        ),
+        domain_rates(name, multiplier) AS (
+            SELECT * FROM unnest($5::text[], $6::float8[])
+        ),
+        inputs AS (
+            SELECT
+                c.id,
+                c.created_at,
+                COALESCE(NULLIF(c.confidence, 0), 0.5) as original,
+                COALESCE(NULLIF(c.current_confidence, 0), NULLIF(c.confidence, 0), 0.5) as previous,
+                COALESCE(DATE_PART('day', NOW() - c.created_at), 0) as age_days,
+                COALESCE(t.days, $7) * COALESCE(s.multiplier, 1.0) * COALESCE(r.multiplier, 1.0) as half_life
+            FROM synthesis.claims c
+            LEFT JOIN synthesis.domains d ON d.id = c.domains[1]
+            LEFT JOIN claim_types t ON t.claim_type = COALESCE(NULLIF(c.claim_type, ''), 'finding')
+            LEFT JOIN strengths s ON s.evidence_strength = COALESCE(NULLIF(c.evidence_strength, ''), 'moderate')
+            LEFT JOIN domain_rates r ON r.name = d.name
+            WHERE (c.status = 'active' OR c.status IS NULL)
+            {due_filter}
+        ),
+        decayed AS (
+            SELECT
+                i.*,
+                CASE
+                    WHEN i.age_days <= 0 OR i.half_life <= 0 THEN i.original
+                    ELSE GREATEST($8, i.original * POWER(0.5, i.age_days / i.half_life))
+                END as confidence
+            FROM inputs i
+        ),
+        changes AS (
+            SELECT
+                d.*,
+                ABS(d.confidence - d.previous) > $9 as changed,
+                CASE WHEN ABS(d.confidence - d.previous) > $9 THEN d.confidence ELSE d.previous END as level
+            FROM decayed d
+        ),
+        planned AS (
+            SELECT p.*, {due} as due_at
+            FROM changes p
+        ),
+        updated AS (
+            UPDATE synthesis.claims c
+            SET
+                current_confidence = CASE WHEN p.changed THEN p.confidence ELSE c.current_confidence END,
+                confidence_trend = CASE
+                    WHEN p.changed THEN p.confidence - COALESCE(c.current_confidence, c.confidence)
+                    ELSE c.confidence_trend
+                END,
+                {due_set}
+                updated_at = CASE WHEN p.changed THEN NOW() ELSE c.updated_at END
+            FROM planned p
+            WHERE c.id = p.id AND (p.changed {due_changed})
+            RETURNING p.changed
+        )
+        SELECT COUNT(*) FILTER (WHERE changed) FROM updated
+    '''
+
+
 class TemporalTracker:
     """
     Tracks temporal dynamics of scientific claims.
@@ -114,6 +203,37 @@ class TemporalTracker:
     # Citation impact (logarithmic)
     CITATION_BOOST_FACTOR = 0.02
 
+    # Base half-life by claim type (in days)
+    BASE_HALF_LIFE = {
+        'definition': 365 * 10,   # 10 years
+        'method': 365 * 5,        # 5 years
+        'finding': 365 * 3,       # 3 years
+        'observation': 365 * 2,   # 2 years
+        'hypothesis': 365 * 1,    # 1 year
+        'conclusion': 365 * 2,    # 2 years
+    }
+
+    # Half-life adjustment by evidence strength
+    EVIDENCE_STRENGTH_MULTIPLIER = {
+        'definitive': 2.0,
+        'strong': 1.5,
+        'moderate': 1.0,
+        'weak': 0.5,
+    }
+
+    # Half-life adjustment by domain (some fields move faster)
+    DOMAIN_HALF_LIFE_MULTIPLIER = {
+        'NEUROSCIENCES': 0.8,    # Fast-moving field
+        'BIOLOGY': 0.9,
+        'PSYCHOLOGY': 0.85,
+        'MEDICINE': 0.9,
+        'MATHEMATICS': 1.5,      # Slower to change
+        'ART': 1.2,
+    }
+
+    # Decay only rewrites a claim whose confidence moved by more than this
+    DECAY_THRESHOLD = 0.01
+
     def __init__(self, db_url: str):
         """
         Initialize the temporal tracker.
@@ -183,33 +303,9 @@ class TemporalTracker:
         - Findings: Medium (subject to replication)
         - Hypotheses: Short (need testing)
         """
-        # Base half-life by claim type (in days)
-        base_half_life = {
-            'definition': 365 * 10,   # 10 years
-            'method': 365 * 5,        # 5 years
-            'finding': 365 * 3,       # 3 years
-            'observation': 365 * 2,   # 2 years
-            'hypothesis': 365 * 1,    # 1 year
-            'conclusion': 365 * 2,    # 2 years
-        }.get(claim_type, 365 * 3)
-
-        # Adjust by evidence strength
-        strength_multiplier = {
-            'definitive': 2.0,
-            'strong': 1.5,
-            'moderate': 1.0,
-            'weak': 0.5,
-        }.get(evidence_strength, 1.0)
-
-        # Adjust by domain (some fields move faster)
-        domain_multiplier = {
-            'NEUROSCIENCES': 0.8,    # Fast-moving field
-            'BIOLOGY': 0.9,
-            'PSYCHOLOGY': 0.85,
-            'MEDICINE': 0.9,
-            'MATHEMATICS': 1.5,      # Slower to change
-            'ART': 1.2,
-        }.get(domain, 1.0)
+        base_half_life = self.BASE_HALF_LIFE.get(claim_type, self.DEFAULT_HALF_LIFE)
+        strength_multiplier = self.EVIDENCE_STRENGTH_MULTIPLIER.get(evidence_strength, 1.0)
+        domain_multiplier = self.DOMAIN_HALF_LIFE_MULTIPLIER.get(domain, 1.0)
 
         return base_half_life * strength_multiplier * domain_multiplier
 
@@ -487,57 +583,42 @@ class TemporalTracker:
                     WHERE id = $1
                 ''', claim_id, citation_count, velocity)
 
-    async def decay_all_claims(self) -> int:
+    async def decay_all_claims(self, incremental: bool = False) -> int:
         """
         Apply confidence decay to all claims.
         Should be run periodically (e.g., daily).
 
+        The whole pass is one set-based UPDATE: half-lives and decayed
+        confidences are computed in PostgreSQL from the tables above, each
+        claim is scored once (by its primary domain) and only claims whose
+        confidence moved by more than DECAY_THRESHOLD are rewritten.
+
+        Each claim also records decay_due_at, the day its decayed confidence
+        next leaves that threshold band (sql/migrations/004_decay_due.sql).
+        An incremental run only visits claims that are due, or whose
+        confidence inputs were changed since the last run.
+
+        Args:
+            incremental: Only visit claims whose decay bucket may have changed
+                (run a full pass after changing the half-life tables)
+
         Returns:
             Number of claims updated
         """
-        async with self.pool.acquire() as conn:
-            # Get all active claims
-            rows = await conn.fetch('''
-                SELECT
-                    c.id,
-                    c.confidence,
-                    c.current_confidence,
-                    c.created_at,
-                    c.claim_type,
-                    c.evidence_strength,
-                    COALESCE(d.name, 'UNKNOWN') as domain
-                FROM synthesis.claims c
-                LEFT JOIN synthesis.domains d ON d.id = ANY(c.domains)
-                WHERE c.status = 'active' OR c.status IS NULL
-            ''')
+        args = (
+            list(self.BASE_HALF_LIFE), [float(v) for v in self.BASE_HALF_LIFE.values()],
+            list(self.EVIDENCE_STRENGTH_MULTIPLIER), list(self.EVIDENCE_STRENGTH_MULTIPLIER.values()),
+            list(self.DOMAIN_HALF_LIFE_MULTIPLIER), list(self.DOMAIN_HALF_LIFE_MULTIPLIER.values()),
+            float(self.DEFAULT_HALF_LIFE), self.MIN_CONFIDENCE, self.DECAY_THRESHOLD,
+        )
 
-            updated = 0
-            for row in rows:
-                age_days = (datetime.now() - row['created_at']).days
-                half_life = self.calculate_half_life(
-                    row['claim_type'] or 'finding',
-                    row['domain'],
-                    row['evidence_strength'] or 'moderate'
-                )
-
-                new_confidence = self.calculate_decay(
-                    row['confidence'] or 0.5,
-                    age_days,
-                    half_life
-                )
-
-                # Only update if confidence changed significantly
-                old_conf = row['current_confidence'] or row['confidence'] or 0.5
-                if abs(new_confidence - old_conf) > 0.01:
-                    await conn.execute('''
-                        UPDATE synthesis.claims
-                        SET
-                            current_confidence = $2,
-                            confidence_trend = $2 - COALESCE(current_confidence, confidence),
-                            updated_at = NOW()
-                        WHERE id = $1
-                    ''', row['id'], new_confidence)
-                    updated += 1
+        async with self.pool.acquire() as conn:
+            try:
+                updated = await conn.fetchval(_decay_query(incremental, track_due=True), *args)
+            except asyncpg.UndefinedColumnError:
+                logger.warning("synthesis.claims.decay_due_at missing (apply sql/migrations/004_decay_due.sql), "
+                               "running a full decay pass")
+                updated = await conn.fetchval(_decay_query(False, track_due=False), *args)
 
             logger.info(f"Decayed confidence for {updated} claims")
             return updated
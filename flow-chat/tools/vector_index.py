@@ -0,0 +1,326 @@
+"""
+CIPHER Vector Index
+
+Nearest-neighbour search over claim embeddings. Used by CipherBrain when
+the pgvector HNSW index (sql/migrations/001_embeddings.sql) cannot serve
+a query.
+
+- All vectors are L2-normalised float32 rows of one contiguous matrix, so
+  cosine similarity is a single matrix-vector product
+- Small indexes are searched exactly; above IVF_MIN_SIZE vectors an
+  inverted-file structure (k-means coarse quantiser) restricts each query
+  to the nearest `nprobe` lists
+- Vectors can be appended one at a time (incremental add on claim save)
+- save()/load() persist to .npy files; load() memory-maps the matrix so
+  large indexes do not have to fit in the heap
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .embeddings import normalize_rows
+
+logger = logging.getLogger(__name__)
+
+# Below this many vectors an exact scan is faster than probing lists
+IVF_MIN_SIZE = 20000
+DEFAULT_NPROBE = 8
+
+VectorLike = Union[str, Sequence[float], np.ndarray]
+
+
+def parse_vector(value: VectorLike) -> np.ndarray:
+    """
+    Convert a pgvector value to a float32 array.
+
+    Args:
+        value: pgvector text ('[0.1,0.2,...]'), list of floats or array
+
+    Returns:
+        1-D float32 array
+    """
+    if isinstance(value, str):
+        return np.fromstring(value.strip('[]'), dtype=np.float32, sep=',')
+    return np.asarray(value, dtype=np.float32)
+
+
+def to_pgvector(vector: VectorLike) -> str:
+    """Format a vector as pgvector text input."""
+    return '[' + ','.join(str(float(x)) for x in np.asarray(vector).ravel()) + ']'
+
+
+class VectorIndex:
+    """
+    Cosine-similarity index over normalised float32 vectors.
+
+    Each vector carries an integer id and an optional payload (e.g. the
+    claim's domains) that search filters can inspect.
+    """
+
+    def __init__(self, dimensions: int, capacity: int = 1024):
+        """
+        Initialize an empty index.
+
+        Args:
+            dimensions: Vector dimensions
+            capacity: Initial row capacity (grows by doubling)
+        """
+        self.dimensions = dimensions
+        self._matrix = np.zeros((capacity, dimensions), dtype=np.float32)
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._size = 0
+        self.payloads: List[Any] = []
+        self._row_of: dict = {}
+
+        # IVF state (None until build_ivf)
+        self.centroids: Optional[np.ndarray] = None
+        self._lists: List[List[int]] = []
+        self.nprobe = DEFAULT_NPROBE
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The populated rows of the vector matrix"""
+        return self._matrix[:self._size]
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids[:self._size]
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+
+    def _reserve(self, extra: int):
+        needed = self._size + extra
+        if needed <= len(self._ids) and self._matrix.flags.writeable:
+            return
+        capacity = max(needed, len(self._ids) * 2, 1024)
+        matrix = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+        ids = np.zeros(capacity, dtype=np.int64)
+        ids[:self._size] = self._ids[:self._size]
+        self._matrix, self._ids = matrix, ids
+
+    def add(self, item_id: int, vector: VectorLike, payload: Any = None):
+        """
+        Add or replace one vector.
+
+        Args:
+            item_id: Identifier returned by search
+            vector: Embedding (any pgvector representation)
+            payload: Data passed to search filters
+        """
+        vec = normalize_rows(parse_vector(vector))[0]
+        if vec.shape[0] != self.dimensions:
+            raise ValueError(f"Expected {self.dimensions} dimensions, got {vec.shape[0]}")
+
+        row = self._row_of.get(item_id)
+        if row is not None:
+            if not self._matrix.flags.writeable:
+                self._reserve(0)
+            self._matrix[row] = vec
+            self.payloads[row] = payload
+            return
+
+        self._reserve(1)
+        row = self._size
+        self._matrix[row] = vec
+        self._ids[row] = item_id
+        self.payloads.append(payload)
+        self._row_of[item_id] = row
+        self._size += 1
+
+        if self.centroids is not None:
+            self._lists[int(np.argmax(self.centroids @ vec))].append(row)
+
+    def add_batch(self, item_ids: Sequence[int], vectors: np.ndarray, payloads: Optional[Sequence[Any]] = None):
+        """
+        Append many new vectors at once.
+
+        Args:
+            item_ids: Identifiers (must not already be indexed)
+            vectors: (n, dimensions) array
+            payloads: Per-vector payloads
+        """
+        vectors = normalize_rows(np.asarray(vectors, dtype=np.float32).reshape(len(item_ids), self.dimensions))
+        self._reserve(len(item_ids))
+        start = self._size
+        self._matrix[start:start + len(item_ids)] = vectors
+        self._ids[start:start + len(item_ids)] = item_ids
+        self.payloads.extend(payloads if payloads is not None else [None] * len(item_ids))
+        for offset, item_id in enumerate(item_ids):
+            self._row_of[int(item_id)] = start + offset
+        self._size += len(item_ids)
+
+        if self.centroids is not None:
+            assignments = np.argmax(vectors @ self.centroids.T, axis=1)
+            for offset, list_no in enumerate(assignments):
+                self._lists[int(list_no)].append(start + offset)
+
+    def build_ivf(self, n_lists: Optional[int] = None, iterations: int = 10, sample_size: int = 50000):
+        """
+        Train the coarse quantiser and assign every vector to a list.
+
+        Args:
+            n_lists: Number of lists (default: sqrt of the index size)
+            iterations: k-means iterations
+            sample_size: Vectors used to train the centroids
+        """
+        if self._size < IVF_MIN_SIZE:
+            self.centroids = None
+            self._lists = []
+            return
+
+        n_lists = n_lists or int(np.sqrt(self._size))
+        rng = np.random.default_rng(0)
+        sample = self.matrix[rng.choice(self._size, min(sample_size, self._size), replace=False)]
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+
+        # Spherical k-means: assign by dot product, re-normalise the means
+        for _ in range(iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = sample[assignments == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+            centroids = normalize_rows(centroids)
+
+        self.centroids = centroids
+        self._lists = [[] for _ in range(n_lists)]
+        for start in range(0, self._size, 65536):
+            block = self.matrix[start:start + 65536]
+            for offset, list_no in enumerate(np.argmax(block @ centroids.T, axis=1)):
+                self._lists[int(list_no)].append(start + offset)
+        logger.info(f"Vector index: {n_lists} IVF lists over {self._size} vectors")
+
+    # -------------------------------------------------------------------------
+    # Searching
+    # -------------------------------------------------------------------------
+
+    def _candidate_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """Rows in the nprobe nearest lists, or None to scan everything"""
+        if self.centroids is None:
+            return None
+        nprobe = min(self.nprobe, len(self._lists))
+        nearest = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        rows = [self._lists[int(c)] for c in nearest if self._lists[int(c)]]
+        return np.concatenate([np.asarray(r, dtype=np.int64) for r in rows]) if rows else np.zeros(0, dtype=np.int64)
+
+    def search(
+        self,
+        query: VectorLike,
+        k: int = 10,
+        threshold: float = -1.0,
+        accept: Optional[Callable[[int, Any], bool]] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the vectors most similar to a query.
+
+        Args:
+            query: Query embedding
+            k: Number of results
+            threshold: Minimum cosine similarity
+            accept: Optional filter called with (item_id, payload)
+
+        Returns:
+            List of (item_id, similarity), best first
+        """
+        if not self._size or k <= 0:
+            return []
+        q = normalize_rows(parse_vector(query))[0]
+
+        rows = self._candidate_rows(q)
+        scores = (self.matrix @ q) if rows is None else (self.matrix[rows] @ q)
+        if rows is None:
+            rows = np.arange(self._size)
+
+        keep = scores >= threshold
+        rows, scores = rows[keep], scores[keep]
+
+        results: List[Tuple[int, float]] = []
+        # Top-k without a full sort; widen the window if the filter rejects rows
+        window = k if accept is None else k * 4
+        while True:
+            if window < len(scores):
+                top = np.argpartition(-scores, window - 1)[:window]
+            else:
+                top = np.arange(len(scores))
+            top = top[np.argsort(-scores[top], kind='stable')]
+
+            results = []
+            for i in top:
+                row = int(rows[i])
+                item_id = int(self._ids[row])
+                if accept is None or accept(item_id, self.payloads[row]):
+                    results.append((item_id, float(scores[i])))
+                    if len(results) >= k:
+                        return results
+            if window >= len(scores):
+                return results
+            window *= 4
+
+    def vector(self, item_id: int) -> Optional[np.ndarray]:
+        """Stored (normalised) vector for an id"""
+        row = self._row_of.get(item_id)
+        return None if row is None else self._matrix[row]
+
+    def payload(self, item_id: int) -> Any:
+        row = self._row_of.get(item_id)
+        return None if row is None else self.payloads[row]
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def save(self, directory: Union[str, Path]):
+        """
+        Write the index as .npy files plus a JSON payload file.
+
+        Args:
+            directory: Target directory (created if missing)
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / 'vectors.npy', self.matrix)
+        np.save(directory / 'ids.npy', self.ids)
+        (directory / 'payloads.json').write_text(json.dumps(self.payloads))
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap: bool = True) -> 'VectorIndex':
+        """
+        Load an index written by save().
+
+        Args:
+            directory: Directory written by save()
+            mmap: Memory-map the vector matrix (read-only until the next add)
+
+        Returns:
+            VectorIndex with IVF lists rebuilt if the index is large
+        """
+        directory = Path(directory)
+        matrix = np.load(directory / 'vectors.npy', mmap_mode='r' if mmap else None)
+        ids = np.load(directory / 'ids.npy')
+
+        index = cls(matrix.shape[1], capacity=1)
+        index._matrix, index._ids = matrix, ids.copy()
+        index._size = len(ids)
+        index.payloads = json.loads((directory / 'payloads.json').read_text())
+        index._row_of = {int(item_id): row for row, item_id in enumerate(ids)}
+        index.build_ivf()
+        return index
+
+    def stats(self) -> dict:
+        return {
+            'vectors': self._size,
+            'dimensions': self.dimensions,
+            'ivf_lists': len(self._lists),
+            'nprobe': self.nprobe if self.centroids is not None else None,
+            'memory_mapped': not self._matrix.flags.writeable,
+        }
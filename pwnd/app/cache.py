@@ -0,0 +1,377 @@
+"""Shared cache tier - one cache for search, pipeline and worker results
+
+Architecture:
+- L1: in-process LRU bounded by bytes (pickled size), per-namespace TTLs
+- L2 (optional): SQLite file in WAL mode, shared by every uvicorn worker
+  so a hit computed by one worker is visible to the others
+- Single-flight: concurrent misses on the same key run the loader once
+- Stats: hits/misses/evictions per namespace, exposed on /api/stats
+
+Usage:
+    _search_cache = get_cache("search", ttl=300)
+    value = _search_cache.get(key)
+    _search_cache.set(key, value)
+    value = _search_cache.get_or_set(key, lambda: expensive(key))
+"""
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.config import (
+    CACHE_BACKEND, CACHE_LOAD_TIMEOUT, CACHE_MAX_BYTES, CACHE_SHARED_MAX_BYTES, CACHE_SQLITE_PATH
+)
+
+log = logging.getLogger(__name__)
+
+# Sentinel for "not cached" (None is a valid cached value for loaders)
+_MISSING = object()
+
+
+# =============================================================================
+# L2 - SQLite shared backend
+# =============================================================================
+
+class SQLiteBackend:
+    """Cross-process cache store in a single SQLite file (WAL mode)"""
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.local = threading.local()
+        self.evictions = 0
+        self.errors = 0
+        self._writes = 0
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_created ON cache(created_at)")
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread - sqlite3 connections are not thread-safe
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=1.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+
+    def get(self, namespace: str, key: str) -> Optional[Tuple[bytes, float]]:
+        """(blob, expires_at) for a live row, None otherwise"""
+        try:
+            row = self._conn().execute(
+                "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.errors += 1
+            log.debug("Shared cache read failed: %s", e)
+            return None
+        if row is None or row[1] < time.time():
+            return None
+        return row[0], row[1]
+
+    def set(self, namespace: str, key: str, blob: bytes, ttl: float):
+        now = time.time()
+        try:
+            conn = self._conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, size, expires_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, blob, len(blob), now + ttl, now)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            self.errors += 1
+            log.debug("Shared cache write failed: %s", e)
+            return
+        # Enforce the byte bound every 100 writes, not on each one
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self._evict()
+
+    def _evict(self):
+        """Drop expired rows, then oldest rows until under max_bytes"""
+        try:
+            conn = self._conn()
+            cur = conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+            self.evictions += cur.rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                rows = conn.execute("SELECT namespace, key, size FROM cache ORDER BY created_at").fetchall()
+                doomed = []
+                for ns, k, size in rows:
+                    if excess <= 0:
+                        break
+                    doomed.append((ns, k))
+                    excess -= size
+                conn.executemany("DELETE FROM cache WHERE namespace = ? AND key = ?", doomed)
+                self.evictions += len(doomed)
+            conn.commit()
+        except sqlite3.Error as e:
+            self.errors += 1
+            log.debug("Shared cache eviction failed: %s", e)
+
+    def stats(self) -> Dict:
+        try:
+            count, total = self._conn().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+        except sqlite3.Error:
+            count, total = 0, 0
+        return {
+            "path": self.path,
+            "entries": count,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+
+
+# =============================================================================
+# L1 - in-process LRU bounded by bytes
+# =============================================================================
+
+class CacheTier:
+    """Thread-safe LRU shared by all namespaces, bounded by total bytes"""
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES, shared: Optional[SQLiteBackend] = None):
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self.entries: OrderedDict = OrderedDict()  # (ns, key) -> (value, size, expires_at)
+        self.bytes = 0
+        self.lock = threading.Lock()
+        self.namespaces: Dict[str, "CacheNamespace"] = {}
+
+    def namespace(self, name: str, ttl: float = 300) -> "CacheNamespace":
+        with self.lock:
+            ns = self.namespaces.get(name)
+            if ns is None:
+                ns = CacheNamespace(self, name, ttl)
+                self.namespaces[name] = ns
+            return ns
+
+    def _get(self, ns: "CacheNamespace", key: str) -> Any:
+        full_key = (ns.name, key)
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(full_key)
+            if entry is not None:
+                value, size, expires_at = entry
+                if expires_at >= now:
+                    self.entries.move_to_end(full_key)
+                    return value
+                del self.entries[full_key]
+                self.bytes -= size
+                ns.expired += 1
+
+        if self.shared is not None:
+            row = self.shared.get(ns.name, key)
+            if row is not None:
+                blob, expires_at = row
+                try:
+                    value = pickle.loads(blob)
+                except Exception:
+                    return _MISSING
+                ns.shared_hits += 1
+                # Keep the shared row's deadline - a fresh TTL would let L1 outlive it
+                self._put(ns, key, value, len(blob), expires_at)
+                return value
+
+        return _MISSING
+
+    def _set(self, ns: "CacheNamespace", key: str, value: Any):
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Unpicklable values are not cached
+            return
+        self._put(ns, key, value, len(blob), time.time() + ns.ttl)
+        if self.shared is not None:
+            self.shared.set(ns.name, key, blob, ns.ttl)
+
+    def _put(self, ns: "CacheNamespace", key: str, value: Any, size: int, expires_at: float):
+        if size > self.max_bytes:
+            return
+        full_key = (ns.name, key)
+        with self.lock:
+            old = self.entries.pop(full_key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self.entries[full_key] = (value, size, expires_at)
+            self.bytes += size
+            while self.bytes > self.max_bytes and self.entries:
+                (evicted_ns, _), (_, evicted_size, _) = self.entries.popitem(last=False)
+                self.bytes -= evicted_size
+                victim = self.namespaces.get(evicted_ns)
+                if victim is not None:
+                    victim.evictions += 1
+
+    def _delete(self, ns: "CacheNamespace", key: str):
+        with self.lock:
+            old = self.entries.pop((ns.name, key), None)
+            if old is not None:
+                self.bytes -= old[1]
+
+    def stats(self) -> Dict:
+        with self.lock:
+            namespaces = list(self.namespaces.values())
+            per_ns_bytes: Dict[str, int] = {}
+            per_ns_entries: Dict[str, int] = {}
+            for (name, _), (_, size, _) in self.entries.items():
+                per_ns_bytes[name] = per_ns_bytes.get(name, 0) + size
+                per_ns_entries[name] = per_ns_entries.get(name, 0) + 1
+            total_bytes = self.bytes
+        return {
+            "backend": "sqlite" if self.shared is not None else "memory",
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "namespaces": {
+                ns.name: ns.stats(per_ns_entries.get(ns.name, 0), per_ns_bytes.get(ns.name, 0))
+                for ns in namespaces
+            },
+            "shared": self.shared.stats() if self.shared is not None else None,
+        }
+
+
+class CacheNamespace:
+    """One logical cache (own TTL and counters) inside the shared tier"""
+
+    def __init__(self, tier: CacheTier, name: str, ttl: float):
+        self.tier = tier
+        self.name = name
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+        self.evictions = 0
+        self.expired = 0
+        self.coalesced = 0
+        # Single-flight bookkeeping: key -> Event set when the leader finishes
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.tier._get(self, key)
+        if value is _MISSING:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any):
+        self.tier._set(self, key, value)
+
+    def delete(self, key: str):
+        self.tier._delete(self, key)
+
+    def get_or_set(self, key: str, loader: Callable[[], Any], timeout: float = CACHE_LOAD_TIMEOUT) -> Any:
+        """Return cached value or run loader once for all concurrent callers
+
+        Callers that find a load in progress wait up to `timeout` seconds for
+        it, then give up on the leader and run the loader themselves.
+        """
+        value = self.tier._get(self, key)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        with self._inflight_lock:
+            event = self._inflight.get(key)
+            leader = event is None
+            if leader:
+                event = threading.Event()
+                self._inflight[key] = event
+
+        if not leader:
+            # Another thread is loading this key - wait for it
+            self.coalesced += 1
+            if event.wait(timeout):
+                value = self.tier._get(self, key)
+                if value is not _MISSING:
+                    self.hits += 1
+                    return value
+            else:
+                log.warning("Cache %s: loader for %r still running after %ss, loading again",
+                            self.name, key, timeout)
+            # Leader failed, hung, or value was uncacheable - load ourselves
+            self.misses += 1
+            return loader()
+
+        self.misses += 1
+        try:
+            value = loader()
+            self.set(key, value)
+            return value
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def stats(self, entries: Optional[int] = None, size: Optional[int] = None) -> Dict:
+        total = self.hits + self.misses
+        out = {
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 2) if total > 0 else 0,
+            "shared_hits": self.shared_hits,
+            "evictions": self.evictions,
+            "expired": self.expired,
+            "coalesced": self.coalesced,
+        }
+        if entries is not None:
+            out["entries"] = entries
+            out["bytes"] = size
+        return out
+
+
+# =============================================================================
+# GLOBAL TIER
+# =============================================================================
+
+_tier: Optional[CacheTier] = None
+_tier_lock = threading.Lock()
+
+
+def _get_tier() -> CacheTier:
+    """Get or create the process-wide cache tier (lazy initialization)"""
+    global _tier
+    if _tier is None:
+        with _tier_lock:
+            if _tier is None:
+                shared = None
+                if CACHE_BACKEND == "sqlite":
+                    try:
+                        shared = SQLiteBackend(str(CACHE_SQLITE_PATH), CACHE_SHARED_MAX_BYTES)
+                        log.info(f"Shared cache backend: {CACHE_SQLITE_PATH}")
+                    except (sqlite3.Error, OSError) as e:
+                        log.warning(f"Shared cache unavailable, using memory only: {e}")
+                _tier = CacheTier(CACHE_MAX_BYTES, shared)
+    return _tier
+
+
+def get_cache(namespace: str, ttl: float = 300) -> CacheNamespace:
+    """Get a named cache; namespaces share the byte budget, not their keys"""
+    return _get_tier().namespace(namespace, ttl)
+
+
+def cache_stats() -> Dict:
+    """Hit/miss/eviction stats for every namespace (for /api/stats)"""
+    return _get_tier().stats()
@@ -24,6 +24,27 @@ DB_SCORES = "scores"      # scores table
 DB_AUDIT = "audit"        # audit logs
 DB_SESSIONS = "sessions"  # conversations, messages, auto_sessions
 
+# Cache tier (app/cache.py)
+# CACHE_BACKEND=sqlite shares cached results between uvicorn workers
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")  # memory | sqlite
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", 64 * 1024 * 1024))  # per process
+CACHE_SHARED_MAX_BYTES = int(os.getenv("CACHE_SHARED_MAX_BYTES", 256 * 1024 * 1024))
+CACHE_SQLITE_PATH = Path(os.getenv("CACHE_SQLITE_PATH", str(DATA_DIR / "cache.sqlite")))
+# Seconds a caller waits for another thread's loader before loading itself
+CACHE_LOAD_TIMEOUT = float(os.getenv("CACHE_LOAD_TIMEOUT", 30))
+
+# Search snippets (app/ranking.py): ts_headline only parses this much of a body
+SNIPPET_MAX_CHARS = int(os.getenv("SNIPPET_MAX_CHARS", 20000))
+
+# Graph snapshot (app/graph.py)
+GRAPH_REFRESH_INTERVAL = float(os.getenv("GRAPH_REFRESH_INTERVAL", 30))    # seconds between delta checks
+GRAPH_REBUILD_INTERVAL = float(os.getenv("GRAPH_REBUILD_INTERVAL", 3600))  # full reload (deletes, merges)
+GRAPH_DELTA_MAX = int(os.getenv("GRAPH_DELTA_MAX", 50000))                 # delta edges before a full reload
+GRAPH_RESCAN_WINDOW = int(os.getenv("GRAPH_RESCAN_WINDOW", 10000))        # trailing ids re-read per delta check
+
+# Entity index (app/entity_index.py): node scores are written by ingest scripts
+ENTITY_SCORES_TTL = float(os.getenv("ENTITY_SCORES_TTL", 300))  # seconds before scores are reloaded
+
 # LLM endpoints
 LLM_MISTRAL_URL = "http://127.0.0.1:8001/generate"
 LLM_HAIKU_API_KEY = os.getenv("ANTHROPIC_API_KEY")
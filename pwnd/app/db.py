@@ -1,14 +1,24 @@
-"""Database connections and utilities - PostgreSQL with connection pooling"""
+"""Database connections and utilities - PostgreSQL with connection pooling
+
+Two pools share the same DATABASE_URL:
+- psycopg2 ThreadedConnectionPool: sync helpers (scripts, pipeline, workers)
+- psycopg3 AsyncConnectionPool: async helpers for FastAPI routes, so a slow
+  query awaits instead of blocking the event loop
+"""
 import logging
 import os
+import time
 from pathlib import Path
-from contextlib import contextmanager
-from typing import List, Dict, Any
+from contextlib import contextmanager, asynccontextmanager
+from typing import List, Dict, Any, Optional, AsyncIterator
 
 from dotenv import load_dotenv
 import psycopg2
 import psycopg2.extras
 import psycopg2.pool
+import psycopg
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 
 log = logging.getLogger(__name__)
 
@@ -28,6 +38,25 @@ _pool = None
 POOL_MIN_CONN = int(os.getenv('DB_POOL_MIN', 5))
 POOL_MAX_CONN = int(os.getenv('DB_POOL_MAX', 30))
 
+# Async pool (psycopg3) - used by the FastAPI routes
+_async_pool: Optional[AsyncConnectionPool] = None
+
+ASYNC_POOL_MIN_CONN = int(os.getenv('DB_ASYNC_POOL_MIN', 5))
+ASYNC_POOL_MAX_CONN = int(os.getenv('DB_ASYNC_POOL_MAX', 30))
+ASYNC_POOL_TIMEOUT = float(os.getenv('DB_ASYNC_POOL_TIMEOUT', 10))
+
+# Server-side cursor names for stream_query_async (unique per process)
+_stream_seq = 0
+
+# Server-side prepared statements: a query is prepared after being run
+# PREPARE_THRESHOLD times on a connection (prepare=True forces it at once),
+# and each connection keeps up to PREPARED_MAX of them (LRU)
+PREPARE_THRESHOLD = int(os.getenv('DB_PREPARE_THRESHOLD', 2))
+PREPARED_MAX = int(os.getenv('DB_PREPARED_MAX', 100))
+
+# Sync pool usage counters (psycopg2 exposes no stats of its own)
+_sync_stats = {"requests": 0, "wait_ms": 0.0, "errors": 0}
+
 def _get_pool():
     """Get or create the connection pool (lazy initialization)"""
     global _pool
@@ -48,7 +77,14 @@ def get_db(db_name: str = None):
     since PostgreSQL uses single database with multiple tables
     """
     pool = _get_pool()
-    conn = pool.getconn()
+    start = time.perf_counter()
+    try:
+        conn = pool.getconn()
+    except psycopg2.pool.PoolError:
+        _sync_stats["errors"] += 1
+        raise
+    _sync_stats["requests"] += 1
+    _sync_stats["wait_ms"] += (time.perf_counter() - start) * 1000
     conn.set_session(autocommit=False)
     try:
         yield conn
@@ -90,6 +126,133 @@ def execute_insert(db_name: str, query: str, params: tuple = ()) -> int:
             # lastval() fails if no sequence was used in this session
             return 0
 
+# =============================================================================
+# ASYNC HELPERS (psycopg3) - same API as the sync helpers, awaitable
+# =============================================================================
+
+async def _configure_async_conn(conn: psycopg.AsyncConnection):
+    """Per-connection setup for the async pool"""
+    conn.prepare_threshold = PREPARE_THRESHOLD
+    conn.prepared_max = PREPARED_MAX
+
+async def open_async_pool() -> AsyncConnectionPool:
+    """Get or create the async connection pool (opened on first use)"""
+    global _async_pool
+    if _async_pool is None:
+        pool = AsyncConnectionPool(
+            conninfo=DATABASE_URL,
+            min_size=ASYNC_POOL_MIN_CONN,
+            max_size=ASYNC_POOL_MAX_CONN,
+            timeout=ASYNC_POOL_TIMEOUT,
+            kwargs={"row_factory": dict_row},
+            configure=_configure_async_conn,
+            open=False,
+        )
+        await pool.open()
+        _async_pool = pool
+        log.info(f"PostgreSQL async pool initialized ({ASYNC_POOL_MIN_CONN}-{ASYNC_POOL_MAX_CONN} connections)")
+    return _async_pool
+
+@asynccontextmanager
+async def get_db_async(db_name: str = None):
+    """Async context manager for a psycopg3 connection from the async pool
+
+    Note: db_name parameter is kept for compatibility but ignored,
+    like get_db(). The transaction is committed on success and rolled
+    back on error when the connection returns to the pool.
+    """
+    pool = await open_async_pool()
+    async with pool.connection() as conn:
+        yield conn
+
+async def execute_query_async(db_name: str, query: str, params: tuple = (),
+                              prepare: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """Execute a SELECT query without blocking the event loop
+
+    prepare=True prepares the statement server-side on first use (hot
+    queries such as the FTS searches); None leaves it to PREPARE_THRESHOLD.
+    """
+    async with get_db_async(db_name) as conn:
+        cursor = await conn.execute(query, params, prepare=prepare)
+        return await cursor.fetchall()
+
+async def execute_update_async(db_name: str, query: str, params: tuple = (),
+                               prepare: Optional[bool] = None) -> int:
+    """Execute an INSERT/UPDATE/DELETE and return rowcount"""
+    async with get_db_async(db_name) as conn:
+        cursor = await conn.execute(query, params, prepare=prepare)
+        return cursor.rowcount
+
+async def execute_insert_async(db_name: str, query: str, params: tuple = ()) -> int:
+    """Execute an INSERT and return last inserted id
+
+    Note: For PostgreSQL, prefer using RETURNING id in the query itself
+    """
+    async with get_db_async(db_name) as conn:
+        await conn.execute(query, params)
+        try:
+            async with conn.transaction():
+                cursor = await conn.execute("SELECT lastval();")
+                result = await cursor.fetchone()
+        except psycopg.errors.ObjectNotInPrerequisiteState:
+            # lastval() fails if no sequence was used in this session
+            return 0
+        return result["lastval"] if result else 0
+
+async def stream_query_async(db_name: str, query: str, params: tuple = (),
+                             batch_size: int = 500) -> AsyncIterator[Dict[str, Any]]:
+    """Iterate a large SELECT through a server-side cursor
+
+    Rows are fetched batch_size at a time, so memory stays flat and the
+    query runs once however many rows the caller walks. The connection
+    is held until the iterator is exhausted or closed.
+    """
+    global _stream_seq
+    _stream_seq += 1
+    async with get_db_async(db_name) as conn:
+        async with conn.cursor(name=f"stream_{_stream_seq}") as cursor:
+            cursor.itersize = batch_size
+            await cursor.execute(query, params)
+            async for row in cursor:
+                yield row
+
+def pool_stats() -> Dict[str, Any]:
+    """Connection pool saturation metrics for /api/stats"""
+    stats: Dict[str, Any] = {}
+
+    if _pool is not None:
+        in_use = len(_pool._used)
+        requests = _sync_stats["requests"]
+        stats["sync"] = {
+            "max": POOL_MAX_CONN,
+            "in_use": in_use,
+            "idle": len(_pool._pool),
+            "saturation": round(in_use / POOL_MAX_CONN, 2),
+            "requests": requests,
+            "avg_wait_ms": round(_sync_stats["wait_ms"] / requests, 2) if requests else 0,
+            "exhausted": _sync_stats["errors"],
+        }
+
+    if _async_pool is not None:
+        s = _async_pool.get_stats()
+        size = s.get("pool_size", 0)
+        in_use = size - s.get("pool_available", 0)
+        requests = s.get("requests_num", 0)
+        stats["async"] = {
+            "max": ASYNC_POOL_MAX_CONN,
+            "size": size,
+            "in_use": in_use,
+            "idle": s.get("pool_available", 0),
+            "saturation": round(in_use / ASYNC_POOL_MAX_CONN, 2),
+            "waiting": s.get("requests_waiting", 0),
+            "requests": requests,
+            "queued": s.get("requests_queued", 0),
+            "avg_wait_ms": round(s.get("requests_wait_ms", 0) / requests, 2) if requests else 0,
+            "timeouts": s.get("requests_errors", 0),
+        }
+
+    return stats
+
 def init_databases():
     """Initialize PostgreSQL tables if needed"""
     with get_db() as conn:
@@ -209,3 +372,11 @@ def close_pool():
         _pool.closeall()
         _pool = None
         log.info("PostgreSQL connection pool closed")
+
+async def close_async_pool():
+    """Close the async pool (for graceful shutdown)"""
+    global _async_pool
+    if _async_pool is not None:
+        await _async_pool.close()
+        _async_pool = None
+        log.info("PostgreSQL async pool closed")
@@ -0,0 +1,289 @@
+"""Entity name index - prefix lookups for search_nodes and autocomplete
+
+search_nodes used `name ILIKE '%q%' OR name_normalized ILIKE ... OR
+similarity(name, q) > 0.3`, which no index can serve, then a second query
+for scores. This index answers the common case from memory:
+
+- Every node name and alias is normalised (case, accents, punctuation)
+  and stored once per word start in a sorted key list, so "maxw" finds
+  "Ghislaine Maxwell" with one bisect
+- Node scores are loaded alongside and returned with each hit; they are
+  reloaded after ENTITY_SCORES_TTL seconds, or on the next lookup after
+  invalidate_entity_scores()
+- Misspellings and matches inside a word ("axwel") fall back to
+  PostgreSQL: the trigram operator (name % q) and ILIKE '%q%', both
+  served by the gin_trgm_ops indexes, scores joined in the same query
+
+The index follows the graph snapshot (app/graph.py): names are read from
+it instead of being queried again, nodes added by an incremental refresh
+go into a small overlay, and a snapshot rebuild rebuilds the index.
+"""
+import asyncio
+import logging
+import re
+import threading
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config import ENTITY_SCORES_TTL
+from app.db import execute_query, execute_query_async
+from app.graph import GraphSnapshot, get_graph
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SCORES = {'suspicion': 0, 'pertinence': 50, 'confidence': 50, 'anomaly': 0}
+
+# Word-start matches rank below matches at the start of the full name
+WORD_MATCH_WEIGHT = 0.8
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+# Substring matching needs at least one trigram to use the index
+SUBSTRING_MIN_CHARS = 3
+
+# Trigram fallback - same scoring columns as the prefix hits
+_TRIGRAM_SQL = """
+    SELECT
+        n.id,
+        n.type,
+        n.name,
+        GREATEST(similarity(n.name, %s), similarity(COALESCE(n.name_normalized, ''), %s)) as rank,
+        COALESCE(s.suspicion, 0) as suspicion,
+        COALESCE(s.pertinence, 50) as pertinence,
+        COALESCE(s.confidence, 50) as confidence,
+        COALESCE(s.anomaly, 0) as anomaly
+    FROM nodes n
+    LEFT JOIN scores s ON s.target_type = 'node' AND s.target_id = n.id
+    WHERE n.name %% %s OR n.name_normalized %% %s{substring}
+    ORDER BY rank DESC
+    LIMIT %s
+"""
+TRIGRAM_QUERY = _TRIGRAM_SQL.format(substring="")
+SUBSTRING_QUERY = _TRIGRAM_SQL.format(substring=" OR n.name ILIKE %s OR n.name_normalized ILIKE %s")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents, collapse punctuation to single spaces"""
+    name = unicodedata.normalize('NFKD', name or '')
+    name = ''.join(c for c in name if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(' ', name.lower()).strip()
+
+
+def _word_keys(normalized: str) -> List[Tuple[str, bool]]:
+    """(key, is_full_name) for the full name and every later word start"""
+    keys = [(normalized, True)]
+    for m in re.finditer(r' (?=\S)', normalized):
+        keys.append((normalized[m.end():], False))
+    return keys
+
+
+class EntityIndex:
+    """Sorted word-prefix index over node names and aliases"""
+
+    def __init__(self, graph: GraphSnapshot, aliases: List[Tuple[int, str]],
+                 scores: Dict[int, Dict[str, int]]):
+        self.graph = graph
+        self.scores = scores
+        self.scores_at = time.monotonic()
+
+        entries: List[Tuple[str, int, bool, int]] = []  # (key, node id, full name, name length)
+        for i, node_id in enumerate(graph.ids):
+            self._add(entries, node_id, graph.names[i])
+        for node_id in graph.delta_nodes:
+            self._add(entries, node_id, graph.delta_nodes[node_id][0])
+        for node_id, alias in aliases:
+            if graph.has_node(node_id):
+                self._add(entries, node_id, alias)
+        entries.sort()
+
+        # Parallel arrays keep the index compact (one str per key, no tuples)
+        self.keys = [e[0] for e in entries]
+        self.node_ids = array('q', (e[1] for e in entries))
+        self.name_lens = array('i', (e[3] if e[2] else -e[3] for e in entries))  # < 0: word match
+        del entries
+        self.overlay: List[Tuple[str, int, bool, int]] = []
+        self.seen_delta = set(graph.delta_nodes)
+
+    @staticmethod
+    def _add(entries: list, node_id: int, name: str):
+        normalized = normalize_name(name)
+        if not normalized:
+            return
+        for key, full in _word_keys(normalized):
+            entries.append((key, node_id, full, len(normalized)))
+
+    def follow(self, graph: GraphSnapshot):
+        """Adopt an incrementally refreshed snapshot (new nodes go to the overlay)"""
+        overlay = list(self.overlay)
+        for node_id, (name, _) in graph.delta_nodes.items():
+            if node_id not in self.seen_delta:
+                self._add(overlay, node_id, name)
+        self.seen_delta = set(graph.delta_nodes)
+        self.overlay = overlay
+        self.graph = graph
+
+    def lookup(self, q: str, limit: int = 20, node_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Prefix/word-prefix matches, best first, with scores attached"""
+        prefix = normalize_name(q)
+        if not prefix:
+            return []
+
+        best: Dict[int, float] = {}
+
+        def consider(node_id: int, full: bool, name_len: int):
+            rank = len(prefix) / name_len if full else WORD_MATCH_WEIGHT * len(prefix) / name_len
+            if rank > best.get(node_id, 0.0):
+                best[node_id] = rank
+
+        # Walk every key sharing the prefix; cap the walk for very short prefixes
+        keys = self.keys
+        i = bisect_left(keys, prefix)
+        end = min(len(keys), i + max(limit * 50, 1000))
+        while i < end and keys[i].startswith(prefix):
+            name_len = self.name_lens[i]
+            consider(self.node_ids[i], name_len > 0, abs(name_len))
+            i += 1
+        for key, node_id, full, name_len in self.overlay:
+            if key.startswith(prefix):
+                consider(node_id, full, name_len)
+
+        hits = []
+        for node_id, rank in sorted(best.items(), key=lambda kv: kv[1], reverse=True):
+            node = self.graph.node(node_id)
+            if node is None or (node_type and node['type'] != node_type):
+                continue
+            node.update(self.scores.get(node_id, DEFAULT_SCORES))
+            node['rank'] = rank
+            hits.append(node)
+            if len(hits) >= limit:
+                break
+        return hits
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'keys': len(self.keys),
+            'overlay': len(self.overlay),
+            'scored': len(self.scores),
+            'scores_age_s': round(time.monotonic() - self.scores_at, 1),
+        }
+
+
+# =============================================================================
+# PROCESS-LEVEL INDEX
+# =============================================================================
+
+_index: Optional[EntityIndex] = None
+_index_lock = threading.Lock()
+_scores_stale = False
+
+
+def invalidate_entity_scores():
+    """Call after writing node scores; the next lookup reloads them"""
+    global _scores_stale
+    _scores_stale = True
+
+
+def _load_scores() -> Dict[int, Dict[str, int]]:
+    scores = {}
+    for r in execute_query("scores", """SELECT target_id, suspicion, pertinence, confidence, anomaly
+                                          FROM scores WHERE target_type = 'node'"""):
+        scores[r['target_id']] = {
+            'suspicion': r['suspicion'] or 0,
+            'pertinence': r['pertinence'] or 50,
+            'confidence': r['confidence'] or 50,
+            'anomaly': r['anomaly'] or 0,
+        }
+    return scores
+
+
+def _load_index(graph: GraphSnapshot) -> EntityIndex:
+    try:
+        aliases = [(r['canonical_node_id'], r['alias_name'])
+                   for r in execute_query("graph", "SELECT canonical_node_id, alias_name FROM aliases")]
+    except Exception as e:
+        log.debug("No entity aliases loaded: %s", e)
+        aliases = []
+
+    index = EntityIndex(graph, aliases, _load_scores())
+    log.info("Entity index built: %d keys, %d aliases", len(index.keys), len(aliases))
+    return index
+
+
+def _scores_due(index: EntityIndex) -> bool:
+    return _scores_stale or time.monotonic() - index.scores_at >= ENTITY_SCORES_TTL
+
+
+def get_entity_index() -> EntityIndex:
+    """Index matching the current graph snapshot (blocking on first build)"""
+    global _index, _scores_stale
+    graph = get_graph()
+    index = _index
+    if index is not None and index.graph is graph and not _scores_due(index):
+        return index
+
+    with _index_lock:
+        index = _index
+        if index is not None and index.graph is graph and not _scores_due(index):
+            return index
+        if index is None or index.graph.built_at != graph.built_at:
+            _scores_stale = False
+            index = _load_index(graph)
+        else:
+            if index.graph is not graph:
+                index.follow(graph)  # same base CSR, only appended nodes
+            if _scores_due(index):
+                _scores_stale = False
+                try:
+                    index.scores = _load_scores()
+                except Exception as e:
+                    log.warning("Entity scores reload failed, keeping previous scores: %s", e)
+                index.scores_at = time.monotonic()
+        _index = index
+        return index
+
+
+def _trigram_query(q: str, limit: int) -> Tuple[str, tuple]:
+    """Trigram query and params; adds '%q%' substring matching for long enough q"""
+    if len(q.strip()) < SUBSTRING_MIN_CHARS:
+        return TRIGRAM_QUERY, (q, q, q, q, limit)
+    pattern = '%' + q.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+    return SUBSTRING_QUERY, (q, q, q, q, pattern, pattern, limit)
+
+
+def _fallback_rows(rows: List[Dict], hits: List[Dict], node_type: Optional[str]) -> List[Dict]:
+    """Trigram rows not already found by the prefix index"""
+    seen = {h['id'] for h in hits}
+    return [r for r in rows if r['id'] not in seen and (not node_type or r['type'] == node_type)]
+
+
+def lookup_entities(q: str, limit: int = 20, node_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Prefix index first, PostgreSQL trigram fallback when it finds too little"""
+    hits = get_entity_index().lookup(q, limit, node_type)
+    if len(hits) < limit:
+        try:
+            rows = execute_query("graph", *_trigram_query(q, limit))
+            hits.extend(_fallback_rows(rows, hits, node_type))
+        except Exception as e:
+            log.debug("Trigram fallback failed for %r: %s", q, e)
+    return hits[:limit]
+
+
+async def lookup_entities_async(q: str, limit: int = 20, node_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Async version of lookup_entities"""
+    index = await asyncio.to_thread(get_entity_index)
+    hits = index.lookup(q, limit, node_type)
+    if len(hits) < limit:
+        try:
+            query, params = _trigram_query(q, limit)
+            rows = await execute_query_async("graph", query, params, prepare=True)
+            hits.extend(_fallback_rows(rows, hits, node_type))
+        except Exception as e:
+            log.debug("Trigram fallback failed for %r: %s", q, e)
+    return hits[:limit]
+
+
+def entity_index_stats() -> Optional[Dict[str, Any]]:
+    return _index.stats() if _index is not None else None
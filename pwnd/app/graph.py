@@ -0,0 +1,385 @@
+"""In-memory graph snapshot - CSR adjacency over nodes/edges
+
+explore_graph_connections and /api/v2/graph/network used to walk the graph
+with one edges query per node and per depth. The snapshot loads nodes and
+edges once per process into compressed sparse row (CSR) arrays:
+
+    ptr[i] .. ptr[i+1]  ->  slice of nbr / etype / eid for node index i
+
+one set for outgoing and one for incoming edges, so neighbourhoods, k-hop
+expansion, edge-type filtering and degrees are served from memory.
+
+Refresh:
+- Incremental: nodes/edges above the last accepted id minus
+  GRAPH_RESCAN_WINDOW go into a small delta overlay, checked every
+  GRAPH_REFRESH_INTERVAL seconds or on the next access after
+  mark_graph_dirty(). Re-reading a trailing window picks up rows whose
+  transaction committed after a higher id was already seen, and edges
+  skipped until their endpoint node showed up; rows already in the
+  snapshot are skipped
+- Full rebuild: when the delta passes GRAPH_DELTA_MAX edges, or every
+  GRAPH_REBUILD_INTERVAL seconds to pick up deletes, entity merges and
+  anything that committed later than the window allows
+
+Snapshots are immutable once published; a refresh builds a new one that
+shares the CSR arrays and swaps it in, so readers never take a lock.
+"""
+import logging
+import sys
+import threading
+import time
+from array import array
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.config import GRAPH_REFRESH_INTERVAL, GRAPH_REBUILD_INTERVAL, GRAPH_DELTA_MAX, GRAPH_RESCAN_WINDOW
+from app.db import get_db
+
+log = logging.getLogger(__name__)
+
+# (neighbour id, edge type code, edge id)
+Adjacent = Tuple[int, int, int]
+
+
+def _build_csr(n: int, src: np.ndarray, dst: np.ndarray, etype: np.ndarray,
+               eid: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Sort the edge list by source index (stable: ties keep load order)"""
+    ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=ptr[1:])
+    order = np.argsort(src, kind='stable')
+    return ptr, dst[order], etype[order], eid[order]
+
+
+class GraphSnapshot:
+    """Read-only adjacency for the whole graph at one point in time"""
+
+    def __init__(self, ids: array, names: List[str], types: List[str], edge_types: List[str],
+                 out_csr: Tuple, in_csr: Tuple, max_node_id: int, max_edge_id: int,
+                 recent_edges: Set[int]):
+        self.ids = ids                        # dense index -> node id
+        self.index = {node_id: i for i, node_id in enumerate(ids)}
+        self.names = names
+        self.types = types
+        self.edge_types = edge_types          # type code -> edge type name
+        self.edge_type_codes = {t: i for i, t in enumerate(edge_types)}
+        self.out_csr = out_csr
+        self.in_csr = in_csr
+        self.edge_count = len(out_csr[1])
+        self.max_node_id = max_node_id
+        self.max_edge_id = max_edge_id        # highest accepted edge id
+        self.recent_edges = recent_edges      # accepted ids inside the rescan window
+
+        # Delta overlay, keyed by node id (see with_delta)
+        self.delta_nodes: Dict[int, Tuple[str, str]] = {}
+        self.delta_out: Dict[int, List[Adjacent]] = {}
+        self.delta_in: Dict[int, List[Adjacent]] = {}
+        self.delta_edges = 0
+
+        self.built_at = time.monotonic()
+        self.refreshed_at = self.built_at
+
+    # -------------------------------------------------------------------------
+    # Incremental refresh
+    # -------------------------------------------------------------------------
+
+    def with_delta(self, nodes: Iterable[Tuple[int, str, str]],
+                   edges: Iterable[Tuple[int, int, int, str]]) -> "GraphSnapshot":
+        """New snapshot sharing this one's CSR, plus appended nodes/edges"""
+        snap = object.__new__(GraphSnapshot)
+        snap.__dict__.update(self.__dict__)
+        snap.edge_types = list(self.edge_types)
+        snap.edge_type_codes = dict(self.edge_type_codes)
+        snap.delta_nodes = dict(self.delta_nodes)
+        snap.delta_out = dict(self.delta_out)
+        snap.delta_in = dict(self.delta_in)
+        snap.recent_edges = set(self.recent_edges)
+
+        for node_id, node_type, name in nodes:
+            if snap.has_node(node_id):
+                continue  # re-read from the rescan window
+            snap.delta_nodes[node_id] = (name, sys.intern(node_type or 'unknown'))
+            snap.max_node_id = max(snap.max_node_id, node_id)
+
+        for edge_id, from_id, to_id, edge_type in edges:
+            if edge_id in snap.recent_edges or not snap.accepts_edge(from_id, to_id):
+                continue  # already loaded, or retried once its endpoints exist
+            code = snap._intern_edge_type(edge_type)
+            # Copy-on-write: lists still shared with the previous snapshot are replaced
+            snap.delta_out[from_id] = snap.delta_out.get(from_id, []) + [(to_id, code, edge_id)]
+            snap.delta_in[to_id] = snap.delta_in.get(to_id, []) + [(from_id, code, edge_id)]
+            snap.delta_edges += 1
+            snap.recent_edges.add(edge_id)
+            snap.max_edge_id = max(snap.max_edge_id, edge_id)
+
+        floor = snap.max_edge_id - GRAPH_RESCAN_WINDOW
+        snap.recent_edges = {e for e in snap.recent_edges if e > floor}
+        snap.refreshed_at = time.monotonic()
+        return snap
+
+    def _intern_edge_type(self, edge_type: Optional[str]) -> int:
+        edge_type = edge_type or ''
+        code = self.edge_type_codes.get(edge_type)
+        if code is None:
+            code = len(self.edge_types)
+            self.edge_types.append(edge_type)
+            self.edge_type_codes[edge_type] = code
+        return code
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def has_node(self, node_id: int) -> bool:
+        return node_id in self.index or node_id in self.delta_nodes
+
+    def accepts_edge(self, from_id: int, to_id: int) -> bool:
+        """Edges are kept only when both endpoints are loaded"""
+        return self.has_node(from_id) and self.has_node(to_id)
+
+    def node(self, node_id: int) -> Optional[Dict[str, Any]]:
+        i = self.index.get(node_id)
+        if i is not None:
+            return {'id': node_id, 'name': self.names[i], 'type': self.types[i]}
+        if node_id in self.delta_nodes:
+            name, node_type = self.delta_nodes[node_id]
+            return {'id': node_id, 'name': name, 'type': node_type}
+        return None
+
+    def _type_filter(self, edge_types: Optional[Iterable[str]]) -> Optional[Set[int]]:
+        """Edge type names -> set of codes (None = no filter)"""
+        if not edge_types:
+            return None
+        return {self.edge_type_codes[t] for t in edge_types if t in self.edge_type_codes}
+
+    def _adjacent(self, node_id: int, outgoing: bool) -> Iterator[Adjacent]:
+        i = self.index.get(node_id)
+        if i is not None:
+            ptr, nbr, typ, eid = self.out_csr if outgoing else self.in_csr
+            a, b = ptr[i], ptr[i + 1]
+            ids = self.ids
+            # tolist(): plain ints for callers (and JSON), and faster than numpy scalars
+            for k, code, edge_id in zip(nbr[a:b].tolist(), typ[a:b].tolist(), eid[a:b].tolist()):
+                yield ids[k], code, edge_id
+        delta = self.delta_out if outgoing else self.delta_in
+        yield from delta.get(node_id, ())
+
+    def neighbors(self, node_id: int, edge_types: Optional[Iterable[str]] = None,
+                  direction: str = 'both') -> Iterator[Tuple[int, str, int, str]]:
+        """Yield (neighbour id, edge type, edge id, 'out'|'in') for node_id"""
+        codes = self._type_filter(edge_types)
+        for outgoing in ((True, False) if direction == 'both' else (direction == 'out',)):
+            label = 'out' if outgoing else 'in'
+            for nbr, code, edge_id in self._adjacent(node_id, outgoing):
+                if codes is None or code in codes:
+                    yield nbr, self.edge_types[code], edge_id, label
+
+    def degree(self, node_id: int, edge_types: Optional[Iterable[str]] = None,
+               direction: str = 'both') -> int:
+        """Number of incident edges (optionally of the given types)"""
+        if edge_types:
+            return sum(1 for _ in self.neighbors(node_id, edge_types, direction))
+
+        total = 0
+        i = self.index.get(node_id)
+        for outgoing in ((True, False) if direction == 'both' else (direction == 'out',)):
+            if i is not None:
+                ptr = (self.out_csr if outgoing else self.in_csr)[0]
+                total += int(ptr[i + 1] - ptr[i])
+            total += len((self.delta_out if outgoing else self.delta_in).get(node_id, ()))
+        return total
+
+    def k_hop(self, centers: Iterable[int], depth: int, edge_types: Optional[Iterable[str]] = None,
+              limit: Optional[int] = None) -> List[int]:
+        """Breadth-first neighbourhood of centers (both directions), nearest first"""
+        edge_types = list(edge_types or ())
+        seen: Dict[int, int] = {}
+        queue = deque()
+        for c in centers:
+            if self.has_node(c) and c not in seen:
+                seen[c] = 0
+                queue.append(c)
+
+        while queue and (limit is None or len(seen) < limit):
+            node_id = queue.popleft()
+            hop = seen[node_id]
+            if hop >= depth:
+                continue
+            for nbr, _, _, _ in self.neighbors(node_id, edge_types):
+                if nbr not in seen:
+                    seen[nbr] = hop + 1
+                    queue.append(nbr)
+                    if limit is not None and len(seen) >= limit:
+                        break
+
+        return list(seen)
+
+    def edges_between(self, node_ids: Iterable[int], edge_types: Optional[Iterable[str]] = None,
+                      limit: Optional[int] = None) -> List[Tuple[int, int, int, str]]:
+        """(edge id, from id, to id, type) for edges with both ends in node_ids"""
+        members = set(node_ids)
+        edges = []
+        for node_id in members:
+            for nbr, edge_type, edge_id, _ in self.neighbors(node_id, edge_types, 'out'):
+                if nbr in members:
+                    edges.append((edge_id, node_id, nbr, edge_type))
+        edges.sort()
+        return edges[:limit] if limit is not None else edges
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'nodes': len(self.ids) + len(self.delta_nodes),
+            'edges': self.edge_count + self.delta_edges,
+            'delta_nodes': len(self.delta_nodes),
+            'delta_edges': self.delta_edges,
+            'edge_types': len(self.edge_types),
+            'age_s': round(time.monotonic() - self.built_at, 1),
+        }
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+def _iter_rows(conn, name: str, query: str, params: tuple = ()) -> Iterator[tuple]:
+    """Stream a large result through a psycopg2 server-side cursor"""
+    cursor = conn.cursor(name=name)
+    cursor.itersize = 50000
+    try:
+        cursor.execute(query, params)
+        yield from cursor
+    finally:
+        cursor.close()
+
+
+def _load_full() -> GraphSnapshot:
+    start = time.perf_counter()
+    ids = array('q')
+    names: List[str] = []
+    types: List[str] = []
+    edge_types: List[str] = []
+    edge_type_codes: Dict[str, int] = {}
+    src, dst, etype, eid = array('i'), array('i'), array('H'), array('q')
+
+    with get_db("graph") as conn:
+        for node_id, node_type, name in _iter_rows(
+                conn, "graph_snapshot_nodes", "SELECT id, type, name FROM nodes ORDER BY id"):
+            ids.append(node_id)
+            names.append(name or '')
+            types.append(sys.intern(node_type or 'unknown'))
+        index = {node_id: i for i, node_id in enumerate(ids)}
+
+        for edge_id, from_id, to_id, edge_type in _iter_rows(
+                conn, "graph_snapshot_edges", "SELECT id, from_node_id, to_node_id, type FROM edges"):
+            s, d = index.get(from_id), index.get(to_id)
+            if s is None or d is None:
+                continue  # dangling edge
+            edge_type = edge_type or ''
+            code = edge_type_codes.get(edge_type)
+            if code is None:
+                code = edge_type_codes[edge_type] = len(edge_types)
+                edge_types.append(edge_type)
+            src.append(s)
+            dst.append(d)
+            etype.append(code)
+            eid.append(edge_id)
+        conn.rollback()  # end the read-only transaction before returning the connection
+
+    n = len(ids)
+    src, dst = np.frombuffer(src, dtype=np.int32), np.frombuffer(dst, dtype=np.int32)
+    etype, eid = np.frombuffer(etype, dtype=np.uint16), np.frombuffer(eid, dtype=np.int64)
+    max_edge_id = int(eid.max()) if len(eid) else 0
+    snap = GraphSnapshot(
+        ids, names, types, edge_types,
+        out_csr=_build_csr(n, src, dst, etype, eid),
+        in_csr=_build_csr(n, dst, src, etype, eid),
+        max_node_id=ids[-1] if n else 0,
+        max_edge_id=max_edge_id,
+        recent_edges=set(eid[eid > max_edge_id - GRAPH_RESCAN_WINDOW].tolist()),
+    )
+    log.info("Graph snapshot built: %d nodes, %d edges in %.1fs",
+             n, snap.edge_count, time.perf_counter() - start)
+    return snap
+
+
+def _load_delta(base: GraphSnapshot) -> GraphSnapshot:
+    """Rows in the trailing id window that the snapshot does not have yet"""
+    with get_db("graph") as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT id, type, name FROM nodes WHERE id > %s ORDER BY id",
+            (base.max_node_id - GRAPH_RESCAN_WINDOW,)
+        )
+        nodes = [row for row in cursor.fetchall() if not base.has_node(row[0])]
+        cursor.execute(
+            "SELECT id, from_node_id, to_node_id, type FROM edges WHERE id > %s ORDER BY id",
+            (base.max_edge_id - GRAPH_RESCAN_WINDOW,)
+        )
+        new_ids = {row[0] for row in nodes}
+        edges = [
+            row for row in cursor.fetchall()
+            if row[0] not in base.recent_edges
+            and all(base.has_node(n) or n in new_ids for n in (row[1], row[2]))
+        ]
+        cursor.close()
+        conn.rollback()
+
+    if not nodes and not edges:
+        base.refreshed_at = time.monotonic()
+        return base
+    return base.with_delta(nodes, edges)
+
+
+# =============================================================================
+# PROCESS-LEVEL SNAPSHOT
+# =============================================================================
+
+_snapshot: Optional[GraphSnapshot] = None
+_refresh_lock = threading.Lock()
+_dirty = False
+
+
+def mark_graph_dirty():
+    """Call after inserting nodes/edges; the next get_graph() picks them up"""
+    global _dirty
+    _dirty = True
+
+
+def get_graph() -> GraphSnapshot:
+    """Current snapshot, loading or refreshing it first when due
+
+    The first call loads the whole graph (seconds on the full corpus);
+    async callers should go through asyncio.to_thread.
+    """
+    global _snapshot, _dirty
+    snap = _snapshot
+    if snap is not None and not _dirty and time.monotonic() - snap.refreshed_at < GRAPH_REFRESH_INTERVAL:
+        return snap
+
+    with _refresh_lock:
+        snap = _snapshot
+        now = time.monotonic()
+        if snap is not None and not _dirty and now - snap.refreshed_at < GRAPH_REFRESH_INTERVAL:
+            return snap
+        _dirty = False
+        try:
+            if snap is None or now - snap.built_at >= GRAPH_REBUILD_INTERVAL:
+                snap = _load_full()
+            else:
+                snap = _load_delta(snap)
+                if snap.delta_edges > GRAPH_DELTA_MAX:
+                    snap = _load_full()
+        except Exception as e:
+            if _snapshot is None:
+                raise
+            log.warning("Graph snapshot refresh failed, serving previous snapshot: %s", e)
+            _snapshot.refreshed_at = now
+            return _snapshot
+        _snapshot = snap
+        return snap
+
+
+def graph_stats() -> Optional[Dict[str, Any]]:
+    """Snapshot size and age for /api/stats (None until first load)"""
+    return _snapshot.stats() if _snapshot is not None else None
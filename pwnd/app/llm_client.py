@@ -146,6 +146,7 @@ def insert_extracted_entities(validated: Dict, source_email_id: int = None) -> D
         Dict with counts of inserted entities by type
     """
     from app.db import execute_insert, execute_query
+    from app.graph import mark_graph_dirty
 
     counts = {"persons": 0, "orgs": 0, "locations": 0, "edges": 0}
 
@@ -233,6 +234,9 @@ def insert_extracted_entities(validated: Dict, source_email_id: int = None) -> D
                 except Exception:
                     pass
 
+    if any(counts.values()):
+        mark_graph_dirty()
+
     return counts
 
 
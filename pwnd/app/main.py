@@ -1,4 +1,5 @@
 """FastAPI application entry point"""
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
@@ -14,7 +15,10 @@ from app.routes import router
 from app.routes_auth import router as auth_router
 from app.routes_chat import router as chat_router
 from app.routes_v2 import router as v2_router
-from app.db import init_databases, close_pool
+from app.db import init_databases, close_pool, open_async_pool, close_async_pool
+from app.sidecars import close_sidecars
+from app.ranking import init_rank_features, refresh_rank_features
+from app.entity_index import get_entity_index
 from app.config import API_HOST, API_PORT
 
 # =============================================================================
@@ -80,6 +84,7 @@ log = logging.getLogger("app")
 
 # Initialize databases
 init_databases()
+init_rank_features()
 
 
 @asynccontextmanager
@@ -89,9 +94,20 @@ async def lifespan(app: FastAPI):
     # Using structured search result formatting instead
     log.info("Phi-3 disabled (CPU inference too slow), using structured fallback")
 
+    # Warm the async pool used by the routes
+    await open_async_pool()
+
+    # Pick up score changes made since the last deploy without delaying startup
+    asyncio.get_running_loop().run_in_executor(None, refresh_rank_features)
+
+    # Load the graph snapshot and entity index before the first request needs them
+    asyncio.get_running_loop().run_in_executor(None, get_entity_index)
+
     yield
 
-    # Close database connection pool
+    # Close sidecar HTTP pools and database connection pools
+    await close_sidecars()
+    await close_async_pool()
     close_pool()
 
 
@@ -22,16 +22,19 @@ import re
 import random
 import asyncio
 import hashlib
-import threading
-import time
 from datetime import datetime
-from typing import AsyncGenerator, Dict, Any, List
-from functools import lru_cache
-from collections import OrderedDict
+from typing import AsyncGenerator, Dict, Any, List, Set
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 from app.llm_client import call_local, call_opus
 from app.db import execute_query, execute_insert, execute_update
-from app.search import search_corpus_scored, search_nodes, search_go_sync, auto_score_result
+from app.cache import get_cache
+from app.sidecars import rust_extract
+from app.graph import get_graph, mark_graph_dirty
+from app.entity_index import get_entity_index
+from app.search import search_corpus_scored, search_nodes, search_go_sync, auto_score_result, search_terms_batch
 
 log = logging.getLogger(__name__)
 
@@ -322,47 +325,10 @@ def get_curated_suggestions(query: str) -> List[str]:
     return [s for s in suggestions if s.lower() not in query_lower][:3]
 
 # =============================================================================
-# LRU CACHE - Avoid redundant searches
+# SEARCH CACHE - Avoid redundant searches (shared tier, see app/cache.py)
 # =============================================================================
 
-class TTLCache:
-    """Thread-safe LRU cache with TTL"""
-    def __init__(self, maxsize=200, ttl=300):
-        self.cache = OrderedDict()
-        self.ttl = ttl
-        self.maxsize = maxsize
-        self.lock = threading.Lock()
-        self.hits = 0
-        self.misses = 0
-
-    def get(self, key):
-        with self.lock:
-            if key not in self.cache:
-                self.misses += 1
-                return None
-            value, ts = self.cache[key]
-            if time.time() - ts > self.ttl:
-                del self.cache[key]
-                self.misses += 1
-                return None
-            self.cache.move_to_end(key)
-            self.hits += 1
-            return value
-
-    def set(self, key, value):
-        with self.lock:
-            if key in self.cache:
-                del self.cache[key]
-            elif len(self.cache) >= self.maxsize:
-                self.cache.popitem(last=False)
-            self.cache[key] = (value, time.time())
-
-    def stats(self):
-        total = self.hits + self.misses
-        return {"hits": self.hits, "misses": self.misses, "ratio": self.hits/total if total else 0}
-
-# Global search cache
-_search_cache = TTLCache(maxsize=500, ttl=300)
+_search_cache = get_cache("corpus_search", ttl=300)
 
 # =============================================================================
 # CHAIN OF CUSTODY - Evidence Integrity
@@ -586,11 +552,10 @@ def build_smart_response(query: str, results: List[Dict], entities: Dict) -> str
 
 def rust_extract_entities(text: str) -> Dict[str, List]:
     """Call Rust extraction service (3ms vs 50ms Python)"""
-    import httpx
-    try:
-        r = httpx.post("http://127.0.0.1:9001/extract",
-                       json={"text": text[:5000]}, timeout=2.0)
-        if r.status_code == 200:
+    # Pooled client; returns None at once while the circuit is open
+    r = rust_extract.post("/extract", json={"text": text[:5000]})
+    if r is not None and r.status_code == 200:
+        try:
             data = r.json()
             return {
                 "persons": [{"name": p["value"]} for p in data.get("persons", [])],
@@ -601,8 +566,8 @@ def rust_extract_entities(text: str) -> Dict[str, List]:
                 "emails": [{"value": e["value"]} for e in data.get("emails", [])],
                 "patterns": []
             }
-    except (httpx.RequestError, httpx.TimeoutException, ValueError):
-        pass  # Rust service unavailable, fallback to Python
+        except (KeyError, ValueError, TypeError):
+            pass  # Malformed response, fallback to Python
     return fast_extract_python(text)
 
 def fast_extract_entities(text: str) -> Dict[str, List]:
@@ -751,6 +716,28 @@ def record_session_search(conversation_id: str, term: str, email_ids: List[int])
         log.debug("Failed to record session search: %s", e)
 
 
+def record_session_searches(conversation_id: str, searches: List[tuple]):
+    """Record several searches in session history with one multi-row INSERT
+
+    searches: list of (term, email_ids) tuples
+    """
+    if not conversation_id or not searches:
+        return
+    try:
+        placeholders = ", ".join(["(%s, %s, %s)"] * len(searches))
+        params = []
+        for term, email_ids in searches:
+            params.extend([conversation_id, term.lower(), json.dumps(email_ids)])
+        execute_update(
+            "sessions",
+            f"""INSERT INTO session_searches (conversation_id, search_term, email_ids)
+                VALUES {placeholders}""",
+            tuple(params)
+        )
+    except Exception as e:
+        log.debug("Failed to record session searches: %s", e)
+
+
 def get_session_seen_emails(conversation_id: str) -> set:
     """Get email IDs already seen in this session"""
     if not conversation_id:
@@ -788,20 +775,18 @@ def get_timeline_context(query: str, email_dates: list) -> str:
     matching_people = [p for p in people_terms if p in query_lower]
 
     if matching_people:
-        # Get events involving these people
-        placeholders = ','.join(['%s'] * len(matching_people))
-        for person in matching_people:
-            rows = execute_query(
-                "l_data",
-                f"""SELECT event_date, event_type, event_title, event_description, jurisdiction, case_number
-                    FROM case_timeline
-                    WHERE people_involved::text ILIKE %s
-                    ORDER BY event_date""",
-                (f'%{person}%',)
-            )
-            for r in rows:
-                if r not in events:
-                    events.append(r)
+        # Get events involving any of these people in one scan
+        rows = execute_query(
+            "l_data",
+            """SELECT event_date, event_type, event_title, event_description, jurisdiction, case_number
+               FROM case_timeline
+               WHERE people_involved::text ILIKE ANY(%s)
+               ORDER BY event_date""",
+            ([f'%{person}%' for person in matching_people],)
+        )
+        for r in rows:
+            if r not in events:
+                events.append(r)
 
     # Also get events near email dates
     if email_dates:
@@ -865,25 +850,28 @@ def get_graph_context(query: str, discovered_names: List[str] = None) -> str:
             except Exception:
                 pass  # Continue with other names
 
-    # Get edges/relationships for key entities
+    # Get edges/relationships for key entities (name index + graph snapshot)
     if graph_lines:
         try:
-            # Get some relationships
-            rows = execute_query("graph", """
-                SELECT DISTINCT e.type, fn.name as from_name, tn.name as to_name
-                FROM edges e
-                JOIN nodes fn ON e.from_node_id = fn.id
-                JOIN nodes tn ON e.to_node_id = tn.id
-                WHERE fn.name ILIKE %s OR tn.name ILIKE %s
-                LIMIT 10
-            """, (f'%{query}%', f'%{query}%'))
-
-            if rows:
+            graph = get_graph()
+            relationships = []
+            for entity in get_entity_index().lookup(query, limit=10):
+                for nbr_id, rel_type, _, direction in graph.neighbors(entity['id']):
+                    other = graph.node(nbr_id)['name']
+                    rel = (entity['name'], rel_type, other) if direction == 'out' else (other, rel_type, entity['name'])
+                    if rel not in relationships:
+                        relationships.append(rel)
+                    if len(relationships) >= 8:
+                        break
+                if len(relationships) >= 8:
+                    break
+
+            if relationships:
                 graph_lines.append("\nRELATIONSHIPS:")
-                for r in rows[:8]:
-                    graph_lines.append(f"  {r['from_name']} --[{r['type']}]--> {r['to_name']}")
+                for from_name, rel_type, to_name in relationships:
+                    graph_lines.append(f"  {from_name} --[{rel_type}]--> {to_name}")
         except Exception as e:
-            log.debug("Edge query failed: %s", e)
+            log.debug("Edge lookup failed: %s", e)
 
     return NL.join(graph_lines) if graph_lines else ""
 
@@ -1012,28 +1000,45 @@ def search_corpus(search_term: str, limit: int = 10) -> List[Dict[str, Any]]:
     """Search emails with caching - Go fast search first, fallback to PostgreSQL"""
     cache_key = f"search:{search_term.lower()}:{limit}"
 
-    # Check cache first
-    cached = _search_cache.get(cache_key)
-    if cached is not None:
-        return cached
+    def load():
+        # Try Go service first (3-4x faster)
+        go_results = search_go_sync([search_term], limit)
+        if go_results:
+            for r in go_results:
+                scores = auto_score_result(r)
+                r.update(scores)
+            return go_results
+
+        # Fallback to PostgreSQL FTS
+        return search_corpus_scored(search_term, limit)
+
+    # Single-flight: concurrent identical misses share one search
+    return _search_cache.get_or_set(cache_key, load)
+
+
+def search_corpus_batch(search_terms: List[str], limit: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+    """Search several terms in one round trip - cached per term like search_corpus"""
+    results = {}
+    missing = []
+    for term in search_terms:
+        cached = _search_cache.get(f"search:{term.lower()}:{limit}")
+        if cached is not None:
+            results[term] = cached
+        else:
+            missing.append(term)
 
-    # Try Go service first (3-4x faster)
-    go_results = search_go_sync([search_term], limit)
-    if go_results:
-        for r in go_results:
-            scores = auto_score_result(r)
-            r.update(scores)
-        _search_cache.set(cache_key, go_results)
-        return go_results
+    if missing:
+        fetched = search_terms_batch(missing, limit)
+        for term in missing:
+            res = fetched.get(term, [])
+            _search_cache.set(f"search:{term.lower()}:{limit}", res)
+            results[term] = res
 
-    # Fallback to PostgreSQL FTS
-    results = search_corpus_scored(search_term, limit)
-    _search_cache.set(cache_key, results)
-    return results
+    return {t: results.get(t, []) for t in search_terms}
 
 
 def explore_graph_connections(entity_name: str, limit: int = 10) -> List[Dict[str, Any]]:
-    """Explore graph for entity connections"""
+    """Explore graph for entity connections (edges served from the graph snapshot)"""
     try:
         # Find node by name
         nodes = execute_query(
@@ -1047,43 +1052,27 @@ def explore_graph_connections(entity_name: str, limit: int = 10) -> List[Dict[st
         if not nodes:
             return []
 
+        graph = get_graph()
         connections = []
         for node in nodes:
-            # Get edges from this node
-            edges = execute_query(
-                "graph",
-                """SELECT e.type as rel_type, n2.name as connected_to, n2.type as node_type
-                   FROM edges e
-                   JOIN nodes n2 ON e.to_node_id = n2.id
-                   WHERE e.from_node_id = %s
-                   LIMIT %s""",
-                (node['id'], limit)
-            )
-            for edge in edges:
-                connections.append({
-                    'from': node['name'],
-                    'relation': edge['rel_type'],
-                    'to': edge['connected_to'],
-                    'to_type': edge['node_type']
-                })
-
-            # Also get reverse edges
-            rev_edges = execute_query(
-                "graph",
-                """SELECT e.type as rel_type, n2.name as connected_from, n2.type as node_type
-                   FROM edges e
-                   JOIN nodes n2 ON e.from_node_id = n2.id
-                   WHERE e.to_node_id = %s
-                   LIMIT %s""",
-                (node['id'], limit)
-            )
-            for edge in rev_edges:
-                connections.append({
-                    'from': edge['connected_from'],
-                    'relation': edge['rel_type'],
-                    'to': node['name'],
-                    'from_type': edge['node_type']
-                })
+            # Outgoing edges first, then reverse edges, up to `limit` of each
+            for direction in ('out', 'in'):
+                for nbr_id, rel_type, _, _ in islice(graph.neighbors(node['id'], direction=direction), limit):
+                    other = graph.node(nbr_id)
+                    if direction == 'out':
+                        connections.append({
+                            'from': node['name'],
+                            'relation': rel_type,
+                            'to': other['name'],
+                            'to_type': other['type']
+                        })
+                    else:
+                        connections.append({
+                            'from': other['name'],
+                            'relation': rel_type,
+                            'to': node['name'],
+                            'from_type': other['type']
+                        })
 
         return connections[:limit]
     except Exception:
@@ -1197,30 +1186,259 @@ async def extract_entities_from_results(results: List[Dict], use_local_llm: bool
     return entities
 
 
+# =============================================================================
+# PIPELINE STAGES - sync work fanned out from process_query
+# =============================================================================
+
+# Bounded pool for the blocking DB/sidecar calls process_query runs concurrently
+_pipeline_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="pipeline")
+
+GENERIC_MAIL_DOMAINS = ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'aol.com']
+GENERIC_MAILBOXES = ['info', 'admin', 'support', 'contact', 'noreply']
+
+
+# Stages nobody may await, referenced here until they finish
+_background: Set[asyncio.Future] = set()
+
+
+def _offload(fn, *args, **kwargs) -> asyncio.Future:
+    """Run a sync stage on the pipeline pool without blocking the event loop"""
+    return asyncio.get_running_loop().run_in_executor(_pipeline_executor, partial(fn, *args, **kwargs))
+
+
+def _track(future: asyncio.Future, name: str, level: int) -> asyncio.Future:
+    _background.add(future)
+
+    def done(f: asyncio.Future):
+        _background.discard(f)
+        if not f.cancelled() and f.exception() is not None:
+            log.log(level, "Pipeline stage %s failed: %s", name, f.exception())
+
+    future.add_done_callback(done)
+    return future
+
+
+def _detach(future: asyncio.Future, name: str) -> asyncio.Future:
+    """Keep a future whose result may never be awaited (early return, discarded prefetch)
+
+    A caller that does await it still gets the exception; the log is for
+    the ones nobody awaits.
+    """
+    return _track(future, name, logging.DEBUG)
+
+
+def _spawn(fn, *args) -> asyncio.Future:
+    """Fire-and-forget stage (writes after the answer): failures are logged"""
+    return _track(_offload(fn, *args), fn.__name__, logging.WARNING)
+
+
+class _Prefetch:
+    """A stage started before its inputs are final
+
+    start() launches the work for a predicted key; result() reuses it only
+    when the key computed from the final inputs is the same, otherwise it
+    runs the stage again. Output is identical to running the stages in
+    series - prediction only decides what can overlap.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.future = None
+
+    def start(self, key, fn, *args):
+        self.key = key
+        self.future = _detach(_offload(fn, *args), fn.__name__)
+
+    async def result(self, key, fn, *args):
+        if self.future is not None and key == self.key:
+            return await self.future
+        return await _offload(fn, *args)
+
+
+def _save_message(conversation_id: str, role: str, content: str, is_auto: bool):
+    try:
+        execute_insert(
+            "sessions",
+            "INSERT INTO messages (conversation_id, role, content, is_auto) VALUES (%s, %s, %s, %s)",
+            (conversation_id, role, content, 1 if is_auto else 0)
+        )
+    except Exception as e:
+        log.debug("Failed to save %s message: %s", role, e)
+
+
+def _plan_domain_search(all_results: List[Dict], initial_terms: List[str]):
+    """Step 2: (domain, count, search term) for the first interesting sender domain"""
+    domain_counts = {}
+    for s in [r.get('sender_email', '') for r in all_results if r.get('sender_email')]:
+        if '@' in s:
+            domain = s.split('@')[1]
+            if domain not in GENERIC_MAIL_DOMAINS:
+                domain_counts[domain] = domain_counts.get(domain, 0) + 1
+
+    # Search top 2 domains - the first that qualifies
+    for domain, count in sorted(domain_counts.items(), key=lambda x: -x[1])[:2]:
+        domain_term = domain.split('.')[0]
+        if domain_term.lower() not in [t.lower() for t in initial_terms] and len(domain_term) > 3:
+            return domain, count, domain_term
+    return None
+
+
+def _plan_entity_stage(all_results: List[Dict], discovered: set, query: str) -> Dict[str, Any]:
+    """Step 3: fast extraction and the persons/orgs to search next"""
+    combined_text = NL.join([
+        f"{r.get('name', '')} {r.get('sender_email', '')} {r.get('snippet', '')[:300]}"
+        for r in all_results[:20]
+    ])
+    parallel_extracted = fast_extract_entities(combined_text)
+
+    # Convert to old format
+    extracted_entities = []
+    for p in parallel_extracted.get("persons", []):
+        extracted_entities.append({"name": p.get("name", ""), "type": "person", "count": 1})
+    for o in parallel_extracted.get("orgs", []):
+        extracted_entities.append({"name": o.get("name", ""), "type": "org", "count": 1})
+    for l in parallel_extracted.get("locations", []):
+        extracted_entities.append({"name": l.get("name", ""), "type": "location", "count": 1})
+
+    persons = [e for e in extracted_entities if e.get('type') == 'person']
+    persons = sorted(persons, key=lambda x: -x.get('count', 0))
+
+    discovered = set(discovered)
+    entities_to_search = []
+    for entity in persons[:3]:
+        name = entity.get('name', '')
+        if name and name not in discovered and name.lower() not in query.lower():
+            entities_to_search.append(entity)
+            discovered.add(name)
+
+    orgs = [e for e in extracted_entities if e.get('type') == 'org']
+    org_names = [e.get('name', '') for e in orgs[:1]
+                 if e.get('name') and e.get('name') not in discovered]
+
+    return {
+        "parallel_extracted": parallel_extracted,
+        "entities_to_search": entities_to_search,
+        "org_names": org_names,
+        # Persons (limit 2 for speed) and orgs searched in one batch
+        "batch_terms": [e.get('name', '') for e in entities_to_search[:2]] + org_names,
+        "discovered": discovered,
+    }
+
+
+def _run_entity_stage(all_results: List[Dict], discovered: set, query: str):
+    """Step 3 plan plus its batched search, as one pipeline task"""
+    plan = _plan_entity_stage(all_results, discovered, query)
+    return plan, search_corpus_batch(plan["batch_terms"], limit=8)
+
+
+def _entity_stage_key(all_results: List[Dict], discovered: set) -> tuple:
+    return tuple(r.get('id') for r in all_results[:20]), frozenset(discovered)
+
+
+def _plan_recipient_search(all_results: List[Dict], discovered: set, query: str):
+    """Step 5: (recipient, count, local part) of the most frequent interesting recipient"""
+    if len(all_results) <= 3:
+        return None
+
+    all_recipients = []
+    for r in all_results[:10]:
+        recip = r.get('recipients_to', '')
+        if isinstance(recip, list):
+            all_recipients.extend([x for x in recip if x])
+        elif isinstance(recip, str) and recip:
+            all_recipients.extend([x.strip() for x in recip.split(',') if x.strip()])
+
+    recip_counts = {}
+    for rec in all_recipients:
+        if '@' in rec:
+            local = rec.split('@')[0].lower()
+            if len(local) > 3 and local not in GENERIC_MAILBOXES:
+                recip_counts[rec] = recip_counts.get(rec, 0) + 1
+
+    for recip, count in sorted(recip_counts.items(), key=lambda x: -x[1])[:1]:
+        if count >= 2:
+            local_part = recip.split('@')[0]
+            if local_part not in discovered and local_part.lower() not in query.lower():
+                return recip, count, local_part
+    return None
+
+
+def _plan_keyword_search(all_results: List[Dict], discovered: set, query: str):
+    """Step 6: (word, count) for the most repeated subject keyword"""
+    if len(all_results) <= 5:
+        return None
+
+    subject_words = []
+    for r in all_results[:15]:
+        subj = str(r.get('name', '')).lower()
+        subject_words.extend(re.findall(r'\b([a-z]{5,15})\b', subj))
+
+    word_counts = {}
+    # No filtering - anything could be evidence
+    for w in subject_words:
+        if w not in query.lower():  # Only skip query terms to avoid loops
+            word_counts[w] = word_counts.get(w, 0) + 1
+
+    for word, count in sorted(word_counts.items(), key=lambda x: -x[1])[:1]:
+        if count >= 3 and word not in discovered:
+            return word, count
+    return None
+
+
+def _enrich_graph(parallel_extracted: Dict[str, List]):
+    """Insert extracted entities as graph nodes (runs after the answer is sent)"""
+    try:
+        for p in parallel_extracted.get("persons", [])[:20]:
+            name = p.get("name", "").strip()
+            if len(name) > 3:
+                execute_insert("graph",
+                    "INSERT INTO nodes (name, name_normalized, type) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING",
+                    (name, name.lower(), "person"))
+        for o in parallel_extracted.get("orgs", [])[:10]:
+            name = o.get("name", "").strip()
+            if len(name) > 3:
+                execute_insert("graph",
+                    "INSERT INTO nodes (name, name_normalized, type) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING",
+                    (name, name.lower(), "organization"))
+        for loc in parallel_extracted.get("locations", [])[:10]:
+            name = loc.get("name", "").strip()
+            if len(name) > 2:
+                execute_insert("graph",
+                    "INSERT INTO nodes (name, name_normalized, type) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING",
+                    (name, name.lower(), "location"))
+        mark_graph_dirty()
+    except Exception as e:
+        log.debug("Entity enrichment failed: %s", e)
+
+
 # =============================================================================
 # MAIN PIPELINE - MULTI-STEP INVESTIGATION
 # =============================================================================
 
 async def process_query(query: str, conversation_id: str = None, is_auto: bool = False) -> AsyncGenerator[Dict[str, Any], None]:
-    """Multi-step investigation pipeline - deep local search, single API call"""
+    """Multi-step investigation pipeline - deep local search, single API call
+
+    Stages form a dependency DAG. Work that does not depend on earlier
+    results (session history, the initial term batch, mind context) starts
+    immediately; later searches are prefetched from predicted inputs while
+    earlier stages are still reporting (see _Prefetch). Events are still
+    yielded in the same fixed order as the sequential pipeline.
+    """
 
     # Detect language
     user_lang = detect_language(query)
 
-    # Save user message
-    if conversation_id:
-        try:
-            execute_insert(
-                "sessions",
-                "INSERT INTO messages (conversation_id, role, content, is_auto) VALUES (%s, %s, %s, %s)",
-                (conversation_id, "user", query, 1 if is_auto else 0)
-            )
-        except Exception as e:
-            log.debug("Failed to save user message: %s", e)
+    initial_terms = extract_search_terms(query)
+    if not initial_terms:
+        initial_terms = [query]
 
-    # Get session history for anti-loop
-    session_history = get_session_search_history(conversation_id)
-    session_seen_emails = get_session_seen_emails(conversation_id)
+    # Independent work - none of these depend on each other
+    user_saved = _detach(_offload(_save_message, conversation_id, "user", query, is_auto),
+                         "_save_message") if conversation_id else None
+    history_task = _offload(get_session_search_history, conversation_id)
+    seen_task = _offload(get_session_seen_emails, conversation_id)
+    initial_task = _detach(_offload(search_corpus_batch, initial_terms[:4], 12), "search_corpus_batch")
+    mind_task = _detach(_offload(load_mind_context, query, 1500), "load_mind_context")
 
     all_results = []
     all_ids = set()
@@ -1236,12 +1454,11 @@ async def process_query(query: str, conversation_id: str = None, is_auto: bool =
     if user_lang != 'en':
         yield {"type": "thinking", "text": f"Language: {user_lang}\n"}
 
-    initial_terms = extract_search_terms(query)
-    if not initial_terms:
-        initial_terms = [query]
-
     yield {"type": "thinking", "text": f"Terms: {', '.join(initial_terms)}\n\n"}
 
+    # Get session history for anti-loop
+    session_history, session_seen_emails = await asyncio.gather(history_task, seen_task)
+
     # Check for loop - if ALL initial terms were already searched 2+ times
     loop_terms = [t for t in initial_terms if session_history.get(t.lower(), 0) >= 2]
     if len(loop_terms) == len(initial_terms) and len(loop_terms) > 0:
@@ -1267,15 +1484,19 @@ async def process_query(query: str, conversation_id: str = None, is_auto: bool =
     # First search - search each term separately for better recall
     yield {"type": "status", "msg": f"[1/5] Searching {len(initial_terms[:4])} terms..."}
 
+    # All terms in one batch: concurrent Go calls or a single LATERAL query
+    batch = await initial_task
+    session_searches = []
+
     for i, term in enumerate(initial_terms[:4]):
         yield {"type": "thinking", "text": f"[1.{i+1}] \"{term}\"\n"}
 
-        res = search_corpus(term, limit=12)
+        res = batch.get(term, [])
         search_history.append({"term": term, "count": len(res)})
 
         # Track this search
         result_ids = [r.get('id') for r in res if r.get('id')]
-        record_session_search(conversation_id, term, result_ids)
+        session_searches.append((term, result_ids))
 
         if res:
             new_results = [r for r in res if r.get('id') not in session_seen_emails and r.get('id') not in all_ids]
@@ -1284,63 +1505,65 @@ async def process_query(query: str, conversation_id: str = None, is_auto: bool =
                 all_ids.add(r.get('id'))
             yield {"type": "thinking", "text": f"    → {len(res)} emails ({len(new_results)} new)\n"}
 
+    _spawn(record_session_searches, conversation_id, session_searches)
+
     yield {"type": "sources", "ids": list(all_ids)}
 
+    # Fan out: the domain search, plus steps 3/5/6 predicted from step 1 results
+    domain_plan = _plan_domain_search(all_results, initial_terms) if all_results else None
+    domain_task = _offload(search_corpus, domain_plan[2], 12) if domain_plan else None
+
+    predicted = set(discovered_entities)
+    if domain_plan:
+        predicted.add(domain_plan[0])
+    entity_prefetch, recipient_prefetch, keyword_prefetch = _Prefetch(), _Prefetch(), _Prefetch()
+    if len(all_results) > 2:
+        entity_prefetch.start(_entity_stage_key(all_results, predicted), _run_entity_stage,
+                              list(all_results[:20]), predicted, query)
+    recip_plan = _plan_recipient_search(all_results, predicted, query)
+    if recip_plan:
+        recipient_prefetch.start(recip_plan[2], search_corpus, recip_plan[2], 8)
+    keyword_plan = _plan_keyword_search(all_results, predicted, query)
+    if keyword_plan:
+        keyword_prefetch.start(keyword_plan[0], search_corpus, keyword_plan[0], 8)
+
     # ==========================================================================
     # STEP 2: Extract entities and search by sender domains
     # ==========================================================================
     if all_results:
         yield {"type": "thinking", "text": f"\nExtracting patterns...\n"}
 
-        # Collect all senders
-        all_senders = [r.get('sender_email', '') for r in all_results if r.get('sender_email')]
-
-        # Find interesting domains (not generic)
-        domain_counts = {}
-        for s in all_senders:
-            if '@' in s:
-                domain = s.split('@')[1]
-                if domain not in ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'aol.com']:
-                    domain_counts[domain] = domain_counts.get(domain, 0) + 1
-
-        # Search top 2 domains
-        sorted_domains = sorted(domain_counts.items(), key=lambda x: -x[1])[:2]
-        for domain, count in sorted_domains:
-            domain_term = domain.split('.')[0]
-            if domain_term.lower() not in [t.lower() for t in initial_terms] and len(domain_term) > 3:
-                discovered_entities.add(domain)
-                yield {"type": "status", "msg": f"[2/5] Domain: {domain}..."}
-                yield {"type": "thinking", "text": f"[2] Domain \"{domain}\" ({count}x)\n"}
-
-                res = search_corpus(domain_term, limit=12)
-                search_history.append({"term": domain_term, "count": len(res)})
-                new_count = 0
-                for r in res:
-                    if r.get('id') not in all_ids:
-                        all_results.append(r)
-                        all_ids.add(r.get('id'))
-                        new_count += 1
-                if new_count > 0:
-                    yield {"type": "thinking", "text": f"    → +{new_count} new emails\n"}
-                    yield {"type": "sources", "ids": list(all_ids)}
-                break
+        if domain_plan:
+            domain, count, domain_term = domain_plan
+            discovered_entities.add(domain)
+            yield {"type": "status", "msg": f"[2/5] Domain: {domain}..."}
+            yield {"type": "thinking", "text": f"[2] Domain \"{domain}\" ({count}x)\n"}
+
+            res = await domain_task
+            search_history.append({"term": domain_term, "count": len(res)})
+            new_count = 0
+            for r in res:
+                if r.get('id') not in all_ids:
+                    all_results.append(r)
+                    all_ids.add(r.get('id'))
+                    new_count += 1
+            if new_count > 0:
+                yield {"type": "thinking", "text": f"    → +{new_count} new emails\n"}
+                yield {"type": "sources", "ids": list(all_ids)}
 
     # ==========================================================================
     # STEP 3: Fast regex extraction (instant, no LLM)
     # ==========================================================================
-    extracted_entities = []
     parallel_extracted = {}
     if len(all_results) > 2:
         yield {"type": "status", "msg": "[3/5] Fast extraction..."}
 
-        # Combine text from results
-        combined_text = NL.join([
-            f"{r.get('name', '')} {r.get('sender_email', '')} {r.get('snippet', '')[:300]}"
-            for r in all_results[:20]
-        ])
-
-        # Fast regex extraction (instant)
-        parallel_extracted = fast_extract_entities(combined_text)
+        # Extraction + person/org batch, prefetched unless step 2 changed its inputs
+        plan, entity_batch = await entity_prefetch.result(
+            _entity_stage_key(all_results, discovered_entities), _run_entity_stage,
+            list(all_results[:20]), set(discovered_entities), query
+        )
+        parallel_extracted = plan["parallel_extracted"]
         total_count = sum(len(v) for v in parallel_extracted.values())
         yield {"type": "thinking", "text": f"[3] Extracted: {total_count} entities\n"}
 
@@ -1350,31 +1573,15 @@ async def process_query(query: str, conversation_id: str = None, is_auto: bool =
             pattern_names = [p.get("type", "").replace("_", " ") for p in patterns]
             yield {"type": "thinking", "text": f"    ⚠ PATTERNS: {', '.join(pattern_names)}\n"}
 
-        # Convert to old format
-        for p in parallel_extracted.get("persons", []):
-            extracted_entities.append({"name": p.get("name", ""), "type": "person", "count": 1})
-        for o in parallel_extracted.get("orgs", []):
-            extracted_entities.append({"name": o.get("name", ""), "type": "org", "count": 1})
-        for l in parallel_extracted.get("locations", []):
-            extracted_entities.append({"name": l.get("name", ""), "type": "location", "count": 1})
-
-        # Filter and search by persons found - use parallel async searches
-        persons = [e for e in extracted_entities if e.get('type') == 'person']
-        persons = sorted(persons, key=lambda x: -x.get('count', 0))
-
-        # Collect entities to search in parallel
-        entities_to_search = []
-        for entity in persons[:3]:
-            name = entity.get('name', '')
-            if name and name not in discovered_entities and name.lower() not in query.lower():
-                entities_to_search.append(entity)
-                discovered_entities.add(name)
+        entities_to_search = plan["entities_to_search"]
+        org_names = plan["org_names"]
+        discovered_entities.update(e.get('name', '') for e in entities_to_search)
 
         # Search entities
         for entity in entities_to_search[:2]:  # Limit to 2 for speed
             name = entity.get('name', '')
             yield {"type": "thinking", "text": f"    → {name}\n"}
-            res = search_corpus(name, limit=8)
+            res = entity_batch.get(name, [])
             search_history.append({"term": name, "count": len(res)})
             new_count = 0
             for r in res:
@@ -1387,23 +1594,22 @@ async def process_query(query: str, conversation_id: str = None, is_auto: bool =
                 yield {"type": "sources", "ids": list(all_ids)}
 
         # Also search organizations
-        orgs = [e for e in extracted_entities if e.get('type') == 'org']
-        for entity in orgs[:1]:
-            name = entity.get('name', '')
-            if name and name not in discovered_entities:
+        for name in org_names:
+            if name not in discovered_entities:
                 discovered_entities.add(name)
                 yield {"type": "thinking", "text": f"    Org: {name}\n"}
-                res = search_corpus(name, limit=8)
+                res = entity_batch.get(name, [])
                 search_history.append({"term": name, "count": len(res)})
                 for r in res:
                     if r.get('id') not in all_ids:
                         all_results.append(r)
                         all_ids.add(r.get('id'))
 
-        # Explore graph connections for top entities
+        # Explore graph connections for top entities (both at once)
         graph_connections = []
-        for entity_name in list(discovered_entities)[:2]:
-            conns = explore_graph_connections(entity_name, limit=5)
+        explore_names = list(discovered_entities)[:2]
+        explored = await asyncio.gather(*(_offload(explore_graph_connections, n, 5) for n in explore_names))
+        for entity_name, conns in zip(explore_names, explored):
             if conns:
                 graph_connections.extend(conns)
                 # Search connected entities
@@ -1437,77 +1643,45 @@ async def process_query(query: str, conversation_id: str = None, is_auto: bool =
     # ==========================================================================
     # STEP 5: Search recipients trail
     # ==========================================================================
-    if len(all_results) > 3:
-        all_recipients = []
-        for r in all_results[:10]:
-            recip = r.get('recipients_to', '')
-            if isinstance(recip, list):
-                all_recipients.extend([x for x in recip if x])
-            elif isinstance(recip, str) and recip:
-                all_recipients.extend([x.strip() for x in recip.split(',') if x.strip()])
-
-        # Find interesting recipients
-        recip_counts = {}
-        for rec in all_recipients:
-            if '@' in rec:
-                local = rec.split('@')[0].lower()
-                if len(local) > 3 and local not in ['info', 'admin', 'support', 'contact', 'noreply']:
-                    recip_counts[rec] = recip_counts.get(rec, 0) + 1
-
-        top_recips = sorted(recip_counts.items(), key=lambda x: -x[1])[:1]
-        for recip, count in top_recips:
-            if count >= 2:
-                local_part = recip.split('@')[0]
-                if local_part not in discovered_entities and local_part.lower() not in query.lower():
-                    discovered_entities.add(local_part)
-                    yield {"type": "status", "msg": f"[4/5] Recipient: {local_part}..."}
-                    yield {"type": "thinking", "text": f"[5] Recipient \"{recip}\" ({count}x)\n"}
-
-                    res = search_corpus(local_part, limit=8)
-                    search_history.append({"term": local_part, "count": len(res)})
-                    new_count = 0
-                    for r in res:
-                        if r.get('id') not in all_ids:
-                            all_results.append(r)
-                            all_ids.add(r.get('id'))
-                            new_count += 1
-                    if new_count > 0:
-                        yield {"type": "thinking", "text": f"    → +{new_count} new emails\n"}
-                        yield {"type": "sources", "ids": list(all_ids)}
+    recip_plan = _plan_recipient_search(all_results, discovered_entities, query)
+    if recip_plan:
+        recip, count, local_part = recip_plan
+        discovered_entities.add(local_part)
+        yield {"type": "status", "msg": f"[4/5] Recipient: {local_part}..."}
+        yield {"type": "thinking", "text": f"[5] Recipient \"{recip}\" ({count}x)\n"}
+
+        res = await recipient_prefetch.result(local_part, search_corpus, local_part, 8)
+        search_history.append({"term": local_part, "count": len(res)})
+        new_count = 0
+        for r in res:
+            if r.get('id') not in all_ids:
+                all_results.append(r)
+                all_ids.add(r.get('id'))
+                new_count += 1
+        if new_count > 0:
+            yield {"type": "thinking", "text": f"    → +{new_count} new emails\n"}
+            yield {"type": "sources", "ids": list(all_ids)}
 
     # ==========================================================================
     # STEP 6: One more keyword from subjects
     # ==========================================================================
-    if len(all_results) > 5:
-        subject_words = []
-        for r in all_results[:15]:
-            subj = str(r.get('name', '')).lower()
-            words = re.findall(r'\b([a-z]{5,15})\b', subj)
-            subject_words.extend(words)
-
-        word_counts = {}
-        # No filtering - anything could be evidence
-        for w in subject_words:
-            if w not in query.lower():  # Only skip query terms to avoid loops
-                word_counts[w] = word_counts.get(w, 0) + 1
-
-        top_words = sorted(word_counts.items(), key=lambda x: -x[1])[:1]
-        for word, count in top_words:
-            if count >= 3 and word not in discovered_entities:
-                yield {"type": "status", "msg": f"[5/5] Keyword: {word}..."}
-                yield {"type": "thinking", "text": f"[6] Keyword \"{word}\" ({count}x in subjects)\n"}
-
-                res = search_corpus(word, limit=8)
-                search_history.append({"term": word, "count": len(res)})
-                new_count = 0
-                for r in res:
-                    if r.get('id') not in all_ids:
-                        all_results.append(r)
-                        all_ids.add(r.get('id'))
-                        new_count += 1
-                if new_count > 0:
-                    yield {"type": "thinking", "text": f"    → +{new_count} new emails\n"}
-                    yield {"type": "sources", "ids": list(all_ids)}
+    keyword_plan = _plan_keyword_search(all_results, discovered_entities, query)
+    if keyword_plan:
+        word, count = keyword_plan
+        yield {"type": "status", "msg": f"[5/5] Keyword: {word}..."}
+        yield {"type": "thinking", "text": f"[6] Keyword \"{word}\" ({count}x in subjects)\n"}
+
+        res = await keyword_prefetch.result(word, search_corpus, word, 8)
+        search_history.append({"term": word, "count": len(res)})
+        new_count = 0
+        for r in res:
+            if r.get('id') not in all_ids:
+                all_results.append(r)
+                all_ids.add(r.get('id'))
+                new_count += 1
+        if new_count > 0:
+            yield {"type": "thinking", "text": f"    → +{new_count} new emails\n"}
+            yield {"type": "sources", "ids": list(all_ids)}
 
     yield {"type": "thinking", "text": f"\n━━━ {len(all_results)} emails collected ━━━\n"}
 
@@ -1593,7 +1767,7 @@ NEXT STEP: Try alternate spellings, related names, or broader search terms."""
 
     # Get system prompt and mind context
     from app.config import SYSTEM_PROMPT_L
-    mind_context = load_mind_context(query, max_chars=1500)
+    mind_context = await mind_task
 
     # Claude prompt - rich context from local processing + mind files
     opus_prompt = f"""User query: "{query}"
@@ -1650,40 +1824,12 @@ Key finding with #ID. 2-3 sentences max.
 
     yield {"type": "chunk", "text": response}
 
-    # Save response
+    # Save response and enrich the graph in the background - the answer is already out
     if conversation_id:
-        try:
-            execute_insert(
-                "sessions",
-                "INSERT INTO messages (conversation_id, role, content, is_auto) VALUES (%s, %s, %s, %s)",
-                (conversation_id, "assistant", response, 1 if is_auto else 0)
-            )
-        except Exception as e:
-            log.debug("Failed to save assistant message: %s", e)
-
-    # Background: Enrich DB with extracted entities (non-blocking)
+        await user_saved  # keep message order
+        _spawn(_save_message, conversation_id, "assistant", response, is_auto)
     if parallel_extracted:
-        try:
-            for p in parallel_extracted.get("persons", [])[:20]:
-                name = p.get("name", "").strip()
-                if len(name) > 3:
-                    execute_insert("graph",
-                        "INSERT INTO nodes (name, name_normalized, type) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING",
-                        (name, name.lower(), "person"))
-            for o in parallel_extracted.get("orgs", [])[:10]:
-                name = o.get("name", "").strip()
-                if len(name) > 3:
-                    execute_insert("graph",
-                        "INSERT INTO nodes (name, name_normalized, type) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING",
-                        (name, name.lower(), "organization"))
-            for loc in parallel_extracted.get("locations", [])[:10]:
-                name = loc.get("name", "").strip()
-                if len(name) > 2:
-                    execute_insert("graph",
-                        "INSERT INTO nodes (name, name_normalized, type) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING",
-                        (name, name.lower(), "location"))
-        except Exception as e:
-            log.debug("Entity enrichment failed: %s", e)
+        _spawn(_enrich_graph, parallel_extracted)
 
     # Suggest follow-ups - NO FILTERING, anything could be a lead
     query_lower = query.lower()
@@ -0,0 +1,232 @@
+"""Email ranking engine - precomputed features + two-phase FTS plans
+
+The old FTS queries evaluated ts_rank up to three times per matching row,
+LEFT JOINed scores on (target_type, target_id) for every match, and ran
+ts_headline over the full body_text of every fetched row - the dominant
+cost on long depositions.
+
+Ranking now works in three phases, all in one statement:
+1. Candidates: ts_rank computed once per matching row, plus the
+   precomputed boost from email_rank_features (one PK lookup)
+2. Rerank: the composite score (pertinence/suspicion/confidence) is
+   applied to the top candidates only
+3. Snippets: ts_headline runs on the final `limit` rows only, over at
+   most SNIPPET_MAX_CHARS of the body
+
+email_rank_features is a materialized view keyed by doc_id. Anything
+that writes scores must call refresh_rank_features() (seed_scores.py does);
+documents ingested after the last refresh fall back to the default scores.
+"""
+import logging
+
+from app.config import SNIPPET_MAX_CHARS
+from app.db import get_db
+from app.entity_index import invalidate_entity_scores
+
+log = logging.getLogger(__name__)
+
+# =============================================================================
+# FEATURES VIEW
+# =============================================================================
+
+# Defaults match the unscored-document defaults used by search.py
+RANK_FEATURES_DDL = """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS email_rank_features AS
+    SELECT
+        e.doc_id,
+        COALESCE(s.pertinence, 50) as pertinence,
+        COALESCE(s.suspicion, 0) as suspicion,
+        COALESCE(s.confidence, 50) as confidence,
+        COALESCE(s.anomaly, 0) as anomaly,
+        (COALESCE(s.pertinence, 50) / 100.0 * 0.5)::real as boost
+    FROM emails e
+    LEFT JOIN scores s ON s.target_type = 'email' AND s.target_id = e.doc_id;
+
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_email_rank_features_doc
+    ON email_rank_features(doc_id);
+"""
+
+
+def init_rank_features() -> bool:
+    """Create email_rank_features if missing (no-op when it already exists)"""
+    try:
+        with get_db("sources") as conn:
+            cursor = conn.cursor()
+            cursor.execute(RANK_FEATURES_DDL)
+            conn.commit()
+            cursor.close()
+        return True
+    except Exception as e:
+        log.warning("Could not create email_rank_features: %s", e)
+        return False
+
+
+def refresh_rank_features() -> bool:
+    """Re-materialize score boosts after scores or emails change
+
+    CONCURRENTLY keeps the view readable by searches during the refresh.
+    """
+    try:
+        with get_db("sources") as conn:
+            cursor = conn.cursor()
+            cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY email_rank_features")
+            conn.commit()
+            cursor.close()
+        log.info("email_rank_features refreshed")
+        invalidate_entity_scores()  # same scores table feeds entity lookups
+        return True
+    except Exception as e:
+        log.warning("Could not refresh email_rank_features: %s", e)
+        return False
+
+
+# =============================================================================
+# QUERY PLANS
+# =============================================================================
+
+# Composite score, same weights as search.calculate_composite_score
+_COMPOSITE_SQL = (
+    "c.combined_rank * 0.4 + c.pertinence / 100.0 * 0.3"
+    " + c.suspicion / 100.0 * 0.2 + c.confidence / 100.0 * 0.1"
+)
+
+
+def _headline(tsquery: str, max_words: int) -> str:
+    return (
+        f"ts_headline('english', left(COALESCE(e.body_text, e.subject), {SNIPPET_MAX_CHARS}), {tsquery},"
+        f" 'StartSel=<mark>, StopSel=</mark>, MaxWords={max_words}, MinWords=10')"
+    )
+
+
+def _ranked(tsquery: str) -> str:
+    """Every match, ranked once and boosted from the features view"""
+    return f"""
+        SELECT
+            e.doc_id,
+            tr.rank,
+            COALESCE(f.pertinence, 50) as pertinence,
+            COALESCE(f.suspicion, 0) as suspicion,
+            COALESCE(f.confidence, 50) as confidence,
+            COALESCE(f.anomaly, 0) as anomaly,
+            (tr.rank * 0.5 + COALESCE(f.boost, 0.25))::float8 as combined_rank
+        FROM emails e
+        CROSS JOIN LATERAL (SELECT ts_rank(e.tsv, {tsquery}) as rank) tr
+        LEFT JOIN email_rank_features f ON f.doc_id = e.doc_id
+        WHERE e.tsv @@ {tsquery}
+    """
+
+
+def _candidates(tsquery: str) -> str:
+    """Phase 1: keep the top %s matches by combined rank"""
+    return f"""{_ranked(tsquery)}
+        ORDER BY combined_rank DESC
+        LIMIT %s
+    """
+
+
+# stream_search: params (q, rank, doc_id) - every match after the (rank, doc_id)
+# keyset cursor, in a stable order. Read through a server-side cursor, so the
+# FTS runs once per stream and snippets are only built for rows actually fetched
+EMAIL_STREAM_QUERY = f"""
+    WITH q AS (SELECT plainto_tsquery('english', %s) as tsq)
+    SELECT
+        c.doc_id,
+        e.subject,
+        e.sender_email as sender,
+        {_headline('q.tsq', 30)} as snippet,
+        c.rank,
+        c.pertinence,
+        c.suspicion,
+        c.combined_rank
+    FROM q
+    CROSS JOIN LATERAL ({_ranked('q.tsq')}) c
+    JOIN emails e ON e.doc_id = c.doc_id
+    WHERE (c.combined_rank, c.doc_id) < (%s, %s)
+    ORDER BY c.combined_rank DESC, c.doc_id DESC
+"""
+
+# search_emails: params (q, limit) - ordered by combined_rank, snippets for `limit` rows
+EMAIL_FTS_QUERY = f"""
+    WITH q AS (SELECT plainto_tsquery('english', %s) as tsq)
+    SELECT
+        c.doc_id,
+        e.subject,
+        e.sender_email as sender,
+        {_headline('q.tsq', 30)} as snippet,
+        c.rank,
+        c.pertinence,
+        c.suspicion,
+        c.combined_rank
+    FROM q
+    CROSS JOIN LATERAL ({_candidates('q.tsq')}) c
+    JOIN emails e ON e.doc_id = c.doc_id
+    ORDER BY c.combined_rank DESC
+"""
+
+
+def _corpus_plan(tsquery: str) -> str:
+    """Phases 1-3 for the pipeline: candidates -> composite rerank -> snippets
+
+    Params: (candidate_limit, limit). `rank` is the combined rank the
+    composite is computed from, as search_corpus_scored always returned.
+    """
+    return f"""
+        SELECT
+            top.doc_id as id,
+            e.subject as name,
+            e.sender_email,
+            e.recipients_to,
+            e.date_sent as date,
+            {_headline(tsquery, 35)} as snippet,
+            top.ts_rank,
+            top.pertinence,
+            top.suspicion,
+            top.confidence,
+            top.anomaly,
+            top.rank,
+            top.composite
+        FROM (
+            SELECT
+                c.doc_id,
+                c.rank as ts_rank,
+                c.pertinence,
+                c.suspicion,
+                c.confidence,
+                c.anomaly,
+                c.combined_rank as rank,
+                {_COMPOSITE_SQL} as composite
+            FROM ({_candidates(tsquery)}) c
+            ORDER BY composite DESC
+            LIMIT %s
+        ) top
+        JOIN emails e ON e.doc_id = top.doc_id
+        ORDER BY top.composite DESC
+    """
+
+
+# search_corpus_scored: params (term, candidate_limit, limit)
+CORPUS_FTS_QUERY = f"""
+    WITH q AS (SELECT plainto_tsquery('english', %s) as tsq)
+    SELECT r.*
+    FROM q
+    CROSS JOIN LATERAL ({_corpus_plan('q.tsq')}) r
+"""
+
+# search_corpus_scored_batch: params (terms, candidate_limit, limit) - one plan per term
+CORPUS_BATCH_QUERY = f"""
+    SELECT
+        t.term,
+        r.*
+    FROM (
+        SELECT term, plainto_tsquery('english', term) as tsq
+        FROM unnest(%s::text[]) AS u(term)
+    ) t
+    CROSS JOIN LATERAL ({_corpus_plan('t.tsq')}) r
+"""
+
+
+if __name__ == "__main__":
+    # Cron / post-ingest hook: python -m app.ranking
+    logging.basicConfig(level=logging.INFO)
+    init_rank_features()
+    refresh_rank_features()
@@ -8,12 +8,16 @@ from typing import Optional, List
 
 from fastapi import APIRouter, Query, HTTPException
 from fastapi.responses import StreamingResponse
+from contextlib import aclosing
 
 from app.models import (
     SearchResult, QueryRequest, AutoSessionRequest, LanguageRequest
 )
-from app.search import search_all, search_emails, search_nodes
-from app.db import execute_query, execute_insert, execute_update
+from app.search import (
+    search_all_async, search_emails_async, search_nodes_async, stream_search, decode_cursor
+)
+from app.db import execute_query_async, execute_insert_async, execute_update_async
+from app.entity_index import lookup_entities_async
 from app.pipeline import process_query, auto_investigate
 from app.config import STATIC_DIR, MIND_DIR, DATA_DIR
 
@@ -26,7 +30,7 @@ router = APIRouter()
 async def get_notifications():
     """Get unread notifications"""
     try:
-        rows = execute_query('graph', """
+        rows = await execute_query_async('graph', """
             SELECT id, message, type, created_at FROM notifications
             WHERE read = FALSE ORDER BY created_at DESC LIMIT 5
         """)
@@ -52,13 +56,13 @@ async def health():
 @router.get("/api/stats")
 async def stats():
     """System statistics"""
-    nodes_count = execute_query("graph", "SELECT COUNT(*) as c FROM nodes", ())[0]["c"]
-    edges_count = execute_query("graph", "SELECT COUNT(*) as c FROM edges", ())[0]["c"]
-    emails_count = execute_query("sources", "SELECT COUNT(*) as c FROM emails", ())[0]["c"]
+    nodes_count = (await execute_query_async("graph", "SELECT COUNT(*) as c FROM nodes", ()))[0]["c"]
+    edges_count = (await execute_query_async("graph", "SELECT COUNT(*) as c FROM edges", ()))[0]["c"]
+    emails_count = (await execute_query_async("sources", "SELECT COUNT(*) as c FROM emails", ()))[0]["c"]
 
     # Get total documents
     try:
-        docs_count = execute_query("sources", "SELECT COUNT(*) as c FROM documents", ())[0]["c"]
+        docs_count = (await execute_query_async("sources", "SELECT COUNT(*) as c FROM documents", ()))[0]["c"]
     except Exception:
         docs_count = emails_count
 
@@ -71,13 +75,15 @@ async def stats():
     except (ImportError, AttributeError):
         pass
 
-    # Cache stats
-    cache_stats = None
-    try:
-        from app.pipeline import _search_cache
-        cache_stats = _search_cache.stats()
-    except (ImportError, AttributeError):
-        pass
+    # Cache stats (all namespaces of the shared cache tier)
+    from app.cache import cache_stats as get_cache_stats
+    cache_stats = get_cache_stats()
+
+    # Connection pool saturation and sidecar health
+    from app.db import pool_stats
+    from app.sidecars import sidecar_stats
+    from app.graph import graph_stats
+    from app.entity_index import entity_index_stats
 
     return {
         "total_documents": docs_count,
@@ -87,7 +93,11 @@ async def stats():
         "sources": emails_count,
         "databases": ["sources", "graph", "scores", "audit", "sessions"],
         "workers": worker_stats,
-        "cache": cache_stats
+        "cache": cache_stats,
+        "db_pool": pool_stats(),
+        "sidecars": sidecar_stats(),
+        "graph_snapshot": graph_stats(),
+        "entity_index": entity_index_stats()
     }
 
 # Live Thoughts Stream
@@ -191,17 +201,77 @@ async def thoughts_page():
 @router.get("/api/search", response_model=List[SearchResult])
 async def search(q: str = Query(..., max_length=1000), limit: int = Query(20, ge=1, le=100)):
     """Universal search"""
-    return search_all(q, limit)
+    return await search_all_async(q, limit)
+
+@router.get("/api/search/stream")
+async def search_stream(
+    q: str = Query(..., max_length=1000),
+    type: str = Query("all", pattern="^(all|emails|nodes)$"),
+    cursor: Optional[str] = None,
+    max_results: int = Query(1000, ge=1, le=50000),
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$"),
+):
+    """Stream every search hit (NDJSON or SSE), resumable with a keyset cursor
+
+    Each line is {"result": SearchResult, "cursor": str}; the last one is
+    {"done": true, "more": bool, "cursor": str, "count": int}. Pass the
+    cursor back to continue right after the last row received.
+    """
+    types = {"all": ("node", "email"), "emails": ("email",), "nodes": ("node",)}[type]
+    try:
+        if cursor:
+            decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def frame(payload: dict) -> str:
+        data = json.dumps(payload, default=str)
+        return f"data: {data}\n\n" if format == "sse" else data + "\n"
+
+    async def generator():
+        count, last, more = 0, cursor, False
+        async with aclosing(stream_search(q, types, cursor)) as results:
+            async for result, next_cursor in results:
+                if count >= max_results:
+                    more = True
+                    break
+                count += 1
+                last = next_cursor
+                yield frame({"result": result.model_dump(), "cursor": next_cursor})
+        yield frame({"done": True, "more": more, "cursor": last, "count": count})
+
+    return StreamingResponse(
+        generator(),
+        media_type="text/event-stream" if format == "sse" else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+@router.get("/api/search/autocomplete")
+async def search_autocomplete(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(10, ge=1, le=50),
+    type: Optional[str] = Query(None, max_length=50),
+):
+    """Entity name suggestions (prefix of any word in a name or alias)"""
+    hits = await lookup_entities_async(q, limit, node_type=type)
+    return [{
+        "id": h["id"],
+        "name": h["name"],
+        "type": h["type"],
+        "rank": round(float(h["rank"]), 3),
+        "suspicion": h["suspicion"],
+        "pertinence": h["pertinence"],
+    } for h in hits]
 
 @router.get("/api/search/emails", response_model=List[SearchResult])
 async def search_emails_endpoint(q: str = Query(..., max_length=1000), limit: int = Query(20, ge=1, le=100)):
     """Search emails only"""
-    return search_emails(q, limit)
+    return await search_emails_async(q, limit)
 
 @router.get("/api/search/nodes", response_model=List[SearchResult])
 async def search_nodes_endpoint(q: str = Query(..., max_length=1000), limit: int = Query(20, ge=1, le=100)):
     """Search nodes only"""
-    return search_nodes(q, limit)
+    return await search_nodes_async(q, limit)
 
 @router.get("/api/search/blood")
 async def search_blood(q: str = Query(..., max_length=1000), limit: int = Query(30, ge=1, le=100)):
@@ -241,7 +311,7 @@ async def get_email_alias(doc_id: int):
 async def get_document(doc_id: int):
     """Get full document content by ID"""
     try:
-        rows = execute_query("sources", """
+        rows = await execute_query_async("sources", """
             SELECT doc_id, subject, body_text, sender_email, sender_name,
                    recipients_to, recipients_cc, date_sent
             FROM emails WHERE doc_id = %s
@@ -275,15 +345,15 @@ async def get_documents_batch(ids: str = Query(..., description="Comma-separated
             return []
 
         placeholders = ",".join(["%s"] * len(doc_ids))
-        rows = execute_query("sources", f"""
-            SELECT doc_id, subject, body_text, sender_email, sender_name, date_sent
+        rows = await execute_query_async("sources", f"""
+            SELECT doc_id, subject, left(body_text, 2000) as body_text, sender_email, sender_name, date_sent
             FROM emails WHERE doc_id IN ({placeholders})
         """, tuple(doc_ids))
 
         return [{
             "id": r["doc_id"],
             "subject": r["subject"],
-            "body": r["body_text"][:2000] if r["body_text"] else "",
+            "body": r["body_text"] or "",
             "sender": r["sender_email"],
             "date": str(r["date_sent"]) if r["date_sent"] else None
         } for r in rows]
@@ -301,12 +371,12 @@ async def get_nodes(type: Optional[str] = None, limit: int = Query(100, ge=1, le
         query = "SELECT * FROM nodes ORDER BY updated_at DESC LIMIT %s"
         params = (limit,)
 
-    return execute_query("graph", query, params)
+    return await execute_query_async("graph", query, params)
 
 @router.get("/api/nodes/{node_id}")
 async def get_node(node_id: int):
     """Get single node"""
-    nodes = execute_query("graph", "SELECT * FROM nodes WHERE id = %s", (node_id,))
+    nodes = await execute_query_async("graph", "SELECT * FROM nodes WHERE id = %s", (node_id,))
     if not nodes:
         raise HTTPException(status_code=404, detail="Node not found")
     return nodes[0]
@@ -319,17 +389,17 @@ async def get_node_edges(node_id: int):
         WHERE from_node_id = %s OR to_node_id = %s
         ORDER BY created_at DESC
     """
-    return execute_query("graph", query, (node_id, node_id))
+    return await execute_query_async("graph", query, (node_id, node_id))
 
 @router.get("/api/nodes/{node_id}/properties")
 async def get_node_properties(node_id: int):
     """Get all properties for a node"""
-    return execute_query("graph", "SELECT * FROM properties WHERE node_id = %s", (node_id,))
+    return await execute_query_async("graph", "SELECT * FROM properties WHERE node_id = %s", (node_id,))
 
 @router.get("/api/nodes/{node_id}/scores")
 async def get_node_scores(node_id: int):
     """Get scores for a node"""
-    scores = execute_query("scores", "SELECT * FROM scores WHERE target_type = 'node' AND target_id = %s", (node_id,))
+    scores = await execute_query_async("scores", "SELECT * FROM scores WHERE target_type = 'node' AND target_id = %s", (node_id,))
     if not scores:
         return {"target_type": "node", "target_id": node_id, "confidence": 50}
     return scores[0]
@@ -344,12 +414,12 @@ async def get_edges(type: Optional[str] = None, limit: int = Query(100, ge=1, le
         query = "SELECT * FROM edges ORDER BY created_at DESC LIMIT %s"
         params = (limit,)
 
-    return execute_query("graph", query, params)
+    return await execute_query_async("graph", query, params)
 
 @router.get("/api/edges/{edge_id}")
 async def get_edge(edge_id: int):
     """Get single edge"""
-    edges = execute_query("graph", "SELECT * FROM edges WHERE id = %s", (edge_id,))
+    edges = await execute_query_async("graph", "SELECT * FROM edges WHERE id = %s", (edge_id,))
     if not edges:
         raise HTTPException(status_code=404, detail="Edge not found")
     return edges[0]
@@ -481,7 +551,7 @@ async def auto_start(request: AutoSessionRequest):
 @router.post("/api/auto/stop")
 async def auto_stop(conversation_id: str):
     """Stop auto-investigation"""
-    execute_update(
+    await execute_update_async(
         "sessions",
         "UPDATE auto_sessions SET status = 'stopped', stopped_at = NOW() WHERE conversation_id = %s AND status = 'running'",
         (conversation_id,)
@@ -491,7 +561,7 @@ async def auto_stop(conversation_id: str):
 @router.get("/api/auto/status")
 async def auto_status(conversation_id: str):
     """Get auto-investigation status"""
-    sessions = execute_query(
+    sessions = await execute_query_async(
         "sessions",
         "SELECT * FROM auto_sessions WHERE conversation_id = %s ORDER BY started_at DESC LIMIT 1",
         (conversation_id,)
@@ -512,13 +582,13 @@ async def auto_status(conversation_id: str):
 @router.get("/api/conversations")
 async def get_conversations():
     """Get all conversations"""
-    return execute_query("sessions", "SELECT * FROM conversations ORDER BY updated_at DESC", ())
+    return await execute_query_async("sessions", "SELECT * FROM conversations ORDER BY updated_at DESC", ())
 
 @router.post("/api/conversations")
 async def create_conversation(title: str = "New Investigation"):
     """Create new conversation"""
     conv_id = str(uuid.uuid4())
-    execute_insert(
+    await execute_insert_async(
         "sessions",
         "INSERT INTO conversations (id, title) VALUES (%s, %s)",
         (conv_id, title)
@@ -528,7 +598,7 @@ async def create_conversation(title: str = "New Investigation"):
 @router.get("/api/conversations/{conv_id}/messages")
 async def get_messages(conv_id: str):
     """Get messages for conversation"""
-    return execute_query(
+    return await execute_query_async(
         "sessions",
         "SELECT * FROM messages WHERE conversation_id = %s ORDER BY created_at ASC",
         (conv_id,)
@@ -538,11 +608,11 @@ async def get_messages(conv_id: str):
 async def delete_conversation(conv_id: str):
     """Delete a conversation and all its messages"""
     # Delete messages first (foreign key)
-    execute_update("sessions", "DELETE FROM messages WHERE conversation_id = %s", (conv_id,))
+    await execute_update_async("sessions", "DELETE FROM messages WHERE conversation_id = %s", (conv_id,))
     # Delete auto sessions
-    execute_update("sessions", "DELETE FROM auto_sessions WHERE conversation_id = %s", (conv_id,))
+    await execute_update_async("sessions", "DELETE FROM auto_sessions WHERE conversation_id = %s", (conv_id,))
     # Delete conversation
-    deleted = execute_update("sessions", "DELETE FROM conversations WHERE id = %s", (conv_id,))
+    deleted = await execute_update_async("sessions", "DELETE FROM conversations WHERE id = %s", (conv_id,))
     if deleted == 0:
         raise HTTPException(status_code=404, detail="Conversation not found")
     return {"status": "deleted", "id": conv_id}
@@ -550,14 +620,14 @@ async def delete_conversation(conv_id: str):
 @router.get("/api/settings")
 async def get_settings():
     """Get all settings"""
-    rows = execute_query("sessions", "SELECT key, value FROM settings", ())
+    rows = await execute_query_async("sessions", "SELECT key, value FROM settings", ())
     return {row["key"]: row["value"] for row in rows}
 
 @router.put("/api/settings")
 async def update_settings(settings: dict):
     """Update settings"""
     for key, value in settings.items():
-        execute_update(
+        await execute_update_async(
             "sessions",
             "INSERT INTO settings (key, value, updated_at) VALUES (%s, %s, NOW()) ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()",
             (key, str(value))
@@ -577,7 +647,7 @@ async def set_language(request: LanguageRequest):
     if request.language not in SUPPORTED_LANGUAGES:
         raise HTTPException(status_code=400, detail=f"Unsupported language. Use: {list(SUPPORTED_LANGUAGES.keys())}")
 
-    execute_update(
+    await execute_update_async(
         "sessions",
         "INSERT INTO settings (key, value, updated_at) VALUES ('language', %s, NOW()) ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()",
         (request.language,)
@@ -589,7 +659,7 @@ async def set_language(request: LanguageRequest):
 @router.get("/api/sources")
 async def get_sources():
     """Get data source metadata"""
-    sources = execute_query(
+    sources = await execute_query_async(
         "l_data",
         """SELECT id, source_name, source_type, origin, how_obtained,
                   date_obtained, original_format, file_count, total_size_mb,
@@ -647,7 +717,7 @@ async def ingest_status():
 async def get_timeline(person: Optional[str] = None):
     """Get case timeline events"""
     if person:
-        events = execute_query(
+        events = await execute_query_async(
             "l_data",
             """SELECT id, event_date, event_type, event_title, event_description,
                       jurisdiction, case_number, people_involved, verified
@@ -657,7 +727,7 @@ async def get_timeline(person: Optional[str] = None):
             (f'%{person}%',)
         )
     else:
-        events = execute_query(
+        events = await execute_query_async(
             "l_data",
             """SELECT id, event_date, event_type, event_title, event_description,
                       jurisdiction, case_number, people_involved, verified
@@ -9,8 +9,8 @@ from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from app.db import execute_query, execute_insert
-from app.search import search_all
+from app.db import execute_query_async, execute_insert_async, execute_update_async
+from app.search import search_all_async
 
 log = logging.getLogger(__name__)
 
@@ -70,16 +70,16 @@ def generate_title(message: str) -> str:
     return title or "New Chat"
 
 
-def ensure_conversation_exists(conversation_id: str, title: str = None):
+async def ensure_conversation_exists(conversation_id: str, title: str = None):
     """Create conversation if it doesn't exist"""
     try:
-        existing = execute_query(
+        existing = await execute_query_async(
             "sessions",
             "SELECT id FROM conversations WHERE id = %s",
             (conversation_id,)
         )
         if not existing:
-            execute_insert(
+            await execute_insert_async(
                 "sessions",
                 "INSERT INTO conversations (id, title) VALUES (%s, %s)",
                 (conversation_id, title or "New Chat")
@@ -88,10 +88,10 @@ def ensure_conversation_exists(conversation_id: str, title: str = None):
         log.warning(f"Error ensuring conversation: {e}")
 
 
-def get_conversation(conversation_id: str) -> List[Dict]:
+async def get_conversation(conversation_id: str) -> List[Dict]:
     """Get conversation history from database"""
     try:
-        rows = execute_query(
+        rows = await execute_query_async(
             "sessions",
             """SELECT role, content, sources, created_at
                FROM messages
@@ -113,11 +113,10 @@ def get_conversation(conversation_id: str) -> List[Dict]:
         return []
 
 
-def update_conversation_title(conversation_id: str, title: str):
+async def update_conversation_title(conversation_id: str, title: str):
     """Update conversation title"""
     try:
-        from app.db import execute_update
-        execute_update(
+        await execute_update_async(
             "sessions",
             "UPDATE conversations SET title = %s WHERE id = %s AND title = 'New Chat'",
             (title, conversation_id)
@@ -126,13 +125,13 @@ def update_conversation_title(conversation_id: str, title: str):
         log.warning(f"Error updating title: {e}")
 
 
-def save_message(conversation_id: str, role: str, content: str, sources: List[Dict] = None):
+async def save_message(conversation_id: str, role: str, content: str, sources: List[Dict] = None):
     """Save a message to conversation history"""
     try:
         # Ensure conversation exists first
-        ensure_conversation_exists(conversation_id)
+        await ensure_conversation_exists(conversation_id)
 
-        execute_insert(
+        await execute_insert_async(
             "sessions",
             """INSERT INTO messages (conversation_id, role, content, sources)
                VALUES (%s, %s, %s, %s::jsonb)""",
@@ -142,7 +141,7 @@ def save_message(conversation_id: str, role: str, content: str, sources: List[Di
         # Auto-generate title from first user message
         if role == "user":
             title = generate_title(content)
-            update_conversation_title(conversation_id, title)
+            await update_conversation_title(conversation_id, title)
 
     except Exception as e:
         log.warning(f"Error saving message: {e}")
@@ -152,9 +151,9 @@ def save_message(conversation_id: str, role: str, content: str, sources: List[Di
 # RAG SEARCH
 # =============================================================================
 
-def search_context(query: str, limit: int = 10) -> List[Dict]:
+async def search_context(query: str, limit: int = 10) -> List[Dict]:
     """Search documents for relevant context"""
-    results = search_all(query, limit)
+    results = await search_all_async(query, limit)
 
     # Format for context
     context_docs = []
@@ -289,13 +288,13 @@ async def send_message(request: ChatRequest):
     conversation_id = request.conversation_id or str(uuid.uuid4())
 
     # Get conversation history
-    history = get_conversation(conversation_id) if request.conversation_id else []
+    history = await get_conversation(conversation_id) if request.conversation_id else []
 
     # Save user message
-    save_message(conversation_id, "user", request.message)
+    await save_message(conversation_id, "user", request.message)
 
     # Search for relevant documents
-    sources = search_context(request.message, limit=10)
+    sources = await search_context(request.message, limit=10)
 
     # Build context from documents
     context = build_context_prompt(sources)
@@ -304,7 +303,7 @@ async def send_message(request: ChatRequest):
     response_text = await generate_response(request.message, context, history)
 
     # Save assistant response
-    save_message(conversation_id, "assistant", response_text, sources)
+    await save_message(conversation_id, "assistant", response_text, sources)
 
     return {
         "conversation_id": conversation_id,
@@ -321,7 +320,7 @@ async def send_message(request: ChatRequest):
 async def list_conversations(limit: int = Query(20, ge=1, le=100)):
     """List recent conversations"""
     try:
-        rows = execute_query(
+        rows = await execute_query_async(
             "sessions",
             """SELECT c.id, c.title, c.created_at as started_at,
                       MAX(m.created_at) as last_message,
@@ -351,7 +350,7 @@ async def list_conversations(limit: int = Query(20, ge=1, le=100)):
 @router.get("/conversations/{conversation_id}")
 async def get_conversation_endpoint(conversation_id: str):
     """Get full conversation history"""
-    messages = get_conversation(conversation_id)
+    messages = await get_conversation(conversation_id)
     if not messages:
         raise HTTPException(status_code=404, detail="Conversation not found")
     return {"conversation_id": conversation_id, "messages": messages}
@@ -361,15 +360,14 @@ async def get_conversation_endpoint(conversation_id: str):
 async def delete_conversation(conversation_id: str):
     """Delete a conversation and its messages"""
     try:
-        from app.db import execute_update
         # Delete messages first (foreign key constraint)
-        execute_update(
+        await execute_update_async(
             "sessions",
             "DELETE FROM messages WHERE conversation_id = %s",
             (conversation_id,)
         )
         # Delete conversation
-        execute_update(
+        await execute_update_async(
             "sessions",
             "DELETE FROM conversations WHERE id = %s",
             (conversation_id,)
@@ -384,10 +382,10 @@ async def stream_response(request: ChatRequest):
     """Stream response (for real-time typing effect)"""
 
     conversation_id = request.conversation_id or str(uuid.uuid4())
-    history = get_conversation(conversation_id) if request.conversation_id else []
+    history = await get_conversation(conversation_id) if request.conversation_id else []
 
-    save_message(conversation_id, "user", request.message)
-    sources = search_context(request.message, limit=10)
+    await save_message(conversation_id, "user", request.message)
+    sources = await search_context(request.message, limit=10)
     context = build_context_prompt(sources)
 
     async def generate():
@@ -413,7 +411,7 @@ async def stream_response(request: ChatRequest):
             yield f"data: {json.dumps({'type': 'chunk', 'content': buffer})}\n\n"
 
         # Save and signal completion
-        save_message(conversation_id, "assistant", response_text, sources)
+        await save_message(conversation_id, "assistant", response_text, sources)
         yield f"data: {json.dumps({'type': 'done', 'full_response': response_text})}\n\n"
 
     return StreamingResponse(
@@ -13,7 +13,8 @@ from fastapi import APIRouter, Query, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from app.db import execute_query, execute_insert, execute_update, get_db
+from app.db import execute_query_async, execute_update_async
+from app.graph import get_graph
 import psycopg2.extras
 
 log = logging.getLogger(__name__)
@@ -34,11 +35,11 @@ class ChatMessage(BaseModel):
 @router.get("/api/v2/stats")
 async def stats():
     """System statistics"""
-    nodes = execute_query("graph", "SELECT COUNT(*) as c FROM nodes")[0]["c"]
-    edges = execute_query("graph", "SELECT COUNT(*) as c FROM edges")[0]["c"]
-    emails = execute_query("sources", "SELECT COUNT(*) as c FROM emails")[0]["c"]
-    docs = execute_query("sources", "SELECT COUNT(*) as c FROM documents")[0]["c"]
-    chunks = execute_query("sources", "SELECT COUNT(*) as c FROM chunks")[0]["c"]
+    nodes = (await execute_query_async("graph", "SELECT COUNT(*) as c FROM nodes"))[0]["c"]
+    edges = (await execute_query_async("graph", "SELECT COUNT(*) as c FROM edges"))[0]["c"]
+    emails = (await execute_query_async("sources", "SELECT COUNT(*) as c FROM emails"))[0]["c"]
+    docs = (await execute_query_async("sources", "SELECT COUNT(*) as c FROM documents"))[0]["c"]
+    chunks = (await execute_query_async("sources", "SELECT COUNT(*) as c FROM chunks"))[0]["c"]
 
     return {
         "emails": emails,
@@ -81,7 +82,7 @@ async def search(q: str = Query(..., max_length=500), limit: int = Query(20, ge=
     # 1. Search emails (FTS) - prioritize these
     try:
         ts_query = " | ".join(keywords)
-        email_results = execute_query("sources", """
+        email_results = await execute_query_async("sources", """
             SELECT doc_id as id, subject as title,
                    LEFT(body_text, 500) as snippet,
                    ts_rank(tsv, plainto_tsquery('english', %s)) as score
@@ -89,7 +90,7 @@ async def search(q: str = Query(..., max_length=500), limit: int = Query(20, ge=
             WHERE tsv @@ plainto_tsquery('english', %s)
             ORDER BY score DESC
             LIMIT %s
-        """, (q, q, limit))
+        """, (q, q, limit), prepare=True)
 
         for r in email_results:
             results.append({
@@ -105,7 +106,7 @@ async def search(q: str = Query(..., max_length=500), limit: int = Query(20, ge=
     # 2. Search documents via chunks
     try:
         like_pattern = f"%{keywords[0]}%"
-        doc_results = execute_query("sources", """
+        doc_results = await execute_query_async("sources", """
             SELECT DISTINCT d.id, d.filename as title,
                    LEFT(c.content, 300) as snippet
             FROM documents d
@@ -127,7 +128,7 @@ async def search(q: str = Query(..., max_length=500), limit: int = Query(20, ge=
 
     # 3. Search nodes (graph) - get related entities
     try:
-        node_results = execute_query("graph", """
+        node_results = await execute_query_async("graph", """
             SELECT id, name as title, type,
                    similarity(name_normalized, %s) as score
             FROM nodes
@@ -158,7 +159,7 @@ async def search(q: str = Query(..., max_length=500), limit: int = Query(20, ge=
 @router.get("/api/v2/email/{doc_id}")
 async def get_email(doc_id: int):
     """Get full email"""
-    rows = execute_query("sources", """
+    rows = await execute_query_async("sources", """
         SELECT doc_id, subject, body_text, sender_email, sender_name,
                recipients_to, recipients_cc, date_sent
         FROM emails WHERE doc_id = %s
@@ -186,7 +187,7 @@ async def get_email(doc_id: int):
 @router.get("/api/v2/document/{doc_id}")
 async def get_document(doc_id: int):
     """Get full document with chunks"""
-    doc = execute_query("sources", """
+    doc = await execute_query_async("sources", """
         SELECT id, filename, filepath, doc_type, origin, page_count, status
         FROM documents WHERE id = %s
     """, (doc_id,))
@@ -194,7 +195,7 @@ async def get_document(doc_id: int):
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    chunks = execute_query("sources", """
+    chunks = await execute_query_async("sources", """
         SELECT chunk_index, content FROM chunks
         WHERE doc_id = %s ORDER BY chunk_index
     """, (doc_id,))
@@ -227,7 +228,7 @@ async def get_nodes(type: Optional[str] = None, limit: int = Query(50, ge=1, le=
             ORDER BY nc.relevance_score DESC NULLS LAST
             LIMIT %s
         """
-        return execute_query("graph", query, (type, limit))
+        return await execute_query_async("graph", query, (type, limit))
     else:
         query = """
             SELECT n.id, n.name, n.type, n.source_db,
@@ -237,12 +238,12 @@ async def get_nodes(type: Optional[str] = None, limit: int = Query(50, ge=1, le=
             ORDER BY nc.relevance_score DESC NULLS LAST
             LIMIT %s
         """
-        return execute_query("graph", query, (limit,))
+        return await execute_query_async("graph", query, (limit,))
 
 @router.get("/api/v2/nodes/{node_id}")
 async def get_node(node_id: int):
     """Get node with edges"""
-    node = execute_query("graph", """
+    node = await execute_query_async("graph", """
         SELECT n.*, nc.relevance_score, nc.confidence_score, nc.factors
         FROM nodes n
         LEFT JOIN node_confidence nc ON n.id = nc.node_id
@@ -252,7 +253,7 @@ async def get_node(node_id: int):
     if not node:
         raise HTTPException(status_code=404, detail="Node not found")
 
-    edges = execute_query("graph", """
+    edges = await execute_query_async("graph", """
         SELECT e.id, e.type, e.excerpt,
                n1.name as from_name, n1.type as from_type,
                n2.name as to_name, n2.type as to_type
@@ -272,7 +273,7 @@ async def get_node(node_id: int):
 async def get_edges(type: Optional[str] = None, limit: int = Query(50, ge=1, le=500)):
     """Get edges"""
     if type:
-        return execute_query("graph", """
+        return await execute_query_async("graph", """
             SELECT e.id, e.type, e.excerpt,
                    n1.name as from_name, n2.name as to_name
             FROM edges e
@@ -282,7 +283,7 @@ async def get_edges(type: Optional[str] = None, limit: int = Query(50, ge=1, le=
             LIMIT %s
         """, (type, limit))
     else:
-        return execute_query("graph", """
+        return await execute_query_async("graph", """
             SELECT e.id, e.type, e.excerpt,
                    n1.name as from_name, n2.name as to_name
             FROM edges e
@@ -294,7 +295,7 @@ async def get_edges(type: Optional[str] = None, limit: int = Query(50, ge=1, le=
 @router.get("/api/v2/graph/edge-types")
 async def get_edge_types():
     """Get all available edge types with counts"""
-    types = execute_query("graph", """
+    types = await execute_query_async("graph", """
         SELECT type, COUNT(*) as count
         FROM edges
         WHERE type IS NOT NULL AND type != ''
@@ -346,7 +347,7 @@ async def get_timeline(
     ]
 
     # Also get events from database
-    db_events = execute_query("graph", """
+    db_events = await execute_query_async("graph", """
         SELECT n.id, n.name, n.type,
                COALESCE(nc.total_connections, 0) as connections
         FROM nodes n
@@ -446,7 +447,7 @@ async def get_network(
 
     if center:
         # Get centered on specific node
-        center_node = execute_query("graph", """
+        center_node = await execute_query_async("graph", """
             SELECT n.id, n.name, n.type, nc.centrality_score, nc.total_connections
             FROM nodes n
             LEFT JOIN node_confidence nc ON n.id = nc.node_id
@@ -457,7 +458,7 @@ async def get_network(
 
         if not center_node:
             # Search by partial match
-            center_node = execute_query("graph", """
+            center_node = await execute_query_async("graph", """
                 SELECT n.id, n.name, n.type, nc.centrality_score, nc.total_connections
                 FROM nodes n
                 LEFT JOIN node_confidence nc ON n.id = nc.node_id
@@ -471,47 +472,13 @@ async def get_network(
 
         center_id = center_node[0]['id']
 
-        # Get connected nodes (depth 1) - with optional type filter
-        if type_filter:
-            connected = execute_query("graph", """
-                SELECT DISTINCT
-                    CASE WHEN e.from_node_id = %s THEN e.to_node_id ELSE e.from_node_id END as node_id
-                FROM edges e
-                WHERE (e.from_node_id = %s OR e.to_node_id = %s)
-                  AND e.type = ANY(%s)
-            """, (center_id, center_id, center_id, type_filter))
-        else:
-            connected = execute_query("graph", """
-                SELECT DISTINCT
-                    CASE WHEN e.from_node_id = %s THEN e.to_node_id ELSE e.from_node_id END as node_id
-                FROM edges e
-                WHERE e.from_node_id = %s OR e.to_node_id = %s
-            """, (center_id, center_id, center_id))
-
-        node_ids = [center_id] + [c['node_id'] for c in connected]
-
-        # Get depth 2 if requested
-        if depth >= 2 and len(node_ids) < limit:
-            if type_filter:
-                depth2 = execute_query("graph", """
-                    SELECT DISTINCT
-                        CASE WHEN e.from_node_id = ANY(%s) THEN e.to_node_id ELSE e.from_node_id END as node_id
-                    FROM edges e
-                    WHERE (e.from_node_id = ANY(%s) OR e.to_node_id = ANY(%s))
-                      AND e.type = ANY(%s)
-                """, (node_ids, node_ids, node_ids, type_filter))
-            else:
-                depth2 = execute_query("graph", """
-                    SELECT DISTINCT
-                        CASE WHEN e.from_node_id = ANY(%s) THEN e.to_node_id ELSE e.from_node_id END as node_id
-                    FROM edges e
-                    WHERE e.from_node_id = ANY(%s) OR e.to_node_id = ANY(%s)
-                """, (node_ids, node_ids, node_ids))
-            node_ids = list(set(node_ids + [d['node_id'] for d in depth2]))[:limit]
+        # k-hop neighbourhood from the in-memory graph snapshot, nearest first
+        graph = await asyncio.to_thread(get_graph)
+        node_ids = graph.k_hop([center_id], depth, type_filter, limit) or [center_id]
 
     else:
         # Get top nodes by centrality
-        top_nodes = execute_query("graph", """
+        top_nodes = await execute_query_async("graph", """
             SELECT n.id
             FROM nodes n
             JOIN node_confidence nc ON n.id = nc.node_id
@@ -520,12 +487,13 @@ async def get_network(
             LIMIT %s
         """, (limit // 2,))
         node_ids = [n['id'] for n in top_nodes]
+        graph = await asyncio.to_thread(get_graph)
 
     if not node_ids:
         return {"nodes": [], "edges": []}
 
     # Get node details
-    nodes_data = execute_query("graph", """
+    nodes_data = await execute_query_async("graph", """
         SELECT n.id, n.name, n.type,
                COALESCE(nc.centrality_score, 0) as centrality,
                COALESCE(nc.total_connections, 0) as connections,
@@ -535,22 +503,19 @@ async def get_network(
         WHERE n.id = ANY(%s)
     """, (node_ids,))
 
-    # Get edges between these nodes - with optional type filter
-    if type_filter:
-        edges_data = execute_query("graph", """
-            SELECT e.id, e.from_node_id, e.to_node_id, e.type, e.excerpt
-            FROM edges e
-            WHERE e.from_node_id = ANY(%s) AND e.to_node_id = ANY(%s)
-              AND e.type = ANY(%s)
-            LIMIT 500
-        """, (node_ids, node_ids, type_filter))
-    else:
-        edges_data = execute_query("graph", """
-            SELECT e.id, e.from_node_id, e.to_node_id, e.type, e.excerpt
-            FROM edges e
-            WHERE e.from_node_id = ANY(%s) AND e.to_node_id = ANY(%s)
-            LIMIT 500
-        """, (node_ids, node_ids))
+    # Edges between these nodes from the snapshot; only excerpts come from PostgreSQL
+    edge_rows = graph.edges_between(node_ids, type_filter, limit=500)
+    excerpts = {}
+    if edge_rows:
+        rows = await execute_query_async(
+            "graph", "SELECT id, excerpt FROM edges WHERE id = ANY(%s)", ([e[0] for e in edge_rows],)
+        )
+        excerpts = {r['id']: r['excerpt'] for r in rows}
+    edges_data = [
+        {'id': edge_id, 'from_node_id': from_id, 'to_node_id': to_id, 'type': edge_type,
+         'excerpt': excerpts.get(edge_id)}
+        for edge_id, from_id, to_id, edge_type in edge_rows
+    ]
 
     # Color mapping for node types
     type_colors = {
@@ -644,7 +609,7 @@ async def ask(q: str = Query(..., max_length=1000)):
 @router.get("/api/v2/targets")
 async def get_targets():
     """Get prosecution targets from graph"""
-    targets = execute_query("graph", """
+    targets = await execute_query_async("graph", """
         SELECT n.id, n.name, n.type,
                nc.relevance_score, nc.confidence_score,
                nc.total_connections, nc.centrality_score,
@@ -678,7 +643,7 @@ async def get_targets():
 @router.get("/api/v2/chat/conversations")
 async def get_conversations():
     """List all conversations"""
-    return execute_query("sessions", """
+    return await execute_query_async("sessions", """
         SELECT id, title, created_at, updated_at
         FROM conversations
         ORDER BY updated_at DESC
@@ -689,7 +654,7 @@ async def get_conversations():
 async def new_conversation():
     """Create new conversation"""
     conv_id = str(uuid.uuid4())
-    execute_update("sessions", """
+    await execute_update_async("sessions", """
         INSERT INTO conversations (id, title) VALUES (%s, %s)
     """, (conv_id, "New Chat"))
     return {"id": conv_id}
@@ -697,7 +662,7 @@ async def new_conversation():
 @router.get("/api/v2/chat/{conv_id}/messages")
 async def get_messages(conv_id: str):
     """Get messages for a conversation"""
-    return execute_query("sessions", """
+    return await execute_query_async("sessions", """
         SELECT id, role, content, created_at
         FROM messages
         WHERE conversation_id = %s
@@ -712,12 +677,12 @@ async def chat_send(msg: ChatMessage):
     # Create conversation if needed
     if not conv_id:
         conv_id = str(uuid.uuid4())
-        execute_update("sessions", """
+        await execute_update_async("sessions", """
             INSERT INTO conversations (id, title) VALUES (%s, %s)
         """, (conv_id, msg.message[:50]))
 
     # Save user message
-    execute_update("sessions", """
+    await execute_update_async("sessions", """
         INSERT INTO messages (conversation_id, role, content) VALUES (%s, %s, %s)
     """, (conv_id, "user", msg.message))
 
@@ -749,12 +714,12 @@ async def chat_send(msg: ChatMessage):
         yield f'data: {json.dumps({"type": "chunk", "text": response_text})}\n\n'
 
         # Save assistant response
-        execute_update("sessions", """
+        await execute_update_async("sessions", """
             INSERT INTO messages (conversation_id, role, content) VALUES (%s, %s, %s)
         """, (conv_id, "assistant", response_text))
 
         # Update conversation timestamp
-        execute_update("sessions", """
+        await execute_update_async("sessions", """
             UPDATE conversations SET updated_at = NOW() WHERE id = %s
         """, (conv_id,))
 
@@ -1,71 +1,34 @@
 """Full-text search functions with score integration - PostgreSQL + Go
 
 Hybrid search architecture:
-- Go microservice (port 8003): Fast parallel term search
-- PostgreSQL FTS: Full-text with scoring and snippets
+- Go microservice (port 8003, app/sidecars.py): Fast parallel term search
+- PostgreSQL FTS: Full-text with scoring and snippets (plans in app/ranking.py)
 - In-memory caching: Avoid redundant queries
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 import logging
-import httpx
-import threading
-import time
-from collections import OrderedDict
-from app.db import execute_query
+import asyncio
+import base64
+import json
+from contextlib import aclosing
+from concurrent.futures import ThreadPoolExecutor
+from app.db import execute_query, execute_query_async, stream_query_async
+from app.cache import get_cache
+from app.sidecars import go_search
+from app.entity_index import lookup_entities, lookup_entities_async
+from app.ranking import EMAIL_FTS_QUERY, EMAIL_STREAM_QUERY, CORPUS_FTS_QUERY, CORPUS_BATCH_QUERY
 from app.models import SearchResult
 
 log = logging.getLogger(__name__)
 
-GO_SEARCH_URL = "http://127.0.0.1:8003"
+# Shared pool for fanning out per-term Go searches in search_corpus_batch
+_batch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="search-batch")
 
 # =============================================================================
-# SEARCH CACHE - Avoid redundant queries
+# SEARCH CACHE - Avoid redundant queries (shared tier, see app/cache.py)
 # =============================================================================
 
-class SearchCache:
-    """Thread-safe LRU cache for search results"""
-    def __init__(self, max_size: int = 200, ttl: int = 300):
-        self.max_size = max_size
-        self.ttl = ttl
-        self.cache: OrderedDict = OrderedDict()
-        self.timestamps: Dict[str, float] = {}
-        self.lock = threading.Lock()
-        self.hits = 0
-        self.misses = 0
-
-    def get(self, key: str) -> Optional[List]:
-        with self.lock:
-            if key not in self.cache:
-                self.misses += 1
-                return None
-            if time.time() - self.timestamps[key] > self.ttl:
-                del self.cache[key]
-                del self.timestamps[key]
-                self.misses += 1
-                return None
-            self.cache.move_to_end(key)
-            self.hits += 1
-            return self.cache[key]
-
-    def set(self, key: str, value: List):
-        with self.lock:
-            if key in self.cache:
-                self.cache.move_to_end(key)
-            else:
-                if len(self.cache) >= self.max_size:
-                    oldest = next(iter(self.cache))
-                    del self.cache[oldest]
-                    del self.timestamps[oldest]
-            self.cache[key] = value
-            self.timestamps[key] = time.time()
-
-    def stats(self) -> Dict:
-        with self.lock:
-            total = self.hits + self.misses
-            return {"size": len(self.cache), "hits": self.hits, "misses": self.misses,
-                    "hit_rate": round(self.hits / total, 2) if total > 0 else 0}
-
-_search_cache = SearchCache()
+_search_cache = get_cache("go_search", ttl=300)
 
 # =============================================================================
 # AUTO-SCORING - Keywords that indicate importance
@@ -127,6 +90,19 @@ def auto_score_result(result: Dict) -> Dict[str, int]:
 # GO FAST SEARCH - Sync wrapper for pipeline
 # =============================================================================
 
+def _go_results(resp, limit: int) -> Optional[List[Dict[str, Any]]]:
+    """Parse a Go /search/fast response (None if unusable)"""
+    if resp is None or resp.status_code != 200:
+        return None
+    try:
+        results = resp.json()
+        return [{"id": r["id"], "name": r["name"], "snippet": r.get("snippet", ""),
+                 "rank": r["rank"], "type": "email"} for r in results[:limit]]
+    except (KeyError, ValueError, TypeError) as e:
+        log.warning("Go search response parse error: %s", e)
+        return None
+
+
 def search_go_sync(terms: List[str], limit: int = 15) -> List[Dict[str, Any]]:
     """Synchronous Go search for use in pipeline"""
     cache_key = f"go:{'+'.join(sorted(terms[:4]))}:{limit}"
@@ -134,21 +110,12 @@ def search_go_sync(terms: List[str], limit: int = 15) -> List[Dict[str, Any]]:
     if cached is not None:
         return cached
 
-    try:
-        q = " ".join(terms[:4])
-        resp = httpx.get(f"{GO_SEARCH_URL}/search/fast", params={"q": q}, timeout=3.0)
-        if resp.status_code == 200:
-            results = resp.json()
-            out = [{"id": r["id"], "name": r["name"], "snippet": r.get("snippet", ""),
-                    "rank": r["rank"], "type": "email"} for r in results[:limit]]
-            _search_cache.set(cache_key, out)
-            return out
-    except httpx.TimeoutException:
-        log.debug("Go search timeout for terms: %s", terms[:4])
-    except httpx.RequestError as e:
-        log.debug("Go search connection error: %s", e)
-    except (KeyError, ValueError) as e:
-        log.warning("Go search response parse error: %s", e)
+    # Pooled client; returns None at once while the circuit is open
+    q = " ".join(terms[:4])
+    out = _go_results(go_search.get("/search/fast", params={"q": q}), limit)
+    if out is not None:
+        _search_cache.set(cache_key, out)
+        return out
     return []
 
 async def search_go_fast(terms: List[str], limit: int = 15) -> List[Dict[str, Any]]:
@@ -158,52 +125,65 @@ async def search_go_fast(terms: List[str], limit: int = 15) -> List[Dict[str, An
     if cached is not None:
         return cached
 
-    try:
-        async with httpx.AsyncClient(timeout=3.0) as client:
-            q = " ".join(terms[:4])
-            resp = await client.get(f"{GO_SEARCH_URL}/search/fast", params={"q": q})
-            if resp.status_code == 200:
-                results = resp.json()
-                out = [{"id": r["id"], "name": r["name"], "snippet": r.get("snippet", ""),
-                         "rank": r["rank"], "type": "email"} for r in results[:limit]]
-                _search_cache.set(cache_key, out)
-                return out
-    except httpx.TimeoutException:
-        log.debug("Go search async timeout for terms: %s", terms[:4])
-    except httpx.RequestError as e:
-        log.debug("Go search async connection error: %s", e)
-    except (KeyError, ValueError) as e:
-        log.warning("Go search async response parse error: %s", e)
+    q = " ".join(terms[:4])
+    out = _go_results(await go_search.aget("/search/fast", params={"q": q}), limit)
+    if out is not None:
+        _search_cache.set(cache_key, out)
+        return out
     return []
 
 # =============================================================================
 # SCORE LOOKUP (PostgreSQL)
 # =============================================================================
 
+def _scores_query(target_ids: List[int]) -> str:
+    placeholders = ','.join(['%s'] * len(target_ids))
+    return f"""SELECT target_id, suspicion, pertinence, confidence, anomaly
+                FROM scores
+                WHERE target_type = %s AND target_id IN ({placeholders})"""
+
+
+def _scores_from_rows(rows: List[Dict]) -> Dict[int, Dict[str, int]]:
+    scores = {}
+    for row in rows:
+        scores[row['target_id']] = {
+            'suspicion': row['suspicion'] or 0,
+            'pertinence': row['pertinence'] or 50,
+            'confidence': row['confidence'] or 50,
+            'anomaly': row['anomaly'] or 0
+        }
+    return scores
+
+
 def get_scores(target_type: str, target_ids: List[int]) -> Dict[int, Dict[str, int]]:
     """Fetch scores from PostgreSQL for given targets"""
     if not target_ids:
         return {}
 
     try:
-        placeholders = ','.join(['%s'] * len(target_ids))
         rows = execute_query(
             "scores",
-            f"""SELECT target_id, suspicion, pertinence, confidence, anomaly
-                FROM scores
-                WHERE target_type = %s AND target_id IN ({placeholders})""",
+            _scores_query(target_ids),
             tuple([target_type] + list(target_ids))
         )
+        return _scores_from_rows(rows)
+    except Exception as e:
+        log.debug("Failed to fetch scores for %s: %s", target_type, e)
+        return {}
 
-        scores = {}
-        for row in rows:
-            scores[row['target_id']] = {
-                'suspicion': row['suspicion'] or 0,
-                'pertinence': row['pertinence'] or 50,
-                'confidence': row['confidence'] or 50,
-                'anomaly': row['anomaly'] or 0
-            }
-        return scores
+
+async def get_scores_async(target_type: str, target_ids: List[int]) -> Dict[int, Dict[str, int]]:
+    """Async version of get_scores"""
+    if not target_ids:
+        return {}
+
+    try:
+        rows = await execute_query_async(
+            "scores",
+            _scores_query(target_ids),
+            tuple([target_type] + list(target_ids))
+        )
+        return _scores_from_rows(rows)
     except Exception as e:
         log.debug("Failed to fetch scores for %s: %s", target_type, e)
         return {}
@@ -235,38 +215,8 @@ def calculate_composite_score(ts_rank: float, scores: Dict[str, int]) -> float:
 # SEARCH FUNCTIONS
 # =============================================================================
 
-def search_emails(q: str, limit: int = 20) -> List[SearchResult]:
-    """Search emails using PostgreSQL FTS + score enhancement"""
-    if not q.strip():
-        return []
-
-    # Fetch more results initially to allow re-ranking
-    fetch_limit = min(limit * 3, 100)
-
-    # JOIN with scores to prioritize curated investigation documents
-    query = """
-        SELECT
-            e.doc_id,
-            e.subject,
-            e.sender_email as sender,
-            ts_headline('english', COALESCE(e.body_text, e.subject), plainto_tsquery('english', %s),
-                'StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=10') as snippet,
-            ts_rank(e.tsv, plainto_tsquery('english', %s)) as rank,
-            COALESCE(s.pertinence, 50) as pertinence,
-            COALESCE(s.suspicion, 0) as suspicion,
-            (ts_rank(e.tsv, plainto_tsquery('english', %s)) * 0.5 + COALESCE(s.pertinence, 50) / 100.0 * 0.5) as combined_rank
-        FROM emails e
-        LEFT JOIN scores s ON s.target_type = 'email' AND s.target_id = e.doc_id
-        WHERE e.tsv @@ plainto_tsquery('english', %s)
-        ORDER BY combined_rank DESC
-        LIMIT %s
-    """
-
-    rows = execute_query("sources", query, (q, q, q, q, fetch_limit))
-    if not rows:
-        return []
-
-    # Build results - scores already included from JOIN
+def _email_results(rows: List[Dict], limit: int) -> List[SearchResult]:
+    """Build results - scores already included from JOIN"""
     results = []
     for row in rows:
         doc_id = row['doc_id']
@@ -292,42 +242,16 @@ def search_emails(q: str, limit: int = 20) -> List[SearchResult]:
     return results[:limit]
 
 
-def search_nodes(q: str, limit: int = 20) -> List[SearchResult]:
-    """Search nodes using trigram similarity + score enhancement"""
-    if not q.strip():
-        return []
-
-    # Fetch more for re-ranking
-    fetch_limit = min(limit * 3, 100)
-
-    query = """
-        SELECT
-            id,
-            type,
-            name,
-            name as snippet,
-            GREATEST(
-                similarity(name, %s),
-                similarity(COALESCE(name_normalized, ''), %s)
-            ) as rank
-        FROM nodes
-        WHERE name ILIKE %s
-           OR name_normalized ILIKE %s
-           OR similarity(name, %s) > 0.3
-        ORDER BY rank DESC
-        LIMIT %s
-    """
-
-    search_pattern = f"%{q}%"
-    rows = execute_query("graph", query, (q, q, search_pattern, search_pattern, q, fetch_limit))
-    if not rows:
-        return []
+def _entity_scores(rows: List[Dict]) -> Dict[int, Dict[str, int]]:
+    """Scores already attached to entity index hits, keyed by node id"""
+    return {
+        row['id']: {k: row[k] for k in ('suspicion', 'pertinence', 'confidence', 'anomaly')}
+        for row in rows
+    }
 
-    # Get scores for these nodes
-    node_ids = [row['id'] for row in rows]
-    scores_map = get_scores('node', node_ids)
 
-    # Build results with composite scores
+def _node_results(rows: List[Dict], scores_map: Dict[int, Dict[str, int]], limit: int) -> List[SearchResult]:
+    """Build node results with composite scores"""
     results = []
     for row in rows:
         node_id = row['id']
@@ -344,7 +268,7 @@ def search_nodes(q: str, limit: int = 20) -> List[SearchResult]:
             id=node_id,
             type=row['type'],
             name=row['name'],
-            snippet=row.get('snippet', ''),
+            snippet=row.get('snippet') or row['name'],
             score=composite,
             metadata={
                 'sim_rank': sim_rank,
@@ -360,6 +284,34 @@ def search_nodes(q: str, limit: int = 20) -> List[SearchResult]:
     return results[:limit]
 
 
+def search_emails(q: str, limit: int = 20) -> List[SearchResult]:
+    """Search emails using PostgreSQL FTS + score enhancement"""
+    if not q.strip():
+        return []
+
+    # Final order is decided in SQL, so snippets are only built for `limit` rows
+    rows = execute_query("sources", EMAIL_FTS_QUERY, (q, limit))
+    if not rows:
+        return []
+
+    return _email_results(rows, limit)
+
+
+def search_nodes(q: str, limit: int = 20) -> List[SearchResult]:
+    """Search nodes via the entity name index (trigram fallback) + score enhancement"""
+    if not q.strip():
+        return []
+
+    # Fetch more for re-ranking
+    fetch_limit = min(limit * 3, 100)
+
+    rows = lookup_entities(q, fetch_limit)
+    if not rows:
+        return []
+
+    return _node_results(rows, _entity_scores(rows), limit)
+
+
 def search_all(q: str, limit: int = 20) -> List[SearchResult]:
     """Search both emails and nodes with combined scoring"""
     email_results = search_emails(q, limit // 2)
@@ -372,10 +324,191 @@ def search_all(q: str, limit: int = 20) -> List[SearchResult]:
     return all_results[:limit]
 
 
+# =============================================================================
+# ASYNC SEARCH (used by the FastAPI routes - does not block the event loop)
+# =============================================================================
+
+async def search_emails_async(q: str, limit: int = 20) -> List[SearchResult]:
+    """Async version of search_emails (FTS statement prepared server-side)"""
+    if not q.strip():
+        return []
+
+    rows = await execute_query_async("sources", EMAIL_FTS_QUERY, (q, limit), prepare=True)
+    if not rows:
+        return []
+
+    return _email_results(rows, limit)
+
+
+async def search_nodes_async(q: str, limit: int = 20) -> List[SearchResult]:
+    """Async version of search_nodes"""
+    if not q.strip():
+        return []
+
+    fetch_limit = min(limit * 3, 100)
+
+    rows = await lookup_entities_async(q, fetch_limit)
+    if not rows:
+        return []
+
+    return _node_results(rows, _entity_scores(rows), limit)
+
+
+async def search_all_async(q: str, limit: int = 20) -> List[SearchResult]:
+    """Async version of search_all - emails and nodes searched concurrently"""
+    email_results, node_results = await asyncio.gather(
+        search_emails_async(q, limit // 2),
+        search_nodes_async(q, limit // 2),
+    )
+
+    all_results = email_results + node_results
+    all_results.sort(key=lambda x: x.score, reverse=True)
+
+    return all_results[:limit]
+
+
+# =============================================================================
+# STREAMING SEARCH - keyset cursor over the whole result set
+# =============================================================================
+
+# Substring/trigram node matching, unbounded, after a (rank, id) cursor
+NODE_STREAM_QUERY = """
+    SELECT * FROM (
+        SELECT
+            id,
+            type,
+            name,
+            name as snippet,
+            GREATEST(
+                similarity(name, %s),
+                similarity(COALESCE(name_normalized, ''), %s)
+            )::float8 as rank
+        FROM nodes
+        WHERE name ILIKE %s
+           OR name_normalized ILIKE %s
+           OR similarity(name, %s) > 0.3
+    ) n
+    WHERE (n.rank, n.id) < (%s, %s)
+    ORDER BY n.rank DESC, n.id DESC
+"""
+
+# Streams walk nodes first (few, best matches), then emails
+STREAM_ORDER = ('node', 'email')
+
+# Cursor before the first row of a section
+_CURSOR_START = (float('inf'), 2 ** 63 - 1)
+
+
+def encode_cursor(kind: str, rank: float, row_id: int) -> str:
+    """Opaque resume token: the last (rank, id) sent in section `kind`"""
+    raw = json.dumps([kind, rank, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, float, int]:
+    """Inverse of encode_cursor - raises ValueError on a malformed token"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        kind, rank, row_id = json.loads(raw)
+        if kind not in STREAM_ORDER:
+            raise ValueError(kind)
+        return kind, float(rank), int(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"invalid cursor: {cursor!r}") from e
+
+
+async def _stream_nodes(q: str, after: Tuple[float, int]) -> AsyncIterator[Tuple[SearchResult, str]]:
+    pattern = f"%{q}%"
+    params = (q, q, pattern, pattern, q) + after
+    batch: List[Dict] = []
+
+    async def flush():
+        # Scores are looked up per batch, not per row
+        scores_map = await get_scores_async('node', [r['id'] for r in batch])
+        out = []
+        for row in batch:
+            result = _node_results([row], scores_map, 1)[0]
+            out.append((result, encode_cursor('node', row['rank'], row['id'])))
+        batch.clear()
+        return out
+
+    async for row in stream_query_async("graph", NODE_STREAM_QUERY, params, batch_size=200):
+        batch.append(row)
+        if len(batch) >= 200:
+            for item in await flush():
+                yield item
+    if batch:
+        for item in await flush():
+            yield item
+
+
+async def _stream_emails(q: str, after: Tuple[float, int]) -> AsyncIterator[Tuple[SearchResult, str]]:
+    async for row in stream_query_async("sources", EMAIL_STREAM_QUERY, (q,) + after, batch_size=200):
+        result = _email_results([row], 1)[0]
+        yield result, encode_cursor('email', row['combined_rank'], row['doc_id'])
+
+
+async def stream_search(q: str, types: Tuple[str, ...] = STREAM_ORDER,
+                        cursor: Optional[str] = None) -> AsyncIterator[Tuple[SearchResult, str]]:
+    """
+    Walk every match for q, yielding (result, cursor) pairs.
+
+    Each section (nodes, then emails) is read with one server-side cursor
+    in a stable (rank DESC, id DESC) order. Passing a yielded cursor back
+    resumes right after that row - no OFFSET scan, no re-ranked pages.
+    """
+    if not q.strip():
+        return
+
+    start_kind, rank, row_id = decode_cursor(cursor) if cursor else (None, None, None)
+
+    for kind in STREAM_ORDER:
+        if kind not in types:
+            continue
+        if start_kind is not None and STREAM_ORDER.index(kind) < STREAM_ORDER.index(start_kind):
+            continue  # section already fully walked
+        after = (rank, row_id) if kind == start_kind else _CURSOR_START
+
+        stream = _stream_nodes(q, after) if kind == 'node' else _stream_emails(q, after)
+        async with aclosing(stream):  # release the DB cursor as soon as the caller stops
+            async for item in stream:
+                yield item
+
+
 # =============================================================================
 # PIPELINE SEARCH (used by pipeline.py)
 # =============================================================================
 
+def _corpus_results(rows: List[Dict], limit: int) -> List[Dict[str, Any]]:
+    """Build corpus result dicts - scores come from email_rank_features"""
+    results = []
+    for row in rows:
+        ts_rank = float(row.get('rank', 0))
+        entity_scores = {
+            'suspicion': row['suspicion'],
+            'pertinence': row['pertinence'],
+            'confidence': row['confidence'],
+        }
+
+        results.append({
+            'id': row['id'],
+            'name': row.get('name'),
+            'sender_email': row.get('sender_email'),
+            'recipients_to': row.get('recipients_to'),
+            'date': row.get('date'),
+            'snippet': row.get('snippet'),
+            'rank': calculate_composite_score(ts_rank, entity_scores),
+            'ts_rank': ts_rank,
+            'suspicion': entity_scores['suspicion'],
+            'pertinence': entity_scores['pertinence']
+        })
+
+    # Already ordered by composite in SQL; keep the sort for ties/rounding
+    results.sort(key=lambda x: x['rank'], reverse=True)
+
+    return results[:limit]
+
+
 def search_corpus_scored(search_term: str, limit: int = 15) -> List[Dict[str, Any]]:
     """
     Search corpus with score enhancement for pipeline.
@@ -384,67 +517,72 @@ def search_corpus_scored(search_term: str, limit: int = 15) -> List[Dict[str, An
     if not search_term or not search_term.strip():
         return []
 
-    # Fetch more for re-ranking
-    fetch_limit = min(limit * 3, 60)
+    # Candidates for the composite rerank; snippets only for the final `limit`
+    candidate_limit = min(limit * 3, 60)
 
     try:
-        # Join with scores table to boost high-pertinence documents
-        query = """
-            SELECT
-                e.doc_id as id,
-                e.subject as name,
-                e.sender_email,
-                e.recipients_to,
-                e.date_sent as date,
-                ts_headline('english', COALESCE(e.body_text, e.subject), plainto_tsquery('english', %s),
-                    'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=10') as snippet,
-                ts_rank(e.tsv, plainto_tsquery('english', %s)) as ts_rank,
-                COALESCE(s.pertinence, 50) as pertinence,
-                COALESCE(s.suspicion, 0) as suspicion,
-                (ts_rank(e.tsv, plainto_tsquery('english', %s)) * 0.5 + COALESCE(s.pertinence, 50) / 100.0 * 0.5) as rank
-            FROM emails e
-            LEFT JOIN scores s ON s.target_type = 'email' AND s.target_id = e.doc_id
-            WHERE e.tsv @@ plainto_tsquery('english', %s)
-            ORDER BY rank DESC
-            LIMIT %s
-        """
-        rows = execute_query("sources", query, (search_term, search_term, search_term, search_term, fetch_limit))
+        rows = execute_query("sources", CORPUS_FTS_QUERY, (search_term, candidate_limit, limit))
         if not rows:
             return []
 
-        # Get scores
-        doc_ids = [row['id'] for row in rows]
-        scores_map = get_scores('email', doc_ids)
-
-        # Calculate composite scores and sort
-        results = []
-        for row in rows:
-            doc_id = row['id']
-            ts_rank = float(row.get('rank', 0))
-
-            entity_scores = scores_map.get(doc_id, {
-                'suspicion': 0, 'pertinence': 50, 'confidence': 70, 'anomaly': 0
-            })
-
-            composite = calculate_composite_score(ts_rank, entity_scores)
-
-            results.append({
-                'id': doc_id,
-                'name': row.get('name'),
-                'sender_email': row.get('sender_email'),
-                'recipients_to': row.get('recipients_to'),
-                'date': row.get('date'),
-                'snippet': row.get('snippet'),
-                'rank': composite,
-                'ts_rank': ts_rank,
-                'suspicion': entity_scores['suspicion'],
-                'pertinence': entity_scores['pertinence']
-            })
-
-        # Sort by composite score
-        results.sort(key=lambda x: x['rank'], reverse=True)
-
-        return results[:limit]
+        return _corpus_results(rows, limit)
     except Exception as e:
         log.warning("search_corpus_scored failed for '%s': %s", search_term, e)
         return []
+
+
+# =============================================================================
+# BATCHED PIPELINE SEARCH - all terms in one round trip
+# =============================================================================
+
+def search_corpus_scored_batch(terms: List[str], limit: int = 15) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Batched search_corpus_scored: one LATERAL ranking plan per term,
+    all in a single query.
+    Returns {term: results} with the same result dicts as search_corpus_scored.
+    """
+    terms = [t for t in dict.fromkeys(terms) if t and t.strip()]
+    if not terms:
+        return {}
+
+    candidate_limit = min(limit * 3, 60)
+
+    try:
+        rows = execute_query("sources", CORPUS_BATCH_QUERY, (terms, candidate_limit, limit))
+    except Exception as e:
+        log.warning("search_corpus_scored_batch failed for %s: %s", terms, e)
+        return {t: [] for t in terms}
+
+    rows_by_term: Dict[str, List[Dict]] = {t: [] for t in terms}
+    for row in rows:
+        rows_by_term.setdefault(row['term'], []).append(row)
+
+    return {t: _corpus_results(term_rows, limit) for t, term_rows in rows_by_term.items()}
+
+
+def search_terms_batch(terms: List[str], limit: int = 15) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Search several terms at once for the pipeline.
+
+    Go searches run concurrently (one per term); terms the Go service
+    could not answer fall back to a single batched PostgreSQL query.
+    Go results are auto-scored, like the single-term path in pipeline.py.
+    """
+    terms = [t for t in dict.fromkeys(terms) if t and t.strip()]
+    if not terms:
+        return {}
+
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    futures = {t: _batch_executor.submit(search_go_sync, [t], limit) for t in terms}
+    for term, future in futures.items():
+        go_results = future.result()
+        if go_results:
+            for r in go_results:
+                r.update(auto_score_result(r))
+            results[term] = go_results
+
+    missing = [t for t in terms if t not in results]
+    if missing:
+        results.update(search_corpus_scored_batch(missing, limit))
+
+    return {t: results.get(t, []) for t in terms}
@@ -0,0 +1,218 @@
+"""Managed HTTP clients for the local sidecar services
+
+Sidecars:
+- Go search service (port 8003): fast parallel term search
+- Rust extraction service (port 9001): entity extraction
+
+Each sidecar gets:
+- Long-lived keep-alive pools (one httpx.Client, one httpx.AsyncClient)
+- A circuit breaker: after FAILURE_THRESHOLD consecutive failures the
+  sidecar is skipped for COOLDOWN seconds, so callers fall back to
+  PostgreSQL / Python regex instantly instead of waiting on a timeout
+- A latency histogram (exposed on /api/stats)
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+log = logging.getLogger(__name__)
+
+FAILURE_THRESHOLD = 3   # consecutive failures before opening the circuit
+COOLDOWN = 30.0         # seconds before a half-open probe is allowed
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +inf)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class Sidecar:
+    """Pooled sync/async client for one sidecar, with circuit breaker"""
+
+    def __init__(self, name: str, base_url: str, timeout: float, max_connections: int = 20):
+        self.name = name
+        self.base_url = base_url
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=60.0,
+        )
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+        # Circuit breaker state
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+        # Metrics
+        self.requests = 0
+        self.errors = 0
+        self.short_circuited = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+
+    # -------------------------------------------------------------------------
+    # Clients (lazy, reused across calls)
+    # -------------------------------------------------------------------------
+
+    def _sync(self) -> httpx.Client:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout, limits=self.limits)
+        return self._client
+
+    def _async(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout, limits=self.limits)
+        return self._async_client
+
+    # -------------------------------------------------------------------------
+    # Circuit breaker
+    # -------------------------------------------------------------------------
+
+    def _admit(self) -> Optional[bool]:
+        """None while the circuit is open, True for the half-open probe, False otherwise
+
+        The caller must pass a True result to _end_probe() once the probe is
+        over, however it ends.
+        """
+        with self._lock:
+            if self.failures < FAILURE_THRESHOLD:
+                return False
+            if time.monotonic() - self.opened_at >= COOLDOWN and not self._probing:
+                self._probing = True  # half-open: a single request decides
+                return True
+            self.short_circuited += 1
+            return None
+
+    def _end_probe(self, probe: bool):
+        if probe:
+            with self._lock:
+                self._probing = False
+
+    def _record(self, elapsed_ms: float, ok: bool):
+        with self._lock:
+            self.requests += 1
+            self.total_ms += elapsed_ms
+            for i, bound in enumerate(LATENCY_BUCKETS_MS):
+                if elapsed_ms <= bound:
+                    self.buckets[i] += 1
+                    break
+            else:
+                self.buckets[-1] += 1
+
+            if ok:
+                if self.failures >= FAILURE_THRESHOLD:
+                    log.info("Sidecar %s recovered, closing circuit", self.name)
+                self.failures = 0
+            else:
+                self.errors += 1
+                self.failures += 1
+                if self.failures >= FAILURE_THRESHOLD:
+                    if self.failures == FAILURE_THRESHOLD:
+                        log.warning("Sidecar %s failing, opening circuit for %.0fs", self.name, COOLDOWN)
+                    self.opened_at = time.monotonic()
+
+    # -------------------------------------------------------------------------
+    # Requests - return None when the sidecar is down or the circuit is open
+    # -------------------------------------------------------------------------
+
+    def request(self, method: str, path: str, **kwargs) -> Optional[httpx.Response]:
+        """Synchronous request through the keep-alive pool"""
+        probe = self._admit()
+        if probe is None:
+            return None
+        start = time.perf_counter()
+        try:
+            resp = self._sync().request(method, path, **kwargs)
+        except httpx.HTTPError as e:
+            self._record((time.perf_counter() - start) * 1000, ok=False)
+            log.debug("Sidecar %s %s %s failed: %s", self.name, method, path, e)
+            return None
+        else:
+            self._record((time.perf_counter() - start) * 1000, ok=resp.status_code < 500)
+            return resp
+        finally:
+            # Any exit (including non-HTTP errors) ends the half-open probe
+            self._end_probe(probe)
+
+    async def arequest(self, method: str, path: str, **kwargs) -> Optional[httpx.Response]:
+        """Async request through the keep-alive pool"""
+        probe = self._admit()
+        if probe is None:
+            return None
+        start = time.perf_counter()
+        try:
+            resp = await self._async().request(method, path, **kwargs)
+        except httpx.HTTPError as e:
+            self._record((time.perf_counter() - start) * 1000, ok=False)
+            log.debug("Sidecar %s %s %s failed: %s", self.name, method, path, e)
+            return None
+        else:
+            self._record((time.perf_counter() - start) * 1000, ok=resp.status_code < 500)
+            return resp
+        finally:
+            # Cancellation or a non-HTTP error must not leave the circuit stuck half-open
+            self._end_probe(probe)
+
+    def get(self, path: str, **kwargs) -> Optional[httpx.Response]:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> Optional[httpx.Response]:
+        return self.request("POST", path, **kwargs)
+
+    async def aget(self, path: str, **kwargs) -> Optional[httpx.Response]:
+        return await self.arequest("GET", path, **kwargs)
+
+    async def apost(self, path: str, **kwargs) -> Optional[httpx.Response]:
+        return await self.arequest("POST", path, **kwargs)
+
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+            return {
+                "url": self.base_url,
+                "circuit": "open" if self.failures >= FAILURE_THRESHOLD else "closed",
+                "consecutive_failures": self.failures,
+                "requests": self.requests,
+                "errors": self.errors,
+                "short_circuited": self.short_circuited,
+                "avg_ms": round(self.total_ms / self.requests, 2) if self.requests else 0,
+                "latency_histogram": dict(zip(labels, self.buckets)),
+            }
+
+    async def aclose(self):
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+# =============================================================================
+# SIDECAR INSTANCES
+# =============================================================================
+
+go_search = Sidecar("go_search", "http://127.0.0.1:8003", timeout=3.0)
+rust_extract = Sidecar("rust_extract", "http://127.0.0.1:9001", timeout=2.0)
+
+SIDECARS = (go_search, rust_extract)
+
+
+def sidecar_stats() -> Dict[str, Any]:
+    """Circuit state and latency histograms for /api/stats"""
+    return {s.name: s.stats() for s in SIDECARS}
+
+
+async def close_sidecars():
+    """Close all sidecar connection pools (for graceful shutdown)"""
+    for s in SIDECARS:
+        await s.aclose()
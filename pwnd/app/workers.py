@@ -17,9 +17,9 @@ import time
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Callable
-from collections import OrderedDict
 
 from app.config import LLM_DIR
+from app.cache import get_cache
 from concurrent.futures import ThreadPoolExecutor, Future
 import threading
 
@@ -28,7 +28,6 @@ log = logging.getLogger("workers")
 # Configuration
 NUM_PHI3_WORKERS = 3  # 3 workers × 2GB = 6GB RAM
 THREADS_PER_WORKER = 2  # 3 workers × 2 threads = 6 threads (leaving 2 for system)
-CACHE_MAX_SIZE = 500
 CACHE_TTL = 3600  # 1 hour
 MAX_QUEUE_SIZE = 100
 JOB_TIMEOUT = 120  # seconds
@@ -67,64 +66,10 @@ class Job:
     completed: bool = field(compare=False, default=False)
 
 
-class LRUCache:
-    """Thread-safe LRU cache with TTL"""
-
-    def __init__(self, max_size: int = CACHE_MAX_SIZE, ttl: int = CACHE_TTL):
-        self.max_size = max_size
-        self.ttl = ttl
-        self.cache: OrderedDict = OrderedDict()
-        self.timestamps: Dict[str, float] = {}
-        self.lock = threading.Lock()
-        self.hits = 0
-        self.misses = 0
-
-    def _make_key(self, job_type: str, payload: Dict) -> str:
-        content = json.dumps({"type": job_type, "payload": payload}, sort_keys=True)
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
-
-    def get(self, job_type: str, payload: Dict) -> Optional[Any]:
-        key = self._make_key(job_type, payload)
-        with self.lock:
-            if key not in self.cache:
-                self.misses += 1
-                return None
-
-            # Check TTL
-            if time.time() - self.timestamps[key] > self.ttl:
-                del self.cache[key]
-                del self.timestamps[key]
-                self.misses += 1
-                return None
-
-            # Move to end (most recently used)
-            self.cache.move_to_end(key)
-            self.hits += 1
-            return self.cache[key]
-
-    def set(self, job_type: str, payload: Dict, value: Any):
-        key = self._make_key(job_type, payload)
-        with self.lock:
-            if key in self.cache:
-                self.cache.move_to_end(key)
-            else:
-                if len(self.cache) >= self.max_size:
-                    oldest = next(iter(self.cache))
-                    del self.cache[oldest]
-                    del self.timestamps[oldest]
-            self.cache[key] = value
-            self.timestamps[key] = time.time()
-
-    def stats(self) -> Dict:
-        with self.lock:
-            total = self.hits + self.misses
-            return {
-                "size": len(self.cache),
-                "max_size": self.max_size,
-                "hits": self.hits,
-                "misses": self.misses,
-                "hit_rate": self.hits / total if total > 0 else 0
-            }
+def _job_cache_key(job_type: str, payload: Dict) -> str:
+    """Stable cache key for a job (type + payload)"""
+    content = json.dumps({"type": job_type, "payload": payload}, sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
 
 
 class Phi3Worker:
@@ -198,7 +143,7 @@ class WorkerPool:
         self.workers: List[Phi3Worker] = []
         self.executor = ThreadPoolExecutor(max_workers=num_workers)
         self.job_queue: asyncio.PriorityQueue = None
-        self.cache = LRUCache()
+        self.cache = get_cache("llm_jobs", ttl=CACHE_TTL)
         self.pending_jobs: Dict[str, Job] = {}
         self.running = False
         self._job_counter = 0
@@ -257,7 +202,7 @@ class WorkerPool:
         """Submit job to queue, return job_id"""
 
         # Check cache first
-        cached = self.cache.get(job_type.value, payload)
+        cached = self.cache.get(_job_cache_key(job_type.value, payload))
         if cached is not None:
             job_id = self._generate_job_id()
             job = Job(
@@ -392,7 +337,7 @@ class WorkerPool:
 
             # Cache result
             if result is not None:
-                self.cache.set(job.job_type.value, job.payload, result)
+                self.cache.set(_job_cache_key(job.job_type.value, job.payload), result)
 
             return result
 
@@ -1,21 +1,28 @@
 #!/usr/bin/env python3
 """
 Bulk ingest text files into documents/contents tables.
-Optimized for parallel processing.
+
+Files are read, hashed and typed in a process pool, streamed into a
+temporary staging table with COPY FROM STDIN, and merged into
+documents/contents in one statement per batch. Duplicates are dropped
+server-side on file_hash (the UNIQUE constraint), so existing hashes are
+never pulled into Python. After each committed batch the last file is
+written to a checkpoint, so an interrupted run resumes where it stopped.
 
 Usage:
     python3 bulk_ingest_text.py /path/to/text/files --workers 4
+    python3 bulk_ingest_text.py /path/to/text/files --no-resume   # re-scan everything
 """
 
 import os
+import io
 import sys
+import json
 import hashlib
 import argparse
 from pathlib import Path
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 import psycopg2
-from psycopg2.extras import execute_values
 
 # Database URL
 DATABASE_URL = os.getenv('DATABASE_URL')
@@ -31,6 +38,42 @@ if not DATABASE_URL:
     print("ERROR: DATABASE_URL not found")
     sys.exit(1)
 
+STAGING_COLUMNS = ('seq', 'filename', 'filepath', 'file_hash', 'doc_type', 'origin', 'char_count', 'full_text')
+
+# Rows vanish at commit, so the table is reused by every batch of the session
+STAGING_DDL = """
+    CREATE TEMP TABLE IF NOT EXISTS staging_documents (
+        seq BIGINT,
+        filename TEXT,
+        filepath TEXT,
+        file_hash TEXT,
+        doc_type TEXT,
+        origin TEXT,
+        char_count INTEGER,
+        full_text TEXT
+    ) ON COMMIT DELETE ROWS
+"""
+
+# One row per new hash (first occurrence wins), documents and contents in one statement
+MERGE_SQL = """
+    WITH picked AS (
+        SELECT DISTINCT ON (file_hash) *
+        FROM staging_documents
+        ORDER BY file_hash, seq
+    ), new_docs AS (
+        INSERT INTO documents (filename, filepath, file_hash, doc_type, origin, char_count, date_added, status)
+        SELECT filename, filepath, file_hash, doc_type, origin, char_count, NOW(), 'processed'
+        FROM picked
+        ON CONFLICT DO NOTHING
+        RETURNING id, file_hash
+    )
+    INSERT INTO contents (doc_id, full_text, created_at)
+    SELECT n.id, p.full_text, NOW()
+    FROM new_docs n
+    JOIN picked p ON p.file_hash = n.file_hash
+    ON CONFLICT DO NOTHING
+"""
+
 
 def file_hash(content: bytes) -> str:
     return hashlib.sha256(content).hexdigest()
@@ -54,18 +97,12 @@ def detect_doc_type(filename: str, content: str) -> str:
     return 'misc'
 
 
-def get_existing_hashes(conn) -> set:
-    """Get all existing file hashes to avoid duplicates"""
-    with conn.cursor() as cur:
-        cur.execute("SELECT file_hash FROM documents WHERE file_hash IS NOT NULL")
-        return {row[0] for row in cur.fetchall()}
-
-
-def process_file(filepath: Path) -> dict:
-    """Process a single file, return data for insertion"""
+def process_file(filepath: Path, origin: str = 'dataset8_foia') -> dict:
+    """Process a single file, return data for insertion (runs in a worker process)"""
     try:
         content_bytes = filepath.read_bytes()
-        content = content_bytes.decode('utf-8', errors='replace')
+        # PostgreSQL text cannot hold NUL
+        content = content_bytes.decode('utf-8', errors='replace').replace('\x00', '')
 
         if len(content.strip()) < 50:
             return None
@@ -75,7 +112,7 @@ def process_file(filepath: Path) -> dict:
             'filepath': str(filepath),
             'file_hash': file_hash(content_bytes),
             'doc_type': detect_doc_type(filepath.name, content),
-            'origin': 'dataset8_foia',
+            'origin': origin,
             'char_count': len(content),
             'content': content
         }
@@ -84,48 +121,90 @@ def process_file(filepath: Path) -> dict:
         return None
 
 
-def ingest_batch(batch: list, conn) -> int:
-    """Insert a batch of documents"""
+def read_batches(files: list, workers: int, batch_size: int, origin: str):
+    """Yield (files, docs) per batch, reading the next batch while the caller loads this one
+
+    At most two batches are in memory: ProcessPoolExecutor.map submits a
+    whole batch up front, so batches are submitted one ahead of the caller.
+    """
+    chunksize = max(1, batch_size // (workers * 4))
+    origins = [origin] * batch_size
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = None
+        for i in range(0, len(files), batch_size):
+            chunk = files[i:i + batch_size]
+            results = executor.map(process_file, chunk, origins, chunksize=chunksize)
+            if pending:
+                yield pending[0], [d for d in pending[1] if d]
+            pending = (chunk, results)
+        if pending:
+            yield pending[0], [d for d in pending[1] if d]
+
+
+def _copy_field(value) -> str:
+    """Escape one value for COPY text format"""
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def ingest_batch(batch: list, conn, seq_start: int = 0) -> int:
+    """COPY a batch into staging and merge it, return the number of new documents"""
     if not batch:
         return 0
 
-    inserted = 0
+    buf = io.StringIO()
+    for seq, doc in enumerate(batch, seq_start):
+        buf.write('\t'.join(_copy_field(v) for v in (
+            seq, doc['filename'], doc['filepath'], doc['file_hash'], doc['doc_type'],
+            doc['origin'], doc['char_count'], doc['content']
+        )))
+        buf.write('\n')
+    buf.seek(0)
+
     with conn.cursor() as cur:
-        for doc in batch:
-            try:
-                # Insert document
-                cur.execute("""
-                    INSERT INTO documents (filename, filepath, file_hash, doc_type, origin, char_count, date_added, status)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, 'processed')
-                    ON CONFLICT DO NOTHING
-                    RETURNING id
-                """, (doc['filename'], doc['filepath'], doc['file_hash'], doc['doc_type'],
-                      doc['origin'], doc['char_count'], datetime.now()))
-
-                result = cur.fetchone()
-                if result:
-                    doc_id = result[0]
-                    # Insert content
-                    cur.execute("""
-                        INSERT INTO contents (doc_id, full_text, created_at)
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT DO NOTHING
-                    """, (doc_id, doc['content'], datetime.now()))
-                    inserted += 1
-            except Exception as e:
-                print(f"Error inserting {doc['filename']}: {e}")
-                continue
-
-        conn.commit()
+        cur.execute(STAGING_DDL)
+        cur.copy_expert(f"COPY staging_documents ({', '.join(STAGING_COLUMNS)}) FROM STDIN", buf)
+        cur.execute(MERGE_SQL)
+        inserted = cur.rowcount
+    conn.commit()
     return inserted
 
 
+# =============================================================================
+# CHECKPOINTS
+# =============================================================================
+
+def load_checkpoint(path: Path, input_dir: Path) -> dict:
+    if not path.exists():
+        return {}
+    try:
+        state = json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable checkpoint {path}: {e}")
+        return {}
+    if state.get('input_dir') != str(input_dir.resolve()):
+        print(f"Checkpoint {path} is for {state.get('input_dir')}, ignoring")
+        return {}
+    return state
+
+
+def save_checkpoint(path: Path, state: dict):
+    """Atomic replace, so a crash never leaves a half-written checkpoint"""
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_text(json.dumps(state, indent=2))
+    os.replace(tmp, path)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Bulk ingest text files')
     parser.add_argument('input_dir', help='Directory containing text files')
-    parser.add_argument('--workers', type=int, default=4, help='Number of parallel workers')
-    parser.add_argument('--batch-size', type=int, default=100, help='Batch size for DB inserts')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4,
+                        help='Reader processes (default: CPU count)')
+    parser.add_argument('--batch-size', type=int, default=2000, help='Files per COPY batch')
     parser.add_argument('--limit', type=int, default=0, help='Limit number of files (0=all)')
+    parser.add_argument('--origin', default='dataset8_foia', help='Value for documents.origin')
+    parser.add_argument('--checkpoint', help='Checkpoint file (default: .bulk_ingest_<dir>.json)')
+    parser.add_argument('--no-resume', action='store_true', help='Ignore the checkpoint and re-scan all files')
     args = parser.parse_args()
 
     input_dir = Path(args.input_dir)
@@ -133,54 +212,46 @@ def main():
         print(f"ERROR: Directory not found: {input_dir}")
         sys.exit(1)
 
-    # Get all text files
-    files = list(input_dir.glob('*.txt'))
+    # Sorted, so the checkpoint's last file splits done from pending
+    files = sorted(input_dir.glob('*.txt'))
     if args.limit > 0:
         files = files[:args.limit]
 
     print(f"Found {len(files)} text files to process")
 
-    # Get existing hashes
-    conn = psycopg2.connect(DATABASE_URL)
-    existing_hashes = get_existing_hashes(conn)
-    print(f"Found {len(existing_hashes)} existing documents in DB")
-
-    # Process files in parallel
-    processed = []
-    skipped = 0
-
-    print(f"Processing with {args.workers} workers...")
-    with ThreadPoolExecutor(max_workers=args.workers) as executor:
-        futures = {executor.submit(process_file, f): f for f in files}
-
-        for i, future in enumerate(as_completed(futures)):
-            result = future.result()
-            if result:
-                if result['file_hash'] in existing_hashes:
-                    skipped += 1
-                else:
-                    processed.append(result)
-                    existing_hashes.add(result['file_hash'])
-
-            if (i + 1) % 500 == 0:
-                print(f"  Processed {i + 1}/{len(files)} files...")
+    checkpoint = Path(args.checkpoint or f".bulk_ingest_{input_dir.resolve().name}.json")
+    state = {} if args.no_resume else load_checkpoint(checkpoint, input_dir)
+    if state.get('last_file'):
+        files = [f for f in files if str(f) > state['last_file']]
+        print(f"Resuming after {state['last_file']}: {len(files)} files left")
+    state.setdefault('input_dir', str(input_dir.resolve()))
+    state.setdefault('inserted', 0)
+    state.setdefault('skipped', 0)
 
-    print(f"Processed {len(processed)} new files, skipped {skipped} duplicates")
-
-    # Insert in batches
-    if processed:
-        print(f"Inserting {len(processed)} documents in batches of {args.batch_size}...")
-        total_inserted = 0
-
-        for i in range(0, len(processed), args.batch_size):
-            batch = processed[i:i + args.batch_size]
-            inserted = ingest_batch(batch, conn)
-            total_inserted += inserted
-            print(f"  Inserted batch {i // args.batch_size + 1}: {inserted} documents")
+    conn = psycopg2.connect(DATABASE_URL)
 
-        print(f"\nTotal inserted: {total_inserted} documents")
+    print(f"Reading with {args.workers} processes, loading in batches of {args.batch_size}...")
+    total_inserted = 0
+    done = 0
+    for batch_num, (chunk, docs) in enumerate(read_batches(files, args.workers, args.batch_size, args.origin), 1):
+        try:
+            inserted = ingest_batch(docs, conn, seq_start=done)
+        except Exception as e:
+            conn.rollback()
+            print(f"Batch {batch_num} failed, stopping (resume to retry): {e}")
+            break
+
+        done += len(chunk)
+        total_inserted += inserted
+        state['inserted'] += inserted
+        state['skipped'] += len(chunk) - inserted
+        state['last_file'] = str(chunk[-1])
+        save_checkpoint(checkpoint, state)
+        print(f"  Batch {batch_num}: {inserted} new of {len(chunk)} files ({done}/{len(files)})")
 
     conn.close()
+    print(f"\nTotal inserted: {total_inserted} documents "
+          f"(run totals: {state['inserted']} inserted, {state['skipped']} skipped or duplicate)")
     print("Done!")
 
 
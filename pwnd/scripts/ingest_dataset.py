@@ -632,46 +632,60 @@ def safe_db_value(value: Any) -> str:
     return str(value)
 
 
+def bulk_insert(cursor, sql: str, rows: List[tuple], fetch: bool = False):
+    """Multi-row INSERT (one round trip per 500 rows instead of one per row)"""
+    from psycopg2.extras import execute_values
+    return execute_values(cursor, sql, rows, page_size=500, fetch=fetch)
+
+
+def create_nodes(cursor, keys: List[Tuple[str, str]], source_type: str) -> Dict[Tuple[str, str], int]:
+    """Insert (name, type) nodes in one statement, return their ids"""
+    if not keys:
+        return {}
+    created = bulk_insert(cursor, """
+        INSERT INTO nodes (type, name, name_normalized, source_db, created_by)
+        VALUES %s
+        RETURNING name, type, id
+    """, [(node_type, name, name.lower().strip(), source_type, 'dataset_ingest') for name, node_type in keys], fetch=True)
+    return {(name, node_type): node_id for name, node_type, node_id in created}
+
+
 def insert_nodes(nodes: List[Dict], source_id: str, source_type: str = 'document', dry_run: bool = False) -> Dict[str, int]:
     """Insert nodes into PostgreSQL graph database"""
     if dry_run:
         return {safe_db_value(n.get('name', '')): i for i, n in enumerate(nodes, 1)}
 
-    conn = get_pg_connection()
-    cursor = conn.cursor()
-    node_id_map = {}
-
+    rows = []
     for node in nodes:
         name = safe_db_value(node.get('name'))
-        node_type = safe_db_value(node.get('type', 'unknown'))
-        context = safe_db_value(node.get('context', ''))
+        if name:
+            rows.append((name, safe_db_value(node.get('type', 'unknown')), safe_db_value(node.get('context', ''))))
+    if not rows:
+        return {}
 
-        if not name:
-            continue
-
-        name_normalized = name.lower().strip()
-
-        # Check exists
-        cursor.execute("SELECT id FROM nodes WHERE name = %s AND type = %s", (name, node_type))
-        existing = cursor.fetchone()
-
-        if existing:
-            node_id = existing[0]
-        else:
-            cursor.execute("""
-                INSERT INTO nodes (type, name, name_normalized, source_db, created_by)
-                VALUES (%s, %s, %s, %s, 'dataset_ingest')
-                RETURNING id
-            """, (node_type, name, name_normalized, source_type))
-            node_id = cursor.fetchone()[0]
+    conn = get_pg_connection()
+    cursor = conn.cursor()
 
-        node_id_map[name] = node_id
+    # Existing nodes in one lookup, the rest created in one INSERT
+    keys = list(dict.fromkeys((name, node_type) for name, node_type, _ in rows))
+    cursor.execute("""
+        SELECT DISTINCT ON (n.name, n.type) n.name, n.type, n.id
+        FROM nodes n
+        JOIN unnest(%s::text[], %s::text[]) AS k(name, type) ON n.name = k.name AND n.type = k.type
+        ORDER BY n.name, n.type, n.id
+    """, ([k[0] for k in keys], [k[1] for k in keys]))
+    ids = {(name, node_type): node_id for name, node_type, node_id in cursor.fetchall()}
+    ids.update(create_nodes(cursor, [k for k in keys if k not in ids], source_type))
 
+    node_id_map = {}
+    contexts = []
+    for name, node_type, context in rows:
+        node_id_map[name] = ids[(name, node_type)]
         if context:
-            cursor.execute("""
-                INSERT INTO properties (node_id, key, value, created_by)
-                VALUES (%s, 'context', %s, 'dataset_ingest')
-            """, (node_id, context))
+            contexts.append((ids[(name, node_type)], 'context', context, 'dataset_ingest'))
+
+    if contexts:
+        bulk_insert(cursor, "INSERT INTO properties (node_id, key, value, created_by) VALUES %s", contexts)
 
     conn.commit()
     conn.close()
@@ -683,52 +697,40 @@ def insert_edges(edges: List[Dict], node_id_map: Dict[str, int], source_id: str,
     if dry_run:
         return len(edges)
 
-    conn = get_pg_connection()
-    cursor = conn.cursor()
-    inserted = 0
-
+    triples = []
     for edge in edges:
         from_name = safe_db_value(edge.get('from'))
         to_name = safe_db_value(edge.get('to'))
-        edge_type = safe_db_value(edge.get('type', 'related_to'))
-
-        if not from_name or not to_name:
-            continue
+        if from_name and to_name:
+            triples.append((from_name, to_name, safe_db_value(edge.get('type', 'related_to'))))
+    if not triples:
+        return 0
 
-        from_id = node_id_map.get(from_name)
-        to_id = node_id_map.get(to_name)
-
-        # Create missing nodes
-        if not from_id:
-            cursor.execute("""
-                INSERT INTO nodes (type, name, name_normalized, source_db, created_by)
-                VALUES ('unknown', %s, %s, 'document', 'dataset_ingest')
-                RETURNING id
-            """, (from_name, from_name.lower().strip()))
-            from_id = cursor.fetchone()[0]
-            node_id_map[from_name] = from_id
-
-        if not to_id:
-            cursor.execute("""
-                INSERT INTO nodes (type, name, name_normalized, source_db, created_by)
-                VALUES ('unknown', %s, %s, 'document', 'dataset_ingest')
-                RETURNING id
-            """, (to_name, to_name.lower().strip()))
-            to_id = cursor.fetchone()[0]
-            node_id_map[to_name] = to_id
+    conn = get_pg_connection()
+    cursor = conn.cursor()
 
-        try:
-            cursor.execute("""
-                INSERT INTO edges (from_node_id, to_node_id, type, directed, created_by)
-                VALUES (%s, %s, %s, true, 'dataset_ingest')
-            """, (from_id, to_id, edge_type))
-            inserted += 1
-        except:
-            conn.rollback()
+    try:
+        # Create missing endpoint nodes in one INSERT
+        missing = [n for n in dict.fromkeys(name for t in triples for name in t[:2]) if not node_id_map.get(n)]
+        for (name, _), node_id in create_nodes(cursor, [(n, 'unknown') for n in missing], 'document').items():
+            node_id_map[name] = node_id
+
+        inserted = bulk_insert(cursor, """
+            INSERT INTO edges (from_node_id, to_node_id, type, directed, created_by)
+            VALUES %s
+            ON CONFLICT DO NOTHING
+            RETURNING id
+        """, [(node_id_map[f], node_id_map[t], edge_type, True, 'dataset_ingest') for f, t, edge_type in triples],
+            fetch=True)
+        conn.commit()
+        count = len(inserted)
+    except Exception as e:
+        conn.rollback()
+        print(f"    Edge insert failed: {e}")
+        count = 0
 
-    conn.commit()
     conn.close()
-    return inserted
+    return count
 
 
 def insert_properties(properties: List[Dict], node_id_map: Dict[str, int], source_id: str, dry_run: bool = False) -> int:
@@ -736,10 +738,7 @@ def insert_properties(properties: List[Dict], node_id_map: Dict[str, int], sourc
     if dry_run:
         return len(properties)
 
-    conn = get_pg_connection()
-    cursor = conn.cursor()
-    inserted = 0
-
+    rows = []
     for prop in properties:
         node_name = safe_db_value(prop.get('node'))
         key = safe_db_value(prop.get('key'))
@@ -749,19 +748,22 @@ def insert_properties(properties: List[Dict], node_id_map: Dict[str, int], sourc
             continue
 
         node_id = node_id_map.get(node_name)
-        if not node_id:
-            continue
+        if node_id:
+            rows.append((node_id, key, value, 'dataset_ingest'))
+    if not rows:
+        return 0
 
-        try:
-            cursor.execute("""
-                INSERT INTO properties (node_id, key, value, created_by)
-                VALUES (%s, %s, %s, 'dataset_ingest')
-            """, (node_id, key, value))
-            inserted += 1
-        except:
-            conn.rollback()
+    conn = get_pg_connection()
+    cursor = conn.cursor()
+    try:
+        bulk_insert(cursor, "INSERT INTO properties (node_id, key, value, created_by) VALUES %s", rows)
+        conn.commit()
+        inserted = len(rows)
+    except Exception as e:
+        conn.rollback()
+        print(f"    Property insert failed: {e}")
+        inserted = 0
 
-    conn.commit()
     conn.close()
     return inserted
 
@@ -770,25 +772,29 @@ def insert_signals(signals: List[Dict], source_id: str, dry_run: bool = False) -
     """Insert signals as flags into PostgreSQL"""
     if dry_run:
         return len(signals)
+    if not signals:
+        return 0
+
+    rows = [
+        ('document', source_id, safe_db_value(signal.get('type', 'unknown')),
+         safe_db_value(signal.get('detail', '')), 0, 'dataset_ingest')
+        for signal in signals
+    ]
 
     conn = get_pg_connection()
     cursor = conn.cursor()
-    inserted = 0
-
-    for signal in signals:
-        signal_type = safe_db_value(signal.get('type', 'unknown'))
-        detail = safe_db_value(signal.get('detail', ''))
-
-        try:
-            cursor.execute("""
-                INSERT INTO flags (target_type, target_id, flag_type, description, severity, created_by)
-                VALUES ('document', %s, %s, %s, 0, 'dataset_ingest')
-            """, (source_id, signal_type, detail))
-            inserted += 1
-        except:
-            conn.rollback()
+    try:
+        bulk_insert(cursor, """
+            INSERT INTO flags (target_type, target_id, flag_type, description, severity, created_by)
+            VALUES %s
+        """, rows)
+        conn.commit()
+        inserted = len(rows)
+    except Exception as e:
+        conn.rollback()
+        print(f"    Signal insert failed: {e}")
+        inserted = 0
 
-    conn.commit()
     conn.close()
     return inserted
 
@@ -798,10 +804,7 @@ def insert_cross_references(cross_refs: List[Dict], node_id_map: Dict[str, int],
     if dry_run:
         return len(cross_refs)
 
-    conn = get_pg_connection()
-    cursor = conn.cursor()
-    inserted = 0
-
+    rows = []
     for xref in cross_refs:
         entity_name = safe_db_value(xref.get('entity'))
         email_ids = xref.get('related_emails', [])
@@ -812,16 +815,26 @@ def insert_cross_references(cross_refs: List[Dict], node_id_map: Dict[str, int],
             continue
 
         for email_id in email_ids[:5]:  # Limit cross-refs
-            try:
-                cursor.execute("""
-                    INSERT INTO edges (from_node_id, to_node_id, type, directed, excerpt, created_by)
-                    VALUES (%s, %s, 'cross_reference', true, %s, 'dataset_ingest')
-                """, (entity_id, email_id, f"Email #{email_id}: {relationship}"))
-                inserted += 1
-            except:
-                conn.rollback()
+            rows.append((entity_id, email_id, 'cross_reference', True,
+                         f"Email #{email_id}: {relationship}", 'dataset_ingest'))
+    if not rows:
+        return 0
+
+    conn = get_pg_connection()
+    cursor = conn.cursor()
+    try:
+        inserted = len(bulk_insert(cursor, """
+            INSERT INTO edges (from_node_id, to_node_id, type, directed, excerpt, created_by)
+            VALUES %s
+            ON CONFLICT DO NOTHING
+            RETURNING id
+        """, rows, fetch=True))
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"    Cross-reference insert failed: {e}")
+        inserted = 0
 
-    conn.commit()
     conn.close()
     return inserted
 
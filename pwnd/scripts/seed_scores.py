@@ -6,8 +6,11 @@ Populates scores.db with suspicion, pertinence, anomaly based on known patterns.
 
 import sqlite3
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 DB_DIR = Path("/opt/rag/db")
 SOURCES_DB = DB_DIR / "sources.db"
 GRAPH_DB = DB_DIR / "graph.db"
@@ -99,6 +102,19 @@ def init_scores_db():
     return conn
 
 
+def refresh_ranking() -> bool:
+    """Re-materialize email_rank_features so search ranks by the new scores"""
+    try:
+        from app.ranking import refresh_rank_features
+    except Exception as e:  # app not importable here (e.g. no DATABASE_URL)
+        print(f"\nCould not refresh search ranking ({e}) - run: python -m app.ranking")
+        return False
+    refreshed = refresh_rank_features()
+    print("\nSearch ranking refreshed" if refreshed else
+          "\nSearch ranking NOT refreshed - run: python -m app.ranking")
+    return refreshed
+
+
 def score_node(node, edges_count=0):
     """Calculate scores for a node"""
     name = (node['name'] or '').lower()
@@ -426,6 +442,9 @@ def main():
     graph_conn.close()
     sources_conn.close()
 
+    # Search ranks from a materialized view of the scores
+    refresh_ranking()
+
     print("\nDone!")
 
 
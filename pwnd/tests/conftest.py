@@ -0,0 +1,64 @@
+"""Test setup: import the app package without a deployed /opt/rag tree"""
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("RAG_BASE_DIR", tempfile.mkdtemp(prefix="pwnd-tests-"))
+# Pools connect lazily; tests replace get_db before any query runs
+os.environ.setdefault("DATABASE_URL", "postgresql://tests@localhost/unused")
+
+
+class FakeCursor:
+    """Answers the graph snapshot queries from in-memory nodes/edges rows"""
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.rows = []
+        self.itersize = None
+
+    def execute(self, query, params=()):
+        rows = sorted(self.tables["nodes" if "FROM nodes" in query else "edges"])
+        if params:
+            rows = [r for r in rows if r[0] > params[0]]  # WHERE id > %s
+        self.rows = rows
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def close(self):
+        pass
+
+
+class FakeConn:
+    def __init__(self, tables):
+        self.tables = tables
+
+    def cursor(self, name=None):
+        return FakeCursor(self.tables)
+
+    def rollback(self):
+        pass
+
+
+@pytest.fixture
+def graph_tables(monkeypatch):
+    """Mutable nodes/edges rows behind app.graph.get_db"""
+    from app import graph
+
+    tables = {"nodes": [], "edges": []}
+
+    @contextmanager
+    def get_db(name=None):
+        yield FakeConn(tables)
+
+    monkeypatch.setattr(graph, "get_db", get_db)
+    monkeypatch.setattr(graph, "GRAPH_RESCAN_WINDOW", 100)
+    return tables
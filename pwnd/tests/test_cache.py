@@ -0,0 +1,136 @@
+"""Shared cache tier: TTLs, shared-tier promotion, single-flight"""
+import threading
+import time
+
+import pytest
+
+from app.cache import CacheTier, SQLiteBackend
+
+
+@pytest.fixture
+def tier():
+    return CacheTier(max_bytes=1024 * 1024)
+
+
+@pytest.fixture
+def shared(tmp_path):
+    return SQLiteBackend(str(tmp_path / "cache.sqlite"), 1024 * 1024)
+
+
+def test_get_set_and_expiry(tier):
+    ns = tier.namespace("t", ttl=0.05)
+    ns.set("k", {"a": 1})
+    assert ns.get("k") == {"a": 1}
+    time.sleep(0.1)
+    assert ns.get("k") is None
+    assert ns.expired == 1
+
+
+def test_byte_bound_evicts_oldest():
+    tier = CacheTier(max_bytes=600)
+    ns = tier.namespace("t")
+    for i in range(5):
+        ns.set(str(i), "x" * 200)
+    assert tier.bytes <= 600
+    assert ns.get("0") is None
+    assert ns.get("4") == "x" * 200
+    assert ns.evictions > 0
+
+
+def test_shared_hit_keeps_remaining_ttl(shared):
+    writer = CacheTier(shared=shared).namespace("t", ttl=10)
+    writer.set("k", "v")
+    expires_at = shared.get("t", "k")[1]
+
+    # A second process promotes the row: its L1 copy must not outlive the shared one
+    reader_tier = CacheTier(shared=shared)
+    reader = reader_tier.namespace("t", ttl=10)
+    assert reader.get("k") == "v"
+    assert reader.shared_hits == 1
+    assert reader_tier.entries[("t", "k")][2] == expires_at
+
+
+def test_get_or_set_runs_loader_once(tier):
+    ns = tier.namespace("t")
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(ns.get_or_set("k", loader)))]
+    threads[0].start()
+    started.wait(5)
+    for _ in range(4):
+        t = threading.Thread(target=lambda: results.append(ns.get_or_set("k", loader)))
+        threads.append(t)
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert ns.coalesced == 4
+
+
+def test_get_or_set_follower_gives_up_on_hung_leader(tier):
+    ns = tier.namespace("t")
+    started = threading.Event()
+    release = threading.Event()
+
+    def hung():
+        started.set()
+        release.wait(5)
+        return "late"
+
+    leader = threading.Thread(target=lambda: ns.get_or_set("k", hung))
+    leader.start()
+    started.wait(5)
+    try:
+        t0 = time.monotonic()
+        assert ns.get_or_set("k", lambda: "own", timeout=0.1) == "own"
+        assert time.monotonic() - t0 < 2
+    finally:
+        release.set()
+        leader.join(5)
+
+
+def test_get_or_set_follower_loads_after_leader_failure(tier):
+    ns = tier.namespace("t")
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("boom")
+
+    errors = []
+
+    def lead():
+        try:
+            ns.get_or_set("k", failing)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    started.wait(5)
+    result = []
+    follower = threading.Thread(target=lambda: result.append(ns.get_or_set("k", lambda: "own")))
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert len(errors) == 1
+    assert result == ["own"]
+    assert ns._inflight == {}
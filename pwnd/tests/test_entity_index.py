@@ -0,0 +1,71 @@
+"""Entity index: prefix lookups, substring fallback query, score reloads"""
+import pytest
+
+from app import entity_index, graph
+from app.entity_index import EntityIndex, normalize_name
+
+
+@pytest.fixture
+def snapshot(graph_tables):
+    graph_tables["nodes"] = [(1, "person", "Ghislaine Maxwell"), (2, "person", "Jean-Luc Brunel"),
+                             (3, "organization", "Maxwell Foundation")]
+    return graph._load_full()
+
+
+def test_normalize_name():
+    assert normalize_name("  Jean-Luc  BRUNEL ") == "jean luc brunel"
+    assert normalize_name("Sébastien") == "sebastien"
+
+
+def test_prefix_and_word_prefix(snapshot):
+    index = EntityIndex(snapshot, aliases=[(2, "JL Brunel")], scores={1: {
+        'suspicion': 90, 'pertinence': 80, 'confidence': 60, 'anomaly': 5}})
+
+    hits = index.lookup("maxw")
+    # A match at the start of the full name ranks above a word-start match
+    assert [h['id'] for h in hits] == [3, 1]
+    assert hits[1]['suspicion'] == 90
+    assert hits[0]['pertinence'] == 50  # unscored default
+
+    assert [h['id'] for h in index.lookup("jl")] == [2]
+    assert [h['id'] for h in index.lookup("max", node_type="person")] == [1]
+    # Inside a word: left to the PostgreSQL fallback
+    assert index.lookup("axwel") == []
+
+
+def test_substring_query_only_for_long_queries():
+    query, params = entity_index._trigram_query("ax", 10)
+    assert query is entity_index.TRIGRAM_QUERY
+    assert params == ("ax", "ax", "ax", "ax", 10)
+
+    query, params = entity_index._trigram_query("50%_a\\", 10)
+    assert query is entity_index.SUBSTRING_QUERY
+    assert "ILIKE" in query
+    assert params[4] == params[5] == "%50\\%\\_a\\\\%"
+
+
+def test_scores_reload_after_invalidate(snapshot, monkeypatch):
+    loads = []
+
+    def load_scores():
+        loads.append(1)
+        return {1: {'suspicion': 10 * len(loads), 'pertinence': 50, 'confidence': 50, 'anomaly': 0}}
+
+    monkeypatch.setattr(entity_index, "get_graph", lambda: snapshot)
+    monkeypatch.setattr(entity_index, "_load_scores", load_scores)
+    monkeypatch.setattr(entity_index, "execute_query", lambda *a, **k: [])
+    monkeypatch.setattr(entity_index, "_index", None)
+    monkeypatch.setattr(entity_index, "ENTITY_SCORES_TTL", 3600)
+
+    index = entity_index.get_entity_index()
+    assert index.lookup("ghis")[0]['suspicion'] == 10
+    assert entity_index.get_entity_index() is index
+    assert len(loads) == 1
+
+    entity_index.invalidate_entity_scores()
+    assert entity_index.get_entity_index() is index
+    assert index.lookup("ghis")[0]['suspicion'] == 20
+
+    monkeypatch.setattr(entity_index, "ENTITY_SCORES_TTL", 0)
+    entity_index.get_entity_index()
+    assert len(loads) == 3
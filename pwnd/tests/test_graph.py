@@ -0,0 +1,88 @@
+"""Graph snapshot: CSR build and incremental refresh over an id window"""
+from app import graph
+
+
+def neighbours(snap, node_id, direction='both'):
+    return sorted((n, t, e, d) for n, t, e, d in snap.neighbors(node_id, direction=direction))
+
+
+def test_full_load_builds_csr(graph_tables):
+    graph_tables["nodes"] = [(1, "person", "A"), (2, "person", "B"), (3, "org", "C")]
+    graph_tables["edges"] = [(10, 1, 2, "knows"), (11, 1, 3, "works_at"), (12, 3, 1, "employs"), (13, 1, 99, "dangling")]
+    snap = graph._load_full()
+
+    assert snap.edge_count == 3
+    assert neighbours(snap, 1, 'out') == [(2, "knows", 10, "out"), (3, "works_at", 11, "out")]
+    assert neighbours(snap, 1, 'in') == [(3, "employs", 12, "in")]
+    assert snap.degree(1) == 3
+    assert snap.degree(2, edge_types=["knows"]) == 1
+    assert all(type(x) is int for n in neighbours(snap, 1) for x in (n[0], n[2]))
+    # The dangling edge is not accepted, so it does not move the mark
+    assert snap.max_edge_id == 12
+    assert sorted(snap.k_hop([2], depth=2)) == [1, 2, 3]
+    assert snap.edges_between([1, 2, 3], edge_types=["knows", "employs"]) == [
+        (10, 1, 2, "knows"), (12, 3, 1, "employs")]
+
+
+def test_empty_graph(graph_tables):
+    snap = graph._load_full()
+    assert snap.edge_count == 0
+    assert graph._load_delta(snap) is snap
+
+
+def test_delta_picks_up_out_of_order_commits(graph_tables):
+    graph_tables["nodes"] = [(1, "person", "A"), (2, "person", "B"), (3, "person", "C")]
+    graph_tables["edges"] = [(10, 1, 2, "knows"), (12, 2, 3, "knows")]
+    snap = graph._load_full()
+
+    # Edge 11 commits after 12 was already loaded
+    graph_tables["edges"].append((11, 1, 3, "knows"))
+    snap = graph._load_delta(snap)
+    assert snap.delta_edges == 1
+    assert (3, "knows", 11, "out") in neighbours(snap, 1)
+
+    # Re-reading the window does not duplicate anything
+    assert graph._load_delta(snap) is snap
+    assert snap.degree(1) == 2
+
+
+def test_edge_waits_for_its_endpoint(graph_tables):
+    graph_tables["nodes"] = [(1, "person", "A")]
+    graph_tables["edges"] = []
+    snap = graph._load_full()
+
+    # Edge to a node whose transaction has not committed yet
+    graph_tables["edges"].append((20, 1, 5, "knows"))
+    snap = graph._load_delta(snap)
+    assert snap.degree(1) == 0
+    assert snap.max_edge_id == 0
+
+    graph_tables["nodes"].append((5, "person", "E"))
+    snap = graph._load_delta(snap)
+    assert snap.node(5) == {"id": 5, "name": "E", "type": "person"}
+    assert neighbours(snap, 5) == [(1, "knows", 20, "in")]
+    assert snap.max_edge_id == 20
+
+
+def test_delta_shares_base_snapshot(graph_tables):
+    graph_tables["nodes"] = [(1, "person", "A"), (2, "person", "B")]
+    graph_tables["edges"] = [(10, 1, 2, "knows")]
+    base = graph._load_full()
+    graph_tables["edges"].append((11, 2, 1, "knows"))
+    snap = graph._load_delta(base)
+
+    assert snap is not base
+    assert snap.out_csr is base.out_csr
+    assert base.degree(1) == 1 and snap.degree(1) == 2
+
+
+def test_recent_edges_pruned_to_window(graph_tables, monkeypatch):
+    monkeypatch.setattr(graph, "GRAPH_RESCAN_WINDOW", 5)
+    graph_tables["nodes"] = [(1, "person", "A"), (2, "person", "B")]
+    graph_tables["edges"] = [(i, 1, 2, "knows") for i in range(1, 21)]
+    snap = graph._load_full()
+    assert snap.recent_edges == set(range(16, 21))
+
+    graph_tables["edges"].append((30, 2, 1, "knows"))
+    snap = graph._load_delta(snap)
+    assert snap.recent_edges == {30}
@@ -0,0 +1,121 @@
+"""Score writes reach the email ranking (email_rank_features refresh)"""
+import importlib.util
+import os
+import sqlite3
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from app import ranking
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+
+
+def load_seed_scores():
+    spec = importlib.util.spec_from_file_location("seed_scores", SCRIPTS / "seed_scores.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_seed_scores_refreshes_ranking(tmp_path, monkeypatch):
+    seed_scores = load_seed_scores()
+    graph = sqlite3.connect(tmp_path / "graph.db")
+    graph.executescript("""
+        CREATE TABLE nodes (id INTEGER PRIMARY KEY, name TEXT, type TEXT);
+        CREATE TABLE edges (from_node_id INTEGER, to_node_id INTEGER);
+        INSERT INTO nodes VALUES (1, 'Ghislaine Maxwell', 'person'), (2, 'Acme', 'org');
+        INSERT INTO edges VALUES (1, 2);
+    """)
+    graph.close()
+    sources = sqlite3.connect(tmp_path / "sources.db")
+    sources.executescript("""
+        CREATE TABLE emails (doc_id INTEGER PRIMARY KEY, subject TEXT, sender_email TEXT,
+                             date_sent TEXT, body_text TEXT);
+        INSERT INTO emails VALUES (7, 'flight to the island', 'a@bank.com', '2008-03-01', 'wire transfer');
+    """)
+    sources.close()
+    for name in ("SOURCES_DB", "GRAPH_DB", "SCORES_DB"):
+        monkeypatch.setattr(seed_scores, name, tmp_path / f"{name[:-3].lower()}.db")
+
+    refreshed = []
+    monkeypatch.setattr(ranking, "refresh_rank_features", lambda: refreshed.append(True) or True)
+    seed_scores.main()
+    assert refreshed == [True]
+
+
+# -----------------------------------------------------------------------------
+# Against PostgreSQL: PWND_TEST_DATABASE_URL=postgresql://... (skipped otherwise)
+# -----------------------------------------------------------------------------
+
+@pytest.fixture
+def pg(monkeypatch):
+    url = os.getenv("PWND_TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("PWND_TEST_DATABASE_URL not set")
+    import psycopg2
+    import psycopg2.extras
+
+    schema = f"pwnd_test_{uuid.uuid4().hex[:8]}"
+    admin = psycopg2.connect(url)
+    admin.autocommit = True
+    admin.cursor().execute(f"CREATE SCHEMA {schema}")
+
+    def connect():
+        return psycopg2.connect(url, options=f"-c search_path={schema}",
+                                cursor_factory=psycopg2.extras.RealDictCursor)
+
+    @contextmanager
+    def get_db(name=None):
+        conn = connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    monkeypatch.setattr(ranking, "get_db", get_db)
+    try:
+        yield get_db
+    finally:
+        admin.cursor().execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
+
+
+def search(get_db, q):
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(ranking.EMAIL_FTS_QUERY, (q, 10))
+        return [row["doc_id"] for row in cursor.fetchall()]
+
+
+def test_score_write_changes_ranking(pg):
+    with pg() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE emails (
+                doc_id integer PRIMARY KEY, subject text, sender_email text, body_text text,
+                tsv tsvector GENERATED ALWAYS AS (to_tsvector('english', coalesce(subject, '') || ' ' || coalesce(body_text, ''))) STORED
+            );
+            CREATE TABLE scores (
+                target_type text, target_id integer, pertinence integer, suspicion integer,
+                confidence integer, anomaly integer, UNIQUE (target_type, target_id)
+            );
+            INSERT INTO emails VALUES (1, 'flight manifest', 'a@x', 'flight list'),
+                                      (2, 'flight manifest', 'b@x', 'flight list');
+            INSERT INTO scores VALUES ('email', 1, 60, 0, 50, 0);
+        """)
+        conn.commit()
+    assert ranking.init_rank_features()
+    assert search(pg, "flight") == [1, 2]
+
+    # A rescoring pass makes the second email far more pertinent
+    with pg() as conn:
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO scores VALUES ('email', 2, 100, 40, 50, 0)")
+        conn.commit()
+    assert search(pg, "flight") == [1, 2]  # still ranked from the old view
+
+    assert ranking.refresh_rank_features()
+    assert search(pg, "flight") == [2, 1]
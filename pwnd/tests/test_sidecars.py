@@ -0,0 +1,115 @@
+"""Sidecar circuit breaker: open, half-open probe, recovery"""
+import asyncio
+
+import httpx
+import pytest
+
+from app import sidecars
+from app.sidecars import FAILURE_THRESHOLD, Sidecar
+
+
+def make_sidecar(handler) -> Sidecar:
+    sidecar = Sidecar("test", "http://sidecar.test", timeout=1.0)
+    sidecar._client = httpx.Client(base_url=sidecar.base_url, transport=httpx.MockTransport(handler))
+    sidecar._async_client = httpx.AsyncClient(base_url=sidecar.base_url, transport=httpx.MockTransport(handler))
+    return sidecar
+
+
+def refuse(request):
+    raise httpx.ConnectError("refused", request=request)
+
+
+@pytest.fixture
+def no_cooldown(monkeypatch):
+    monkeypatch.setattr(sidecars, "COOLDOWN", 0.0)
+
+
+def test_circuit_opens_after_threshold():
+    sidecar = make_sidecar(refuse)
+    for _ in range(FAILURE_THRESHOLD):
+        assert sidecar.get("/x") is None
+    assert sidecar.stats()["circuit"] == "open"
+    assert sidecar.get("/x") is None
+    assert sidecar.short_circuited == 1
+    assert sidecar.requests == FAILURE_THRESHOLD
+
+
+def test_successful_probe_closes_circuit(no_cooldown):
+    state = {"up": False}
+
+    def handler(request):
+        if not state["up"]:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    sidecar = make_sidecar(handler)
+    for _ in range(FAILURE_THRESHOLD):
+        sidecar.get("/x")
+    state["up"] = True
+    assert sidecar.get("/x").status_code == 200
+    assert sidecar.stats()["circuit"] == "closed"
+    assert not sidecar._probing
+
+
+def test_server_errors_count_as_failures():
+    sidecar = make_sidecar(lambda request: httpx.Response(503))
+    for _ in range(FAILURE_THRESHOLD):
+        assert sidecar.get("/x").status_code == 503
+    assert sidecar.stats()["circuit"] == "open"
+
+
+def test_only_one_probe_at_a_time(no_cooldown):
+    sidecar = make_sidecar(refuse)
+    for _ in range(FAILURE_THRESHOLD):
+        sidecar.get("/x")
+    assert sidecar._admit() is True
+    assert sidecar._admit() is None
+    sidecar._end_probe(True)
+    assert sidecar._admit() is True
+
+
+def test_probe_released_on_non_http_error(no_cooldown):
+    state = {"calls": 0}
+
+    def handler(request):
+        state["calls"] += 1
+        if state["calls"] <= FAILURE_THRESHOLD:
+            raise httpx.ConnectError("refused", request=request)
+        raise RuntimeError("transport bug")
+
+    sidecar = make_sidecar(handler)
+    for _ in range(FAILURE_THRESHOLD):
+        sidecar.get("/x")
+    with pytest.raises(RuntimeError):
+        sidecar.get("/x")
+    assert not sidecar._probing
+    # The next request is allowed to probe again
+    assert sidecar._admit() is True
+
+
+def test_probe_released_when_cancelled(no_cooldown):
+    async def run():
+        started = asyncio.Event()
+        state = {"calls": 0}
+
+        async def handler(request):
+            state["calls"] += 1
+            if state["calls"] <= FAILURE_THRESHOLD:
+                raise httpx.ConnectError("refused", request=request)
+            started.set()
+            await asyncio.sleep(10)
+            return httpx.Response(200)
+
+        sidecar = make_sidecar(handler)
+        for _ in range(FAILURE_THRESHOLD):
+            await sidecar.aget("/x")
+        task = asyncio.create_task(sidecar.aget("/x"))
+        await started.wait()
+        assert sidecar._probing
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not sidecar._probing
+        await sidecar.aclose()
+
+    asyncio.run(run())